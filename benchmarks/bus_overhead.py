@@ -0,0 +1,118 @@
+"""
+Per-message overhead benchmark for the in-process buses
+
+Every bus API gets the same workload: one async and one sync no-op
+subscriber on a single topic. The time per message is therefore the bus's
+own cost (topic lookup, envelope handling, dispatch, counters), so the
+APIs can be compared with each other and across changes to BusCore.
+
+- SimpleMessageBus.publish
+- InMemoryMessageBus.publish and send_to_component
+- EventManager.emit, standalone and over the global UnifiedEventBus
+
+Usage:
+    python benchmarks/bus_overhead.py [--iterations 50000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.message_bus.interface import create_component_message, create_hook_message
+from woodwork.core.simple_message_bus import SimpleMessageBus
+from woodwork.core.unified_event_bus import UnifiedEventBus
+from woodwork.events.events import BusEventManager, EventManager
+from woodwork.types import AgentThoughtPayload
+
+TOPIC = "agent.thought"
+
+
+async def _noop_async(message):
+    return None
+
+
+def _noop_sync(message):
+    return None
+
+
+async def _time(send, iterations: int) -> float:
+    """Return microseconds per message"""
+    for _ in range(min(1000, iterations)):
+        await send()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await send()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _simple_publish(iterations: int) -> float:
+    bus = SimpleMessageBus()
+    await bus.start()
+    bus.subscribe(TOPIC, _noop_async)
+    bus.subscribe(TOPIC, _noop_sync)
+    data = {"thought": "benchmark"}
+    try:
+        return await _time(lambda: bus.publish(TOPIC, data, "bench"), iterations)
+    finally:
+        await bus.stop()
+
+
+async def _in_memory_publish(iterations: int) -> float:
+    bus = InMemoryMessageBus()
+    await bus.start()
+    await bus.subscribe(TOPIC, _noop_async)
+    await bus.subscribe(TOPIC, _noop_sync)
+    envelope = create_hook_message("session", TOPIC, {"thought": "benchmark"}, "bench")
+    try:
+        return await _time(lambda: bus.publish(envelope), iterations)
+    finally:
+        await bus.stop()
+
+
+async def _in_memory_send(iterations: int) -> float:
+    bus = InMemoryMessageBus()
+    await bus.start()
+    bus.register_component_handler("target", _noop_async)
+    envelope = create_component_message("session", TOPIC, {"thought": "benchmark"}, "target", "bench")
+    try:
+        return await _time(lambda: bus.send_to_component(envelope), iterations)
+    finally:
+        await bus.stop()
+
+
+async def _event_manager_emit(manager: EventManager, iterations: int) -> float:
+    manager.on_hook(TOPIC, _noop_async)
+    manager.on_event(TOPIC, _noop_sync)
+    payload = AgentThoughtPayload(thought="benchmark", component_id="bench", component_type="agent")
+    return await _time(lambda: manager.emit(TOPIC, payload), iterations)
+
+
+async def main(iterations: int) -> None:
+    # Keep log formatting out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    unified = UnifiedEventBus()
+    scenarios = [
+        ("SimpleMessageBus.publish", _simple_publish(iterations)),
+        ("InMemoryMessageBus.publish", _in_memory_publish(iterations)),
+        ("InMemoryMessageBus.send_to_component", _in_memory_send(iterations)),
+        ("EventManager.emit (standalone)", _event_manager_emit(EventManager(), iterations)),
+        ("EventManager.emit (over UnifiedEventBus)", _event_manager_emit(BusEventManager(unified), iterations)),
+    ]
+
+    print(f"Per-message bus overhead ({iterations} messages per scenario, 1 async + 1 sync subscriber)")
+    for name, scenario in scenarios:
+        micros = await scenario
+        print(f"  {name:<42} {micros:>8.2f} us/msg  {1e6 / micros:>12,.0f} msgs/sec")
+
+    await unified.shutdown(drain=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,100 @@
+"""
+Retry scheduling benchmark with a large backlog of pending retries
+
+Fills the retry queue with N failed envelopes (default 100k) whose next
+attempts are spread over a minute, then compares:
+- the previous approach: every 500ms copy the list, scan it for due
+  envelopes and list.remove() each one
+- RetryScheduler: pop due envelopes from a heap, sleeping until the next
+
+Reported per processor wake-up (a tick that finds ~1% of the backlog due)
+and for draining the whole backlog. The list scan is quadratic, so only
+its first tick is timed.
+
+Usage:
+    python benchmarks/retry_scheduler.py [--pending 100000]
+"""
+
+import argparse
+import random
+import time
+
+from woodwork.core.message_bus.interface import MessageEnvelope
+from woodwork.core.message_bus.retry_scheduler import RetryScheduler
+
+SPREAD_SECONDS = 60.0
+TICK_SECONDS = 0.5
+
+
+def _envelopes(count: int):
+    return [
+        MessageEnvelope(message_id=f"msg-{i}", session_id="bench", event_type="tool.call", payload={}, retry_count=1)
+        for i in range(count)
+    ]
+
+
+def _legacy_tick(queue: list, due_at: dict, now: float) -> int:
+    """One pass of the old processor: copy, scan, list.remove each due envelope"""
+    retried = 0
+    for envelope in queue[:]:
+        if now >= due_at[envelope.message_id]:
+            queue.remove(envelope)
+            retried += 1
+    return retried
+
+
+def _bench_legacy(envelopes, due_times):
+    queue = list(envelopes)
+    due_at = {envelope.message_id: due for envelope, due in zip(envelopes, due_times)}
+
+    start = time.perf_counter()
+    _legacy_tick(queue, due_at, TICK_SECONDS)
+    return time.perf_counter() - start
+
+
+def _bench_heap(envelopes, due_times, ticks: int):
+    clock = [0.0]
+    scheduler = RetryScheduler(base_delay=0.0, jitter=0.0, clock=lambda: clock[0])
+
+    start = time.perf_counter()
+    for envelope, due in zip(envelopes, due_times):
+        scheduler.schedule(envelope, now=due)
+    schedule_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        clock[0] += TICK_SECONDS
+        scheduler.pop_due()
+        scheduler.time_until_next()
+    per_tick = (time.perf_counter() - start) / ticks
+
+    start = time.perf_counter()
+    clock[0] = SPREAD_SECONDS + 1
+    drained = len(scheduler.pop_due())
+    drain_time = time.perf_counter() - start
+    return schedule_time, per_tick, drained, drain_time
+
+
+def main(pending: int, ticks: int) -> None:
+    rng = random.Random(7)
+    envelopes = _envelopes(pending)
+    due_times = [rng.uniform(0, SPREAD_SECONDS) for _ in range(pending)]
+
+    print(f"Retry scheduling with {pending:,} pending retries due over {SPREAD_SECONDS:.0f}s")
+
+    schedule_time, heap_tick, drained, drain_time = _bench_heap(envelopes, due_times, ticks)
+    print(f"  heap: schedule all        {schedule_time * 1e3:>10.1f} ms ({schedule_time / pending * 1e6:.2f} us each)")
+    print(f"  heap: per wake-up         {heap_tick * 1e3:>10.3f} ms")
+    print(f"  heap: drain remaining     {drain_time * 1e3:>10.1f} ms ({drained:,} envelopes)")
+
+    legacy_tick = _bench_legacy(envelopes, due_times)
+    print(f"  list scan: per 500ms tick {legacy_tick * 1e3:>10.3f} ms")
+    print(f"  speedup per wake-up       {legacy_tick / max(heap_tick, 1e-9):>10.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pending", type=int, default=100000)
+    parser.add_argument("--ticks", type=int, default=20)
+    args = parser.parse_args()
+    main(args.pending, args.ticks)
@@ -0,0 +1,78 @@
+"""
+SQLite message bus throughput by group-commit batch size
+
+Persists N point-to-point messages (default 5000) from C concurrent senders
+into a fresh WAL database for each batch size, then registers a handler and
+times delivery (claim, handler call, batched ack) of the backlog. Batch
+size 1 is a commit per message; larger batches let concurrent senders share
+a transaction.
+
+Usage:
+    python benchmarks/sqlite_bus_throughput.py [--messages 5000] [--senders 64] [--batch-sizes 1,8,64,256]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from woodwork.core.message_bus.interface import create_component_message
+from woodwork.core.message_bus.sqlite_bus import SQLiteMessageBus
+
+
+async def _run(path: str, batch_size: int, messages: int, senders: int, synchronous: str):
+    bus = SQLiteMessageBus(path=path, batch_size=batch_size, synchronous=synchronous, claim_size=256)
+    await bus.start()
+
+    per_sender = messages // senders
+
+    async def sender(index: int):
+        for i in range(per_sender):
+            envelope = create_component_message("bench", "tool.call", {"i": i}, "tool", f"agent{index}")
+            await bus.send_to_component(envelope)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(sender(i) for i in range(senders)))
+    send_time = time.perf_counter() - start
+    sent = per_sender * senders
+    commits = bus.stats["commits"]
+
+    delivered = asyncio.Event()
+    count = [0]
+
+    def handler(envelope):
+        count[0] += 1
+        if count[0] == sent:
+            delivered.set()
+
+    start = time.perf_counter()
+    bus.register_component_handler("tool", handler)
+    await delivered.wait()
+    await bus._flush_writes()
+    deliver_time = time.perf_counter() - start
+
+    await bus.stop()
+    return sent, send_time, commits, deliver_time
+
+
+def main(messages: int, senders: int, batch_sizes, synchronous: str) -> None:
+    print(f"SQLite bus: {messages:,} messages from {senders} concurrent senders (synchronous={synchronous})")
+    print(f"  {'batch':>6} {'send msg/s':>12} {'commits':>8} {'deliver msg/s':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        for batch_size in batch_sizes:
+            path = os.path.join(directory, f"bus-{batch_size}.db")
+            sent, send_time, commits, deliver_time = asyncio.run(
+                _run(path, batch_size, messages, senders, synchronous)
+            )
+            print(f"  {batch_size:>6} {sent / send_time:>12,.0f} {commits:>8} {sent / deliver_time:>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--senders", type=int, default=64)
+    parser.add_argument("--batch-sizes", default="1,8,64,256")
+    parser.add_argument("--synchronous", default="NORMAL", choices=["OFF", "NORMAL", "FULL"])
+    args = parser.parse_args()
+    main(args.messages, args.senders, [int(size) for size in args.batch_sizes.split(",")], args.synchronous)
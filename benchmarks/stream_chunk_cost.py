@@ -0,0 +1,97 @@
+"""
+StreamChunk memory and throughput: slotted lazy chunks vs the eager dataclass
+
+"eager" is the previous StreamChunk layout (instance __dict__, a metadata
+dict per chunk, SHA-256 in __post_init__), reproduced here for comparison.
+Memory is the tracemalloc growth per retained chunk. Throughput is chunks
+per second for creation alone (the in-process path) and for creation plus
+to_dict() with each integrity mode (the serialized path).
+
+Usage:
+    python benchmarks/stream_chunk_cost.py [--chunks 50000] [--token-chars 4]
+"""
+
+import argparse
+import hashlib
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from woodwork.types.streaming_data import IntegrityMode, StreamChunk, StreamDataType
+
+
+@dataclass
+class EagerStreamChunk:
+    stream_id: str
+    chunk_index: int
+    data: Any
+    data_type: StreamDataType
+    is_final: bool = False
+    chunk_size: Optional[int] = None
+    checksum: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def __post_init__(self):
+        data = self.data.encode("utf-8")
+        self.chunk_size = len(data)
+        self.checksum = hashlib.sha256(data).hexdigest()[:16]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stream_id": self.stream_id, "chunk_index": self.chunk_index, "data": StreamChunk._serialize_data(self),
+            "data_type": self.data_type.value, "is_final": self.is_final, "chunk_size": self.chunk_size,
+            "checksum": self.checksum, "metadata": self.metadata, "timestamp": self.timestamp,
+        }
+
+
+def _bytes_per_chunk(make, chunks: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [make(i) for i in range(chunks)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / chunks
+
+
+def _per_second(func, chunks: int, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(chunks):
+            func(i)
+        best = min(best, time.perf_counter() - start)
+    return chunks / best
+
+
+def main(chunks: int, token_chars: int) -> None:
+    # Distinct token strings per chunk, as an LLM stream would produce
+    tokens = [f"{i:0{token_chars}d}"[-token_chars:] for i in range(chunks)]
+
+    def eager(i):
+        return EagerStreamChunk("stream-1", i, tokens[i], StreamDataType.TEXT)
+
+    def lazy(mode):
+        return lambda i: StreamChunk("stream-1", i, tokens[i], StreamDataType.TEXT, integrity=mode)
+
+    print(f"{'chunk':<16} {'bytes/chunk':>12} {'created/s':>12}")
+    print(f"{'eager sha256':<16} {_bytes_per_chunk(eager, chunks):>12.0f} {_per_second(eager, chunks):>12,.0f}")
+    make = lazy(IntegrityMode.SHA256)
+    print(f"{'slotted lazy':<16} {_bytes_per_chunk(make, chunks):>12.0f} {_per_second(make, chunks):>12,.0f}")
+
+    print()
+    print(f"{'serialized':<16} {'to_dict/s':>12}")
+    print(f"{'eager sha256':<16} {_per_second(lambda i: eager(i).to_dict(), chunks):>12,.0f}")
+    for mode in IntegrityMode:
+        make = lazy(mode)
+        print(f"{mode.value:<16} {_per_second(lambda i: make(i).to_dict(), chunks):>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=50000)
+    parser.add_argument("--token-chars", type=int, default=4)
+    args = parser.parse_args()
+    main(args.chunks, args.token_chars)
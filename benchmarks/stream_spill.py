@@ -0,0 +1,78 @@
+"""
+StreamManager spill-to-disk cost: memory-only stream vs stream with a memory limit
+
+Writes a large binary stream (a file read or audio, say) while the consumer
+is not reading, then reads it all back, so every chunk beyond the memory
+limit goes through a StreamSpill segment: binary-codec encode, checksum
+(per --integrity) and mmap write on the way out, mmap read and decode on
+the way back. The memory-only run holds every chunk in the ring instead.
+Reports write and read throughput and the peak memory the manager held.
+
+Usage:
+    python benchmarks/stream_spill.py [--chunks 4000] [--chunk-kb 16] [--memory-limit-kb 1024] [--integrity sha256]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from woodwork.core.simple_message_bus import SimpleMessageBus
+from woodwork.core.stream_manager import StreamManager
+from woodwork.types.streaming_data import StreamDataType
+
+
+async def _run(memory_limit, chunks: int, payload: bytes, integrity: str, spill_dir: str):
+    bus = SimpleMessageBus()
+    await bus.start()
+    manager = StreamManager(bus, integrity=integrity)
+    manager.spill_dir = spill_dir
+    total = chunks * len(payload)
+    manager.max_memory_usage = total + 1
+    manager.max_buffer_size = chunks + 1
+    manager.max_stream_bytes = total + 1
+
+    stream_id = await manager.create_stream(
+        "bench", "coding_env", "agent", StreamDataType.BINARY, memory_limit=memory_limit
+    )
+    peak = 0
+
+    start = time.perf_counter()
+    for i in range(chunks):
+        await manager.send_chunk(stream_id, payload, is_final=i == chunks - 1, wait=False)
+        peak = max(peak, manager.current_memory_usage)
+    write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    received = 0
+    async for chunk in manager.receive_stream(stream_id):
+        received += len(chunk.data)
+    read = time.perf_counter() - start
+    assert received == total, received
+
+    spilled = manager.stats["bytes_spilled"]
+    await manager.stop()
+    await bus.stop()
+    mb = total / (1024 * 1024)
+    return mb / write, mb / read, peak / (1024 * 1024), spilled / (1024 * 1024)
+
+
+async def main(chunks: int, chunk_kb: int, memory_limit_kb: int, integrity: str) -> None:
+    payload = os.urandom(chunk_kb * 1024)
+    print(f"{chunks} chunks of {chunk_kb} KiB ({chunks * chunk_kb / 1024:.0f} MiB), integrity {integrity}")
+    print(f"{'buffer':<14} {'write MiB/s':>12} {'read MiB/s':>12} {'peak MiB':>10} {'spilled MiB':>12}")
+    with tempfile.TemporaryDirectory() as spill_dir:
+        for label, limit in (("memory", None), (f"spill@{memory_limit_kb}K", memory_limit_kb * 1024)):
+            write, read, peak, spilled = await _run(limit, chunks, payload, integrity, spill_dir)
+            print(f"{label:<14} {write:>12,.0f} {read:>12,.0f} {peak:>10,.1f} {spilled:>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=4000)
+    parser.add_argument("--chunk-kb", type=int, default=16)
+    parser.add_argument("--memory-limit-kb", type=int, default=1024)
+    parser.add_argument("--integrity", default="sha256", choices=["none", "crc32", "fast", "sha256"])
+    args = parser.parse_args()
+    asyncio.run(main(args.chunks, args.chunk_kb, args.memory_limit_kb, args.integrity))
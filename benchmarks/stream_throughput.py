@@ -0,0 +1,64 @@
+"""
+StreamManager token throughput: in-process fast path vs serialized path
+
+Streams LLM-sized text tokens through one StreamManager and reads them back
+with receive_stream(). The local path hands chunk objects straight to the
+reader; the serialized path (local_delivery=False) pays for to_dict(), the
+SHA-256 checksum, the bus publish and from_dict() on every token, as a stream
+crossing a process boundary would. With --consumers N every token is read by
+N subscribers sharing the stream's ring.
+
+Usage:
+    python benchmarks/stream_throughput.py [--tokens 20000] [--token-chars 4] [--consumers 1]
+"""
+
+import argparse
+import asyncio
+import time
+
+from woodwork.core.simple_message_bus import SimpleMessageBus
+from woodwork.core.stream_manager import StreamManager
+
+
+async def _tokens_per_second(local: bool, tokens: int, token: str, consumers: int) -> float:
+    bus = SimpleMessageBus()
+    await bus.start()
+    manager = StreamManager(bus, local_delivery=local)
+    manager.max_buffer_size = tokens + 1
+
+    stream_id = await manager.create_stream("bench", "llm", "console")
+    for i in range(consumers):
+        manager.subscribe(stream_id, f"consumer-{i}")
+    start = time.perf_counter()
+
+    async def produce():
+        for i in range(tokens):
+            await manager.send_chunk(stream_id, token, is_final=i == tokens - 1)
+
+    async def consume(name):
+        count = 0
+        async for _ in manager.receive_stream(stream_id, subscriber=name):
+            count += 1
+        return count
+
+    _, *received = await asyncio.gather(produce(), *(consume(f"consumer-{i}") for i in range(consumers)))
+    elapsed = time.perf_counter() - start
+    assert received == [tokens] * consumers, received
+    await bus.stop()
+    return tokens / elapsed
+
+
+async def main(tokens: int, token_chars: int, consumers: int) -> None:
+    token = "x" * token_chars
+    print(f"{'path':<12} {'tokens/s':>12}")
+    for label, local in (("local", True), ("serialized", False)):
+        print(f"{label:<12} {await _tokens_per_second(local, tokens, token, consumers):>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=20000)
+    parser.add_argument("--token-chars", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args.tokens, args.token_chars, args.consumers))
@@ -0,0 +1,60 @@
+import asyncio
+
+from woodwork.core.bus_core import BusCore
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.simple_message_bus import SimpleMessageBus
+
+
+async def test_fan_out_mixes_sync_async_and_counts_failures():
+    core = BusCore()
+    received = []
+
+    async def async_subscriber(message):
+        await asyncio.sleep(0)
+        received.append(("async", message))
+
+    def sync_subscriber(message):
+        received.append(("sync", message))
+
+    def failing_subscriber(message):
+        raise RuntimeError("boom")
+
+    core.subscribe("agent.*", async_subscriber)
+    core.subscribe("agent.thought", sync_subscriber)
+    core.subscribe("agent.#", failing_subscriber)
+
+    delivered, failed = await core.fan_out("agent.thought", "m1")
+
+    assert (delivered, failed) == (2, 1)
+    assert received == [("async", "m1"), ("sync", "m1")]
+    assert core.stats == {"messages_published": 1, "messages_delivered": 2, "messages_failed": 1}
+
+
+def test_mailboxes_are_bounded_and_taken_once():
+    core = BusCore(mailbox_size=2)
+    for i in range(3):
+        core.enqueue("tool", i)
+
+    assert core.queued_count() == 2
+    assert core.take_mailbox("tool") == [1, 2]
+    assert core.take_mailbox("tool") == []
+    assert core.next_id() != core.next_id()
+
+
+async def test_buses_are_adapters_over_core():
+    simple = SimpleMessageBus()
+    await simple.start()
+    received = []
+    simple.subscribe("stream.>", received.append)
+    await simple.publish("stream.chunk", {"n": 1})
+
+    assert simple.component_handlers is simple.core.handlers
+    assert simple.stats is simple.core.stats
+    assert simple.stats["messages_delivered"] == 1
+    assert received[0]["data"] == {"n": 1}
+    await simple.stop()
+
+    in_memory = InMemoryMessageBus(max_queue_size=5)
+    assert in_memory.component_queues is in_memory.core.mailboxes
+    assert in_memory.component_handlers is in_memory.core.handlers
+    assert in_memory.stats is in_memory.core.stats
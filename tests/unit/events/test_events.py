@@ -86,3 +86,33 @@ async def test_hooks_on_once_off():
     once_count = sum(1 for c in calls if c[0] == "once")
     assert sync_count == 2
     assert once_count == 2
+
+
+async def test_bus_event_manager_registers_once_on_bus():
+    from woodwork.events import BusEventManager
+
+    bus = UnifiedEventBus()
+    manager = BusEventManager(bus)
+    calls = []
+
+    def hook(payload):
+        calls.append(("hook", payload.thought))
+
+    def pipe(payload):
+        calls.append(("pipe", payload.thought))
+        return payload
+
+    manager.on_hook("agent.thought", hook)
+    manager.on_pipe("agent.thought", pipe)
+    assert bus._hooks["agent.thought"] == [hook]
+    assert bus._pipes["agent.thought"] == [pipe]
+
+    await manager.emit("agent.thought", {"thought": "async"})
+    manager.emit_sync("agent.thought", {"thought": "sync"})
+    assert calls == [("hook", "async"), ("pipe", "async"), ("hook", "sync"), ("pipe", "sync")]
+
+    manager.off("agent.thought", hook)
+    await bus.emit("agent.thought", {"thought": "after off"})
+    assert calls[-1] == ("pipe", "after off")
+    assert ("hook", "after off") not in calls
+    assert bus.get_dispatch_plan("agent.thought").hook_count == 0
@@ -0,0 +1,88 @@
+"""Tests for the append-only event journal."""
+
+import os
+from woodwork.core.journal import EventJournal, JournalRecordKind, list_segments, read_journal
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.message_bus.interface import create_hook_message
+from woodwork.core.unified_event_bus import UnifiedEventBus
+from woodwork.types import AgentThoughtPayload
+
+
+class TestEventJournal:
+    """Test suite for EventJournal."""
+
+    def test_round_trip_across_segments(self, tmp_path):
+        """Test records survive segment rolls and come back in order."""
+        directory = str(tmp_path / "journal")
+        with EventJournal(directory, segment_size=256) as journal:
+            for i in range(20):
+                journal.record_emit("agent.thought", {"thought": f"step {i}"}, session_id="s1")
+            journal.record_delivery("agent", "console", "agent.response", {"response": "done"})
+
+        assert len(list_segments(directory)) > 1
+
+        records = list(read_journal(directory))
+        assert [r.payload["thought"] for r in records[:20]] == [f"step {i}" for i in range(20)]
+        assert records[-1].kind is JournalRecordKind.DELIVERY
+        assert (records[-1].source, records[-1].target) == ("agent", "console")
+        assert records[-1].session_id is None
+
+    def test_reader_ignores_preallocated_tail(self, tmp_path):
+        """Test an open segment can be read while it is still being written."""
+        directory = str(tmp_path / "journal")
+        journal = EventJournal(directory, segment_size=4096)
+        journal.record_emit("agent.thought", {"thought": "live"})
+        journal.flush()
+
+        assert os.path.getsize(list_segments(directory)[0]) == 4096
+        assert [r.payload["thought"] for r in read_journal(directory)] == ["live"]
+        journal.close()
+
+    def test_reopen_starts_new_segment(self, tmp_path):
+        """Test a new journal appends after existing segments."""
+        directory = str(tmp_path / "journal")
+        with EventJournal(directory) as journal:
+            journal.record_emit("agent.thought", {"thought": "first run"})
+        with EventJournal(directory) as journal:
+            journal.record_emit("agent.thought", {"thought": "second run"})
+
+        assert [r.payload["thought"] for r in read_journal(directory)] == ["first run", "second run"]
+
+
+class TestJournalReplay:
+    """Test suite for journaling and replay on the buses."""
+
+    async def test_unified_event_bus_replay(self, tmp_path):
+        """Test recorded emits are replayed through hooks for one session."""
+        directory = str(tmp_path / "journal")
+        journal = EventJournal(directory)
+        bus = UnifiedEventBus(journal=journal)
+
+        await bus.emit("agent.thought", AgentThoughtPayload(thought="a", component_id="agent"))
+        await bus.emit("input.received", {"input": "hello", "session_id": "s1"})
+        journal.close()
+
+        replay_bus = UnifiedEventBus()
+        received = []
+        replay_bus.register_hook("input.received", lambda payload: received.append(payload.input))
+
+        assert await replay_bus.replay_journal(directory, session_id="s1") == 1
+        assert received == ["hello"]
+
+    async def test_in_memory_bus_replay(self, tmp_path):
+        """Test published envelopes are recorded and can be re-published."""
+        directory = str(tmp_path / "journal")
+        bus = InMemoryMessageBus(journal=EventJournal(directory))
+        await bus.start()
+        await bus.publish(create_hook_message("s1", "agent.thought", {"thought": "x"}, "agent"))
+        await bus.stop()
+        bus.journal.close()
+
+        replay_bus = InMemoryMessageBus()
+        await replay_bus.start()
+        received = []
+        await replay_bus.subscribe("agent.thought", lambda envelope: received.append(envelope.payload))
+
+        assert await replay_bus.replay_journal(directory) == 1
+        assert received == [{"thought": "x"}]
+        await replay_bus.stop()
@@ -0,0 +1,107 @@
+"""Tests for latency histograms and metrics export."""
+
+import json
+import pytest
+from woodwork.core.metrics import LatencyHistogram, LatencyMetrics
+from woodwork.core.unified_event_bus import UnifiedEventBus
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_empty_histogram(self):
+        """Test an empty histogram reports zeros."""
+        stats = LatencyHistogram().snapshot()
+
+        assert stats["count"] == 0
+        assert stats["p99_ms"] == 0.0
+        assert stats["max_ms"] == 0.0
+
+    def test_percentiles_within_bucket_error(self):
+        """Test percentile estimates stay within the bucket resolution."""
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value / 10)  # 0.1ms .. 100ms
+
+        stats = histogram.snapshot()
+        assert stats["count"] == 1000
+        assert stats["max_ms"] == 100.0
+        assert stats["p50_ms"] == pytest.approx(50, rel=0.07)
+        assert stats["p90_ms"] == pytest.approx(90, rel=0.07)
+        assert stats["p99_ms"] == pytest.approx(99, rel=0.07)
+
+    def test_out_of_range_values(self):
+        """Test tiny and huge samples are clamped into edge buckets."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(1e9)
+
+        assert histogram.count == 2
+        assert histogram.percentile(1.0) == 1e9
+
+
+class TestLatencyMetrics:
+    """Test suite for LatencyMetrics export."""
+
+    @pytest.fixture
+    def metrics(self):
+        metrics = LatencyMetrics("woodwork_test", {"event": "event_type", "pipe": "pipe"})
+        metrics.observe("event", "agent.thought", 2.0)
+        metrics.observe("event", "agent.thought", 4.0)
+        return metrics
+
+    def test_callable_series_are_named(self, metrics):
+        """Test callable keys are reported by qualified name."""
+        def redact(payload):
+            return payload
+
+        metrics.observe("pipe", redact, 1.0)
+
+        names = list(metrics.snapshot()["pipe"])
+        assert names == [f"{__name__}.{redact.__qualname__}"]
+
+    def test_prometheus_export(self, metrics):
+        """Test Prometheus text export renders summaries in seconds."""
+        text = metrics.export("prometheus")
+
+        assert "# TYPE woodwork_test_event_latency_seconds summary" in text
+        assert 'woodwork_test_event_latency_seconds_count{event_type="agent.thought"} 2' in text
+        assert 'woodwork_test_event_latency_seconds_max{event_type="agent.thought"} 0.004' in text
+        assert "pipe_latency" not in text
+
+    def test_json_export(self, metrics):
+        """Test JSON export contains per-series snapshots."""
+        data = json.loads(metrics.export("json"))
+
+        assert data["latency"]["event"]["agent.thought"]["count"] == 2
+
+        with pytest.raises(ValueError):
+            metrics.export("xml")
+
+
+class TestEventBusLatency:
+    """Test suite for event bus latency instrumentation."""
+
+    async def test_event_hook_and_pipe_latency_recorded(self):
+        """Test emit records latency per event type, hook and pipe."""
+        bus = UnifiedEventBus()
+
+        async def audit_hook(payload):
+            pass
+
+        def passthrough_pipe(payload):
+            return payload
+
+        bus.register_hook("agent.thought", audit_hook)
+        bus.register_pipe("agent.thought", passthrough_pipe)
+
+        for _ in range(3):
+            await bus.emit("agent.thought", {"thought": "step"})
+        await bus.emit("agent.action", {"action": "unobserved"})
+
+        latency = bus.get_stats()["latency"]
+        assert latency["event"]["agent.thought"]["count"] == 3
+        assert "agent.action" not in latency["event"]
+        assert list(latency["hook"].values())[0]["count"] == 3
+        assert list(latency["pipe"].values())[0]["count"] == 3
+        assert 'event_type="agent.thought"' in bus.export_metrics()
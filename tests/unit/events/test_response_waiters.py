@@ -0,0 +1,66 @@
+"""Tests for future-based request/response correlation."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from woodwork.core.response_waiters import ResponseWaiters, deliver_response
+
+
+async def test_response_wakes_waiter_without_polling():
+    waiters = ResponseWaiters()
+    task = asyncio.create_task(waiters.wait("r1", timeout=5.0))
+    await asyncio.sleep(0)
+    assert "r1" in waiters
+
+    start = time.perf_counter()
+    assert waiters.resolve("r1", {"result": 42})
+    assert await task == {"result": 42}
+    assert time.perf_counter() - start < 0.01
+    assert len(waiters) == 0
+
+
+async def test_response_arriving_before_wait_is_returned_immediately():
+    waiters = ResponseWaiters()
+    waiters.resolve("r1", {"result": "early"})
+    assert await waiters.wait("r1", timeout=0.01) == {"result": "early"}
+    assert waiters.get_stats()["unclaimed"] == 0
+
+
+async def test_timeout_and_cancel_discard_late_responses():
+    waiters = ResponseWaiters()
+    with pytest.raises(TimeoutError):
+        await waiters.wait("slow", timeout=0.01)
+
+    task = asyncio.create_task(waiters.wait("cancelled", timeout=5.0))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not waiters.resolve("slow", {"result": "late"})
+    assert not waiters.resolve("cancelled", {"result": "late"})
+    stats = waiters.get_stats()
+    assert (stats["timeouts"], stats["cancelled"], stats["late_discarded"]) == (1, 1, 2)
+    assert stats["pending"] == stats["unclaimed"] == 0
+
+
+def test_unclaimed_responses_are_bounded():
+    waiters = ResponseWaiters(max_early=2)
+    for i in range(5):
+        waiters.resolve(f"r{i}", {"result": i})
+    assert "r4" in waiters and "r0" not in waiters
+    assert waiters.get_stats()["unclaimed"] == 2
+
+
+def test_deliver_response_falls_back_to_received_responses_dict():
+    component = Mock()
+    component._received_responses = {}
+    assert deliver_response(component, "r1", {"result": 1})
+    assert component._received_responses == {"r1": {"result": 1}}
+
+    component._response_waiters = ResponseWaiters()
+    deliver_response(component, "r2", {"result": 2})
+    assert "r2" in component._response_waiters
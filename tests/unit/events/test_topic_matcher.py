@@ -0,0 +1,75 @@
+"""Tests for wildcard topic matching."""
+
+import pytest
+from woodwork.core.topic_matcher import TopicTrie, is_wildcard_pattern
+
+
+class TestTopicTrie:
+    """Test suite for TopicTrie."""
+
+    @pytest.fixture
+    def trie(self):
+        return TopicTrie()
+
+    def test_exact_match(self, trie):
+        """Test exact topics only match themselves."""
+        trie.add("agent.thought", "a")
+
+        assert trie.match("agent.thought") == ("a",)
+        assert trie.match("agent.action") == ()
+        assert trie.match("agent") == ()
+
+    def test_single_segment_wildcard(self, trie):
+        """Test '*' matches exactly one segment."""
+        trie.add("agent.*", "a")
+
+        assert trie.match("agent.thought") == ("a",)
+        assert trie.match("agent") == ()
+        assert trie.match("agent.thought.extra") == ()
+
+    def test_multi_segment_wildcard(self, trie):
+        """Test '#' matches zero or more segments."""
+        trie.add("tool.#", "t")
+
+        assert trie.match("tool") == ("t",)
+        assert trie.match("tool.call") == ("t",)
+        assert trie.match("tool.call.result") == ("t",)
+        assert trie.match("agent.thought") == ()
+
+    def test_tail_wildcard(self, trie):
+        """Test '>' matches one or more trailing segments."""
+        trie.add("stream.>", "s")
+
+        assert trie.match("stream") == ()
+        assert trie.match("stream.chunk") == ("s",)
+        assert trie.match("stream.chunk.audio") == ("s",)
+
+    def test_tail_wildcard_must_be_last(self, trie):
+        """Test '>' is rejected anywhere but the last segment."""
+        with pytest.raises(ValueError):
+            trie.add("stream.>.chunk", "s")
+
+    def test_matches_preserve_registration_order(self, trie):
+        """Test values from different patterns come back in registration order."""
+        trie.add("agent.thought", "first")
+        trie.add("agent.*", "second")
+        trie.add("#", "third")
+
+        assert trie.match("agent.thought") == ("first", "second", "third")
+
+    def test_remove_invalidates_cache(self, trie):
+        """Test removing a subscription updates cached matches."""
+        trie.add("agent.*", "a")
+        assert trie.match("agent.thought") == ("a",)
+
+        assert trie.remove("agent.*", "a")
+        assert trie.match("agent.thought") == ()
+        assert len(trie) == 0
+        assert not trie.remove("agent.*", "a")
+
+    def test_is_wildcard_pattern(self):
+        """Test wildcard detection."""
+        assert is_wildcard_pattern("agent.*")
+        assert is_wildcard_pattern("tool.#")
+        assert is_wildcard_pattern("stream.>")
+        assert not is_wildcard_pattern("agent.thought")
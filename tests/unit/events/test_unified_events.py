@@ -220,4 +220,194 @@ class TestUnifiedEvents:
         result = await event_bus.emit("agent.thought", {"thought": "test"})
 
         # Should return original payload when pipe fails
-        assert result.thought == "test"
\ No newline at end of file
+        assert result.thought == "test"
+    def test_dispatch_plan_compiled_on_registration(self, event_bus):
+        """Test that registering listeners compiles a split dispatch plan."""
+        async def async_hook(payload):
+            pass
+
+        def sync_hook(payload):
+            pass
+
+        def sync_pipe(payload):
+            return payload
+
+        assert event_bus.get_dispatch_plan("agent.thought") is None
+
+        event_bus.register_hook("agent.thought", async_hook)
+        event_bus.register_hook("agent.thought", sync_hook)
+        event_bus.register_pipe("agent.thought", sync_pipe)
+
+        plan = event_bus.get_dispatch_plan("agent.thought")
+        assert plan.async_hooks == (async_hook,)
+        assert plan.executor_hooks == (sync_hook,)
+        assert plan.pipes == ((sync_pipe, False),)
+        assert plan.hook_count == 2
+        assert not plan.is_empty
+
+    async def test_emit_without_subscribers_uses_fast_path(self, event_bus):
+        """Test that events nobody subscribes to still return typed payloads."""
+        result = await event_bus.emit("agent.thought", {"thought": "unobserved"})
+
+        assert isinstance(result, AgentThoughtPayload)
+        assert result.thought == "unobserved"
+        assert event_bus.get_stats()["events_emitted"] == 1
+        assert event_bus.get_stats()["dispatch_plans"] == 0
+
+    async def test_wildcard_hook_receives_event_family(self, event_bus):
+        """Test that a single wildcard hook receives every event in a family."""
+        received = []
+
+        def family_hook(payload):
+            received.append(payload.__class__.__name__)
+
+        event_bus.register_hook("tool.*", family_hook)
+
+        await event_bus.emit("tool.call", {"tool": "test_tool", "args": {}})
+        await event_bus.emit("tool.observation", {"tool": "test_tool", "observation": "result"})
+        await event_bus.emit("agent.thought", {"thought": "not a tool event"})
+
+        assert received == ["ToolCallPayload", "ToolObservationPayload"]
+
+    async def test_detached_hook_does_not_stall_emit(self, event_bus):
+        """Test that a slow detached hook runs off the critical path."""
+        release = asyncio.Event()
+        received = []
+
+        async def slow_hook(payload):
+            await release.wait()
+            received.append(payload.thought)
+
+        event_bus.register_hook("agent.thought", slow_hook, mode="detached")
+
+        await asyncio.wait_for(event_bus.emit("agent.thought", {"thought": "step"}), timeout=0.5)
+        assert received == []
+
+        release.set()
+        await event_bus.drain_hooks()
+
+        assert received == ["step"]
+        assert event_bus.get_stats()["detached_hooks"]["agent.thought:" + slow_hook.__qualname__]["processed"] == 1
+        await event_bus.shutdown()
+
+    async def test_unregistered_detached_hook_stops_its_worker(self, event_bus):
+        """Test that unregistering a detached hook closes its worker and counts what it never handled."""
+        release = asyncio.Event()
+
+        async def blocked_hook(payload):
+            await release.wait()
+
+        event_bus.register_hook("agent.thought", blocked_hook, mode="detached")
+        for i in range(3):
+            await event_bus.emit("agent.thought", {"thought": f"step {i}"})
+        await asyncio.sleep(0)
+
+        detached = event_bus._detached_hooks[0]
+        worker = detached._worker
+        assert event_bus.unregister("agent.thought", blocked_hook)
+        await asyncio.wait_for(asyncio.gather(*event_bus._closing_hooks), timeout=0.5)
+
+        assert worker.done()
+        assert detached.stats["dropped"] == 2  # one was in flight, two still queued
+        assert "agent.thought:" + blocked_hook.__qualname__ not in event_bus.get_stats()["detached_hooks"]
+        await event_bus.shutdown()
+
+    async def test_detached_hook_drops_when_queue_full(self, event_bus):
+        """Test that a full detached hook queue drops events and counts them."""
+        release = asyncio.Event()
+
+        async def blocked_hook(payload):
+            await release.wait()
+
+        event_bus.register_hook("agent.thought", blocked_hook, mode="detached", queue_size=2, overflow="drop")
+
+        for i in range(5):
+            await event_bus.emit("agent.thought", {"thought": f"step {i}"})
+            await asyncio.sleep(0)
+
+        # One event is in flight, two are queued, the rest are dropped
+        assert event_bus.get_stats()["hooks_dropped"] == 2
+
+        release.set()
+        await event_bus.shutdown()
+
+    async def test_detached_hook_timeout_is_counted(self):
+        """Test that detached hooks exceeding their timeout are counted."""
+        event_bus = UnifiedEventBus(hook_mode="detached", hook_timeout=0.01)
+
+        async def hanging_hook(payload):
+            await asyncio.sleep(1)
+
+        def sync_hook(payload):
+            return None
+
+        event_bus.register_hook("agent.thought", hanging_hook)
+        event_bus.register_hook("agent.thought", sync_hook)
+
+        await event_bus.emit("agent.thought", {"thought": "step"})
+        await event_bus.drain_hooks()
+
+        stats = event_bus.get_stats()
+        assert stats["hook_timeouts"] == 1
+        assert stats["hooks_dropped"] == 0
+        assert sum(hook["processed"] for hook in stats["detached_hooks"].values()) == 1
+        await event_bus.shutdown()
+
+    async def test_session_lanes_isolate_sessions(self):
+        """Test that a slow session does not delay another and each stays ordered."""
+        event_bus = UnifiedEventBus(session_sharding=True)
+        release_slow = asyncio.Event()
+        received = []
+
+        async def target_input(text):
+            session_id, _ = text.split(":")
+            if session_id == "slow":
+                await release_slow.wait()
+            received.append(text)
+
+        target = Mock()
+        target.name = "agent"
+        target.config = {}
+        target.input = target_input
+        source = Mock()
+        source.name = "api"
+        source.to = "agent"
+        source.config = {}
+        event_bus.register_component(source)
+        event_bus.register_component(target)
+        event_bus.configure_routing()
+
+        def emit(session_id, text):
+            payload = InputReceivedPayload(input=f"{session_id}:{text}", session_id=session_id,
+                                           component_id="api", component_type="inputs")
+            return event_bus.post_from_component("api", "input.received", payload)
+
+        await emit("slow", "s1")
+        await emit("slow", "s2")
+        await emit("fast", "f1")
+        await asyncio.wait_for(event_bus.emit_from_component(
+            "api", "input.received",
+            InputReceivedPayload(input="fast:f2", session_id="fast", component_id="api", component_type="inputs")
+        ), timeout=0.5)
+
+        assert received == ["fast:f1", "fast:f2"]
+
+        release_slow.set()
+        await event_bus.shutdown()
+
+        assert received[2:] == ["slow:s1", "slow:s2"]
+        assert event_bus.get_stats()["session_lanes"]["lanes_created"] == 2
+
+    async def test_idle_session_lanes_expire(self):
+        """Test that idle session lanes are cleaned up."""
+        event_bus = UnifiedEventBus(session_sharding=True, session_idle_timeout=0.02)
+
+        await event_bus.emit_from_component("api", "input.received", {"input": "hi", "session_id": "s1"})
+        assert event_bus.get_stats()["session_lanes"]["active_lanes"] == 1
+
+        await asyncio.sleep(0.1)
+
+        lanes = event_bus.get_stats()["session_lanes"]
+        assert lanes["active_lanes"] == 0
+        assert lanes["lanes_expired"] == 1
+        await event_bus.shutdown()
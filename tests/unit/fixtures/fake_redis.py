@@ -0,0 +1,308 @@
+"""In-process Redis protocol fake covering the stream commands used by RedisStreamsMessageBus."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+StreamId = Tuple[int, int]
+MAX_ID = (2 ** 64, 0)
+
+
+class _Ok(str):
+    """Simple-string reply"""
+
+
+class _Error(str):
+    """Error reply"""
+
+
+@dataclass
+class _Group:
+    last_delivered: StreamId
+    # entry id -> [consumer, last delivery time (ms), delivery count]
+    pending: Dict[StreamId, list] = field(default_factory=dict)
+
+
+@dataclass
+class _Stream:
+    entries: List[Tuple[StreamId, List[str]]] = field(default_factory=list)
+    last_id: StreamId = (0, 0)
+    groups: Dict[str, _Group] = field(default_factory=dict)
+
+    def get(self, entry_id: StreamId) -> Optional[List[str]]:
+        for existing_id, fields in self.entries:
+            if existing_id == entry_id:
+                return fields
+        return None
+
+
+def _parse_id(value: str, default_seq: int = 0) -> StreamId:
+    if value == "-":
+        return (0, 0)
+    if value == "+":
+        return MAX_ID
+    ms, _, seq = value.partition("-")
+    return (int(ms), int(seq) if seq else default_seq)
+
+
+def _format_id(stream_id: StreamId) -> str:
+    return f"{stream_id[0]}-{stream_id[1]}"
+
+
+def _encode(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, _Error):
+        return b"-%s\r\n" % value.encode()
+    if isinstance(value, _Ok):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        data = value.encode(errors="surrogateescape")
+        return b"$%d\r\n%s\r\n" % (len(data), data)
+    return b"*%d\r\n" % len(value) + b"".join(_encode(item) for item in value)
+
+
+class FakeRedisServer:
+    """Speaks RESP2 on a local TCP port; keeps all data in memory"""
+
+    def __init__(self):
+        self.streams: Dict[str, _Stream] = {}
+        self.commands: List[str] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._changed: Optional[asyncio.Condition] = None
+        self.port = 0
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    async def start(self) -> None:
+        self._changed = asyncio.Condition()
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                args = await self._read_command(reader)
+                if args is None:
+                    break
+                self.commands.append(args[0].upper())
+                reply = await self._dispatch(args)
+                writer.write(_encode(reply))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> Optional[List[str]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2].decode(errors="surrogateescape"))
+        return args
+
+    async def _dispatch(self, args: List[str]) -> Any:
+        name, rest = args[0].upper(), args[1:]
+        handler = getattr(self, f"_cmd_{name.lower()}", None)
+        if handler is None:
+            return _Error(f"ERR unknown command '{name}'")
+        try:
+            return await handler(*rest)
+        except Exception as e:
+            return _Error(f"ERR {e}")
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _block(self, timeout_ms: int, read) -> Any:
+        """Call read() until it returns something or timeout_ms passes (0 = forever)"""
+        deadline = None if timeout_ms == 0 else time.monotonic() + timeout_ms / 1000
+        while True:
+            result = read()
+            if result:
+                return result
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            async with self._changed:
+                try:
+                    await asyncio.wait_for(self._changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    # Connection
+
+    async def _cmd_ping(self, *args):
+        return _Ok("PONG")
+
+    async def _cmd_auth(self, *args):
+        return _Ok("OK")
+
+    async def _cmd_select(self, *args):
+        return _Ok("OK")
+
+    # Streams
+
+    async def _cmd_xadd(self, key, *args):
+        args = list(args)
+        maxlen = None
+        if args[0].upper() == "MAXLEN":
+            args.pop(0)
+            if args[0] in ("~", "="):
+                args.pop(0)
+            maxlen = int(args.pop(0))
+        requested, fields = args[0], args[1:]
+
+        stream = self.streams.setdefault(key, _Stream())
+        if requested == "*":
+            ms = int(time.time() * 1000)
+            entry_id = (ms, 0) if ms > stream.last_id[0] else (stream.last_id[0], stream.last_id[1] + 1)
+        else:
+            entry_id = _parse_id(requested)
+        stream.entries.append((entry_id, fields))
+        stream.last_id = entry_id
+        if maxlen is not None and len(stream.entries) > maxlen:
+            del stream.entries[:len(stream.entries) - maxlen]
+        await self._notify()
+        return _format_id(entry_id)
+
+    async def _cmd_xgroup(self, subcommand, key, group, start_id, *options):
+        if subcommand.upper() != "CREATE":
+            return _Error("ERR unsupported XGROUP subcommand")
+        if key not in self.streams:
+            if "MKSTREAM" not in (option.upper() for option in options):
+                return _Error("ERR The XGROUP subcommand requires the key to exist")
+            self.streams[key] = _Stream()
+        stream = self.streams[key]
+        if group in stream.groups:
+            return _Error("BUSYGROUP Consumer Group name already exists")
+        stream.groups[group] = _Group(stream.last_id if start_id == "$" else _parse_id(start_id))
+        return _Ok("OK")
+
+    def _parse_read_options(self, args):
+        count, block, index = None, None, 0
+        while args[index].upper() != "STREAMS":
+            option = args[index].upper()
+            if option == "COUNT":
+                count = int(args[index + 1])
+                index += 2
+            elif option == "BLOCK":
+                block = int(args[index + 1])
+                index += 2
+            else:
+                index += 1
+        streams = args[index + 1:]
+        half = len(streams) // 2
+        return count, block, list(zip(streams[:half], streams[half:]))
+
+    async def _cmd_xread(self, *args):
+        count, block, keys = self._parse_read_options(args)
+        keys = [(key, self.streams[key].last_id if start == "$" and key in self.streams else
+                 (0, 0) if start == "$" else _parse_id(start)) for key, start in keys]
+
+        def read():
+            result = []
+            for key, after in keys:
+                stream = self.streams.get(key)
+                if stream is None:
+                    continue
+                entries = [[_format_id(i), f] for i, f in stream.entries if i > after][:count]
+                if entries:
+                    result.append([key, entries])
+            return result
+
+        return read() if block is None else await self._block(block, read)
+
+    async def _cmd_xreadgroup(self, _group_keyword, group, consumer, *args):
+        count, block, keys = self._parse_read_options(args)
+        for key, _ in keys:
+            if key not in self.streams or group not in self.streams[key].groups:
+                return _Error("NOGROUP No such key or consumer group")
+
+        def read():
+            result = []
+            now = int(time.time() * 1000)
+            for key, _ in keys:
+                stream = self.streams[key]
+                state = stream.groups[group]
+                entries = [(i, f) for i, f in stream.entries if i > state.last_delivered][:count]
+                if entries:
+                    state.last_delivered = entries[-1][0]
+                    for entry_id, _ in entries:
+                        state.pending[entry_id] = [consumer, now, 1]
+                    result.append([key, [[_format_id(i), f] for i, f in entries]])
+            return result
+
+        return read() if block is None else await self._block(block, read)
+
+    async def _cmd_xack(self, key, group, *ids):
+        state = self.streams.get(key, _Stream()).groups.get(group)
+        if state is None:
+            return 0
+        return sum(1 for entry_id in ids if state.pending.pop(_parse_id(entry_id), None) is not None)
+
+    async def _cmd_xpending(self, key, group, *args):
+        args = list(args)
+        min_idle = 0
+        if args[0].upper() == "IDLE":
+            min_idle = int(args[1])
+            args = args[2:]
+        start, end, count = _parse_id(args[0]), _parse_id(args[1]), int(args[2])
+        state = self.streams[key].groups[group]
+        now = int(time.time() * 1000)
+        result = []
+        for entry_id in sorted(state.pending):
+            consumer, delivered_at, deliveries = state.pending[entry_id]
+            idle = now - delivered_at
+            if start <= entry_id <= end and idle >= min_idle:
+                result.append([_format_id(entry_id), consumer, idle, deliveries])
+        return result[:count]
+
+    async def _cmd_xautoclaim(self, key, group, consumer, min_idle, start, *args):
+        count = int(args[1]) if args and args[0].upper() == "COUNT" else 100
+        stream = self.streams[key]
+        state = stream.groups[group]
+        now = int(time.time() * 1000)
+        claimed = []
+        for entry_id in sorted(state.pending):
+            if entry_id < _parse_id(start) or len(claimed) >= count:
+                continue
+            record = state.pending[entry_id]
+            if now - record[1] < int(min_idle):
+                continue
+            fields = stream.get(entry_id)
+            if fields is None:
+                del state.pending[entry_id]
+                continue
+            state.pending[entry_id] = [consumer, now, record[2] + 1]
+            claimed.append([_format_id(entry_id), fields])
+        return ["0-0", claimed, []]
+
+    async def _cmd_xrange(self, key, start, end, *args):
+        count = int(args[1]) if args else None
+        low, high = _parse_id(start), _parse_id(end)
+        entries = self.streams.get(key, _Stream()).entries
+        return [[_format_id(i), f] for i, f in entries if low <= i <= high][:count]
+
+    async def _cmd_xrevrange(self, key, end, start, *args):
+        count = int(args[1]) if args else None
+        low, high = _parse_id(start), _parse_id(end)
+        entries = self.streams.get(key, _Stream()).entries
+        return [[_format_id(i), f] for i, f in reversed(entries) if low <= i <= high][:count]
+
+    async def _cmd_xlen(self, key):
+        return len(self.streams.get(key, _Stream()).entries)
@@ -0,0 +1,94 @@
+"""Tests for DedupIndex and EXACTLY_ONCE delivery in InMemoryMessageBus."""
+
+import asyncio
+
+from woodwork.core.message_bus.dedup import BloomFilter, DedupIndex
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.message_bus.interface import MessageDeliveryMode, MessageEnvelope
+
+
+def _envelope(message_id: str) -> MessageEnvelope:
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type="tool.call",
+        payload={},
+        target_component="coding",
+        delivery_mode=MessageDeliveryMode.EXACTLY_ONCE,
+    )
+
+
+class TestDedupIndex:
+    def test_false_positive_rate_stays_near_target(self):
+        bloom = BloomFilter(capacity=10000, error_rate=0.01)
+        for i in range(10000):
+            bloom.add(f"in-{i}")
+        assert all(f"in-{i}" in bloom for i in range(10000))
+
+        false_positives = sum(f"out-{i}" in bloom for i in range(20000))
+        assert false_positives / 20000 < 0.02
+        assert 0.005 < bloom.false_positive_rate() < 0.02
+
+    def test_lru_then_bloom_then_forgotten_after_two_windows(self):
+        clock = [0.0]
+        index = DedupIndex(capacity=100, window_seconds=10, lru_size=2, clock=lambda: clock[0])
+        for message_id in ("a", "b", "c"):
+            index.add(message_id)
+
+        assert index.seen("c")  # exact LRU
+        assert index.seen("a")  # evicted from the LRU, still in the bloom filter
+        assert not index.seen("z")
+        assert index.stats["duplicates_exact"] == 1 and index.stats["duplicates_probable"] == 1
+
+        clock[0] = 11  # "a" moves to the previous generation
+        assert index.seen("a")
+        clock[0] = 22  # and is dropped with it
+        assert not index.seen("a")
+
+    def test_memory_is_constant(self):
+        index = DedupIndex(capacity=1000, lru_size=100)
+        size = index.memory_bytes()
+        for i in range(50000):
+            index.add(f"m{i}")
+        assert index.memory_bytes() == size
+        assert index.get_stats()["lru_entries"] == 100
+
+
+async def test_retry_of_handled_message_is_suppressed():
+    bus = InMemoryMessageBus()
+    await bus.start()
+    calls = []
+    bus.register_component_handler("coding", lambda envelope: calls.append(envelope.message_id))
+    try:
+        envelope = _envelope("write-1")
+        assert await bus.send_to_component(envelope)
+        # e.g. the sender timed out waiting for a response and re-sent
+        assert await bus.send_to_component(envelope)
+        assert calls == ["write-1"]
+        assert bus.stats["duplicates_suppressed"] == 1
+        assert "false_positive_rate" in bus.get_stats()["dedup"]["coding"]
+    finally:
+        await bus.stop()
+
+
+async def test_failed_attempt_is_not_recorded():
+    bus = InMemoryMessageBus(retry_base_delay=0.01, retry_jitter=0.0)
+    await bus.start()
+    calls = []
+
+    def flaky(envelope):
+        calls.append(envelope.retry_count)
+        if len(calls) == 1:
+            raise RuntimeError("disk full")
+
+    bus.register_component_handler("coding", flaky)
+    try:
+        assert not await bus.send_to_component(_envelope("write-1"))
+        for _ in range(100):
+            if len(calls) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert calls == [0, 1]
+        assert bus.stats["duplicates_suppressed"] == 0
+    finally:
+        await bus.stop()
@@ -128,6 +128,18 @@ class TestInMemoryMessageBus:
         assert len(message_bus.topic_subscribers.get("test_event", set())) == 0
         assert message_bus.stats["active_subscriptions"] == 0
 
+    async def test_publish_to_wildcard_subscription(self, message_bus):
+        """Test wildcard subscriptions receive matching topics only."""
+        handler = AsyncMock()
+        await message_bus.subscribe("agent.*", handler)
+
+        matching = MockMessageEnvelope(event_type="agent.thought")
+        other = MockMessageEnvelope(event_type="tool.call")
+        await message_bus.publish(matching)
+        await message_bus.publish(other)
+
+        handler.assert_called_once_with(matching)
+
     async def test_handler_execution_error(self, message_bus, test_message):
         """Test error handling when handler throws exception."""
         handler = Mock(side_effect=Exception("Handler error"))
@@ -261,4 +273,40 @@ class TestInMemoryMessageBusCleanup:
         # Give time for async delivery
         await asyncio.sleep(0.01)
 
-        assert message_bus.stats["queued_messages"] == 0
\ No newline at end of file
+        assert message_bus.stats["queued_messages"] == 0
+
+class TestQueuedMessageExpiry:
+    """Expiry index over queued envelopes."""
+
+    @staticmethod
+    def _envelope(message_id, ttl_seconds, created_at):
+        from woodwork.core.message_bus.interface import MessageEnvelope
+        return MessageEnvelope(
+            message_id=message_id, session_id="s1", event_type="tool.call", payload={},
+            target_component="offline_tool", created_at=created_at, ttl_seconds=ttl_seconds,
+        )
+
+    async def test_expired_messages_are_dead_lettered_in_expiry_order(self):
+        bus = InMemoryMessageBus()
+        bus.running = True
+        for message_id, ttl in (("a", 10), ("b", 5), ("c", 100)):
+            await bus.send_to_component(self._envelope(message_id, ttl, created_at=1000.0))
+
+        assert bus.stats["queued_messages"] == 3
+        assert bus.expire_queued_messages(now=1011.0) == 2
+
+        assert [m.message_id for m in bus.component_queues["offline_tool"]] == ["c"]
+        assert bus.stats["queued_messages"] == 1
+        assert [d["envelope"]["message_id"] for d in bus.dead_letter_queue] == ["b", "a"]
+
+    async def test_delivered_messages_are_skipped_lazily(self):
+        bus = InMemoryMessageBus()
+        bus.running = True
+        await bus.send_to_component(self._envelope("a", 5, created_at=1000.0))
+        bus.register_component_handler("offline_tool", AsyncMock())
+        await asyncio.sleep(0)
+
+        assert bus.stats["queued_messages"] == 0
+        assert bus.expire_queued_messages(now=2000.0) == 0
+        assert not bus.dead_letter_queue
+        assert not bus._expiry_heap
@@ -0,0 +1,107 @@
+"""Tests for per-subscriber mailbox delivery in InMemoryMessageBus."""
+
+import asyncio
+import time
+
+import pytest
+
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.message_bus.interface import MessageEnvelope, MessagePattern
+
+
+def _envelope(message_id: str, target: str = None) -> MessageEnvelope:
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type="agent.thought",
+        payload={},
+        target_component=target,
+        pattern=MessagePattern.POINT_TO_POINT if target else MessagePattern.PUBLISH_SUBSCRIBE,
+    )
+
+
+@pytest.fixture
+async def mailbox_bus():
+    bus = InMemoryMessageBus(delivery_mode="mailbox", mailbox_size=2, mailbox_overflow="dead_letter")
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+async def test_slow_subscriber_does_not_delay_publisher_or_others():
+    mailbox_bus = InMemoryMessageBus(delivery_mode="mailbox")
+    await mailbox_bus.start()
+    received = []
+    release = asyncio.Event()
+
+    async def slow(envelope):
+        await release.wait()
+        received.append(("slow", envelope.message_id))
+
+    async def fast(envelope):
+        received.append(("fast", envelope.message_id))
+
+    await mailbox_bus.subscribe("agent.thought", slow)
+    await mailbox_bus.subscribe("agent.thought", fast)
+
+    start = time.perf_counter()
+    for i in range(3):
+        assert await mailbox_bus.publish(_envelope(f"m{i}"))
+    assert time.perf_counter() - start < 0.1
+
+    await asyncio.sleep(0.01)
+    assert received == [("fast", "m0"), ("fast", "m1"), ("fast", "m2")]
+
+    stats = mailbox_bus.get_stats()["mailboxes"]
+    slow_stats = next(s for name, s in stats.items() if name.startswith("agent.thought#") and s["delivered"] == 0)
+    assert slow_stats["depth"] == 2  # one in flight, two waiting
+
+    release.set()
+    await mailbox_bus.drain_mailboxes()
+    assert [m for kind, m in received if kind == "slow"] == ["m0", "m1", "m2"]
+    assert mailbox_bus.stats["messages_delivered"] == 6
+    await mailbox_bus.stop()
+
+
+async def test_full_mailbox_dead_letters_new_envelopes(mailbox_bus):
+    release = asyncio.Event()
+
+    async def stuck(envelope):
+        await release.wait()
+
+    mailbox_bus.register_component_handler("tool", stuck)
+    for i in range(4):
+        await mailbox_bus.send_to_component(_envelope(f"m{i}", target="tool"))
+        await asyncio.sleep(0)
+
+    # m0 in flight, m1 and m2 queued, m3 rejected
+    stats = mailbox_bus.get_stats()["mailboxes"]["component:tool"]
+    assert stats["depth"] == 2
+    assert stats["dead_lettered"] == 1
+    assert [d["envelope"]["message_id"] for d in mailbox_bus.dead_letter_queue] == ["m3"]
+    release.set()
+
+
+async def test_drop_oldest_and_per_call_mode():
+    bus = InMemoryMessageBus(mailbox_size=1, mailbox_overflow="drop_oldest")
+    await bus.start()
+    received = []
+    release = asyncio.Event()
+
+    async def handler(envelope):
+        await release.wait()
+        received.append(envelope.message_id)
+
+    bus.register_component_handler("tool", handler, mode="mailbox")
+    try:
+        for i in range(3):
+            await bus.send_to_component(_envelope(f"m{i}", target="tool"))
+            await asyncio.sleep(0)
+
+        release.set()
+        await bus.drain_mailboxes()
+        assert received == ["m0", "m2"]
+        assert bus.get_stats()["mailboxes"]["component:tool"]["dropped"] == 1
+        assert bus.get_stats()["mailboxes"]["component:tool"]["max_lag_ms"] > 0
+    finally:
+        await bus.stop()
@@ -0,0 +1,148 @@
+"""Tests for priority lanes and deadlines on the message buses."""
+
+import asyncio
+import time
+
+from woodwork.core.message_bus.codec import BinaryCodec
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.message_bus.interface import MessageEnvelope
+from woodwork.core.priority_lanes import LanePolicy, LaneQueue, MessagePriority, PriorityLanes, order_by_lane
+from woodwork.core.simple_message_bus import SimpleMessageBus
+
+
+def _envelope(message_id: str, event_type: str, **kwargs) -> MessageEnvelope:
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type=event_type,
+        payload={},
+        target_component="consumer",
+        **kwargs,
+    )
+
+
+def test_topics_are_classified_into_lanes():
+    policy = LanePolicy()
+    assert policy.classify("agent.error") is MessagePriority.CONTROL
+    assert policy.classify("tool.call.cancel") is MessagePriority.CONTROL
+    assert policy.classify("stream.failed") is MessagePriority.CONTROL
+    assert policy.classify("stream.chunk") is MessagePriority.BULK
+    assert policy.classify("agent.thought") is MessagePriority.INTERACTIVE
+    assert policy.lane_of("bulk", "agent.error") is MessagePriority.BULK
+
+
+def test_weighted_round_robin_does_not_starve_bulk():
+    lanes = PriorityLanes({MessagePriority.CONTROL: 2, MessagePriority.INTERACTIVE: 1, MessagePriority.BULK: 1})
+    for i in range(4):
+        lanes.push(MessagePriority.BULK, f"b{i}")
+        lanes.push(MessagePriority.CONTROL, f"c{i}")
+
+    order = [lanes.pop()[1] for _ in range(len(lanes))]
+    assert order == ["c0", "c1", "b0", "c2", "c3", "b1", "b2", "b3"]
+
+    assert order_by_lane(["stream.chunk", "agent.error"], LanePolicy().classify) == ["agent.error", "stream.chunk"]
+
+
+def test_envelope_priority_and_deadline_round_trip():
+    envelope = _envelope("m1", "agent.thought", priority=MessagePriority.CONTROL, deadline=time.time() + 5)
+    assert MessageEnvelope.from_dict(envelope.to_dict()) == envelope
+    assert BinaryCodec().decode_envelope(BinaryCodec().encode_envelope(envelope)) == envelope
+
+    late = _envelope("m2", "agent.thought", deadline=time.time() - 1)
+    assert late.is_past_deadline()
+    assert not late.can_retry()
+
+
+async def test_lane_queue_blocks_when_full_and_joins_when_done():
+    queue = LaneQueue(lambda item: MessagePriority.CONTROL if item.startswith("c") else MessagePriority.BULK, 2)
+    queue.put_nowait("b0")
+    queue.put_nowait("b1")
+    blocked = asyncio.create_task(queue.put("c0"))
+    await asyncio.sleep(0)
+    assert not blocked.done() and queue.full()
+
+    assert queue.get_nowait() == "b0"
+    await asyncio.wait_for(blocked, 0.5)
+    assert [await queue.get(), await queue.get()] == ["c0", "b1"]
+
+    waiting = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    queue.put_nowait("c1")
+    assert await asyncio.wait_for(waiting, 0.5) == "c1"
+
+    joined = asyncio.create_task(queue.join())
+    for _ in range(3):
+        await asyncio.sleep(0)
+        assert not joined.done()
+        queue.task_done()
+    queue.task_done()
+    await asyncio.wait_for(joined, 0.5)
+
+
+async def test_control_overtakes_queued_bulk_in_mailbox():
+    bus = InMemoryMessageBus(delivery_mode="mailbox")
+    await bus.start()
+    received = []
+    release = asyncio.Event()
+
+    async def consumer(envelope):
+        await release.wait()
+        received.append(envelope.message_id)
+
+    bus.register_component_handler("consumer", consumer)
+    try:
+        await bus.send_to_component(_envelope("chunk0", "stream.chunk"))
+        await asyncio.sleep(0.01)  # chunk0 is now in flight
+        for i in (1, 2):
+            await bus.send_to_component(_envelope(f"chunk{i}", "stream.chunk"))
+        await bus.send_to_component(_envelope("error", "agent.error"))
+
+        lane_depths = bus.get_stats()["mailboxes"]["component:consumer"]["lane_depths"]
+        assert lane_depths == {"control": 1, "interactive": 0, "bulk": 2}
+
+        release.set()
+        await bus.drain_mailboxes()
+        assert received == ["chunk0", "error", "chunk1", "chunk2"]
+        assert bus.get_stats()["lanes"]["bulk"]["delivered"] == 3
+        assert bus.get_stats()["latency"]["lane"]["control"]["count"] == 1
+    finally:
+        await bus.stop()
+
+
+async def test_messages_past_deadline_are_dropped_before_delivery():
+    bus = InMemoryMessageBus()
+    await bus.start()
+    received = []
+    try:
+        assert not await bus.send_to_component(_envelope("late", "tool.call", deadline=time.time() - 1))
+        await bus.send_to_component(_envelope("queued", "tool.call", deadline=time.time() + 0.02))
+        await bus.send_to_component(_envelope("ok", "tool.call"))
+        await asyncio.sleep(0.05)
+
+        bus.register_component_handler("consumer", lambda envelope: received.append(envelope.message_id))
+        await asyncio.sleep(0.01)
+
+        assert received == ["ok"]
+        stats = bus.get_stats()
+        assert stats["messages_deadline_dropped"] == 2
+        assert stats["lanes"]["interactive"]["deadline_dropped"] == 2
+        assert stats["messages_dead_lettered"] == 0
+    finally:
+        await bus.stop()
+
+
+async def test_simple_bus_drops_late_messages_and_orders_queued_by_lane():
+    bus = SimpleMessageBus()
+    await bus.start()
+    received = []
+    await bus.publish("agent.thought", {}, deadline=time.time() - 1)
+    assert bus.get_stats()["messages_deadline_dropped"] == 1
+
+    await bus.send_to_component("consumer", {"event_type": "stream.chunk"})
+    await bus.send_to_component("consumer", {"event_type": "stream.failed"})
+    bus.register_component_handler("consumer", lambda message: received.append(message["priority"]))
+    await asyncio.sleep(0.01)
+
+    assert received == ["control", "bulk"]
+    assert bus.get_stats()["lane_latency"]["bulk"]["count"] == 1
+    await bus.stop()
@@ -0,0 +1,146 @@
+"""Tests for the Redis Streams message bus, run against an in-process Redis protocol fake."""
+
+import asyncio
+
+import pytest
+
+from tests.unit.fixtures.fake_redis import FakeRedisServer
+from woodwork.core.message_bus.factory import MessageBusFactory
+from woodwork.core.message_bus.interface import MessageEnvelope
+from woodwork.core.message_bus.redis_bus import RedisStreamsMessageBus
+from woodwork.core.message_bus.redis_client import RedisConnectionPool
+
+
+def _envelope(message_id: str, event_type: str = "tool.call", target: str = None) -> MessageEnvelope:
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type=event_type,
+        payload={"id": message_id},
+        target_component=target,
+    )
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+async def redis_server():
+    server = FakeRedisServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def make_bus(redis_server):
+    buses = []
+
+    async def make(**kwargs):
+        bus = RedisStreamsMessageBus(redis_url=redis_server.url, block_ms=20, **kwargs)
+        await bus.start()
+        buses.append(bus)
+        return bus
+
+    yield make
+    for bus in buses:
+        await bus.stop()
+
+
+def test_pool_parses_url():
+    pool = RedisConnectionPool("redis://:s%40cret@cache.internal:6380/2")
+    assert (pool.host, pool.port, pool.password, pool.db) == ("cache.internal", 6380, "s@cret", 2)
+
+
+async def test_sends_are_pipelined_and_split_across_consumers(make_bus, redis_server):
+    first, second = await make_bus(), await make_bus()
+    received = {"first": [], "second": []}
+    first.register_component_handler("tool", lambda e: received["first"].append(e.message_id))
+
+    results = await asyncio.gather(*(first.send_to_component(_envelope(f"m{i}", target="tool")) for i in range(20)))
+    assert all(results)
+    assert first.stats["pipelines"] == 1  # 20 XADDs in one round trip
+
+    second.register_component_handler("tool", lambda e: received["second"].append(e.message_id))
+    await _wait_for(lambda: len(received["first"]) + len(received["second"]) == 20)
+    assert sorted(received["first"] + received["second"], key=lambda m: int(m[1:])) == [f"m{i}" for i in range(20)]
+    await _wait_for(lambda: not redis_server.streams["woodwork:component:tool"].groups["components"].pending)
+
+
+async def test_publish_fans_out_to_every_process(make_bus):
+    first, second = await make_bus(), await make_bus()
+    received = []
+    await first.subscribe("agent.*", lambda e: received.append(("first", e.message_id)))
+    await second.subscribe("agent.thought", lambda e: received.append(("second", e.message_id)))
+
+    assert await first.publish(_envelope("h1", event_type="agent.thought"))
+    assert await first.publish(_envelope("h2", event_type="tool.call"))
+    await _wait_for(lambda: len(received) == 2)
+    await asyncio.sleep(0.05)
+    assert sorted(received) == [("first", "h1"), ("second", "h1")]
+
+
+async def test_binary_codec_round_trips_through_redis(make_bus):
+    bus = await make_bus(codec="binary")
+    received = []
+    bus.register_component_handler("tool", received.append)
+    await bus.subscribe("tool.call", received.append)
+
+    envelope = _envelope("b1", target="tool")
+    envelope.payload["blob"] = bytes(range(256))
+    assert await bus.send_to_component(envelope)
+    assert await bus.publish(_envelope("b2"))
+    await _wait_for(lambda: len(received) == 2)
+
+    by_id = {e.message_id: e for e in received}
+    assert by_id["b1"].payload["blob"] == bytes(range(256))
+    assert by_id["b2"].payload == {"id": "b2"}
+
+
+async def test_undecodable_entry_is_dead_lettered_without_holding_up_the_batch(make_bus, redis_server):
+    bus = await make_bus()
+    pool = RedisConnectionPool(redis_server.url)
+    stream = bus.component_stream("tool")
+    await pool.execute("XADD", stream, "*", "data", "not json")
+    await pool.execute("XADD", stream, "*", "data", bus.codec.encode_envelope(_envelope("m1", target="tool")))
+
+    received = []
+    bus.register_component_handler("tool", lambda e: received.append(e.message_id))
+    await _wait_for(lambda: received == ["m1"])
+
+    assert bus.stats["messages_dead_lettered"] == 1
+    dead = redis_server.streams["woodwork:dead"].entries
+    assert len(dead) == 1 and dead[0][1][3] == "not json" and "Undecodable" in dead[0][1][5]
+    await _wait_for(lambda: not redis_server.streams[stream].groups["components"].pending)
+    await pool.close()
+
+
+async def test_failed_message_is_reclaimed_then_dead_lettered(make_bus, redis_server):
+    bus = await make_bus(claim_idle_ms=0, claim_interval=3600, max_retries=2)
+    attempts = []
+
+    def flaky(envelope):
+        attempts.append(envelope.retry_count)
+        raise RuntimeError("boom")
+
+    bus.register_component_handler("tool", flaky)
+    assert await bus.send_to_component(_envelope("m1", target="tool"))
+    await _wait_for(lambda: attempts == [0])
+
+    assert await bus.claim_stale("tool") == 1
+    assert await bus.claim_stale("tool") == 1
+    assert attempts == [0, 1, 2]
+    assert await bus.claim_stale("tool") == 0  # first delivery + 2 retries used up
+    assert bus.stats["messages_dead_lettered"] == 1
+    dead = redis_server.streams["woodwork:dead"].entries
+    assert len(dead) == 1 and "m1" in dead[0][1][3]
+
+
+async def test_factory_creates_redis_bus(redis_server):
+    bus = MessageBusFactory.create_message_bus({"type": "redis", "redis_url": redis_server.url})
+    assert isinstance(bus, RedisStreamsMessageBus)
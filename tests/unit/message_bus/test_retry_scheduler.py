@@ -0,0 +1,71 @@
+"""Tests for RetryScheduler and heap-driven retries in InMemoryMessageBus."""
+
+import asyncio
+
+from woodwork.core.message_bus.in_memory_bus import InMemoryMessageBus
+from woodwork.core.message_bus.interface import MessageEnvelope
+from woodwork.core.message_bus.retry_scheduler import RetryScheduler
+
+
+def _envelope(message_id: str, retry_count: int = 1, target: str = "tool") -> MessageEnvelope:
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type="tool.call",
+        payload={},
+        target_component=target,
+        retry_count=retry_count,
+    )
+
+
+class TestRetryScheduler:
+    def test_backoff_doubles_up_to_max(self):
+        scheduler = RetryScheduler(base_delay=1.0, max_delay=5.0, jitter=0.0)
+        assert [scheduler.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_stays_within_bounds(self):
+        low = RetryScheduler(base_delay=1.0, jitter=0.2, rng=lambda: 0.0)
+        high = RetryScheduler(base_delay=1.0, jitter=0.2, rng=lambda: 0.999999)
+        assert low.backoff(1) == 0.8
+        assert 1.19 < high.backoff(1) <= 1.2
+
+    def test_pops_due_in_due_order_measured_from_schedule_time(self):
+        clock = [100.0]
+        scheduler = RetryScheduler(base_delay=1.0, jitter=0.0, clock=lambda: clock[0])
+
+        assert scheduler.schedule(_envelope("late", retry_count=3))  # due at 104
+        assert scheduler.schedule(_envelope("early", retry_count=1))  # due at 101, now earliest
+        assert not scheduler.schedule(_envelope("mid", retry_count=2))  # due at 102
+
+        assert scheduler.time_until_next() == 1.0
+        clock[0] = 102.0
+        assert [e.message_id for e in scheduler.pop_due()] == ["early", "mid"]
+        assert len(scheduler) == 1
+        assert scheduler.time_until_next() == 2.0
+
+
+async def test_bus_retries_failed_send_after_backoff():
+    bus = InMemoryMessageBus(retry_base_delay=0.05, retry_jitter=0.0)
+    await bus.start()
+    attempts = []
+
+    def flaky_handler(envelope):
+        attempts.append(envelope.retry_count)
+        if len(attempts) < 3:
+            raise RuntimeError("not yet")
+
+    bus.register_component_handler("tool", flaky_handler)
+    try:
+        assert not await bus.send_to_component(_envelope("m1", retry_count=0))
+        assert len(bus.retry_queue) == 1
+
+        for _ in range(100):
+            if len(attempts) == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        assert attempts == [0, 1, 2]
+        assert len(bus.retry_queue) == 0
+        assert bus.stats["messages_retried"] == 2
+    finally:
+        await bus.stop()
@@ -0,0 +1,148 @@
+"""Tests for the Unix domain socket broker and SocketMessageBus."""
+
+import asyncio
+
+import pytest
+
+from woodwork.core.message_bus.factory import MessageBusFactory
+from woodwork.core.message_bus.interface import MessageEnvelope
+from woodwork.core.message_bus.socket_bus import (
+    SHM_FLAG, SHM_REF, FrameKind, SocketBroker, SocketMessageBus, encode_frame, unlink_shm,
+)
+
+
+def _envelope(message_id: str, event_type: str = "agent.thought", target: str = None, payload=None):
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type=event_type,
+        payload=payload or {},
+        target_component=target,
+    )
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+async def broker(tmp_path):
+    broker = SocketBroker(str(tmp_path / "bus.sock"))
+    await broker.start()
+    yield broker
+    await broker.stop()
+
+
+@pytest.fixture
+async def clients(broker):
+    buses = [SocketMessageBus(broker.path, spawn_broker=False) for _ in range(2)]
+    for bus in buses:
+        await bus.start()
+    yield buses
+    for bus in buses:
+        await bus.stop()
+
+
+async def test_publish_reaches_subscribers_in_other_clients(clients):
+    producer, consumer = clients
+    received = []
+    await consumer.subscribe("agent.*", lambda envelope: received.append(envelope.message_id))
+    await consumer.subscribe("agent.thought", lambda envelope: received.append("exact:" + envelope.message_id))
+    await asyncio.sleep(0.05)
+
+    for i in range(3):
+        assert await producer.publish(_envelope(f"m{i}"))
+
+    await _wait_for(lambda: len(received) == 6)
+    assert [m for m in received if not m.startswith("exact:")] == ["m0", "m1", "m2"]
+    assert consumer.stats["messages_received"] == 3  # one frame per message despite two patterns
+
+
+async def test_send_is_queued_until_component_registers(clients, broker):
+    producer, consumer = clients
+    assert await producer.send_to_component(_envelope("m1", target="tool"))
+    await _wait_for(lambda: broker.stats["frames_queued"] == 1)
+
+    received = []
+    consumer.register_component_handler("tool", lambda envelope: received.append(envelope.message_id))
+    await _wait_for(lambda: received == ["m1"])
+
+
+async def test_large_payload_goes_through_shared_memory(clients):
+    producer, consumer = clients
+    received = []
+    consumer.register_component_handler("embedder", lambda envelope: received.append(envelope.payload["text"]))
+    await asyncio.sleep(0.05)
+
+    text = "x" * 200_000
+    assert await producer.send_to_component(_envelope("big", target="embedder", payload={"text": text}))
+    await _wait_for(lambda: received)
+    assert received == [text]
+    assert producer.stats["shm_handoffs"] == 1
+
+
+async def test_factory_spawns_broker_process(tmp_path):
+    bus = MessageBusFactory.create_message_bus({"type": "socket", "path": str(tmp_path / "bus.sock")})
+    assert isinstance(bus, SocketMessageBus)
+    await bus.start()
+    received = []
+    try:
+        assert bus.broker_process is not None
+        await bus.subscribe("ping", lambda envelope: received.append(envelope.message_id))
+        assert await bus.publish(_envelope("p1", event_type="ping"))
+        await _wait_for(lambda: received == ["p1"])
+    finally:
+        await bus.stop()
+    # The spawned broker exits once its last client leaves
+    assert bus.broker_process.wait(timeout=5) == 0
+
+
+async def test_second_broker_refuses_a_socket_in_use(broker):
+    with pytest.raises(RuntimeError, match="already listening"):
+        await SocketBroker(broker.path).start()
+
+    # The running broker still owns the socket
+    bus = SocketMessageBus(broker.path, spawn_broker=False)
+    await bus.start()
+    await bus.stop()
+
+
+async def test_unreadable_frame_is_discarded_and_reading_continues(clients):
+    producer, consumer = clients
+    received = []
+    consumer.register_component_handler("tool", lambda envelope: received.append(envelope.message_id))
+    await asyncio.sleep(0.05)
+
+    producer._write_frame(FrameKind.SEND, "tool", b"not an envelope")
+    producer._write_frame(FrameKind.SEND | SHM_FLAG, "tool", SHM_REF.pack(10) + b"/woodwork-missing")
+    assert await producer.send_to_component(_envelope("m1", target="tool"))
+
+    await _wait_for(lambda: received == ["m1"])
+    assert consumer.stats["frames_discarded"] == 2
+    assert consumer.is_healthy()
+
+
+async def test_segments_handed_to_a_client_that_drops_are_unlinked(clients, broker):
+    producer, consumer = clients
+    received = []
+    consumer.register_component_handler("embedder", lambda envelope: received.append(envelope.message_id))
+
+    # A peer that registers a component and disconnects without reading anything
+    reader, writer = await asyncio.open_unix_connection(broker.path)
+    writer.write(encode_frame(FrameKind.REGISTER, "silent"))
+    await asyncio.sleep(0.05)
+
+    payload = {"text": "x" * 200_000}
+    assert await producer.send_to_component(_envelope("read", target="embedder", payload=payload))
+    assert await producer.send_to_component(_envelope("lost", target="silent", payload=payload))
+    await _wait_for(lambda: received == ["read"] and len(broker.components["silent"].segments) == 1)
+    segment = next(iter(broker.components["silent"].segments))
+
+    writer.close()
+    await _wait_for(lambda: broker.stats["segments_reclaimed"] == 1)
+    assert not unlink_shm(segment)  # already gone
+    await _wait_for(lambda: not any(client.segments for client in broker.clients))
@@ -0,0 +1,168 @@
+"""Tests for the durable SQLite (WAL) message bus."""
+
+import asyncio
+import sqlite3
+
+from woodwork.core.message_bus.factory import MessageBusFactory
+from woodwork.core.message_bus.interface import MessageDeliveryMode, MessageEnvelope
+from woodwork.core.message_bus.sqlite_bus import SQLiteMessageBus
+
+
+def _envelope(message_id: str, target: str = "tool", **kwargs) -> MessageEnvelope:
+    return MessageEnvelope(
+        message_id=message_id,
+        session_id="s1",
+        event_type="tool.call",
+        payload={"n": message_id},
+        target_component=target,
+        sender_component="agent",
+        **kwargs,
+    )
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+async def test_messages_survive_restart_and_are_acked(tmp_path):
+    path = str(tmp_path / "bus.db")
+    bus = SQLiteMessageBus(path=path)
+    await bus.start()
+    for i in range(3):
+        assert await bus.send_to_component(_envelope(f"m{i}"))
+    await bus.stop()
+    assert bus.count_messages()["pending"] == 3
+
+    received = []
+    bus = SQLiteMessageBus(path=path)
+    await bus.start()
+    try:
+        bus.register_component_handler("tool", lambda envelope: received.append(envelope.message_id))
+        await _wait_for(lambda: len(received) == 3)
+        assert received == ["m0", "m1", "m2"]
+    finally:
+        await bus.stop()
+    assert sum(bus.count_messages().values()) == 0
+
+
+async def test_concurrent_sends_share_a_commit(tmp_path):
+    bus = SQLiteMessageBus(path=str(tmp_path / "bus.db"), batch_size=64)
+    await bus.start()
+    try:
+        results = await asyncio.gather(*(bus.send_to_component(_envelope(f"m{i}")) for i in range(50)))
+        assert all(results)
+        assert bus.stats["rows_committed"] == 50
+        assert bus.stats["commits"] == 1
+    finally:
+        await bus.stop()
+
+
+async def test_failed_delivery_is_retried_then_dead_lettered(tmp_path):
+    bus = SQLiteMessageBus(path=str(tmp_path / "bus.db"), retry_base_delay=0.01, retry_jitter=0.0)
+    await bus.start()
+    attempts = []
+
+    def failing(envelope):
+        attempts.append(envelope.retry_count)
+        raise RuntimeError("boom")
+
+    bus.register_component_handler("tool", failing)
+    try:
+        assert await bus.send_to_component(_envelope("m1", max_retries=2))
+        await _wait_for(lambda: bus.stats["messages_dead_lettered"] == 1)
+        assert attempts == [0, 1, 2]
+        await _wait_for(lambda: bus.count_messages()["dead"] == 1)
+        dead = bus.get_dead_letters()
+        assert [d["envelope"]["message_id"] for d in dead] == ["m1"]
+        assert "boom" in dead[0]["reason"]
+    finally:
+        await bus.stop()
+
+
+async def test_expired_lease_is_redelivered(tmp_path):
+    path = str(tmp_path / "bus.db")
+    bus = SQLiteMessageBus(path=path, lease_seconds=0.05)
+    await bus.start()
+    assert await bus.send_to_component(_envelope("m1"))
+    await bus.stop()
+
+    # Simulate a consumer that claimed the message and then died
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE messages SET status = 1, attempts = 1, lease_until = 0")
+
+    received = []
+    bus = SQLiteMessageBus(path=path)
+    await bus.start()
+    try:
+        bus.register_component_handler("tool", lambda envelope: received.append(envelope.retry_count))
+        await _wait_for(lambda: received)
+        assert received == [1]
+    finally:
+        await bus.stop()
+
+
+async def test_at_most_once_and_ttl(tmp_path):
+    bus = MessageBusFactory.create_message_bus({"type": "sqlite", "path": str(tmp_path / "bus.db"), "claim_size": 8})
+    assert isinstance(bus, SQLiteMessageBus)
+    assert bus.claim_size == 8
+    await bus.start()
+    received = []
+    try:
+        bus.register_component_handler("tool", lambda envelope: received.append(envelope.message_id))
+        assert await bus.send_to_component(_envelope("direct", delivery_mode=MessageDeliveryMode.AT_MOST_ONCE))
+        assert received == ["direct"]
+        assert bus.stats["messages_persisted"] == 0
+
+        assert await bus.send_to_component(_envelope("stale", target="offline", ttl_seconds=0))
+        bus._dispatch_signal.set()
+        await _wait_for(lambda: bus.count_messages()["dead"] == 1)
+    finally:
+        await bus.stop()
+
+
+async def test_undecodable_row_is_dead_lettered_without_blocking_the_rest(tmp_path):
+    path = str(tmp_path / "bus.db")
+    bus = SQLiteMessageBus(path=path)
+    await bus.start()
+    for i in range(3):
+        assert await bus.send_to_component(_envelope(f"m{i}"))
+    await bus.stop()
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE messages SET envelope = 'not json' WHERE message_id = 'm0'")
+
+    received = []
+    bus = SQLiteMessageBus(path=path)
+    await bus.start()
+    try:
+        bus.register_component_handler("tool", lambda envelope: received.append(envelope.message_id))
+        await _wait_for(lambda: received == ["m1", "m2"])
+        await _wait_for(lambda: bus.count_messages()["dead"] == 1)
+        assert bus.stats["messages_dead_lettered"] == 1
+        assert bus.get_dead_letters()[0]["envelope"] is None
+    finally:
+        await bus.stop()
+
+
+async def test_slow_handler_does_not_hold_up_other_components(tmp_path):
+    bus = SQLiteMessageBus(path=str(tmp_path / "bus.db"))
+    await bus.start()
+    release = asyncio.Event()
+    fast = []
+
+    async def slow(envelope):
+        await release.wait()
+
+    bus.register_component_handler("slow", slow)
+    bus.register_component_handler("fast", lambda envelope: fast.append(envelope.message_id))
+    try:
+        assert await bus.send_to_component(_envelope("s1", target="slow"))
+        await _wait_for(lambda: "slow" in bus._deliveries)
+        assert await bus.send_to_component(_envelope("f1", target="fast"))
+        await _wait_for(lambda: fast == ["f1"])
+    finally:
+        release.set()
+        await bus.stop()
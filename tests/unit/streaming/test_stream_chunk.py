@@ -0,0 +1,56 @@
+"""Tests for slotted stream chunks and their lazily computed integrity checks."""
+
+import pytest
+
+from woodwork.core.message_bus.codec import get_codec
+from woodwork.types.streaming_data import IntegrityMode, StreamChunk, StreamDataType, StreamMetadata
+
+
+def _chunk(data="token", integrity=IntegrityMode.SHA256):
+    return StreamChunk(stream_id="st", chunk_index=0, data=data, data_type=StreamDataType.TEXT,
+                       integrity=integrity)
+
+
+def test_chunk_is_slotted_and_carries_no_metadata_dict():
+    chunk = _chunk()
+    assert not hasattr(chunk, "__dict__")
+    assert chunk.metadata is None
+    assert chunk.to_dict()["metadata"] == {}
+
+
+@pytest.mark.parametrize("mode, prefix", [
+    (IntegrityMode.CRC32, "crc32:"),
+    (IntegrityMode.FAST, ("xxh3:", "blake2b:")),
+    (IntegrityMode.SHA256, ""),
+])
+def test_checksum_is_computed_only_when_serialized(mode, prefix):
+    chunk = _chunk(integrity=mode)
+    assert chunk.checksum is None
+
+    restored = StreamChunk.from_dict(chunk.to_dict())
+    assert restored.checksum.startswith(prefix)
+    assert restored.integrity is mode
+    assert restored.verify_checksum()
+
+    restored.data = "tampered"
+    assert not restored.verify_checksum()
+
+
+def test_integrity_none_and_legacy_checksums():
+    unchecked = StreamChunk.from_dict(_chunk(integrity=IntegrityMode.NONE).to_dict())
+    assert unchecked.checksum is None and unchecked.verify_checksum()
+
+    # sha256 chunks serialize exactly as before integrity modes: bare hex, no "integrity" key
+    legacy = _chunk().to_dict()
+    assert "integrity" not in legacy and ":" not in legacy["checksum"]
+    assert StreamChunk.from_dict(legacy).verify_checksum()
+
+
+def test_binary_codec_fills_in_lazy_checksum():
+    chunk = _chunk(data=b"\x00\x01", integrity=IntegrityMode.CRC32)
+    chunk.data_type = StreamDataType.BINARY
+    decoded = get_codec("binary").decode(get_codec("binary").encode(chunk))
+    assert decoded.checksum.startswith("crc32:") and decoded.verify_checksum()
+
+    metadata = StreamMetadata("st", "s1", "llm", "console", StreamDataType.TEXT, integrity=IntegrityMode.FAST)
+    assert StreamMetadata.from_dict(metadata.to_dict()).integrity is IntegrityMode.FAST
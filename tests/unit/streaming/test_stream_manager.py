@@ -134,4 +134,255 @@ class TestStreamManagerErrorHandling:
         """Test that stopping without starting is safe."""
         # Should not raise an exception
         await stream_manager.stop()
-        assert not stream_manager._running
\ No newline at end of file
+        assert not stream_manager._running
+
+class TestStreamManagerLocalDelivery:
+    """Test the in-process fast path against the serialized path."""
+
+    async def _round_trip(self, stream_manager):
+        stream_id = await stream_manager.create_stream("s1", "llm", "console", StreamDataType.JSON)
+        payload = {"token": "world"}
+        await stream_manager.send_chunk(stream_id, {"token": "hello"})
+        await stream_manager.send_chunk(stream_id, payload, is_final=True)
+        return [chunk async for chunk in stream_manager.receive_stream(stream_id)], payload
+
+    async def test_local_stream_hands_over_chunk_objects(self):
+        """Test that in-process chunks skip serialization and checksums."""
+        bus = SimpleMessageBus()
+        await bus.start()
+        stream_manager = StreamManager(bus)
+        published = Mock()
+        bus.subscribe("stream.chunk", published)
+
+        chunks, payload = await self._round_trip(stream_manager)
+
+        assert [chunk.data for chunk in chunks] == [{"token": "hello"}, payload]
+        assert chunks[1].data is payload
+        assert all(chunk.checksum is None for chunk in chunks)
+        assert stream_manager.stats["chunks_local"] == 2
+        published.assert_not_called()
+        await bus.stop()
+
+    async def test_serialized_stream_checksums_on_the_way_out(self):
+        """Test that streams crossing a process boundary still go through the bus."""
+        bus = SimpleMessageBus()
+        await bus.start()
+        stream_manager = StreamManager(bus, local_delivery=False)
+
+        chunks, payload = await self._round_trip(stream_manager)
+
+        assert [chunk.data for chunk in chunks] == [{"token": "hello"}, payload]
+        assert all(chunk.checksum and chunk.verify_checksum() for chunk in chunks)
+        assert stream_manager.stats["chunks_serialized"] == 2
+        await bus.stop()
+
+
+class TestStreamManagerBackpressure:
+    """Test credit-based flow control between producers and slow consumers."""
+
+    async def _manager(self, **limits):
+        bus = SimpleMessageBus()
+        await bus.start()
+        stream_manager = StreamManager(bus)
+        for name, value in limits.items():
+            setattr(stream_manager, name, value)
+        return stream_manager
+
+    async def test_producer_waits_for_slow_consumer_without_losing_chunks(self):
+        """Test that the producer suspends at the high watermark and nothing is dropped."""
+        stream_manager = await self._manager(max_buffer_size=4)
+        stream_id = await stream_manager.create_stream("s1", "llm", "websocket")
+        peak = 0
+
+        async def produce():
+            nonlocal peak
+            for i in range(20):
+                assert await stream_manager.send_chunk(stream_id, f"t{i}", is_final=i == 19)
+                peak = max(peak, stream_manager.stream_credits[stream_id].outstanding_chunks)
+
+        async def consume():
+            received = []
+            async for chunk in stream_manager.receive_stream(stream_id):
+                await asyncio.sleep(0.001)
+                received.append(chunk.data)
+            return received
+
+        _, received = await asyncio.gather(produce(), consume())
+
+        assert received == [f"t{i}" for i in range(20)]
+        assert peak <= 4
+        stats = stream_manager.get_stats()
+        assert stats["producer_blocks"] > 0
+        assert stats["producer_blocked_seconds"] > 0
+        assert stats["blocked_ms"]["llm"]["count"] == stats["producer_blocks"]
+        assert stats["backpressure_timeouts"] == 0
+
+    async def test_send_without_credit_fails_fast_or_times_out(self):
+        """Test wait=False and send_timeout when nobody consumes."""
+        stream_manager = await self._manager(max_buffer_size=2, send_timeout=0.02)
+        stream_id = await stream_manager.create_stream("s1", "tool", "logger")
+
+        assert await stream_manager.send_chunk(stream_id, "a")
+        assert await stream_manager.send_chunk(stream_id, "b")
+        assert not await stream_manager.send_chunk(stream_id, "c", wait=False)
+        assert not await stream_manager.send_chunk(stream_id, "c")
+        assert stream_manager.stats["backpressure_timeouts"] == 1
+
+    async def test_consumer_can_grant_credit_itself(self):
+        """Test that auto_credit=False leaves credit to the consumer."""
+        stream_manager = await self._manager(max_buffer_size=2, send_timeout=0.02)
+        stream_id = await stream_manager.create_stream("s1", "llm", "voice")
+        receiver = stream_manager.receive_stream(stream_id, auto_credit=False)
+
+        for data in ("a", "b"):
+            await stream_manager.send_chunk(stream_id, data)
+            await receiver.__anext__()
+        assert not await stream_manager.send_chunk(stream_id, "c", wait=False)
+
+        stream_manager.grant_credit(stream_id, chunks=2, size=2)
+        assert await stream_manager.send_chunk(stream_id, "c", wait=False)
+        await receiver.aclose()
+
+    async def test_stream_leaving_the_process_is_not_held_back(self):
+        """Test that chunks sent to another process spend no credit or memory here."""
+        bus = Mock(spec=SimpleMessageBus)
+        bus.publish = AsyncMock()
+        stream_manager = StreamManager(bus, local_delivery=False)
+        stream_manager.max_buffer_size = 4
+        stream_manager.send_timeout = 0.02
+        stream_id = await stream_manager.create_stream("s1", "llm", "remote_console")
+
+        for i in range(20):
+            assert await stream_manager.send_chunk(stream_id, f"t{i}", is_final=i == 19)
+
+        published = [call for call in bus.publish.call_args_list if call.args[0] == "stream.chunk"]
+        assert len(published) == 20
+        assert stream_manager.current_memory_usage == 0
+        assert stream_manager.stats["producer_blocks"] == 0
+
+
+class TestStreamManagerMulticast:
+    """Test several consumers reading one stream through their own cursors."""
+
+    async def _manager(self):
+        bus = SimpleMessageBus()
+        await bus.start()
+        return StreamManager(bus)
+
+    async def test_every_subscriber_receives_the_whole_stream(self):
+        """Test that chunks are held once and reclaimed behind the slowest cursor."""
+        stream_manager = await self._manager()
+        stream_id = await stream_manager.create_stream("s1", "llm", "websocket")
+        for name in ("websocket", "voice", "logger"):
+            stream_manager.subscribe(stream_id, name)
+
+        async def consume(name, delay):
+            received = []
+            async for chunk in stream_manager.receive_stream(stream_id, subscriber=name):
+                received.append(chunk.data)
+                await asyncio.sleep(delay)
+            return received
+
+        async def produce():
+            for i in range(10):
+                await stream_manager.send_chunk(stream_id, f"t{i}", is_final=i == 9)
+
+        results = await asyncio.gather(
+            consume("websocket", 0), consume("voice", 0.002), consume("logger", 0), produce()
+        )
+
+        expected = [f"t{i}" for i in range(10)]
+        assert results[:3] == [expected, expected, expected]
+        ring = stream_manager.stream_buffers[stream_id]
+        assert ring.reclaimed_chunks == 10
+        assert len(ring.chunks) == 0
+        assert stream_manager.current_memory_usage == 0
+
+    async def test_memory_follows_the_slowest_cursor(self):
+        """Test that only chunks the slowest subscriber has not read are held."""
+        stream_manager = await self._manager()
+        stream_id = await stream_manager.create_stream("s1", "llm", "websocket")
+        fast = stream_manager.receive_stream(stream_id, subscriber="fast")
+        slow = stream_manager.receive_stream(stream_id, subscriber="slow")
+
+        await stream_manager.send_chunk(stream_id, "a")
+        assert (await fast.__anext__()).data == "a"
+        assert (await slow.__anext__()).data == "a"
+        for data in ("b", "c", "d"):
+            await stream_manager.send_chunk(stream_id, data)
+            await fast.__anext__()
+
+        stats = stream_manager.get_stream_info(stream_id)["buffer_stats"]
+        assert stats["buffered_chunks"] == 4
+        assert stats["subscribers"]["slow"]["lag"] == 4
+
+        await slow.aclose()
+        assert stream_manager.get_stream_info(stream_id)["buffer_stats"]["buffered_chunks"] == 1
+        await fast.aclose()
+
+    async def test_late_subscribers_start_at_head_or_tail(self):
+        """Test that a late joiner can replay held chunks or take only new ones."""
+        stream_manager = await self._manager()
+        stream_id = await stream_manager.create_stream("s1", "llm", "websocket")
+        await stream_manager.send_chunk(stream_id, "a")
+        await stream_manager.send_chunk(stream_id, "b")
+
+        stream_manager.subscribe(stream_id, "replay", start="head")
+        stream_manager.subscribe(stream_id, "live", start="tail")
+        await stream_manager.send_chunk(stream_id, "c", is_final=True)
+
+        replay = [c.data async for c in stream_manager.receive_stream(stream_id, subscriber="replay")]
+        live = [c.data async for c in stream_manager.receive_stream(stream_id, subscriber="live")]
+
+        assert replay == ["a", "b", "c"]
+        assert live == ["c"]
+        with pytest.raises(ValueError):
+            stream_manager.subscribe(stream_id, "other", start="middle")
+
+    async def test_completed_stream_waits_for_its_last_reader(self):
+        """Test that cleanup after completion does not cut off a subscriber mid-stream."""
+        stream_manager = await self._manager()
+        stream_id = await stream_manager.create_stream("s1", "llm", "logger")
+        stream_manager.subscribe(stream_id, "logger")
+        for i in range(3):
+            await stream_manager.send_chunk(stream_id, f"t{i}", is_final=i == 2)
+
+        receiver = stream_manager.receive_stream(stream_id, subscriber="logger")
+        assert (await receiver.__anext__()).data == "t0"
+        await stream_manager._cleanup_stream_delayed(stream_id, delay=0)
+        assert stream_id in stream_manager.active_streams
+
+        assert [c.data async for c in receiver] == ["t1", "t2"]
+        assert stream_id not in stream_manager.active_streams
+        assert stream_manager.current_memory_usage == 0
+
+
+class TestStreamManagerSpill:
+    """Test streams whose oldest chunks spill to disk."""
+
+    async def test_large_stream_spills_instead_of_holding_memory(self, tmp_path):
+        """Test a producer far ahead of its consumer is bounded by memory_limit, not blocked."""
+        bus = SimpleMessageBus()
+        await bus.start()
+        stream_manager = StreamManager(bus)
+        stream_manager.spill_dir = str(tmp_path)
+        stream_manager.max_memory_usage = 4096
+        stream_id = await stream_manager.create_stream(
+            "s1", "coding_env", "agent", StreamDataType.BINARY, memory_limit=1024
+        )
+
+        for i in range(50):
+            assert await stream_manager.send_chunk(stream_id, bytes([i]) * 256, is_final=i == 49, wait=False)
+            assert stream_manager.current_memory_usage <= 1024
+
+        assert (tmp_path / stream_id).is_dir()
+        assert stream_manager.get_stream_info(stream_id)["buffer_stats"]["spill"]["spilled_chunks"] == 46
+
+        received = [chunk.data async for chunk in stream_manager.receive_stream(stream_id)]
+        assert received == [bytes([i]) * 256 for i in range(50)]
+        assert stream_manager.current_memory_usage == 0
+        assert stream_manager.stats["bytes_spilled"] == 46 * 256
+
+        await stream_manager._cleanup_stream(stream_id)
+        assert not (tmp_path / stream_id).exists()
+        await bus.stop()
@@ -0,0 +1,76 @@
+"""Tests for spilling stream chunks to disk segments."""
+
+import os
+from woodwork.core.stream_ring import StreamRing
+from woodwork.core.stream_spill import StreamSpill
+from woodwork.types.streaming_data import StreamDataType, create_stream_chunk
+
+
+def _chunk(index, data=b"x" * 100, is_final=False):
+    return create_stream_chunk("stream-1", index, data, StreamDataType.BINARY, is_final=is_final)
+
+
+class TestStreamSpill:
+    """Test suite for StreamSpill."""
+
+    def test_round_trip_across_segments(self, tmp_path):
+        """Test spilled chunks come back intact and in order from several segments."""
+        spill = StreamSpill("stream-1", str(tmp_path), segment_size=512)
+        for i in range(10):
+            spill.append(_chunk(i, bytes([i]) * 100))
+
+        assert len(spill) == 10
+        assert spill.get_stats()["segments"] > 1
+        chunks = [spill.read(i) for i in range(10)]
+        assert [c.chunk_index for c in chunks] == list(range(10))
+        assert chunks[3].data == bytes([3]) * 100
+        assert all(c.verify_checksum() for c in chunks)
+
+    def test_reclaimed_segments_are_deleted(self, tmp_path):
+        """Test a segment file goes once all its chunks are reclaimed, and close removes the rest."""
+        spill = StreamSpill("stream-1", str(tmp_path), segment_size=512)
+        for i in range(10):
+            spill.append(_chunk(i))
+        directory = tmp_path / "stream-1"
+        before = len(os.listdir(directory))
+
+        assert spill.reclaim(6) == 600
+        assert len(os.listdir(directory)) < before
+        assert spill.read(0).chunk_index == 6
+        assert spill.spilled_bytes == 400
+
+        spill.close()
+        assert not directory.exists()
+
+
+class TestStreamRingTiers:
+    """Test the memory and disk tiers of a StreamRing."""
+
+    def test_oldest_chunks_spill_past_the_memory_limit(self, tmp_path):
+        """Test cursors read spilled chunks back transparently."""
+        ring = StreamRing("stream-1", memory_limit=300, spill_dir=str(tmp_path))
+        slow = ring.subscribe("slow")
+        freed = 0
+        for i in range(10):
+            ring.add_chunk(_chunk(i, is_final=i == 9))
+            freed += ring.spill_over()
+
+        assert ring.resident_bytes <= 300
+        assert freed == 700
+        assert ring.spilled == 7
+
+        received = []
+        while not ring.is_done(slow):
+            received.append(ring.read(slow).chunk_index)
+            ring.advance(slow)
+        assert received == list(range(10))
+        assert ring.spilled == 0 and ring.resident_bytes == 0
+
+    def test_unlimited_ring_never_spills(self, tmp_path):
+        """Test that rings without a memory limit stay in memory."""
+        ring = StreamRing("stream-1", spill_dir=str(tmp_path))
+        for i in range(10):
+            ring.add_chunk(_chunk(i))
+            assert ring.spill_over() == 0
+        assert ring.spill is None
+        assert not os.listdir(tmp_path)
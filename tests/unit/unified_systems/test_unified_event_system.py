@@ -135,6 +135,161 @@ class TestUnifiedEventBus:
         # Verify target component received the event
         target_component.input.assert_called_once()
 
+    def _slow_target(self, name, delay, received):
+        target = Mock()
+        target.name = name
+        target.config = {}
+
+        async def slow_input(data):
+            await asyncio.sleep(delay)
+            received.append((name, data.data["seq"]))
+
+        target.input = slow_input
+        return target
+
+    async def test_parallel_fan_out_to_targets(self, event_bus):
+        """Test that parallel routes deliver to all targets concurrently"""
+        received = []
+        source = Mock()
+        source.name = "agent"
+        source.to = ["console", "voice", "relay"]
+        source.config = {"to_mode": "parallel"}
+
+        event_bus.register_component(source)
+        for name in source.to:
+            event_bus.register_component(self._slow_target(name, 0.05, received))
+        event_bus.configure_routing()
+
+        start_time = time.time()
+        await event_bus.emit_from_component("agent", "component.output", {"data": {"seq": 1}})
+        total_time = time.time() - start_time
+
+        assert sorted(received) == [("console", 1), ("relay", 1), ("voice", 1)]
+        assert total_time < 0.12, f"Targets not delivered concurrently: {total_time:.3f}s"
+        assert event_bus.get_routing_info("agent")["route_mode"] == "parallel"
+
+        route_stats = event_bus.get_stats()["route_targets"]
+        assert set(route_stats) == {"console", "voice", "relay"}
+        assert route_stats["voice"]["deliveries"] == 1
+        assert route_stats["voice"]["max_ms"] >= 40
+
+    async def test_target_concurrency_limit_preserves_order(self, event_bus):
+        """Test that a target capped at one in-flight delivery receives events in order"""
+        received = []
+        source = Mock()
+        source.name = "agent"
+        source.to = "console"
+        source.config = {}
+
+        event_bus.register_component(source)
+        event_bus.register_component(self._slow_target("console", 0.01, received))
+        event_bus.configure_routing()
+        event_bus.set_target_concurrency("console", 1)
+
+        await asyncio.gather(*(
+            event_bus.emit_from_component("agent", "component.output", {"data": {"seq": i}})
+            for i in range(5)
+        ))
+
+        assert received == [("console", i) for i in range(5)]
+
+    async def test_sync_tool_runs_off_the_event_loop(self, event_bus):
+        """Test that a blocking sync input() neither stalls the loop nor exceeds its cap"""
+        running = []
+        tool = Mock()
+        tool.name = "shell"
+        tool.config = {"max_concurrency": 1}
+
+        def blocking_input(action, inputs):
+            running.append(action)
+            time.sleep(0.05)
+            return f"ran {action}"
+
+        tool.input = blocking_input
+        event_bus.register_component(tool)
+        event_bus.configure_routing()
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(
+            event_bus.send_to_component_with_response("shell", "agent", {"action": f"cmd{i}", "inputs": {}})
+            for i in range(3)
+        ))
+        ticking.cancel()
+
+        assert all(success for success, _ in results)
+        assert running == ["cmd0", "cmd1", "cmd2"]
+        assert ticks >= 10
+
+        stats = event_bus.get_stats()["component_executors"]["shell"]
+        assert stats["executor"] == "thread"
+        assert (stats["calls"], stats["max_queued"], stats["running"]) == (3, 2, 0)
+        assert stats["wait_ms"]["max_ms"] >= 40
+        await event_bus.shutdown()
+
+    async def test_slow_sync_component_is_promoted_off_the_loop(self, event_bus):
+        """Test that an inline sync component measured slow on the loop moves to the thread pool"""
+        import threading
+        threads = []
+        event_bus.set_component_executor("slow_tool", "inline")
+        event_bus.set_component_executor("fast_tool", "inline")
+
+        def slow_input(data):
+            threads.append(threading.current_thread().name)
+            time.sleep(0.01)
+
+        for _ in range(4):
+            await event_bus.call_component("slow_tool", slow_input, "query")
+            await event_bus.call_component("fast_tool", lambda data: data, "query")
+
+        assert threads[:3] == [threading.current_thread().name] * 3
+        assert threads[3].startswith("woodwork-component")
+
+        stats = event_bus.get_stats()
+        promotion = stats["component_promotions"]["slow_tool"]
+        assert promotion["slow_calls"] == 3
+        assert "more than 5 ms" in promotion["reason"]
+        assert stats["component_executors"]["slow_tool"]["executor"] == "thread"
+        assert stats["component_executors"]["fast_tool"]["executor"] == "inline"
+        assert "fast_tool" not in stats["component_promotions"]
+        await event_bus.shutdown()
+
+    async def test_call_component_defaults_to_the_thread_pool(self, event_bus):
+        """Test that only callers asking for an inline default run unconfigured components on the loop"""
+        import threading
+
+        def where(data):
+            return threading.current_thread().name
+
+        assert (await event_bus.call_component("tool", where, "q")).startswith("woodwork-component")
+        inline = await event_bus.call_component("deployed", where, "q", default_executor="inline")
+        assert inline == threading.current_thread().name
+        await event_bus.shutdown()
+
+    async def test_component_executor_config(self, event_bus):
+        """Test that the 'executor' config key selects where sync inputs run"""
+        for name, executor in (("inline_tool", "inline"), ("bad_tool", "gpu")):
+            component = Mock()
+            component.name = name
+            component.config = {"executor": executor}
+            component.input = Mock(return_value="ok")
+            event_bus.register_component(component)
+        event_bus.configure_routing()
+
+        await event_bus.send_to_component_with_response("inline_tool", "agent", {})
+        await event_bus.send_to_component_with_response("bad_tool", "agent", {})
+
+        stats = event_bus.get_stats()["component_executors"]
+        assert stats["inline_tool"]["executor"] == "inline"
+        assert stats["bad_tool"]["executor"] == "thread"
+
     async def test_concurrent_hook_processing(self, event_bus):
         """Test that hooks are processed concurrently without blocking"""
         hook1_called = False
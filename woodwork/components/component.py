@@ -5,7 +5,7 @@ import logging
 import asyncio
 from typing import List, Optional, Any, Dict
 from woodwork.types.workflows import Hook, Pipe
-from woodwork.events import EventManager, create_default_emitter, get_global_event_manager
+from woodwork.events import EventManager, create_default_emitter
 from woodwork.components.streaming_mixin import StreamingMixin
 from woodwork.core.stream_manager import StreamManager
 from woodwork.core.message_bus.integration import MessageBusIntegration, register_component_with_message_bus
@@ -157,10 +157,7 @@ class component(StreamingMixin, MessageBusIntegration):
         return pipes
     
     def _register_hooks_global(self):
-        """Register all configured hooks with both the old EventManager and unified event bus."""
-        global_manager = get_global_event_manager()
-
-        # Also register with unified event bus
+        """Register all configured hooks once, with the unified event bus (the global EventManager delegates to it)."""
         from woodwork.core.unified_event_bus import get_global_event_bus
         unified_bus = get_global_event_bus()
 
@@ -170,21 +167,15 @@ class component(StreamingMixin, MessageBusIntegration):
                 log.debug(f"[Component {self.name}] Loading hook {i+1}: {hook.function_name} from {hook.script_path} for event '{hook.event}'")
                 func = self._load_function(hook.script_path, hook.function_name)
                 if func:
-                    # Register with old event manager (for backward compatibility)
-                    global_manager.on_hook(hook.event, func)
-                    # Register with unified event bus (for new system)
-                    unified_bus.register_hook(hook.event, func)
-                    log.debug(f"[Component {self.name}] Successfully registered hook for event '{hook.event}' from {hook.script_path}::{hook.function_name} (old + unified)")
+                    unified_bus.register_hook(hook.event, func, mode=hook.mode, timeout=hook.timeout)
+                    log.debug(f"[Component {self.name}] Successfully registered hook for event '{hook.event}' from {hook.script_path}::{hook.function_name}")
                 else:
                     log.warning(f"[Component {self.name}] Failed to load function {hook.function_name} from {hook.script_path}")
             except Exception as e:
                 log.warning(f"[Component {self.name}] Failed to register hook {hook.function_name} for event {hook.event}: {e}")
     
     def _register_pipes_global(self):
-        """Register all configured pipes with both the old EventManager and unified event bus."""
-        global_manager = get_global_event_manager()
-
-        # Also register with unified event bus
+        """Register all configured pipes once, with the unified event bus (the global EventManager delegates to it)."""
         from woodwork.core.unified_event_bus import get_global_event_bus
         unified_bus = get_global_event_bus()
 
@@ -194,11 +185,8 @@ class component(StreamingMixin, MessageBusIntegration):
                 log.debug(f"[Component {self.name}] Loading pipe {i+1}: {pipe.function_name} from {pipe.script_path} for event '{pipe.event}'")
                 func = self._load_function(pipe.script_path, pipe.function_name)
                 if func:
-                    # Register with old event manager (for backward compatibility)
-                    global_manager.on_pipe(pipe.event, func)
-                    # Register with unified event bus (for new system)
                     unified_bus.register_pipe(pipe.event, func)
-                    log.debug(f"[Component {self.name}] Successfully registered pipe for event '{pipe.event}' from {pipe.script_path}::{pipe.function_name} (old + unified)")
+                    log.debug(f"[Component {self.name}] Successfully registered pipe for event '{pipe.event}' from {pipe.script_path}::{pipe.function_name}")
                 else:
                     log.warning(f"[Component {self.name}] Failed to load function {pipe.function_name} from {pipe.script_path}")
             except Exception as e:
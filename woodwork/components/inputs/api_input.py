@@ -10,7 +10,7 @@ import logging
 import json
 import time
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
@@ -64,6 +64,11 @@ class api_input(inputs):
         # Unified event bus integration (no cross-thread queues)
         self.event_bus = get_global_event_bus()
 
+        # Opt in to processing each session on its own lane, so one busy session does not
+        # delay the others; this switches the whole shared bus to session lanes
+        if config.get("session_sharding", False):
+            self.event_bus.enable_session_sharding()
+
         # Setup FastAPI app
         self._setup_app_and_routes()
 
@@ -78,21 +83,17 @@ class api_input(inputs):
     def _setup_real_time_subscriptions(self):
         """Register for real-time event delivery to WebSockets."""
         try:
-            # Register hooks for events that should be forwarded to WebSocket
+            # Register hooks for event families that should be forwarded to WebSocket
+            # (agent.* covers response/thought/action/step_complete/error, tool.* covers call/observation)
             relevant_events = [
                 "input.received",
-                "agent.response",
-                "agent.thought",
-                "agent.action",
-                "tool.call",
-                "tool.observation",
-                "agent.step_complete",
-                "agent.error"
+                "agent.*",
+                "tool.*"
             ]
 
             # Register async hooks for real-time delivery
-            for event_type in relevant_events:
-                self.event_bus.register_hook(event_type, self._handle_real_time_event)
+            for event_pattern in relevant_events:
+                self.event_bus.register_hook(event_pattern, self._handle_real_time_event)
 
             log.info("[api_input] Registered for real-time events: %s", relevant_events)
 
@@ -177,7 +178,7 @@ class api_input(inputs):
         }
         return mapping.get(class_name, class_name.lower())
 
-    async def handle_input(self, user_input: str) -> None:
+    async def handle_input(self, user_input: str, session_id: Optional[str] = None) -> None:
         """Handle user input and emit through unified event system."""
         try:
             log.debug("[api_input] Processing user input: %s", user_input[:100])
@@ -186,7 +187,7 @@ class api_input(inputs):
             payload = InputReceivedPayload(
                 input=user_input,
                 inputs={},
-                session_id="api_session",
+                session_id=session_id or "api_session",
                 component_id=self.name,
                 component_type="inputs"
             )
@@ -329,12 +330,12 @@ class api_input(inputs):
                             # Old API format: {"type": "user_input", "input": "text"}
                             user_input = message.get("input", "")
                             if user_input:
-                                await self.handle_input(user_input)
+                                await self.handle_input(user_input, session_id)
                         elif message_type == "input":
                             # New API format: {"type": "input", "data": "text"}
                             user_input = message.get("data", "")
                             if user_input:
-                                await self.handle_input(user_input)
+                                await self.handle_input(user_input, session_id)
                         elif message_type == "subscribe":
                             # Handle subscription requests (old API compatibility)
                             components = message.get("components", [])
@@ -348,7 +349,7 @@ class api_input(inputs):
                     else:
                         # Handle direct string input
                         if isinstance(message, str):
-                            await self.handle_input(message)
+                            await self.handle_input(message, session_id)
 
             except WebSocketDisconnect:
                 log.info("[api_input] WebSocket session %s disconnected", session_id)
@@ -434,25 +434,10 @@ class MCPServer(component, tool_interface):
     @property
     def description(self) -> str:
         """Get component description with available capabilities."""
-        # Try to wait for capabilities if we have a blocking startup task
-        if not self._capabilities_fetched and hasattr(self, '_blocking_startup_task') and self._blocking_startup_task:
-            try:
-                # Check if we're in an event loop and can wait
-                loop = asyncio.get_running_loop()
-                if loop.is_running() and not self._blocking_startup_task.done():
-                    # Create a quick check to see if capabilities are ready
-                    # without blocking too long
-                    for i in range(100):  # Check for up to 5 seconds (100 * 0.05s)
-                        if self._capabilities_fetched or self._blocking_startup_task.done():
-                            break
-                        # Very brief sleep to let other tasks run
-                        import time
-                        time.sleep(0.05)
-            except RuntimeError:
-                # No event loop, can't wait
-                pass
-            except Exception as e:
-                log.debug(f"[MCPServer] Error checking startup task in description for {self.name}: {e}")
+        # Capabilities still loading: sleeping here would block the event loop that
+        # runs the startup task, so it could never finish; describe what we have
+        if not self._capabilities_fetched and getattr(self, '_blocking_startup_task', None):
+            log.debug(f"[MCPServer] Capabilities for {self.name} not fetched yet, using basic description")
 
         if self._capabilities and self._capabilities_fetched:
             # Build detailed description from capabilities in debug script format
@@ -272,12 +272,9 @@ class AsyncRuntime:
     async def process_component_input(self, component: Any, input_data: Any) -> Any:
         """Process input directly to component (for testing)"""
         if hasattr(component, 'input'):
-            if asyncio.iscoroutinefunction(component.input):
-                return await component.input(input_data)
-            else:
-                # Run sync input in executor
-                loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, component.input, input_data)
+            # Sync inputs run on the bus's component pool, as run_in_executor did before
+            component_name = getattr(component, 'name', str(component))
+            return await self.event_bus.call_component(component_name, component.input, input_data)
         return None
 
     async def stop(self) -> None:
@@ -309,6 +306,12 @@ class AsyncRuntime:
             except Exception as e:
                 log.error("[AsyncRuntime] Error closing component %s: %s", getattr(component, 'name', 'unknown'), e)
 
+        # Let detached hooks finish observing the last events
+        try:
+            await self.event_bus.shutdown()
+        except Exception as e:
+            log.error("[AsyncRuntime] Error shutting down event bus hooks: %s", e)
+
         log.info("[AsyncRuntime] Cleanup completed")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -0,0 +1,161 @@
+"""
+Bus Core - Shared delivery machinery for the in-process buses
+
+SimpleMessageBus and InMemoryMessageBus used to each keep their own topic
+index, handler registry, per-component queues and counters, and each
+re-inspected every callback on every message. BusCore holds those pieces
+once and the buses are thin adapters over it that only add their own
+message shapes (dict messages vs MessageEnvelope) and policies (retries,
+dead letters, journaling).
+
+- topic_index: wildcard-aware subscription trie (see topic_matcher)
+- handlers: component id -> handler (or the adapter's handler record)
+- mailboxes: component id -> messages waiting for a handler to register,
+  with a running total so queue stats are O(1)
+- stats: published / delivered / failed counters shared with the adapter
+
+Whether a callback is a coroutine function is resolved once per callback
+and cached, so the per-message cost of a delivery is a dict lookup and the
+call itself. Message ids come from a per-core counter instead of uuid4.
+"""
+
+import asyncio
+import itertools
+import logging
+import uuid
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from woodwork.core.topic_matcher import TopicTrie
+
+log = logging.getLogger(__name__)
+
+
+class BusCore:
+    """Topic index, handler registry, mailboxes and counters shared by the bus adapters"""
+
+    def __init__(self, mailbox_size: Optional[int] = None):
+        self.mailbox_size = mailbox_size
+
+        self.topic_index = TopicTrie()
+        self.handlers: Dict[str, Any] = {}
+        self.mailboxes: Dict[str, deque] = defaultdict(lambda: deque(maxlen=mailbox_size))
+        self.queued = 0  # messages across all mailboxes, kept in step by the methods below
+
+        self.stats: Dict[str, Any] = {
+            "messages_published": 0,
+            "messages_delivered": 0,
+            "messages_failed": 0,
+        }
+
+        self._is_async: Dict[Any, bool] = {}
+        self._id_prefix = uuid.uuid4().hex[:4]
+        self._ids = itertools.count(1)
+
+    def next_id(self, prefix: str = "msg") -> str:
+        """Get a message id unique within this core (and, practically, across cores)"""
+        return f"{prefix}-{self._id_prefix}{next(self._ids):x}"
+
+    def is_async(self, callback: Callable) -> bool:
+        """Check (once per callback) whether calling it returns a coroutine"""
+        is_async = self._is_async.get(callback)
+        if is_async is None:
+            is_async = self._is_async[callback] = asyncio.iscoroutinefunction(callback)
+        return is_async
+
+    def forget(self, callback: Callable) -> None:
+        """Drop cached state for a callback that is no longer registered"""
+        self._is_async.pop(callback, None)
+
+    async def call(self, callback: Callable, message: Any) -> Any:
+        """Invoke a sync or async callback with one message"""
+        if self.is_async(callback):
+            return await callback(message)
+        return callback(message)
+
+    # Topic subscriptions
+
+    def subscribe(self, pattern: str, subscriber: Any) -> None:
+        self.topic_index.add(pattern, subscriber)
+
+    def unsubscribe(self, pattern: str, subscriber: Any) -> bool:
+        removed = self.topic_index.remove(pattern, subscriber)
+        if removed:
+            self.forget(subscriber)
+        return removed
+
+    def match(self, topic: str) -> Tuple[Any, ...]:
+        return self.topic_index.match(topic)
+
+    async def fan_out(self, topic: str, message: Any) -> Tuple[int, int]:
+        """Deliver message to every callable subscribed to a matching pattern"""
+        delivered = 0
+        failed = 0
+        is_async = self._is_async
+        for callback in self.topic_index.match(topic):
+            try:
+                flag = is_async.get(callback)
+                if flag is None:
+                    flag = self.is_async(callback)
+                if flag:
+                    await callback(message)
+                else:
+                    callback(message)
+                delivered += 1
+            except Exception as e:
+                failed += 1
+                log.error("[BusCore] Subscriber failed for '%s': %s", topic, e)
+
+        stats = self.stats
+        stats["messages_published"] += 1
+        stats["messages_delivered"] += delivered
+        stats["messages_failed"] += failed
+        return delivered, failed
+
+    # Component mailboxes
+
+    def enqueue(self, component_id: str, message: Any) -> deque:
+        """Hold a message until a handler registers for the component"""
+        mailbox = self.mailboxes[component_id]
+        if mailbox.maxlen is None or len(mailbox) < mailbox.maxlen:
+            self.queued += 1  # otherwise the append evicts the oldest message
+        mailbox.append(message)
+        return mailbox
+
+    def take_mailbox(self, component_id: str) -> List[Any]:
+        """Remove and return the messages waiting for a component"""
+        mailbox = self.mailboxes.pop(component_id, None)
+        if not mailbox:
+            return []
+        self.queued -= len(mailbox)
+        return list(mailbox)
+
+    def remove_queued(self, component_id: str, message: Any) -> bool:
+        """Remove one queued message (by identity); O(1) when it is the oldest"""
+        mailbox = self.mailboxes.get(component_id)
+        if not mailbox:
+            return False
+
+        if mailbox[0] is message:
+            mailbox.popleft()
+        else:
+            for index, queued in enumerate(mailbox):
+                if queued is message:
+                    del mailbox[index]
+                    break
+            else:
+                return False
+
+        self.queued -= 1
+        return True
+
+    def queued_count(self) -> int:
+        return self.queued
+
+    def clear(self) -> None:
+        """Drop all subscriptions, handlers and queued messages (counters are kept)"""
+        self.topic_index.clear()
+        self.handlers.clear()
+        self.mailboxes.clear()
+        self.queued = 0
+        self._is_async.clear()
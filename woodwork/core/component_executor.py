@@ -0,0 +1,252 @@
+"""
+Component Executor - Runs component input() calls off the event loop
+
+Sync component methods (docker exec in coding environments, chroma and
+neo4j queries, user functions) used to be called directly on the event
+loop, so one slow tool froze websockets, streams and every other session.
+ComponentExecutor dispatches each call by the component's executor kind:
+
+- THREAD: a managed thread pool shared by all components (the default)
+- PROCESS: a process pool, for CPU-bound components whose input() and
+  arguments can be pickled; others fall back to THREAD with a warning
+- INLINE: called on the event loop, as before, while calls stay fast; a
+  component whose sync calls regularly exceed slow_call_ms (promote_after
+  of its last window calls) is promoted to THREAD, and the promotion is
+  logged and reported with its reason
+
+Callers that used to call a component directly on the loop can pass
+default_kind="inline" to call(), so the component is measured and promoted
+like an INLINE one unless its config picks another executor.
+
+Coroutine functions are always awaited on the loop. Each component can be
+capped at max_concurrency calls in flight; callers beyond the cap wait
+FIFO, so a cap of 1 keeps calls in submission order. Queue depth, calls in
+flight, and wait/run latency histograms are kept per component.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import pickle
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from woodwork.core.metrics import LatencyMetrics
+
+log = logging.getLogger(__name__)
+
+
+class ExecutorKind(Enum):
+    """Where a component's sync methods run"""
+    THREAD = "thread"    # managed thread pool
+    PROCESS = "process"  # process pool (picklable components only)
+    INLINE = "inline"    # directly on the event loop until measured slow
+
+
+class ComponentExecutor:
+    """Per-component concurrency caps and executor dispatch for component calls"""
+
+    def __init__(
+        self,
+        default_kind: str = "thread",
+        thread_workers: int = 8,
+        process_workers: Optional[int] = None,
+        default_limit: Optional[int] = None,
+        slow_call_ms: float = 5.0,
+        promote_after: int = 3,
+        window: int = 10,
+    ):
+        if default_limit is not None and default_limit <= 0:
+            raise ValueError("Concurrency limit must be positive")
+
+        self.default_kind = ExecutorKind(default_kind)
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.default_limit = default_limit
+        self.slow_call_ms = slow_call_ms
+        self.promote_after = promote_after
+        self.window = window
+
+        self._kinds: Dict[str, ExecutorKind] = {}
+        self._limits: Dict[str, int] = {}
+        self._limiters: Dict[str, asyncio.Semaphore] = {}
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        # Recent call times of INLINE components, and why components were promoted
+        self._recent: Dict[str, deque] = {}
+        self._promotions: Dict[str, Dict[str, Any]] = {}
+
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self.latency = LatencyMetrics("woodwork_component_executor", {"wait": "component", "run": "component"})
+
+    # Configuration
+
+    def set_kind(self, name: str, kind: str, component: Any = None) -> None:
+        """Choose where a component's sync calls run"""
+        kind = ExecutorKind(kind)
+        if kind is ExecutorKind.PROCESS and component is not None and not _is_picklable(component):
+            log.warning("[ComponentExecutor] Component '%s' cannot be pickled, using the thread pool instead", name)
+            kind = ExecutorKind.THREAD
+        self._kinds[name] = kind
+        self._recent.pop(name, None)
+        self._promotions.pop(name, None)
+
+    def kind_of(self, name: str, default: Optional[ExecutorKind] = None) -> ExecutorKind:
+        return self._kinds.get(name, default or self.default_kind)
+
+    def set_limit(self, name: str, limit: Optional[int]) -> None:
+        """Cap concurrent calls to a component (None removes the cap)"""
+        if limit is not None and limit <= 0:
+            raise ValueError("Concurrency limit must be positive")
+
+        self._limiters.pop(name, None)
+        if limit is None:
+            self._limits.pop(name, None)
+        else:
+            self._limits[name] = limit
+
+    def _get_limiter(self, name: str) -> Optional[asyncio.Semaphore]:
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limit = self._limits.get(name, self.default_limit)
+            if limit is None:
+                return None
+            limiter = self._limiters[name] = asyncio.Semaphore(limit)
+        return limiter
+
+    # Execution
+
+    async def call(self, name: str, func: Callable, *args: Any, default_kind: Optional[str] = None) -> Any:
+        """Run func(*args) for component name, honouring its cap and executor kind
+
+        default_kind stands in for the executor's default when the component
+        has no executor of its own.
+        """
+        counters = self._counters.get(name)
+        if counters is None:
+            counters = self._counters[name] = {
+                "calls": 0, "errors": 0, "queued": 0, "max_queued": 0, "running": 0
+            }
+
+        limiter = self._get_limiter(name)
+        queued_at = time.perf_counter()
+        if limiter is not None:
+            counters["queued"] += 1
+            counters["max_queued"] = max(counters["max_queued"], counters["queued"])
+            try:
+                await limiter.acquire()
+            finally:
+                counters["queued"] -= 1
+
+        started_at = time.perf_counter()
+        self.latency.observe("wait", name, (started_at - queued_at) * 1000)
+        counters["running"] += 1
+        try:
+            return await self._dispatch(name, func, args, default_kind)
+        except Exception:
+            counters["errors"] += 1
+            raise
+        finally:
+            counters["running"] -= 1
+            counters["calls"] += 1
+            self.latency.observe("run", name, (time.perf_counter() - started_at) * 1000)
+            if limiter is not None:
+                limiter.release()
+
+    async def _dispatch(self, name: str, func: Callable, args: tuple, default_kind: Optional[str]) -> Any:
+        if asyncio.iscoroutinefunction(func):
+            return await func(*args)
+
+        kind = self.kind_of(name, ExecutorKind(default_kind) if default_kind else None)
+        if kind is ExecutorKind.INLINE:
+            started_at = time.perf_counter()
+            result = func(*args)
+            self._observe_inline(name, (time.perf_counter() - started_at) * 1000)
+        else:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(func, *args)
+            if kind is ExecutorKind.THREAD:
+                # Carry context variables (e.g. the current EventSource) into the worker thread
+                call = functools.partial(contextvars.copy_context().run, call)
+            result = await loop.run_in_executor(self._get_pool(kind), call)
+
+        # Some sync methods hand back a coroutine to finish on the loop
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    def _observe_inline(self, name: str, elapsed_ms: float) -> None:
+        """Track how long an INLINE component blocked the loop; promote it once it is regularly slow"""
+        recent = self._recent.get(name)
+        if recent is None:
+            recent = self._recent[name] = deque(maxlen=self.window)
+        recent.append(elapsed_ms)
+
+        slow = [ms for ms in recent if ms > self.slow_call_ms]
+        if len(slow) < self.promote_after:
+            return
+
+        reason = (f"{len(slow)} of its last {len(recent)} calls blocked the event loop for more than "
+                  f"{self.slow_call_ms:g} ms (slowest {max(slow):.1f} ms)")
+        self._kinds[name] = ExecutorKind.THREAD
+        self._promotions[name] = {
+            "executor": ExecutorKind.THREAD.value,
+            "reason": reason,
+            "slow_calls": len(slow),
+            "max_ms": max(slow),
+            "promoted_at": time.time(),
+        }
+        del self._recent[name]
+        log.info("[ComponentExecutor] Moved component '%s' to the thread pool: %s", name, reason)
+
+    def get_promotions(self) -> Dict[str, Dict[str, Any]]:
+        """Components moved off the event loop after being measured slow, with the reason"""
+        return dict(self._promotions)
+
+    def _get_pool(self, kind: ExecutorKind) -> Executor:
+        if kind is ExecutorKind.PROCESS:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+            return self._process_pool
+
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="woodwork-component"
+            )
+        return self._thread_pool
+
+    def shutdown(self) -> None:
+        """Release the pools; calls already running finish in the background"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        latency = self.latency.snapshot()
+        return {
+            name: {
+                **counters,
+                "executor": self.kind_of(name).value,
+                "max_concurrency": self._limits.get(name, self.default_limit),
+                "promoted": name in self._promotions,
+                "wait_ms": latency["wait"].get(name),
+                "run_ms": latency["run"].get(name),
+            }
+            for name, counters in self._counters.items()
+        }
+
+
+def _is_picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+        return True
+    except Exception:
+        return False
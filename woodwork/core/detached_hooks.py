@@ -0,0 +1,199 @@
+"""
+Detached Hooks - Bounded, off-critical-path hook execution
+
+Inline hooks are awaited by UnifiedEventBus.emit() before pipes and routing
+run, so a slow observer adds its full latency to every agent step. A detached
+hook is instead fed through its own bounded asyncio queue and drained by a
+dedicated worker task:
+- emit() only enqueues, so the critical path pays for pipes alone
+- a full queue either drops the new event, drops the oldest one, or blocks
+- each invocation can be bounded by a timeout
+- sync hooks run on a sized thread pool owned by the bus, not the loop default
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+class HookMode(Enum):
+    """How the event bus runs a hook"""
+    INLINE = "inline"      # awaited by emit() before pipes run
+    DETACHED = "detached"  # queued and run by a background worker
+
+
+class HookOverflowPolicy(Enum):
+    """What a detached hook does when its queue is full"""
+    DROP = "drop"                # discard the new event
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued event
+    BLOCK = "block"              # make emit() wait for space
+
+
+class DetachedHook:
+    """
+    A hook drained from a bounded queue by its own worker task.
+
+    The queue and worker are created lazily on the running loop, and recreated
+    if the hook is used from a different loop (e.g. successive asyncio.run()
+    calls in tests).
+
+    Timeouts on sync hooks stop waiting for the result, but the call itself
+    keeps its executor thread until it returns; the pool size bounds how many
+    such stragglers can pile up.
+    """
+
+    def __init__(
+        self,
+        hook: Callable,
+        name: str,
+        executor_provider: Callable[[], Optional[Executor]],
+        queue_size: int = 1000,
+        overflow: HookOverflowPolicy = HookOverflowPolicy.DROP,
+        timeout: Optional[float] = None,
+        observer: Optional[Callable[[float], None]] = None,
+    ):
+        if queue_size <= 0:
+            raise ValueError("Detached hook queue_size must be positive")
+
+        self.hook = hook
+        self.name = name
+        self.queue_size = queue_size
+        self.overflow = HookOverflowPolicy(overflow)
+        self.timeout = timeout
+        self.is_async = asyncio.iscoroutinefunction(hook)
+
+        self._executor_provider = executor_provider
+        self._observer = observer  # called with each invocation's latency in ms
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "dropped": 0,
+            "timeouts": 0,
+            "errors": 0,
+        }
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Get the queue for the running loop, starting the worker if needed"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._worker = None
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run(self._queue), name=f"woodwork-hook:{self.name}")
+
+        return self._queue
+
+    def offer(self, payload: Any) -> bool:
+        """
+        Enqueue payload without waiting.
+
+        Returns False only when the queue is full and the policy is BLOCK;
+        the caller should then await put().
+        """
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            if self.overflow is HookOverflowPolicy.BLOCK:
+                return False
+
+            self.stats["dropped"] += 1
+            if self.overflow is HookOverflowPolicy.DROP_OLDEST:
+                queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait(payload)
+                self.stats["enqueued"] += 1
+
+            log.debug("[DetachedHook] Queue full for '%s', dropped event (%s)", self.name, self.overflow.value)
+            return True
+
+        self.stats["enqueued"] += 1
+        return True
+
+    async def put(self, payload: Any) -> None:
+        """Enqueue payload, waiting for space if the policy is BLOCK"""
+        if not self.offer(payload):
+            await self._queue.put(payload)
+            self.stats["enqueued"] += 1
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            payload = await queue.get()
+            try:
+                await self._invoke(payload)
+            finally:
+                queue.task_done()
+
+    async def _invoke(self, payload: Any) -> None:
+        start_time = time.perf_counter()
+        try:
+            if self.is_async:
+                call = self.hook(payload)
+            else:
+                call = asyncio.get_running_loop().run_in_executor(self._executor_provider(), self.hook, payload)
+
+            if self.timeout is not None:
+                await asyncio.wait_for(call, self.timeout)
+            else:
+                await call
+            self.stats["processed"] += 1
+
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            log.warning("[DetachedHook] Hook '%s' timed out after %.3fs", self.name, self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.error("[DetachedHook] Hook '%s' failed: %s", self.name, e)
+        finally:
+            if self._observer is not None:
+                self._observer((time.perf_counter() - start_time) * 1000)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled"""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        if self._worker is None or self._worker.done():
+            self._ensure_worker()
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the worker; queued events that were not handled are discarded and counted as dropped"""
+        if self._queue is not None and not self._queue.empty():
+            unhandled = self._queue.qsize()
+            self.stats["dropped"] += unhandled
+            log.warning("[DetachedHook] Hook '%s' closed with %d events unhandled", self.name, unhandled)
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done() and self._loop is asyncio.get_running_loop():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._queue = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queue_depth": self.queue_depth,
+            "queue_size": self.queue_size,
+            "overflow": self.overflow.value,
+            "timeout": self.timeout,
+        }
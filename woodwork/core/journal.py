@@ -0,0 +1,272 @@
+"""
+Event Journal - Memory-mapped, append-only log of bus traffic
+
+Records emitted payloads, routed deliveries and message bus traffic into
+segment files under .woodwork/journal, so a session can be inspected after
+the fact or replayed through a bus without DEBUG logging.
+
+Each record is length-prefixed:
+
+    u32 body length
+    u8  kind | f64 timestamp
+    u16 event type | u16 session id | u16 source | u16 target | u32 payload  (lengths)
+    event type, session id, source, target (utf-8), payload (compact JSON)
+
+Segments are preallocated and written through mmap; the body is copied
+before its length prefix, so a reader never sees a length for a partial
+record. Dirty pages are flushed to disk at most every fsync_interval
+seconds and whenever a segment is closed. A zero length marks the unused
+tail of a preallocated segment.
+"""
+
+import glob
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_DIR = os.path.join(".woodwork", "journal")
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".wwj"
+
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<BdHHHHI")  # kind, timestamp, field lengths
+
+
+class JournalRecordKind(IntEnum):
+    """What a journal record describes"""
+    EMIT = 1      # UnifiedEventBus.emit payload (before pipes)
+    DELIVERY = 2  # routed delivery from one component to another
+    PUBLISH = 3   # InMemoryMessageBus.publish envelope
+    SEND = 4      # InMemoryMessageBus.send_to_component envelope
+
+
+@dataclass
+class JournalRecord:
+    """A decoded journal record"""
+    kind: JournalRecordKind
+    timestamp: float
+    event_type: str
+    session_id: Optional[str]
+    source: Optional[str]
+    target: Optional[str]
+    payload: Any
+
+
+def _encode_payload(payload: Any) -> bytes:
+    if hasattr(payload, "to_dict"):
+        payload = payload.to_dict()
+    return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _segment_path(directory: str, index: int) -> str:
+    return os.path.join(directory, f"{SEGMENT_PREFIX}{index:08d}{SEGMENT_SUFFIX}")
+
+
+def list_segments(directory: str = DEFAULT_JOURNAL_DIR) -> list:
+    """Get segment file paths in write order"""
+    return sorted(glob.glob(os.path.join(directory, f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")))
+
+
+class EventJournal:
+    """
+    Append-only journal writer.
+
+    Not thread-safe: append from the event loop thread only.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_JOURNAL_DIR,
+        segment_size: int = 16 * 1024 * 1024,
+        fsync_interval: float = 1.0,
+    ):
+        if segment_size <= _LENGTH.size + _HEADER.size:
+            raise ValueError("Journal segment_size is too small")
+
+        self.directory = directory
+        self.segment_size = segment_size
+        self.fsync_interval = fsync_interval
+
+        os.makedirs(directory, exist_ok=True)
+        existing = list_segments(directory)
+        self._next_index = (
+            int(os.path.basename(existing[-1])[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) + 1 if existing else 0
+        )
+
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._capacity = 0
+        self._offset = 0
+        self._last_sync = time.monotonic()
+        self.closed = False
+
+        self.stats = {
+            "records_written": 0,
+            "bytes_written": 0,
+            "segments_written": 0,
+            "syncs": 0,
+        }
+
+    def record_emit(self, event_type: str, payload: Any, session_id: Optional[str] = None) -> None:
+        self.append(JournalRecordKind.EMIT, event_type, payload, session_id=session_id)
+
+    def record_delivery(self, source: str, target: str, event_type: str, payload: Any,
+                        session_id: Optional[str] = None) -> None:
+        self.append(JournalRecordKind.DELIVERY, event_type, payload,
+                    session_id=session_id, source=source, target=target)
+
+    def record_envelope(self, kind: JournalRecordKind, envelope: Any) -> None:
+        self.append(kind, envelope.event_type, envelope, session_id=envelope.session_id,
+                    source=envelope.sender_component, target=envelope.target_component)
+
+    def append(
+        self,
+        kind: JournalRecordKind,
+        event_type: str,
+        payload: Any,
+        session_id: Optional[str] = None,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Append one record, rolling to a new segment when the current one is full"""
+        if self.closed:
+            raise RuntimeError("Journal is closed")
+
+        event_bytes = event_type.encode("utf-8")
+        session_bytes = (session_id or "").encode("utf-8")
+        source_bytes = (source or "").encode("utf-8")
+        target_bytes = (target or "").encode("utf-8")
+        payload_bytes = _encode_payload(payload)
+
+        body = b"".join((
+            _HEADER.pack(int(kind), timestamp if timestamp is not None else time.time(),
+                         len(event_bytes), len(session_bytes), len(source_bytes), len(target_bytes),
+                         len(payload_bytes)),
+            event_bytes, session_bytes, source_bytes, target_bytes, payload_bytes,
+        ))
+        record_size = _LENGTH.size + len(body)
+
+        if self._mmap is None or self._offset + record_size > self._capacity:
+            self._roll(record_size)
+
+        offset = self._offset
+        body_start = offset + _LENGTH.size
+        self._mmap[body_start:body_start + len(body)] = body
+        _LENGTH.pack_into(self._mmap, offset, len(body))
+        self._offset = body_start + len(body)
+
+        self.stats["records_written"] += 1
+        self.stats["bytes_written"] += record_size
+
+        if self.fsync_interval is not None and time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.flush()
+
+    def _roll(self, min_size: int) -> None:
+        self._close_segment()
+
+        # Oversized records get a segment of their own
+        capacity = max(self.segment_size, min_size + _LENGTH.size)
+        path = _segment_path(self.directory, self._next_index)
+        self._next_index += 1
+
+        self._file = open(path, "w+b")
+        self._file.truncate(capacity)
+        self._mmap = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+        self._offset = 0
+        self.stats["segments_written"] += 1
+        log.debug("[EventJournal] Opened segment %s (%d bytes)", path, capacity)
+
+    def _close_segment(self) -> None:
+        if self._mmap is None:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        # Drop the unused preallocated tail
+        self._file.truncate(self._offset)
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._mmap = None
+        self._file = None
+
+    def flush(self) -> None:
+        """Write dirty pages of the current segment to disk"""
+        if self._mmap is not None:
+            self._mmap.flush()
+            self.stats["syncs"] += 1
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the current segment"""
+        if self.closed:
+            return
+        self._close_segment()
+        self.closed = True
+        log.debug("[EventJournal] Closed after %d records", self.stats["records_written"])
+
+    def __enter__(self) -> "EventJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "directory": self.directory, "segment_offset": self._offset}
+
+
+def _decode_segment(data: bytes) -> Iterator[JournalRecord]:
+    offset = 0
+    end = len(data)
+    while offset + _LENGTH.size <= end:
+        (length,) = _LENGTH.unpack_from(data, offset)
+        if length == 0 or offset + _LENGTH.size + length > end:
+            return  # preallocated tail or torn write
+
+        pos = offset + _LENGTH.size
+        kind, timestamp, event_len, session_len, source_len, target_len, payload_len = _HEADER.unpack_from(data, pos)
+        pos += _HEADER.size
+        fields = []
+        for size in (event_len, session_len, source_len, target_len):
+            fields.append(data[pos:pos + size].decode("utf-8"))
+            pos += size
+        payload = json.loads(data[pos:pos + payload_len])
+
+        yield JournalRecord(
+            kind=JournalRecordKind(kind),
+            timestamp=timestamp,
+            event_type=fields[0],
+            session_id=fields[1] or None,
+            source=fields[2] or None,
+            target=fields[3] or None,
+            payload=payload,
+        )
+        offset += _LENGTH.size + length
+
+
+def read_journal(
+    directory: str = DEFAULT_JOURNAL_DIR,
+    session_id: Optional[str] = None,
+    kinds: Optional[Iterable[JournalRecordKind]] = None,
+) -> Iterator[JournalRecord]:
+    """Iterate journal records in write order, optionally filtered by session and kind"""
+    kinds = set(kinds) if kinds is not None else None
+    for path in list_segments(directory):
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for record in _decode_segment(data):
+                    if kinds is not None and record.kind not in kinds:
+                        continue
+                    if session_id is not None and record.session_id != session_id:
+                        continue
+                    yield record
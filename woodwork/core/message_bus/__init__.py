@@ -12,8 +12,12 @@ Key Features:
 - Support for multiple backends (in-memory, Redis, NATS)
 """
 
-from .interface import MessageBusInterface, MessageEnvelope, MessageDeliveryMode, MessagePattern
+from .interface import MessageBusInterface, MessageEnvelope, MessageDeliveryMode, MessagePattern, MessagePriority
+from .codec import Codec, JSONCodec, BinaryCodec, get_codec, register_codec
 from .in_memory_bus import InMemoryMessageBus
+from .sqlite_bus import SQLiteMessageBus
+from .socket_bus import SocketBroker, SocketMessageBus
+from .redis_bus import RedisStreamsMessageBus
 from .factory import MessageBusFactory, create_default_message_bus, get_global_message_bus, set_global_message_bus
 from .integration import MessageBusIntegration
 
@@ -23,9 +27,21 @@ __all__ = [
     'MessageEnvelope', 
     'MessageDeliveryMode',
     'MessagePattern',
+    'MessagePriority',
     
+    # Codecs
+    'Codec',
+    'JSONCodec',
+    'BinaryCodec',
+    'get_codec',
+    'register_codec',
+
     # Implementations
     'InMemoryMessageBus',
+    'SQLiteMessageBus',
+    'SocketMessageBus',
+    'SocketBroker',
+    'RedisStreamsMessageBus',
     
     # Factory and globals
     'MessageBusFactory',
@@ -35,7 +51,7 @@ __all__ = [
     
     # Routing
     'DeclarativeRouter',
-    
+
     # Integration
     'MessageBusIntegration',
 ]
\ No newline at end of file
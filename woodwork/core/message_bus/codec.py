@@ -0,0 +1,417 @@
+"""
+Codecs - Pluggable wire encodings for envelopes, payloads and stream chunks
+
+Transports that leave the process (socket broker, SQLite store, Redis) serialize
+through a Codec instead of calling json directly:
+
+- JSONCodec: the existing path (to_dict() + json), readable and compatible
+  with data written before codecs existed
+- BinaryCodec: a msgpack-compatible encoding (nil/bool/int/float/str/bin/
+  array/map) plus one extension for dataclass records. A record is a 4-byte
+  type id (CRC32 of module.qualname) followed by its field values in
+  declaration order, so field names are never repeated on the wire. The
+  field table (names, enum converters) is derived once per class from the
+  dataclass definition. bytes travel as bin, without base64.
+
+Record types are resolved by id on decode: MessageEnvelope, StreamChunk,
+StreamMetadata and every imported BasePayload subclass are known; other
+dataclasses can be added with BinaryCodec.register().
+"""
+
+import dataclasses
+import enum
+import json
+import struct
+import typing
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from woodwork.types.events import BasePayload
+from woodwork.types.streaming_data import StreamChunk, StreamMetadata
+
+from .interface import MessageEnvelope
+
+
+class Codec(ABC):
+    """Encodes envelopes (and any value the codec supports) to bytes and back"""
+
+    name = "codec"
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode a value to bytes"""
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes produced by encode()"""
+        pass
+
+    def encode_envelope(self, envelope: MessageEnvelope) -> bytes:
+        return self.encode(envelope)
+
+    def decode_envelope(self, data: bytes) -> MessageEnvelope:
+        return self.decode(data)
+
+
+class JSONCodec(Codec):
+    """UTF-8 JSON via to_dict(); records decode as plain dicts"""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        if hasattr(value, "to_dict"):
+            value = value.to_dict()
+        return json.dumps(value, default=str).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def decode_envelope(self, data: bytes) -> MessageEnvelope:
+        return MessageEnvelope.from_dict(json.loads(data))
+
+
+# msgpack type bytes
+_NIL, _FALSE, _TRUE = 0xC0, 0xC2, 0xC3
+_BIN8, _BIN16, _BIN32 = 0xC4, 0xC5, 0xC6
+_EXT8, _EXT16, _EXT32 = 0xC7, 0xC8, 0xC9
+_FLOAT64 = 0xCB
+_UINT64 = 0xCF
+_INT8, _INT16, _INT32, _INT64 = 0xD0, 0xD1, 0xD2, 0xD3
+_STR8, _STR16, _STR32 = 0xD9, 0xDA, 0xDB
+_ARRAY16, _ARRAY32 = 0xDC, 0xDD
+_MAP16, _MAP32 = 0xDE, 0xDF
+
+_RECORD_EXT = 1  # extension type for dataclass records
+
+_B = struct.Struct(">B")
+_H = struct.Struct(">H")
+_I = struct.Struct(">I")
+_b = struct.Struct(">b")
+_h = struct.Struct(">h")
+_i = struct.Struct(">i")
+_q = struct.Struct(">q")
+_Q = struct.Struct(">Q")
+_d = struct.Struct(">d")
+
+
+class _RecordType:
+    """Field table for one dataclass, built once"""
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.type_id = zlib.crc32(f"{cls.__module__}.{cls.__qualname__}".encode())
+        self.fields = dataclasses.fields(cls)
+        self.names = [f.name for f in self.fields]
+        self.init_names = {f.name for f in self.fields if f.init}
+        # Records that compute fields lazily (StreamChunk checksums) fill them in first
+        self.prepare: Optional[Callable[[Any], None]] = getattr(cls, "_prepare_for_wire", None)
+
+        try:
+            hints = typing.get_type_hints(cls)
+        except Exception:
+            hints = {}  # unresolvable annotations: enum fields then decode as their values
+        self.converters: List[Optional[Callable[[Any], Any]]] = [
+            _enum_type(hints.get(name)) for name in self.names
+        ]
+
+
+def _enum_type(hint: Any) -> Optional[type]:
+    """The Enum class a field holds (also through Optional[...]), if any"""
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        return hint
+    for arg in typing.get_args(hint):
+        if isinstance(arg, type) and issubclass(arg, enum.Enum):
+            return arg
+    return None
+
+
+class BinaryCodec(Codec):
+    """msgpack-compatible binary encoding with schema-aware dataclass records"""
+
+    name = "binary"
+
+    def __init__(self):
+        self._by_class: Dict[type, _RecordType] = {}
+        self._by_id: Dict[int, _RecordType] = {}
+        for cls in (MessageEnvelope, StreamChunk, StreamMetadata):
+            self.register(cls)
+
+    def register(self, cls: Type[Any]) -> None:
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{cls.__name__} is not a dataclass")
+        record = _RecordType(cls)
+        self._by_class[cls] = record
+        self._by_id[record.type_id] = record
+
+    def _record_for_id(self, type_id: int) -> _RecordType:
+        record = self._by_id.get(type_id)
+        if record is None:
+            # Payload classes can be defined anywhere; look through the ones imported so far
+            pending = [BasePayload]
+            while pending:
+                cls = pending.pop()
+                pending.extend(cls.__subclasses__())
+                if cls not in self._by_class and dataclasses.is_dataclass(cls):
+                    self.register(cls)
+            record = self._by_id.get(type_id)
+            if record is None:
+                raise ValueError(f"Unknown record type id {type_id:#x}; register it with BinaryCodec.register()")
+        return record
+
+    # Encoding
+
+    def encode(self, value: Any) -> bytes:
+        parts: List[bytes] = []
+        self._pack(value, parts)
+        return b"".join(parts)
+
+    def _pack(self, value: Any, parts: List[bytes]) -> None:
+        value_type = type(value)
+
+        if value_type is str:
+            data = value.encode()
+            n = len(data)
+            if n < 32:
+                parts.append(_B.pack(0xA0 | n))
+            elif n < 0x100:
+                parts.append(bytes((_STR8, n)))
+            elif n < 0x10000:
+                parts.append(_B.pack(_STR16) + _H.pack(n))
+            else:
+                parts.append(_B.pack(_STR32) + _I.pack(n))
+            parts.append(data)
+
+        elif value_type is int:
+            if 0 <= value < 0x80:
+                parts.append(_B.pack(value))
+            elif -32 <= value < 0:
+                parts.append(_b.pack(value))
+            elif -0x80 <= value < 0x80:
+                parts.append(_B.pack(_INT8) + _b.pack(value))
+            elif -0x8000 <= value < 0x8000:
+                parts.append(_B.pack(_INT16) + _h.pack(value))
+            elif -0x80000000 <= value < 0x80000000:
+                parts.append(_B.pack(_INT32) + _i.pack(value))
+            elif -0x8000000000000000 <= value < 0x8000000000000000:
+                parts.append(_B.pack(_INT64) + _q.pack(value))
+            else:
+                parts.append(_B.pack(_UINT64) + _Q.pack(value))
+
+        elif value is None:
+            parts.append(b"\xc0")
+        elif value is True:
+            parts.append(b"\xc3")
+        elif value is False:
+            parts.append(b"\xc2")
+
+        elif value_type is float:
+            parts.append(_B.pack(_FLOAT64) + _d.pack(value))
+
+        elif value_type is dict:
+            n = len(value)
+            if n < 16:
+                parts.append(_B.pack(0x80 | n))
+            elif n < 0x10000:
+                parts.append(_B.pack(_MAP16) + _H.pack(n))
+            else:
+                parts.append(_B.pack(_MAP32) + _I.pack(n))
+            pack = self._pack
+            for key, item in value.items():
+                pack(key, parts)
+                pack(item, parts)
+
+        elif value_type is list or value_type is tuple:
+            self._pack_array(value, parts)
+
+        elif value_type is bytes or value_type is bytearray or value_type is memoryview:
+            n = len(value)
+            if n < 0x100:
+                parts.append(bytes((_BIN8, n)))
+            elif n < 0x10000:
+                parts.append(_B.pack(_BIN16) + _H.pack(n))
+            else:
+                parts.append(_B.pack(_BIN32) + _I.pack(n))
+            parts.append(bytes(value))
+
+        elif isinstance(value, enum.Enum):
+            self._pack(value.value, parts)
+
+        elif dataclasses.is_dataclass(value):
+            record = self._by_class.get(value_type)
+            if record is None:
+                self.register(value_type)
+                record = self._by_class[value_type]
+            if record.prepare is not None:
+                record.prepare(value)
+            body: List[bytes] = [_I.pack(record.type_id)]
+            self._pack_array([getattr(value, name) for name in record.names], body)
+            data = b"".join(body)
+            n = len(data)
+            if n < 0x100:
+                parts.append(bytes((_EXT8, n, _RECORD_EXT)))
+            elif n < 0x10000:
+                parts.append(_B.pack(_EXT16) + _H.pack(n) + _B.pack(_RECORD_EXT))
+            else:
+                parts.append(_B.pack(_EXT32) + _I.pack(n) + _B.pack(_RECORD_EXT))
+            parts.append(data)
+
+        elif isinstance(value, (str, int, float, dict, list, tuple, bytes)):
+            # Subclasses (IntEnum handled above, str subclasses, OrderedDict, ...)
+            for base in (str, int, float, dict, list, bytes):
+                if isinstance(value, base):
+                    self._pack(base(value), parts)
+                    return
+
+        else:
+            self._pack(str(value), parts)
+
+    def _pack_array(self, values, parts: List[bytes]) -> None:
+        n = len(values)
+        if n < 16:
+            parts.append(_B.pack(0x90 | n))
+        elif n < 0x10000:
+            parts.append(_B.pack(_ARRAY16) + _H.pack(n))
+        else:
+            parts.append(_B.pack(_ARRAY32) + _I.pack(n))
+        pack = self._pack
+        for item in values:
+            pack(item, parts)
+
+    # Decoding
+
+    def decode(self, data: bytes) -> Any:
+        value, offset = self._unpack(data, 0)
+        if offset != len(data):
+            raise ValueError(f"Trailing data after decoded value ({len(data) - offset} bytes)")
+        return value
+
+    def _unpack(self, data: bytes, offset: int) -> Tuple[Any, int]:
+        tag = data[offset]
+        offset += 1
+
+        if tag < 0x80:
+            return tag, offset
+        if 0xA0 <= tag <= 0xBF:
+            end = offset + (tag & 0x1F)
+            return data[offset:end].decode(), end
+        if 0x90 <= tag <= 0x9F:
+            return self._unpack_array(data, offset, tag & 0x0F)
+        if 0x80 <= tag <= 0x8F:
+            return self._unpack_map(data, offset, tag & 0x0F)
+        if tag >= 0xE0:
+            return tag - 0x100, offset
+
+        if tag == _NIL:
+            return None, offset
+        if tag == _TRUE:
+            return True, offset
+        if tag == _FALSE:
+            return False, offset
+        if tag == _FLOAT64:
+            return _d.unpack_from(data, offset)[0], offset + 8
+        if tag == _STR8:
+            n = data[offset]
+            return data[offset + 1:offset + 1 + n].decode(), offset + 1 + n
+        if tag == _STR16:
+            n = _H.unpack_from(data, offset)[0]
+            return data[offset + 2:offset + 2 + n].decode(), offset + 2 + n
+        if tag == _STR32:
+            n = _I.unpack_from(data, offset)[0]
+            return data[offset + 4:offset + 4 + n].decode(), offset + 4 + n
+        if tag == _INT8:
+            return _b.unpack_from(data, offset)[0], offset + 1
+        if tag == _INT16:
+            return _h.unpack_from(data, offset)[0], offset + 2
+        if tag == _INT32:
+            return _i.unpack_from(data, offset)[0], offset + 4
+        if tag == _INT64:
+            return _q.unpack_from(data, offset)[0], offset + 8
+        if tag == _UINT64:
+            return _Q.unpack_from(data, offset)[0], offset + 8
+        if tag == _BIN8:
+            n = data[offset]
+            return bytes(data[offset + 1:offset + 1 + n]), offset + 1 + n
+        if tag == _BIN16:
+            n = _H.unpack_from(data, offset)[0]
+            return bytes(data[offset + 2:offset + 2 + n]), offset + 2 + n
+        if tag == _BIN32:
+            n = _I.unpack_from(data, offset)[0]
+            return bytes(data[offset + 4:offset + 4 + n]), offset + 4 + n
+        if tag == _ARRAY16:
+            return self._unpack_array(data, offset + 2, _H.unpack_from(data, offset)[0])
+        if tag == _ARRAY32:
+            return self._unpack_array(data, offset + 4, _I.unpack_from(data, offset)[0])
+        if tag == _MAP16:
+            return self._unpack_map(data, offset + 2, _H.unpack_from(data, offset)[0])
+        if tag == _MAP32:
+            return self._unpack_map(data, offset + 4, _I.unpack_from(data, offset)[0])
+        if tag == _EXT8:
+            return self._unpack_ext(data, offset + 1, data[offset])
+        if tag == _EXT16:
+            return self._unpack_ext(data, offset + 2, _H.unpack_from(data, offset)[0])
+        if tag == _EXT32:
+            return self._unpack_ext(data, offset + 4, _I.unpack_from(data, offset)[0])
+
+        raise ValueError(f"Unsupported type byte {tag:#x} at offset {offset - 1}")
+
+    def _unpack_array(self, data: bytes, offset: int, n: int) -> Tuple[List[Any], int]:
+        items = []
+        unpack = self._unpack
+        for _ in range(n):
+            item, offset = unpack(data, offset)
+            items.append(item)
+        return items, offset
+
+    def _unpack_map(self, data: bytes, offset: int, n: int) -> Tuple[Dict[Any, Any], int]:
+        result = {}
+        unpack = self._unpack
+        for _ in range(n):
+            key, offset = unpack(data, offset)
+            result[key], offset = unpack(data, offset)
+        return result, offset
+
+    def _unpack_ext(self, data: bytes, offset: int, n: int) -> Tuple[Any, int]:
+        ext_type = data[offset]
+        start = offset + 1
+        if ext_type != _RECORD_EXT:
+            raise ValueError(f"Unsupported extension type {ext_type}")
+
+        record = self._record_for_id(_I.unpack_from(data, start)[0])
+        values, _ = self._unpack(data, start + 4)
+
+        kwargs = {}
+        late = []
+        for name, converter, value in zip(record.names, record.converters, values):
+            if converter is not None and value is not None:
+                value = converter(value)
+            if name in record.init_names:
+                kwargs[name] = value
+            else:
+                late.append((name, value))
+        instance = record.cls(**kwargs)
+        for name, value in late:
+            object.__setattr__(instance, name, value)
+        return instance, start + n
+
+
+_codecs: Dict[str, Codec] = {
+    "json": JSONCodec(),
+    "binary": BinaryCodec(),
+}
+
+
+def register_codec(codec: Codec) -> None:
+    """Make a codec available to transports by its name"""
+    _codecs[codec.name] = codec
+
+
+def get_codec(codec: Any = "json") -> Codec:
+    """Resolve a codec instance or name ("json", "binary", or a registered one)"""
+    if isinstance(codec, Codec):
+        return codec
+    try:
+        return _codecs[codec]
+    except KeyError:
+        raise ValueError(f"Unknown codec: {codec}. Available: {sorted(_codecs)}")
@@ -0,0 +1,163 @@
+"""
+Dedup Index - Bounded memory of delivered message ids for EXACTLY_ONCE
+
+A component handler that is not idempotent (e.g. a tool that writes a file)
+must not run twice for one message, yet retries and redeliveries make
+duplicates routine. DedupIndex remembers which message ids a component has
+already handled, in constant memory:
+
+- an exact LRU of the most recent lru_size ids answers the common case
+  (a retry shortly after the original) with no false positives
+- a time-windowed bloom filter covers ids older than the LRU: two
+  generations of `capacity` ids each, the older dropped when the current
+  one is full or window_seconds old, so an id is remembered for at least
+  one window (by default the envelope TTL, after which a duplicate would
+  be expired anyway)
+
+An id the LRU does not hold but the bloom filter matches is treated as a
+duplicate ("probable"). The chance that this suppresses a new message is
+the filter's false-positive rate, which is reported by get_stats() as an
+estimate from the current fill.
+"""
+
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings using double hashing"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("Bloom filter error_rate must be in (0, 1)")
+
+        self.capacity = capacity
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def positions(self, key: str) -> List[int]:
+        """Bit positions for key; filters of the same size can share them"""
+        value = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=16).digest(), "little")
+        h1 = value & 0xFFFFFFFFFFFFFFFF
+        h2 = (value >> 64) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str, positions: Optional[List[int]] = None) -> None:
+        bits = self.bits
+        for position in positions or self.positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def contains(self, key: str, positions: Optional[List[int]] = None) -> bool:
+        bits = self.bits
+        for position in positions or self.positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    __contains__ = contains
+
+    def fill_ratio(self) -> float:
+        return sum(bin(byte).count("1") for byte in self.bits) / self.num_bits
+
+    def false_positive_rate(self) -> float:
+        """Estimated chance that an id never added is reported as present"""
+        return self.fill_ratio() ** self.num_hashes
+
+
+class DedupIndex:
+    """Message ids a component has already handled: exact LRU plus a two-generation bloom filter"""
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        window_seconds: float = 300.0,
+        error_rate: float = 0.001,
+        lru_size: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.error_rate = error_rate
+        self.lru_size = lru_size
+        self._clock = clock
+
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._generation_started = clock()
+        self._last_positions: Tuple[Optional[str], List[int]] = (None, [])
+
+        self.stats = {
+            "checked": 0,
+            "duplicates_exact": 0,
+            "duplicates_probable": 0,
+            "rotations": 0,
+        }
+
+    def _rotate_if_due(self) -> None:
+        now = self._clock()
+        if self._current.count >= self.capacity or now - self._generation_started >= self.window_seconds:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._generation_started = now
+            self.stats["rotations"] += 1
+
+    def _positions(self, message_id: str) -> List[int]:
+        # Both generations have the same size, and add() usually follows seen() for the same id
+        last_id, positions = self._last_positions
+        if last_id != message_id:
+            positions = self._current.positions(message_id)
+            self._last_positions = (message_id, positions)
+        return positions
+
+    def seen(self, message_id: str) -> bool:
+        """Whether message_id has (probably) been handled before"""
+        self.stats["checked"] += 1
+        recent = self._recent
+        if message_id in recent:
+            recent.move_to_end(message_id)
+            self.stats["duplicates_exact"] += 1
+            return True
+
+        self._rotate_if_due()
+        positions = self._positions(message_id)
+        if self._current.contains(message_id, positions) or self._previous.contains(message_id, positions):
+            self.stats["duplicates_probable"] += 1
+            return True
+        return False
+
+    def add(self, message_id: str) -> None:
+        """Record message_id as handled"""
+        recent = self._recent
+        recent[message_id] = None
+        recent.move_to_end(message_id)
+        if len(recent) > self.lru_size:
+            recent.popitem(last=False)
+
+        self._rotate_if_due()
+        self._current.add(message_id, self._positions(message_id))
+
+    def memory_bytes(self) -> int:
+        """Bloom filter bits (fixed); the LRU adds at most lru_size ids on top"""
+        return len(self._current.bits) + len(self._previous.bits)
+
+    def get_stats(self) -> Dict[str, Any]:
+        current_rate = self._current.false_positive_rate()
+        previous_rate = self._previous.false_positive_rate()
+        return {
+            **self.stats,
+            "lru_entries": len(self._recent),
+            "bloom_entries": self._current.count + self._previous.count,
+            "bloom_bytes": self.memory_bytes(),
+            # A lookup checks both generations
+            "false_positive_rate": 1.0 - (1.0 - current_rate) * (1.0 - previous_rate),
+        }
@@ -39,6 +39,10 @@ class MessageBusFactory:
             return MessageBusFactory._create_auto_bus(config)
         elif bus_type == "memory" or bus_type == "in_memory":
             return MessageBusFactory._create_in_memory_bus(config)
+        elif bus_type == "sqlite":
+            return MessageBusFactory._create_sqlite_bus(config)
+        elif bus_type == "socket":
+            return MessageBusFactory._create_socket_bus(config)
         elif bus_type == "redis":
             return MessageBusFactory._create_redis_bus(config)
         elif bus_type == "nats":
@@ -114,26 +118,101 @@ class MessageBusFactory:
         max_queue_size = config.get("max_queue_size", 10000)
         max_retries = config.get("max_retries", 3)
         
-        log.debug("[MessageBusFactory] Creating InMemoryMessageBus: queue_size=%d, retries=%d", 
-                  max_queue_size, max_retries)
+        # Optional journal: True for defaults, or a dict of EventJournal options
+        journal = None
+        journal_config = config.get("journal")
+        if journal_config:
+            from woodwork.core.journal import EventJournal
+            journal = EventJournal(**(journal_config if isinstance(journal_config, dict) else {}))
+
+        log.debug("[MessageBusFactory] Creating InMemoryMessageBus: queue_size=%d, retries=%d, journal=%s", 
+                  max_queue_size, max_retries, journal.directory if journal else None)
         
         return InMemoryMessageBus(
             max_queue_size=max_queue_size,
-            max_retries=max_retries
+            max_retries=max_retries,
+            journal=journal,
+            retry_base_delay=config.get("retry_base_delay", 2.0),
+            retry_max_delay=config.get("retry_max_delay", 60.0),
+            retry_jitter=config.get("retry_jitter", 0.2),
+            delivery_mode=config.get("delivery_mode", "inline"),
+            mailbox_size=config.get("mailbox_size", 1000),
+            mailbox_overflow=config.get("mailbox_overflow", "block"),
+            dedup_capacity=config.get("dedup_capacity", 10000),
+            dedup_window_seconds=config.get("dedup_window_seconds", 300.0),
+            dedup_error_rate=config.get("dedup_error_rate", 0.001),
+            dedup_lru_size=config.get("dedup_lru_size", 1000),
+            lane_weights=config.get("lane_weights"),
+            lane_rules=config.get("lane_rules")
         )
     
+    @staticmethod
+    def _create_sqlite_bus(config: Dict[str, Any]) -> MessageBusInterface:
+        """Create durable SQLite (WAL) message bus with configuration"""
+        from .sqlite_bus import DEFAULT_SQLITE_PATH, SQLiteMessageBus
+
+        path = config.get("path", DEFAULT_SQLITE_PATH)
+        batch_size = config.get("batch_size", 256)
+
+        log.debug("[MessageBusFactory] Creating SQLiteMessageBus: path=%s, batch_size=%d", path, batch_size)
+
+        return SQLiteMessageBus(
+            path=path,
+            batch_size=batch_size,
+            commit_interval=config.get("commit_interval", 0.002),
+            lease_seconds=config.get("lease_seconds", 30.0),
+            poll_interval=config.get("poll_interval", 0.5),
+            claim_size=config.get("claim_size", 64),
+            max_retries=config.get("max_retries", 3),
+            retry_base_delay=config.get("retry_base_delay", 2.0),
+            retry_max_delay=config.get("retry_max_delay", 60.0),
+            retry_jitter=config.get("retry_jitter", 0.2),
+            synchronous=config.get("synchronous", "NORMAL"),
+            codec=config.get("codec", "json")
+        )
+
+    @staticmethod
+    def _create_socket_bus(config: Dict[str, Any]) -> MessageBusInterface:
+        """Create multi-process message bus over a Unix domain socket broker"""
+        from .socket_bus import DEFAULT_SOCKET_PATH, SocketMessageBus
+
+        path = config.get("path", DEFAULT_SOCKET_PATH)
+
+        log.debug("[MessageBusFactory] Creating SocketMessageBus: path=%s", path)
+
+        return SocketMessageBus(
+            path=path,
+            spawn_broker=config.get("spawn_broker", True),
+            shm_threshold=config.get("shm_threshold", 64 * 1024),
+            high_water=config.get("high_water", 1 << 20),
+            connect_timeout=config.get("connect_timeout", 5.0),
+            codec=config.get("codec", "binary")
+        )
+
     @staticmethod
     def _create_redis_bus(config: Dict[str, Any]) -> MessageBusInterface:
-        """Create Redis message bus (future implementation)"""
-        log.error("[MessageBusFactory] Redis message bus not yet implemented")
-        
-        # For now, fallback to in-memory with Redis-like configuration
-        log.warning("[MessageBusFactory] Falling back to in-memory bus until Redis implementation ready")
-        return MessageBusFactory._create_in_memory_bus({
-            **config,
-            "max_queue_size": config.get("max_queue_size", 50000),  # Higher capacity for Redis-like usage
-            "max_retries": config.get("max_retries", 5)
-        })
+        """Create Redis Streams message bus with configuration"""
+        from .redis_bus import RedisStreamsMessageBus
+
+        redis_url = config.get("redis_url") or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+        log.debug("[MessageBusFactory] Creating RedisStreamsMessageBus: prefix=%s, group=%s",
+                  config.get("stream_prefix", "woodwork"), config.get("consumer_group", "components"))
+
+        return RedisStreamsMessageBus(
+            redis_url=redis_url,
+            stream_prefix=config.get("stream_prefix", "woodwork"),
+            consumer_group=config.get("consumer_group", "components"),
+            consumer_name=config.get("consumer_name"),
+            max_queue_size=config.get("max_queue_size", 50000),
+            max_retries=config.get("max_retries", 5),
+            batch_size=config.get("batch_size", 64),
+            block_ms=config.get("block_ms", 500),
+            claim_idle_ms=config.get("claim_idle_ms", 30000),
+            claim_interval=config.get("claim_interval", 5.0),
+            max_connections=config.get("max_connections", 8),
+            codec=config.get("codec", "json")
+        )
     
     @staticmethod
     def _create_nats_bus(config: Dict[str, Any]) -> MessageBusInterface:
@@ -219,7 +298,7 @@ async def shutdown_global_message_bus() -> None:
     clean resource cleanup.
     """
     global _global_message_bus
-    
+
     if _global_message_bus is not None:
         log.info("[MessageBusFactory] Shutting down global message bus")
         await _global_message_bus.stop()
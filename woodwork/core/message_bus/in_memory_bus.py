@@ -7,14 +7,22 @@ dead letter queues, and comprehensive monitoring.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
-import uuid
 from collections import defaultdict, deque
-from typing import Dict, List, Callable, Any, Optional, Set
+from typing import Dict, List, Callable, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from .interface import MessageBusInterface, MessageEnvelope, MessageDeliveryMode, MessagePattern
+from .dedup import DedupIndex
+from .mailbox import DeliveryMode, MailboxOverflowPolicy, SubscriberMailbox
+from .retry_scheduler import RetryScheduler
+from woodwork.core.bus_core import BusCore
+from woodwork.core.metrics import LatencyMetrics
+from woodwork.core.priority_lanes import LANES, LanePolicy, MessagePriority, order_by_lane
+from woodwork.core.journal import DEFAULT_JOURNAL_DIR, EventJournal, JournalRecordKind, read_journal
 
 log = logging.getLogger(__name__)
 
@@ -27,6 +35,7 @@ class Subscription:
     callback: Callable[[MessageEnvelope], None]
     created_at: float
     message_count: int = 0
+    mailbox: Optional[SubscriberMailbox] = None
 
 
 @dataclass
@@ -37,6 +46,7 @@ class ComponentHandler:
     registered_at: float
     message_count: int = 0
     last_message_at: Optional[float] = None
+    mailbox: Optional[SubscriberMailbox] = None
 
 
 class InMemoryMessageBus(MessageBusInterface):
@@ -44,27 +54,93 @@ class InMemoryMessageBus(MessageBusInterface):
     High-performance in-memory message bus with enterprise features
     
     Features:
-    - Topic-based pub/sub for hooks
+    - Topic-based pub/sub for hooks, with wildcard patterns ("agent.*", "tool.#", "stream.>")
     - Direct component-to-component messaging  
-    - Retry logic with exponential backoff
+    - Retry logic with jittered exponential backoff (heap-scheduled)
     - Dead letter queue for failed messages
     - Comprehensive metrics and monitoring
     - Session isolation
+
+    Topic index, component handlers, queues and message counters live in a
+    shared BusCore; this class adds envelopes, retries and dead letters.
+
+    Queued envelopes are indexed by expiry time (created_at + ttl_seconds) in
+    a heap. Entries for envelopes that were delivered in the meantime are
+    skipped when they surface (lazy deletion), so expiring a message is
+    O(log n) and the cleanup task sleeps until the next expiry.
+
+    With delivery_mode="mailbox" every subscription and component handler
+    gets its own bounded mailbox and consumer task (see mailbox.py), so
+    publish() and send_to_component() only enqueue. The mode can also be
+    chosen per subscribe() / register_component_handler() call.
+
+    EXACTLY_ONCE envelopes are checked against a per-component DedupIndex
+    (see dedup.py) before the handler runs, and recorded once it succeeds,
+    so a retry of a message that was in fact handled is suppressed.
+
+    Envelopes travel in priority lanes (control / interactive / bulk, see
+    priority_lanes.py): mailboxes and queued backlogs are dequeued by
+    weighted round robin so control traffic overtakes stream chunks.
+    Envelopes whose deadline has passed are dropped before their handler
+    runs, and latency from creation to handling is tracked per lane.
     """
     
-    def __init__(self, max_queue_size: int = 10000, max_retries: int = 3):
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        max_retries: int = 3,
+        journal: Optional[EventJournal] = None,
+        retry_base_delay: float = 2.0,
+        retry_max_delay: float = 60.0,
+        retry_jitter: float = 0.2,
+        delivery_mode: str = "inline",
+        mailbox_size: int = 1000,
+        mailbox_overflow: str = "block",
+        dedup_capacity: int = 10000,
+        dedup_window_seconds: float = 300.0,
+        dedup_error_rate: float = 0.001,
+        dedup_lru_size: int = 1000,
+        lane_weights: Optional[Dict[str, int]] = None,
+        lane_rules: Optional[Dict[str, str]] = None,
+    ):
         self.max_queue_size = max_queue_size
         self.max_retries = max_retries
+        self.delivery_mode = DeliveryMode(delivery_mode)
+        self.mailbox_size = mailbox_size
+        self.mailbox_overflow = MailboxOverflowPolicy(mailbox_overflow)
+        self.dedup_options = {
+            "capacity": dedup_capacity,
+            "window_seconds": dedup_window_seconds,
+            "error_rate": dedup_error_rate,
+            "lru_size": dedup_lru_size,
+        }
+        self.lanes = LanePolicy(lane_weights, lane_rules)
+
+        # Optional append-only record of published and sent envelopes
+        self.journal = journal
         
         # Core messaging structures
+        self.core = BusCore(mailbox_size=max_queue_size)
         self.subscriptions: Dict[str, Subscription] = {}
-        self.topic_subscribers: Dict[str, Set[str]] = defaultdict(set)  # topic -> subscription_ids
-        self.component_handlers: Dict[str, ComponentHandler] = {}
+        self.topic_subscribers: Dict[str, Set[str]] = defaultdict(set)  # topic pattern -> subscription_ids
+        self._topic_index = self.core.topic_index  # topic pattern -> Subscription, resolved per published topic
+        self.component_handlers: Dict[str, ComponentHandler] = self.core.handlers
         
         # Message queues
-        self.component_queues: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_queue_size))
+        self.component_queues: Dict[str, deque] = self.core.mailboxes
         self.dead_letter_queue: deque = deque(maxlen=1000)
-        self.retry_queue: List[MessageEnvelope] = []
+
+        # Expiry index over queued envelopes: (expires_at, seq, component_id, envelope)
+        self._expiry_heap: List[Tuple[float, int, str, MessageEnvelope]] = []
+        self._expiry_sequence = itertools.count()
+        self._expiry_live: Dict[int, int] = {}  # id(envelope) -> times currently queued
+        self._expiry_wakeup = asyncio.Event()  # set when a new earliest expiry is indexed
+        self.retry_queue = RetryScheduler(retry_base_delay, retry_max_delay, retry_jitter)
+        self._retry_wakeup = asyncio.Event()  # set when a retry becomes the earliest due
+
+        # EXACTLY_ONCE: component id -> handled message ids, plus deliveries in progress
+        self._dedup: Dict[str, DedupIndex] = {}
+        self._dedup_in_flight: Set[Tuple[str, str]] = set()
         
         # State management
         self.running = False
@@ -75,13 +151,13 @@ class InMemoryMessageBus(MessageBusInterface):
         self._cleanup_task: Optional[asyncio.Task] = None
         
         # Comprehensive statistics
-        self.stats = {
-            # Message counts
-            "messages_published": 0,
-            "messages_delivered": 0,
-            "messages_failed": 0,
+        self.stats = self.core.stats
+        self.stats.update({
+            # Message counts (published/delivered/failed come from the core)
             "messages_retried": 0,
             "messages_dead_lettered": 0,
+            "duplicates_suppressed": 0,
+            "messages_deadline_dropped": 0,
             
             # Component stats  
             "active_subscriptions": 0,
@@ -96,7 +172,15 @@ class InMemoryMessageBus(MessageBusInterface):
             "delivery_failures": 0,
             "timeout_failures": 0,
             "retry_exhausted": 0
+        })
+        self.lane_stats: Dict[MessagePriority, Dict[str, int]] = {
+            lane: {"delivered": 0, "deadline_dropped": 0} for lane in LANES
         }
+
+        # Latency histograms per published topic, per target component and per lane
+        self.latency = LatencyMetrics(
+            "woodwork_message_bus", {"publish": "topic", "delivery": "component", "lane": "lane"}
+        )
         
         log.debug("[InMemoryMessageBus] Initialized with max_queue_size=%d, max_retries=%d", 
                   max_queue_size, max_retries)
@@ -143,12 +227,21 @@ class InMemoryMessageBus(MessageBusInterface):
             except asyncio.CancelledError:
                 pass
         
+        for mailbox in self._mailboxes():
+            await mailbox.close()
+
         # Clear all data structures
         self.subscriptions.clear()
         self.topic_subscribers.clear()
-        self.component_handlers.clear()
-        self.component_queues.clear()
+        self.core.clear()
         self.retry_queue.clear()
+        self._expiry_heap.clear()
+        self._expiry_live.clear()
+        self._dedup.clear()
+        self._dedup_in_flight.clear()
+
+        if self.journal is not None:
+            self.journal.flush()
         
         uptime = time.time() - self.start_time
         log.info("[InMemoryMessageBus] Stopped after %.2f seconds. Final stats: %s", 
@@ -159,58 +252,96 @@ class InMemoryMessageBus(MessageBusInterface):
         if not self.running:
             log.warning("[InMemoryMessageBus] Not running, dropping publish message: %s", envelope.event_type)
             return False
+
+        if self._drop_if_late(envelope):
+            return False
             
-        start_time = time.time()
+        if self.journal is not None:
+            self.journal.record_envelope(JournalRecordKind.PUBLISH, envelope)
+
+        start_time = time.perf_counter()
         delivered_count = 0
         failed_count = 0
         
-        # Get subscribers for this topic
+        # Get subscribers for this topic (exact and wildcard patterns)
         topic = envelope.event_type
-        subscriber_ids = self.topic_subscribers.get(topic, set())
+        subscriptions = self._topic_index.match(topic)
         
         log.debug("[InMemoryMessageBus] Publishing '%s' to %d subscribers (session: %s)", 
-                  topic, len(subscriber_ids), envelope.session_id)
-        
-        # Deliver to each subscriber
-        for sub_id in subscriber_ids:
-            subscription = self.subscriptions.get(sub_id)
-            if not subscription:
-                log.warning("[InMemoryMessageBus] Subscription %s not found for topic %s", sub_id, topic)
-                continue
-                
-            try:
-                # Execute callback
-                if asyncio.iscoroutinefunction(subscription.callback):
-                    await subscription.callback(envelope)
-                else:
-                    subscription.callback(envelope)
-                
-                subscription.message_count += 1
+                  topic, len(subscriptions), envelope.session_id)
+        
+        # Deliver to each subscriber (or hand off to its mailbox)
+        for subscription in subscriptions:
+            mailbox = subscription.mailbox
+            if mailbox is not None:
+                if not mailbox.offer(envelope):
+                    await mailbox.put(envelope)
+            elif await self._invoke_subscription(subscription, envelope):
                 delivered_count += 1
-                
-                log.debug("[InMemoryMessageBus] Delivered to subscription %s", sub_id)
-                
-            except Exception as e:
-                log.error("[InMemoryMessageBus] Failed to deliver to subscription %s: %s", sub_id, e)
+            else:
                 failed_count += 1
-                self.stats["delivery_failures"] += 1
         
         # Update statistics
         self.stats["messages_published"] += 1
         self.stats["messages_delivered"] += delivered_count
         self.stats["messages_failed"] += failed_count
         
-        delivery_time_ms = (time.time() - start_time) * 1000
+        delivery_time_ms = (time.perf_counter() - start_time) * 1000
         self._update_avg_delivery_time(delivery_time_ms)
+        self.latency.observe("publish", topic, delivery_time_ms)
         
         log.debug("[InMemoryMessageBus] Published '%s': %d delivered, %d failed in %.2fms", 
                   topic, delivered_count, failed_count, delivery_time_ms)
         
         return failed_count == 0
     
-    async def subscribe(self, topic: str, callback: Callable[[MessageEnvelope], None]) -> str:
-        """Subscribe to topic with automatic callback execution"""
-        subscription_id = f"sub-{uuid.uuid4().hex[:8]}"
+    async def _invoke_subscription(self, subscription: Subscription, envelope: MessageEnvelope) -> bool:
+        """Run one subscription callback; returns False if it raised"""
+        try:
+            await self.core.call(subscription.callback, envelope)
+        except Exception as e:
+            log.error("[InMemoryMessageBus] Failed to deliver to subscription %s: %s",
+                      subscription.subscription_id, e)
+            self.stats["delivery_failures"] += 1
+            return False
+
+        subscription.message_count += 1
+        self._observe_lane(envelope)
+        return True
+
+    async def _deliver_from_mailbox(self, subscription: Subscription, envelope: MessageEnvelope) -> None:
+        if self._drop_if_late(envelope):
+            return
+        if await self._invoke_subscription(subscription, envelope):
+            self.stats["messages_delivered"] += 1
+        else:
+            self.stats["messages_failed"] += 1
+
+    def _create_mailbox(self, name: str, deliver: Callable) -> SubscriberMailbox:
+        return SubscriberMailbox(
+            name,
+            deliver,
+            on_reject=self._dead_letter,
+            size=self.mailbox_size,
+            overflow=self.mailbox_overflow,
+            lane_of=self._lane_of,
+            lane_weights=self.lanes.weights,
+        )
+
+    def _mailboxes(self) -> List[SubscriberMailbox]:
+        mailboxes = [s.mailbox for s in self.subscriptions.values() if s.mailbox is not None]
+        mailboxes.extend(h.mailbox for h in self.component_handlers.values() if h.mailbox is not None)
+        return mailboxes
+
+    async def drain_mailboxes(self) -> None:
+        """Wait until every subscriber and component mailbox is empty"""
+        for mailbox in self._mailboxes():
+            await mailbox.drain()
+
+    async def subscribe(self, topic: str, callback: Callable[[MessageEnvelope], None], *,
+                        mode: Optional[str] = None) -> str:
+        """Subscribe to topic with automatic callback execution (mode: "inline" or "mailbox")"""
+        subscription_id = self.core.next_id("sub")
         
         subscription = Subscription(
             subscription_id=subscription_id,
@@ -218,9 +349,15 @@ class InMemoryMessageBus(MessageBusInterface):
             callback=callback,
             created_at=time.time()
         )
+        if (DeliveryMode(mode) if mode is not None else self.delivery_mode) is DeliveryMode.MAILBOX:
+            subscription.mailbox = self._create_mailbox(
+                f"{topic}#{subscription_id}",
+                lambda envelope: self._deliver_from_mailbox(subscription, envelope),
+            )
         
         self.subscriptions[subscription_id] = subscription
         self.topic_subscribers[topic].add(subscription_id)
+        self.core.subscribe(topic, subscription)
         self.stats["active_subscriptions"] = len(self.subscriptions)
         
         log.debug("[InMemoryMessageBus] Subscribed %s to topic '%s'. Total subscriptions: %d", 
@@ -237,9 +374,14 @@ class InMemoryMessageBus(MessageBusInterface):
             
         # Remove from topic subscribers
         self.topic_subscribers[subscription.topic].discard(subscription_id)
+        self._topic_index.remove(subscription.topic, subscription)
+        self.core.forget(subscription.callback)
         if not self.topic_subscribers[subscription.topic]:
             del self.topic_subscribers[subscription.topic]
         
+        if subscription.mailbox is not None:
+            await subscription.mailbox.close()
+
         # Remove subscription
         del self.subscriptions[subscription_id]
         self.stats["active_subscriptions"] = len(self.subscriptions)
@@ -259,52 +401,25 @@ class InMemoryMessageBus(MessageBusInterface):
         if not envelope.target_component:
             log.error("[InMemoryMessageBus] Missing target_component in envelope")
             return False
-        
-        start_time = time.time()
+
+        if self._drop_if_late(envelope):
+            return False
+
+        if self.journal is not None:
+            self.journal.record_envelope(JournalRecordKind.SEND, envelope)
         
         log.debug("[InMemoryMessageBus] Sending '%s' from %s to %s (session: %s)", 
                   envelope.event_type, envelope.sender_component, 
                   envelope.target_component, envelope.session_id)
         
-        # Try direct delivery if handler exists
+        # Try direct delivery (or hand off to the component's mailbox) if handler exists
         handler = self.component_handlers.get(envelope.target_component)
         if handler:
-            try:
-                # Execute handler
-                if asyncio.iscoroutinefunction(handler.handler):
-                    await handler.handler(envelope)
-                else:
-                    handler.handler(envelope)
-                
-                # Update handler stats
-                handler.message_count += 1
-                handler.last_message_at = time.time()
-                
-                # Update message bus stats
-                self.stats["messages_delivered"] += 1
-                delivery_time_ms = (time.time() - start_time) * 1000
-                self._update_avg_delivery_time(delivery_time_ms)
-                
-                log.debug("[InMemoryMessageBus] Delivered to %s in %.2fms", 
-                          envelope.target_component, delivery_time_ms)
-                
+            if handler.mailbox is not None:
+                if not handler.mailbox.offer(envelope):
+                    await handler.mailbox.put(envelope)
                 return True
-                
-            except Exception as e:
-                log.error("[InMemoryMessageBus] Handler failed for %s: %s", envelope.target_component, e)
-                self.stats["delivery_failures"] += 1
-                
-                # Queue for retry if eligible
-                if envelope.can_retry():
-                    envelope.retry_count += 1
-                    self.retry_queue.append(envelope)
-                    self.stats["messages_retried"] += 1
-                    log.debug("[InMemoryMessageBus] Queued for retry %d/%d: %s", 
-                              envelope.retry_count, envelope.max_retries, envelope.message_id)
-                else:
-                    self._dead_letter(envelope, f"Handler exception: {e}")
-                
-                return False
+            return await self._invoke_component_handler(handler, envelope)
         else:
             # Queue message for when component becomes available
             queue = self.component_queues[envelope.target_component]
@@ -314,8 +429,9 @@ class InMemoryMessageBus(MessageBusInterface):
                 self._dead_letter(envelope, "Queue full")
                 return False
             
-            queue.append(envelope)
-            self.stats["queued_messages"] = sum(len(q) for q in self.component_queues.values())
+            self.core.enqueue(envelope.target_component, envelope)
+            self._index_expiry(envelope.target_component, envelope)
+            self.stats["queued_messages"] = self.core.queued_count()
             self.stats["peak_queue_size"] = max(self.stats["peak_queue_size"], len(queue))
             
             log.debug("[InMemoryMessageBus] Queued message for %s (queue size: %d)", 
@@ -323,22 +439,103 @@ class InMemoryMessageBus(MessageBusInterface):
             
             return True
     
-    def register_component_handler(self, component_id: str, handler: Callable[[MessageEnvelope], None]) -> None:
-        """Register handler for direct component messaging"""
+    def _claim_exactly_once(self, component_id: str, envelope: MessageEnvelope) -> bool:
+        """For EXACTLY_ONCE envelopes, False if the component already handled (or is handling) it"""
+        if getattr(envelope, "delivery_mode", None) is not MessageDeliveryMode.EXACTLY_ONCE:
+            return True
+
+        key = (component_id, envelope.message_id)
+        index = self._dedup.get(component_id)
+        if index is None:
+            index = self._dedup[component_id] = DedupIndex(**self.dedup_options)
+        if key in self._dedup_in_flight or index.seen(envelope.message_id):
+            self.stats["duplicates_suppressed"] += 1
+            log.debug("[InMemoryMessageBus] Suppressed duplicate %s for %s", envelope.message_id, component_id)
+            return False
+
+        self._dedup_in_flight.add(key)
+        return True
+
+    def _release_exactly_once(self, component_id: str, envelope: MessageEnvelope, handled: bool) -> None:
+        if getattr(envelope, "delivery_mode", None) is not MessageDeliveryMode.EXACTLY_ONCE:
+            return
+        self._dedup_in_flight.discard((component_id, envelope.message_id))
+        if handled:
+            self._dedup[component_id].add(envelope.message_id)
+
+    async def _invoke_component_handler(self, handler: ComponentHandler, envelope: MessageEnvelope) -> bool:
+        """Run a component handler; failures are retried or dead-lettered"""
+        if self._drop_if_late(envelope):
+            return False
+        if not self._claim_exactly_once(handler.component_id, envelope):
+            return True
+
+        start_time = time.perf_counter()
+        try:
+            # Execute handler
+            await self.core.call(handler.handler, envelope)
+        except Exception as e:
+            self._release_exactly_once(handler.component_id, envelope, handled=False)
+            log.error("[InMemoryMessageBus] Handler failed for %s: %s", handler.component_id, e)
+            self.stats["delivery_failures"] += 1
+
+            # Queue for retry if eligible
+            if envelope.can_retry():
+                self._schedule_retry(envelope)
+                self.stats["messages_retried"] += 1
+                log.debug("[InMemoryMessageBus] Queued for retry %d/%d: %s", 
+                          envelope.retry_count, envelope.max_retries, envelope.message_id)
+            else:
+                self._dead_letter(envelope, f"Handler exception: {e}")
+
+            return False
+
+        # The handler succeeded; bookkeeping below must not turn that into a retry
+        self._release_exactly_once(handler.component_id, envelope, handled=True)
+
+        # Update handler stats
+        handler.message_count += 1
+        handler.last_message_at = time.time()
+
+        # Update message bus stats
+        self.stats["messages_delivered"] += 1
+        delivery_time_ms = (time.perf_counter() - start_time) * 1000
+        self._update_avg_delivery_time(delivery_time_ms)
+        self.latency.observe("delivery", handler.component_id, delivery_time_ms)
+        self._observe_lane(envelope)
+
+        log.debug("[InMemoryMessageBus] Delivered to %s in %.2fms", 
+                  handler.component_id, delivery_time_ms)
+
+        return True
+
+    def register_component_handler(self, component_id: str, handler: Callable[[MessageEnvelope], None], *,
+                                   mode: Optional[str] = None) -> None:
+        """Register handler for direct component messaging (mode: "inline" or "mailbox")"""
         handler_obj = ComponentHandler(
             component_id=component_id,
             handler=handler,
             registered_at=time.time()
         )
+        if (DeliveryMode(mode) if mode is not None else self.delivery_mode) is DeliveryMode.MAILBOX:
+            handler_obj.mailbox = self._create_mailbox(
+                f"component:{component_id}",
+                lambda envelope: self._invoke_component_handler(handler_obj, envelope),
+            )
+
+        previous = self.component_handlers.get(component_id)
+        if previous is not None and previous.mailbox is not None:
+            previous.mailbox.cancel()
         
         self.component_handlers[component_id] = handler_obj
         self.stats["registered_components"] = len(self.component_handlers)
         
         # Deliver any queued messages
-        queued_messages = list(self.component_queues[component_id])
+        queued_messages = self.core.take_mailbox(component_id)
         if queued_messages:
-            self.component_queues[component_id].clear()
-            
+            for envelope in queued_messages:
+                self._unindex_expiry(envelope)
+            self.stats["queued_messages"] = self.core.queued_count()
             log.debug("[InMemoryMessageBus] Delivering %d queued messages to %s", 
                       len(queued_messages), component_id)
             
@@ -355,6 +552,9 @@ class InMemoryMessageBus(MessageBusInterface):
             return False
             
         del self.component_handlers[component_id]
+        self.core.forget(handler.handler)
+        if handler.mailbox is not None:
+            handler.mailbox.cancel()
         self.stats["registered_components"] = len(self.component_handlers)
         
         log.debug("[InMemoryMessageBus] Unregistered component %s. Messages processed: %d", 
@@ -368,62 +568,74 @@ class InMemoryMessageBus(MessageBusInterface):
         if not handler:
             log.warning("[InMemoryMessageBus] Handler disappeared during queued delivery: %s", component_id)
             return
+
+        messages = order_by_lane(messages, self._lane_of, self.lanes.weights)
             
+        if handler.mailbox is not None:
+            for envelope in messages:
+                await handler.mailbox.put(envelope)
+            return
+
         delivered = 0
         failed = 0
         
         for envelope in messages:
+            if self._drop_if_late(envelope) or not self._claim_exactly_once(component_id, envelope):
+                continue
             try:
-                if asyncio.iscoroutinefunction(handler.handler):
-                    await handler.handler(envelope)
-                else:
-                    handler.handler(envelope)
-                
-                delivered += 1
-                handler.message_count += 1
-                
+                await self.core.call(handler.handler, envelope)
             except Exception as e:
+                self._release_exactly_once(component_id, envelope, handled=False)
                 log.error("[InMemoryMessageBus] Failed queued delivery to %s: %s", component_id, e)
                 failed += 1
                 
                 # Queue for retry if eligible
                 if envelope.can_retry():
-                    envelope.retry_count += 1
-                    self.retry_queue.append(envelope)
+                    self._schedule_retry(envelope)
                 else:
                     self._dead_letter(envelope, f"Queued delivery failed: {e}")
+                continue
+
+            self._release_exactly_once(component_id, envelope, handled=True)
+            delivered += 1
+            handler.message_count += 1
+            self._observe_lane(envelope)
         
         self.stats["messages_delivered"] += delivered
         self.stats["messages_failed"] += failed
-        self.stats["queued_messages"] = sum(len(q) for q in self.component_queues.values())
+        self.stats["queued_messages"] = self.core.queued_count()
         
         log.debug("[InMemoryMessageBus] Delivered queued messages to %s: %d success, %d failed", 
                   component_id, delivered, failed)
     
+    def _schedule_retry(self, envelope: MessageEnvelope) -> None:
+        """Schedule the envelope's next attempt, waking the processor if it is now the earliest"""
+        envelope.retry_count += 1
+        if self.retry_queue.schedule(envelope):
+            self._retry_wakeup.set()
+
     async def _retry_processor(self) -> None:
-        """Background task to process retry queue"""
+        """Background task that sleeps until the next retry is due, then re-sends it"""
         log.debug("[InMemoryMessageBus] Started retry processor")
         
         while self.running:
             try:
-                if not self.retry_queue:
-                    await asyncio.sleep(1.0)
+                # Clear before planning so a retry scheduled meanwhile is not missed
+                self._retry_wakeup.clear()
+                delay = self.retry_queue.time_until_next()
+                if delay is None or delay > 0:
+                    try:
+                        await asyncio.wait_for(self._retry_wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
                 
-                # Process retries with exponential backoff
-                messages_to_retry = []
-                current_time = time.time()
-                
-                for envelope in self.retry_queue[:]:  # Copy to avoid modification during iteration
-                    # Calculate backoff delay: 2^retry_count seconds
-                    backoff_delay = min(2 ** envelope.retry_count, 60)  # Max 60 seconds
-                    
-                    if current_time - envelope.created_at >= backoff_delay:
-                        messages_to_retry.append(envelope)
-                        self.retry_queue.remove(envelope)
-                
-                # Retry messages
-                for envelope in messages_to_retry:
+                for envelope in self.retry_queue.pop_due():
+                    # Expired retries are dropped when they come due rather than by scanning
+                    if envelope.is_expired():
+                        self._dead_letter(envelope, "Message expired")
+                        continue
+
                     if envelope.pattern == MessagePattern.PUBLISH_SUBSCRIBE:
                         success = await self.publish(envelope)
                     else:
@@ -434,8 +646,6 @@ class InMemoryMessageBus(MessageBusInterface):
                     else:
                         log.debug("[InMemoryMessageBus] Retry failed for %s", envelope.message_id)
                 
-                await asyncio.sleep(0.5)  # Check every 500ms
-                
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -444,53 +654,75 @@ class InMemoryMessageBus(MessageBusInterface):
         
         log.debug("[InMemoryMessageBus] Retry processor stopped")
     
+    def _index_expiry(self, component_id: str, envelope: MessageEnvelope) -> None:
+        """Add a queued envelope to the expiry heap (envelopes without a TTL never expire)"""
+        ttl_seconds = getattr(envelope, "ttl_seconds", None)
+        if ttl_seconds is None:
+            return
+
+        expires_at = getattr(envelope, "created_at", time.time()) + ttl_seconds
+        entry = (expires_at, next(self._expiry_sequence), component_id, envelope)
+        heapq.heappush(self._expiry_heap, entry)
+        key = id(envelope)
+        self._expiry_live[key] = self._expiry_live.get(key, 0) + 1
+
+        if self._expiry_heap[0] is entry:
+            self._expiry_wakeup.set()
+
+    def _unindex_expiry(self, envelope: MessageEnvelope) -> None:
+        """Mark an envelope as no longer queued; its heap entry is dropped when it surfaces"""
+        key = id(envelope)
+        count = self._expiry_live.get(key)
+        if count is None:
+            return
+        if count > 1:
+            self._expiry_live[key] = count - 1
+        else:
+            del self._expiry_live[key]
+
+    def expire_queued_messages(self, now: Optional[float] = None) -> int:
+        """Dead-letter queued envelopes whose TTL has passed; returns how many expired"""
+        now = time.time() if now is None else now
+        heap = self._expiry_heap
+        expired = 0
+
+        while heap and heap[0][0] <= now:
+            _, _, component_id, envelope = heapq.heappop(heap)
+            if id(envelope) not in self._expiry_live:
+                continue  # delivered since it was indexed
+            if not self.core.remove_queued(component_id, envelope):
+                continue
+            self._unindex_expiry(envelope)
+            self._dead_letter(envelope, "Message expired")
+            expired += 1
+
+        if expired:
+            self.stats["queued_messages"] = self.core.queued_count()
+            log.debug("[InMemoryMessageBus] Expired %d queued messages", expired)
+        return expired
+
     async def _cleanup_processor(self) -> None:
-        """Background task to cleanup expired messages and stats"""
+        """Background task that sleeps until the next queued envelope expires, then expires it"""
         log.debug("[InMemoryMessageBus] Started cleanup processor")
         
         while self.running:
             try:
-                await asyncio.sleep(30.0)  # Run every 30 seconds
-                
-                current_time = time.time()
-                cleaned_count = 0
-                
-                # Clean expired messages from retry queue
-                self.retry_queue = [
-                    envelope for envelope in self.retry_queue 
-                    if not envelope.is_expired()
-                ]
-                
-                # Clean expired messages from component queues
-                for component_id, queue in self.component_queues.items():
-                    original_size = len(queue)
-                    expired_messages = []
-                    
-                    # Find expired messages
-                    for envelope in list(queue):
-                        if envelope.is_expired():
-                            expired_messages.append(envelope)
-                            queue.remove(envelope)
-                    
-                    # Dead letter expired messages
-                    for envelope in expired_messages:
-                        self._dead_letter(envelope, "Message expired")
-                        cleaned_count += 1
-                    
-                    if expired_messages:
-                        log.debug("[InMemoryMessageBus] Cleaned %d expired messages from %s queue", 
-                                  len(expired_messages), component_id)
-                
-                # Update stats
-                self.stats["queued_messages"] = sum(len(q) for q in self.component_queues.values())
+                self._expiry_wakeup.clear()
+                delay = self._expiry_heap[0][0] - time.time() if self._expiry_heap else None
+                if delay is None or delay > 0:
+                    try:
+                        await asyncio.wait_for(self._expiry_wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
                 
-                if cleaned_count > 0:
-                    log.debug("[InMemoryMessageBus] Cleanup cycle completed: %d messages cleaned", cleaned_count)
+                self.expire_queued_messages()
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 log.error("[InMemoryMessageBus] Error in cleanup processor: %s", e)
+                await asyncio.sleep(1.0)
         
         log.debug("[InMemoryMessageBus] Cleanup processor stopped")
     
@@ -506,6 +738,29 @@ class InMemoryMessageBus(MessageBusInterface):
         
         log.warning("[InMemoryMessageBus] Dead lettered message %s: %s", envelope.message_id, reason)
     
+    def _lane_of(self, envelope: MessageEnvelope) -> MessagePriority:
+        return self.lanes.lane_of(getattr(envelope, "priority", None), envelope.event_type)
+
+    def _drop_if_late(self, envelope: MessageEnvelope) -> bool:
+        """Drop an envelope whose deadline has passed, so no handler works on it"""
+        deadline = getattr(envelope, "deadline", None)
+        if deadline is None or time.time() <= deadline:
+            return False
+
+        self.stats["messages_deadline_dropped"] += 1
+        self.lane_stats[self._lane_of(envelope)]["deadline_dropped"] += 1
+        log.debug("[InMemoryMessageBus] Dropped %s: deadline passed %.3fs ago",
+                  envelope.message_id, time.time() - deadline)
+        return True
+
+    def _observe_lane(self, envelope: MessageEnvelope) -> None:
+        """Record time from envelope creation to handling in its lane's histogram"""
+        lane = self._lane_of(envelope)
+        self.lane_stats[lane]["delivered"] += 1
+        created_at = getattr(envelope, "created_at", None)
+        if created_at is not None:
+            self.latency.observe("lane", lane.value, (time.time() - created_at) * 1000)
+
     def _update_avg_delivery_time(self, delivery_time_ms: float) -> None:
         """Update rolling average delivery time"""
         current_avg = self.stats["avg_delivery_time_ms"]
@@ -543,8 +798,57 @@ class InMemoryMessageBus(MessageBusInterface):
                     "registered_duration": time.time() - handler.registered_at
                 }
                 for comp_id, handler in self.component_handlers.items()
-            }
+            },
+
+            # EXACTLY_ONCE dedup indexes (hit counts, estimated false-positive rate)
+            "dedup": {
+                comp_id: index.get_stats() for comp_id, index in self._dedup.items()
+            },
+
+            # Per-subscriber mailboxes (depth, lag) when delivering via mailboxes
+            "delivery_mode": self.delivery_mode.value,
+            "mailboxes": {
+                mailbox.name: mailbox.get_stats() for mailbox in self._mailboxes()
+            },
+
+            # Priority lanes (weights, deliveries and deadline drops per lane)
+            "lanes": {
+                lane.value: {"weight": self.lanes.weights[lane], **counts}
+                for lane, counts in self.lane_stats.items()
+            },
+
+            # Latency distributions (p50/p90/p99/max)
+            "latency": self.latency.snapshot(),
+            "journal": self.journal.get_stats() if self.journal is not None else None
         }
+
+    async def replay_journal(self, directory: str = DEFAULT_JOURNAL_DIR, session_id: Optional[str] = None) -> int:
+        """
+        Re-publish and re-send recorded envelopes at full speed.
+
+        The attached journal (if any) is paused so the replay is not recorded
+        again. Returns the number of envelopes replayed.
+        """
+        journal, self.journal = self.journal, None
+        replayed = 0
+        try:
+            for record in read_journal(directory, session_id=session_id,
+                                       kinds=(JournalRecordKind.PUBLISH, JournalRecordKind.SEND)):
+                envelope = MessageEnvelope.from_dict(record.payload)
+                if record.kind is JournalRecordKind.PUBLISH:
+                    await self.publish(envelope)
+                else:
+                    await self.send_to_component(envelope)
+                replayed += 1
+        finally:
+            self.journal = journal
+
+        log.info("[InMemoryMessageBus] Replayed %d envelopes from %s", replayed, directory)
+        return replayed
+
+    def export_metrics(self, format: str = "prometheus") -> str:
+        """Export latency histograms as Prometheus text or JSON"""
+        return self.latency.export(format)
     
     def is_healthy(self) -> bool:
         """Check if message bus is healthy"""
@@ -571,5 +875,5 @@ class InMemoryMessageBus(MessageBusInterface):
         if self._cleanup_task and self._cleanup_task.done():
             log.warning("[InMemoryMessageBus] Cleanup processor task died")
             return False
-        
+
         return True
\ No newline at end of file
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from woodwork.events import get_global_event_manager
 from .factory import get_global_message_bus
 from woodwork.core.unified_event_bus import get_global_event_bus
+from woodwork.core.response_waiters import ResponseWaiters, deliver_response
 
 log = logging.getLogger(__name__)
 
@@ -103,8 +104,9 @@ class RequestContext:
         log.debug(f"[RequestContext] Request context completed in {duration:.3f}s")
 
         # Cleanup any pending request data if needed
-        if hasattr(self.agent, '_received_responses') and self._request_id:
-            self.agent._received_responses.pop(self._request_id, None)
+        waiters = getattr(self.agent, '_response_waiters', None)
+        if waiters is not None and self._request_id:
+            waiters.discard(self._request_id)
 
     async def send(self, data: dict) -> Any:
         """Send data and return response."""
@@ -290,17 +292,14 @@ class MessageBusIntegration:
                                   component_name, request_id, source_component)
 
                         if request_id:
-                            # Ensure response storage exists
-                            if not hasattr(self, '_received_responses'):
-                                self._received_responses = {}
-
-                            self._received_responses[request_id] = {
+                            self._get_response_waiters()
+                            deliver_response(self, request_id, {
                                 "result": result,
                                 "source_component": source_component,
-                                "received_at": __import__('time').time()
-                            }
+                                "received_at": time.time()
+                            })
 
-                            log.debug("[MessageBusIntegration] Stored response for component '%s' (request_id: %s)",
+                            log.debug("[MessageBusIntegration] Delivered response for component '%s' (request_id: %s)",
                                       component_name, request_id)
                     else:
                         log.debug("[MessageBusIntegration] Component '%s' received non-response message: %s",
@@ -571,7 +570,8 @@ class MessageBusIntegration:
             "component_name": getattr(self, 'name', 'unknown'),
             "integration_duration": time.time() - getattr(self, '_integration_start_time', time.time()),
             "message_bus_connected": self._message_bus is not None,
-            "router_configured": self._router is not None
+            "router_configured": self._router is not None,
+            "responses": self._get_response_waiters().get_stats()
         }
 
     # ============================================================================
@@ -756,8 +756,7 @@ class MessageBusIntegration:
         Components that need custom response handling should override this method.
         """
         # Default implementation for components that have _router
-        if not hasattr(self, '_received_responses'):
-            self._received_responses = {}
+        self._get_response_waiters()
 
         # Check if we already have a response handler registered
         if hasattr(self, '_response_handler_registered') and self._response_handler_registered:
@@ -777,12 +776,12 @@ class MessageBusIntegration:
                         source_component = data.get("source_component")
 
                         if request_id:
-                            self._received_responses[request_id] = {
+                            deliver_response(self, request_id, {
                                 "result": result,
                                 "source_component": source_component,
                                 "received_at": time.time()
-                            }
-                            log.debug(f"[MessageAPI] {self.name} stored response for request_id: {request_id}")
+                            })
+                            log.debug(f"[MessageAPI] {self.name} delivered response for request_id: {request_id}")
 
                 except Exception as e:
                     log.error(f"[MessageAPI] Error processing response message: {e}")
@@ -792,33 +791,29 @@ class MessageBusIntegration:
             self._response_handler_registered = True
             log.debug(f"[MessageAPI] Registered default response handler for '{self.name}'")
 
+    def _get_response_waiters(self) -> ResponseWaiters:
+        """Get (creating on first use) the futures for this component's in-flight requests"""
+        waiters = getattr(self, '_response_waiters', None)
+        if waiters is None:
+            waiters = self._response_waiters = ResponseWaiters()
+        return waiters
+
     async def _wait_for_response_with_processing(self, request_id: str, timeout: float) -> str:
         """
         Wait for response with proper timeout handling.
 
-        Components can override this for custom response waiting logic.
+        The response resolves a future for request_id directly, so there is
+        no polling; on timeout or cancellation the request is abandoned and a
+        late response is discarded. Components can override this for custom
+        response waiting logic.
         """
-        poll_interval = 0.05  # 50ms polling
-        waited = 0.0
-
-        while waited < timeout:
-            # Check if response has arrived
-            if hasattr(self, '_received_responses') and request_id in self._received_responses:
-                response_data = self._received_responses.pop(request_id)
-                log.debug(f"[MessageAPI] Found response for request_id '{request_id}': {response_data}")
-                return response_data["result"]
-
-            if waited % 1.0 < poll_interval:  # Log every second
-                stored_responses = list(self._received_responses.keys()) if hasattr(self, '_received_responses') else []
-                log.debug(f"[MessageAPI] Still waiting for response '{request_id}' after {waited:.1f}s, stored responses: {stored_responses}")
-
-            await asyncio.sleep(poll_interval)
-            waited += poll_interval
-
-        # Cleanup failed request
-        if hasattr(self, '_received_responses'):
-            self._received_responses.pop(request_id, None)
-        raise TimeoutError(f"Tool response timeout after {timeout}s")
+        try:
+            response_data = await self._get_response_waiters().wait(request_id, timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Tool response timeout after {timeout}s") from None
+
+        log.debug(f"[MessageAPI] Received response for request_id '{request_id}': {response_data}")
+        return response_data["result"]
 
 
 class GlobalMessageBusManager:
@@ -14,6 +14,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Callable, Union
 import logging
 
+from woodwork.core.priority_lanes import MessagePriority
+
 log = logging.getLogger(__name__)
 
 
@@ -45,6 +47,8 @@ class MessageEnvelope:
     retry_count: int = 0
     max_retries: int = 3
     ttl_seconds: Optional[int] = 300  # 5 minutes default
+    priority: Optional[MessagePriority] = None  # None: lane chosen from event_type
+    deadline: Optional[float] = None  # epoch seconds; dropped undelivered once passed
     
     def __post_init__(self):
         """Validate message envelope"""
@@ -71,7 +75,9 @@ class MessageEnvelope:
             "created_at": self.created_at,
             "retry_count": self.retry_count,
             "max_retries": self.max_retries,
-            "ttl_seconds": self.ttl_seconds
+            "ttl_seconds": self.ttl_seconds,
+            "priority": self.priority.value if self.priority is not None else None,
+            "deadline": self.deadline
         }
     
     @classmethod
@@ -89,7 +95,9 @@ class MessageEnvelope:
             created_at=data.get("created_at", time.time()),
             retry_count=data.get("retry_count", 0),
             max_retries=data.get("max_retries", 3),
-            ttl_seconds=data.get("ttl_seconds", 300)
+            ttl_seconds=data.get("ttl_seconds", 300),
+            priority=MessagePriority(data["priority"]) if data.get("priority") else None,
+            deadline=data.get("deadline")
         )
     
     def is_expired(self) -> bool:
@@ -98,9 +106,15 @@ class MessageEnvelope:
             return False
         return time.time() - self.created_at > self.ttl_seconds
     
+    def is_past_deadline(self, now: Optional[float] = None) -> bool:
+        """Check if the delivery deadline (if any) has passed"""
+        if self.deadline is None:
+            return False
+        return (time.time() if now is None else now) > self.deadline
+
     def can_retry(self) -> bool:
         """Check if message can be retried"""
-        return self.retry_count < self.max_retries and not self.is_expired()
+        return self.retry_count < self.max_retries and not self.is_expired() and not self.is_past_deadline()
 
 
 class MessageBusInterface(ABC):
@@ -211,7 +225,9 @@ def create_component_message(
     payload: Dict[str, Any],
     target_component: str,
     sender_component: Optional[str] = None,
-    delivery_mode: MessageDeliveryMode = MessageDeliveryMode.AT_LEAST_ONCE
+    delivery_mode: MessageDeliveryMode = MessageDeliveryMode.AT_LEAST_ONCE,
+    priority: Optional[MessagePriority] = None,
+    deadline: Optional[float] = None
 ) -> MessageEnvelope:
     """Create a point-to-point component message"""
     
@@ -225,7 +241,9 @@ def create_component_message(
         sender_component=sender_component,
         target_component=target_component,
         delivery_mode=delivery_mode,
-        pattern=MessagePattern.POINT_TO_POINT
+        pattern=MessagePattern.POINT_TO_POINT,
+        priority=priority,
+        deadline=deadline
     )
 
 
@@ -234,12 +252,14 @@ def create_hook_message(
     event_type: str,
     payload: Dict[str, Any],
     sender_component: Optional[str] = None,
-    delivery_mode: MessageDeliveryMode = MessageDeliveryMode.AT_MOST_ONCE
+    delivery_mode: MessageDeliveryMode = MessageDeliveryMode.AT_MOST_ONCE,
+    priority: Optional[MessagePriority] = None,
+    deadline: Optional[float] = None
 ) -> MessageEnvelope:
     """Create a pub/sub hook message"""
     
     log.debug(f"[MessageBus] Creating hook message from {sender_component}, event: {event_type}")
-    
+
     return MessageEnvelope(
         message_id=f"hook-{uuid.uuid4().hex[:12]}",
         session_id=session_id,
@@ -248,5 +268,7 @@ def create_hook_message(
         sender_component=sender_component,
         target_component=None,
         delivery_mode=delivery_mode,
-        pattern=MessagePattern.PUBLISH_SUBSCRIBE
+        pattern=MessagePattern.PUBLISH_SUBSCRIBE,
+        priority=priority,
+        deadline=deadline
     )
\ No newline at end of file
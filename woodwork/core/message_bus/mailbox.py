@@ -0,0 +1,201 @@
+"""
+Subscriber Mailboxes - Actor-style delivery for InMemoryMessageBus
+
+In inline delivery, publish() and send_to_component() await each callback in
+the sender's coroutine, so one slow subscriber delays the sender and every
+subscriber after it. In mailbox delivery, each subscription and component
+handler owns a bounded asyncio queue drained by its own consumer task:
+- publish() is an O(subscribers) enqueue
+- a full mailbox blocks the sender, drops its oldest envelope, or
+  dead-letters the new one
+- depth and lag (time from enqueue to delivery) are tracked per mailbox so
+  hot consumers show up in get_stats()
+- given lane_of, the mailbox is split into priority lanes (see
+  priority_lanes.py) so control traffic overtakes queued bulk traffic
+"""
+
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from woodwork.core.priority_lanes import LaneQueue, MessagePriority
+
+log = logging.getLogger(__name__)
+
+
+class DeliveryMode(Enum):
+    """How the bus hands messages to subscribers and component handlers"""
+    INLINE = "inline"    # awaited in the sender's coroutine
+    MAILBOX = "mailbox"  # queued and delivered by a per-subscriber task
+
+
+class MailboxOverflowPolicy(Enum):
+    """What a mailbox does when it is full"""
+    BLOCK = "block"              # make the sender wait for space
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued envelope
+    DEAD_LETTER = "dead_letter"  # dead-letter the new envelope
+
+
+class SubscriberMailbox:
+    """
+    Bounded FIFO of envelopes for one consumer, drained by its own task.
+
+    deliver(envelope) does the actual delivery (callback, stats, retries) and
+    should handle its own errors. on_reject(envelope, reason) is called for
+    envelopes turned away by the DEAD_LETTER policy. lane_of(envelope), if
+    given, sorts envelopes into priority lanes dequeued by lane_weights; size
+    bounds all lanes together and DROP_OLDEST evicts from the lowest lane.
+    The queue and task are created lazily on the running loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        deliver: Callable[[Any], Awaitable[Any]],
+        on_reject: Optional[Callable[[Any, str], None]] = None,
+        size: int = 1000,
+        overflow: MailboxOverflowPolicy = MailboxOverflowPolicy.BLOCK,
+        lane_of: Optional[Callable[[Any], MessagePriority]] = None,
+        lane_weights: Optional[Dict[MessagePriority, int]] = None,
+    ):
+        if size <= 0:
+            raise ValueError("Mailbox size must be positive")
+
+        self.name = name
+        self.size = size
+        self.overflow = MailboxOverflowPolicy(overflow)
+        self._deliver = deliver
+        self._on_reject = on_reject
+        self._lane_of = lane_of
+        self._lane_weights = lane_weights
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.stats = {
+            "enqueued": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "dead_lettered": 0,
+        }
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            if self._lane_of is not None:
+                lane_of = self._lane_of
+                self._queue = LaneQueue(lambda item: lane_of(item[1]), self.size, self._lane_weights)
+            else:
+                self._queue = asyncio.Queue(maxsize=self.size)
+            self._worker = None
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run(self._queue), name=f"woodwork-mailbox:{self.name}")
+
+        return self._queue
+
+    def offer(self, envelope: Any) -> bool:
+        """
+        Enqueue without waiting.
+
+        Returns False only when the mailbox is full and the policy is BLOCK;
+        the caller should then await put().
+        """
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait((time.perf_counter(), envelope))
+        except asyncio.QueueFull:
+            if self.overflow is MailboxOverflowPolicy.BLOCK:
+                return False
+
+            if self.overflow is MailboxOverflowPolicy.DROP_OLDEST:
+                if isinstance(queue, LaneQueue):
+                    queue.evict_nowait()
+                else:
+                    queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait((time.perf_counter(), envelope))
+                self.stats["enqueued"] += 1
+                self.stats["dropped"] += 1
+                log.debug("[SubscriberMailbox] Mailbox full for '%s', dropped oldest", self.name)
+            else:
+                self.stats["dead_lettered"] += 1
+                log.debug("[SubscriberMailbox] Mailbox full for '%s', dead-lettering", self.name)
+                if self._on_reject is not None:
+                    self._on_reject(envelope, "Mailbox full")
+            return True
+
+        self.stats["enqueued"] += 1
+        return True
+
+    async def put(self, envelope: Any) -> None:
+        """Enqueue, waiting for space if the policy is BLOCK"""
+        if not self.offer(envelope):
+            await self._queue.put((time.perf_counter(), envelope))
+            self.stats["enqueued"] += 1
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            enqueued_at, envelope = await queue.get()
+            lag_ms = (time.perf_counter() - enqueued_at) * 1000
+            self.last_lag_ms = lag_ms
+            if lag_ms > self.max_lag_ms:
+                self.max_lag_ms = lag_ms
+            try:
+                await self._deliver(envelope)
+                self.stats["delivered"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("[SubscriberMailbox] Delivery failed for '%s': %s", self.name, e)
+            finally:
+                queue.task_done()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def drain(self) -> None:
+        """Wait until every queued envelope has been delivered"""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        if self._worker is None or self._worker.done():
+            self._ensure_worker()
+        await self._queue.join()
+
+    def cancel(self) -> None:
+        """Stop the consumer without waiting; queued envelopes are discarded"""
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done() and not worker.get_loop().is_closed():
+            worker.cancel()
+        self._queue = None
+        self._loop = None
+
+    async def close(self) -> None:
+        """Stop the consumer and wait for it to exit; queued envelopes are discarded"""
+        worker = self._worker
+        same_loop = self._loop is asyncio.get_running_loop()
+        self.cancel()
+        if worker is not None and same_loop:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {
+            **self.stats,
+            "depth": self.depth,
+            "size": self.size,
+            "overflow": self.overflow.value,
+            "lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+        }
+        if isinstance(self._queue, LaneQueue):
+            stats["lane_depths"] = self._queue.depths()
+        return stats
@@ -0,0 +1,424 @@
+"""
+Redis Streams Message Bus - Horizontally scalable backend
+
+Every process running a woodwork deployment connects to the same Redis and
+shares work through streams:
+- point-to-point messages go to one stream per component
+  ({prefix}:component:<id>) read through a consumer group, so processes that
+  register the same component split its messages between them
+- pub/sub hooks go to a single {prefix}:events stream that every process
+  reads (XREAD, no group) and filters through its local topic index
+
+Writes (XADD, XACK) are buffered and sent as one pipeline per event-loop
+tick. Reads are batched: one blocking XREADGROUP over all locally
+registered component streams, COUNT batch_size at a time.
+
+AT_LEAST_ONCE messages are acked only after their handler succeeds. A
+message left pending for claim_idle_ms (handler failed, or its process
+died) is taken over with XAUTOCLAIM and redelivered; once it has been
+delivered more than max_retries times it is copied to {prefix}:dead and
+acked. AT_MOST_ONCE messages are acked before the handler runs.
+
+Envelopes are encoded with the JSON codec by default (see codec.py);
+codec="binary" is smaller, but every process on one Redis must use the
+same codec.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from woodwork.core.bus_core import BusCore
+
+from .codec import get_codec
+from .interface import MessageBusInterface, MessageDeliveryMode, MessageEnvelope
+from .redis_client import RedisConnectionPool, RedisError
+
+log = logging.getLogger(__name__)
+
+
+class RedisStreamsMessageBus(MessageBusInterface):
+    """Message bus on Redis Streams with consumer groups per component"""
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        stream_prefix: str = "woodwork",
+        consumer_group: str = "components",
+        consumer_name: Optional[str] = None,
+        max_queue_size: int = 50000,
+        max_retries: int = 5,
+        batch_size: int = 64,
+        block_ms: int = 500,
+        claim_idle_ms: int = 30000,
+        claim_interval: float = 5.0,
+        max_connections: int = 8,
+        codec: str = "json",
+    ):
+        self.redis_url = redis_url
+        self.stream_prefix = stream_prefix
+        self.consumer_group = consumer_group
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.claim_interval = claim_interval
+        self.codec = get_codec(codec)
+
+        self.pool = RedisConnectionPool(redis_url, max_connections=max_connections)
+        self.events_stream = f"{stream_prefix}:events"
+        self.dead_letter_stream = f"{stream_prefix}:dead"
+
+        self.core = BusCore()
+        self.component_handlers: Dict[str, Callable] = self.core.handlers
+        self.subscriptions: Dict[str, Tuple[str, Tuple[str, Callable]]] = {}
+        self._groups_ready: set = set()
+
+        self.running = False
+        self.start_time = 0.0
+        self._commands: List[Tuple[Sequence[Any], Optional[asyncio.Future]]] = []
+        self._commands_signal = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+        self.stats = self.core.stats
+        self.stats.update({
+            "messages_sent": 0,
+            "messages_redelivered": 0,
+            "messages_dead_lettered": 0,
+            "pipelines": 0,
+            "commands_pipelined": 0,
+        })
+
+    def component_stream(self, component_id: str) -> str:
+        return f"{self.stream_prefix}:component:{component_id}"
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        if self.running:
+            return
+
+        await self.pool.execute("PING")
+        self.running = True
+        self.start_time = time.time()
+        self._tasks = [
+            asyncio.create_task(self._writer(), name="redis_bus_writer"),
+            asyncio.create_task(self._consume_components(), name="redis_bus_components"),
+            asyncio.create_task(self._consume_events(await self._events_tail()), name="redis_bus_events"),
+            asyncio.create_task(self._claim_processor(), name="redis_bus_claims"),
+        ]
+        log.info("[RedisStreamsMessageBus] Started as consumer %s on %s:%d",
+                 self.consumer_name, self.pool.host, self.pool.port)
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+        await self._flush_commands()
+        await self.pool.close()
+        self.core.clear()
+        self.subscriptions.clear()
+        self._groups_ready.clear()
+        log.info("[RedisStreamsMessageBus] Stopped. Stats: %s", self.stats)
+
+    # Pipelined writes
+
+    def _queue_command(self, *args: Any, wait: bool = True) -> Optional[asyncio.Future]:
+        future = asyncio.get_running_loop().create_future() if wait else None
+        self._commands.append((args, future))
+        self._commands_signal.set()
+        return future
+
+    async def _writer(self) -> None:
+        while True:
+            await self._commands_signal.wait()
+            await asyncio.sleep(0)  # let every sender in this tick join the pipeline
+            await self._flush_commands()
+
+    async def _flush_commands(self) -> None:
+        while self._commands:
+            batch = self._commands[:self.batch_size * 4]
+            del self._commands[:len(batch)]
+            if not self._commands:
+                self._commands_signal.clear()
+
+            try:
+                replies = await self.pool.pipeline([args for args, _ in batch])
+            except Exception as e:
+                log.error("[RedisStreamsMessageBus] Pipeline of %d commands failed: %s", len(batch), e)
+                replies = [e] * len(batch)
+
+            self.stats["pipelines"] += 1
+            self.stats["commands_pipelined"] += len(batch)
+            for (args, future), reply in zip(batch, replies):
+                if isinstance(reply, Exception):
+                    if future is None:
+                        log.error("[RedisStreamsMessageBus] %s failed: %s", args[0], reply)
+                    elif not future.done():
+                        future.set_exception(reply)
+                elif future is not None and not future.done():
+                    future.set_result(reply)
+        self._commands_signal.clear()
+
+    async def _xadd(self, stream: str, *fields: str) -> bool:
+        if not self.running:
+            log.warning("[RedisStreamsMessageBus] Not running, dropping message for %s", stream)
+            return False
+        try:
+            await self._queue_command("XADD", stream, "MAXLEN", "~", self.max_queue_size, "*", *fields)
+            return True
+        except Exception as e:
+            log.error("[RedisStreamsMessageBus] XADD to %s failed: %s", stream, e)
+            return False
+
+    # Pub/sub
+
+    async def publish(self, envelope: MessageEnvelope) -> bool:
+        data = self.codec.encode_envelope(envelope)
+        published = await self._xadd(self.events_stream, "topic", envelope.event_type, "data", data)
+        if published:
+            self.stats["messages_published"] += 1
+        return published
+
+    async def subscribe(self, topic: str, callback: Callable[[MessageEnvelope], None]) -> str:
+        subscription_id = self.core.next_id("sub")
+        entry = (subscription_id, callback)
+        self.subscriptions[subscription_id] = (topic, entry)
+        self.core.subscribe(topic, entry)
+        return subscription_id
+
+    async def unsubscribe(self, subscription_id: str) -> bool:
+        subscription = self.subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        topic, entry = subscription
+        self.core.unsubscribe(topic, entry)
+        return True
+
+    async def _events_tail(self) -> str:
+        """Id of the newest event, so this process only sees events published from now on"""
+        newest = await self.pool.execute("XREVRANGE", self.events_stream, "+", "-", "COUNT", 1)
+        return newest[0][0] if newest else "0-0"
+
+    async def _consume_events(self, last_id: str) -> None:
+        while True:
+            try:
+                reply = await self.pool.execute(
+                    "XREAD", "COUNT", self.batch_size, "BLOCK", self.block_ms, "STREAMS", self.events_stream, last_id
+                )
+                for _, entries in reply or ():
+                    for entry_id, fields in entries:
+                        last_id = entry_id
+                        await self._deliver_event(_fields(fields))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("[RedisStreamsMessageBus] Event read failed: %s", e)
+                await asyncio.sleep(self.block_ms / 1000)
+
+    async def _deliver_event(self, fields: Dict[str, str]) -> None:
+        subscribers = self.core.match(fields["topic"])
+        if not subscribers:
+            return
+        try:
+            envelope = self._decode(fields["data"])
+        except Exception as e:
+            # Skip just this event; the rest of the batch is still delivered
+            self.stats["messages_failed"] += 1
+            log.error("[RedisStreamsMessageBus] Undecodable event on '%s': %s", fields["topic"], e)
+            return
+        for _, callback in subscribers:
+            try:
+                await self.core.call(callback, envelope)
+                self.stats["messages_delivered"] += 1
+            except Exception as e:
+                self.stats["messages_failed"] += 1
+                log.error("[RedisStreamsMessageBus] Subscriber failed for '%s': %s", envelope.event_type, e)
+
+    def _decode(self, data: str) -> MessageEnvelope:
+        # The client hands bulk strings back as str; undo that to get the encoded bytes
+        return self.codec.decode_envelope(data.encode(errors="surrogateescape"))
+
+    # Point-to-point
+
+    async def send_to_component(self, envelope: MessageEnvelope) -> bool:
+        if not envelope.target_component:
+            log.error("[RedisStreamsMessageBus] Missing target_component in envelope")
+            return False
+        data = self.codec.encode_envelope(envelope)
+        sent = await self._xadd(self.component_stream(envelope.target_component), "data", data)
+        if sent:
+            self.stats["messages_sent"] += 1
+        return sent
+
+    def register_component_handler(self, component_id: str, handler: Callable[[MessageEnvelope], None]) -> None:
+        """Join the component's consumer group; messages sent before any process registered are delivered too"""
+        self.component_handlers[component_id] = handler
+        log.debug("[RedisStreamsMessageBus] Registered component handler: %s", component_id)
+
+    def unregister_component_handler(self, component_id: str) -> bool:
+        handler = self.component_handlers.pop(component_id, None)
+        if handler is None:
+            return False
+        self.core.forget(handler)
+        return True
+
+    async def _ensure_group(self, stream: str) -> None:
+        if stream in self._groups_ready:
+            return
+        try:
+            await self.pool.execute("XGROUP", "CREATE", stream, self.consumer_group, "0", "MKSTREAM")
+        except RedisError as e:
+            if not str(e).startswith("BUSYGROUP"):
+                raise
+        self._groups_ready.add(stream)
+
+    async def _consume_components(self) -> None:
+        while True:
+            try:
+                streams = {self.component_stream(c): c for c in self.component_handlers}
+                if not streams:
+                    await asyncio.sleep(self.block_ms / 1000)
+                    continue
+                for stream in streams:
+                    await self._ensure_group(stream)
+
+                reply = await self.pool.execute(
+                    "XREADGROUP", "GROUP", self.consumer_group, self.consumer_name,
+                    "COUNT", self.batch_size, "BLOCK", self.block_ms,
+                    "STREAMS", *streams, *[">"] * len(streams),
+                )
+                for stream, entries in reply or ():
+                    for entry_id, fields in entries:
+                        await self._handle_entry(streams[stream], stream, entry_id, fields, deliveries=1)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("[RedisStreamsMessageBus] Component read failed: %s", e)
+                await asyncio.sleep(self.block_ms / 1000)
+
+    async def _handle_entry(self, component_id: str, stream: str, entry_id: str,
+                            fields: Sequence[str], deliveries: int) -> None:
+        data = _fields(fields).get("data", "")
+        try:
+            envelope = self._decode(data)
+        except Exception as e:
+            # Redelivery cannot fix it, so dead-letter now rather than after claim_idle_ms
+            await self._bury(stream, entry_id, data, f"Undecodable envelope: {e}")
+            return
+        envelope.retry_count = deliveries - 1
+        at_most_once = envelope.delivery_mode is MessageDeliveryMode.AT_MOST_ONCE
+        if at_most_once:
+            self._queue_command("XACK", stream, self.consumer_group, entry_id, wait=False)
+
+        handler = self.component_handlers.get(component_id)
+        try:
+            if handler is None:
+                raise RuntimeError(f"No handler registered for {component_id}")
+            await self.core.call(handler, envelope)
+        except Exception as e:
+            # Left pending: XAUTOCLAIM redelivers it after claim_idle_ms
+            self.stats["messages_failed"] += 1
+            log.error("[RedisStreamsMessageBus] Handler failed for %s: %s", component_id, e)
+            return
+
+        self.stats["messages_delivered"] += 1
+        if not at_most_once:
+            self._queue_command("XACK", stream, self.consumer_group, entry_id, wait=False)
+
+    # Redelivery
+
+    async def _claim_processor(self) -> None:
+        while True:
+            await asyncio.sleep(self.claim_interval)
+            for component_id in list(self.component_handlers):
+                try:
+                    await self.claim_stale(component_id)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    log.error("[RedisStreamsMessageBus] Redelivery for %s failed: %s", component_id, e)
+
+    async def claim_stale(self, component_id: str) -> int:
+        """Dead-letter or redeliver messages pending longer than claim_idle_ms; returns how many were redelivered"""
+        stream = self.component_stream(component_id)
+        await self._ensure_group(stream)
+
+        pending = await self.pool.execute(
+            "XPENDING", stream, self.consumer_group, "IDLE", self.claim_idle_ms, "-", "+", self.batch_size
+        )
+        deliveries = {}
+        for entry_id, _, _, count in pending or ():
+            if count > self.max_retries:
+                await self._dead_letter(stream, entry_id, count)
+            else:
+                deliveries[entry_id] = count
+        if not deliveries:
+            return 0
+
+        reply = await self.pool.execute(
+            "XAUTOCLAIM", stream, self.consumer_group, self.consumer_name,
+            self.claim_idle_ms, "0-0", "COUNT", self.batch_size,
+        )
+        redelivered = 0
+        for entry in reply[1]:
+            if entry is None:
+                continue  # trimmed away while pending
+            entry_id, fields = entry
+            # The claim itself counts as a delivery
+            await self._handle_entry(component_id, stream, entry_id, fields, deliveries.get(entry_id, 0) + 1)
+            redelivered += 1
+        self.stats["messages_redelivered"] += redelivered
+        return redelivered
+
+    async def _dead_letter(self, stream: str, entry_id: str, deliveries: int) -> None:
+        entries = await self.pool.execute("XRANGE", stream, entry_id, entry_id)
+        data = _fields(entries[0][1]).get("data", "") if entries else None
+        await self._bury(stream, entry_id, data, f"Delivered {deliveries} times without success")
+
+    async def _bury(self, stream: str, entry_id: str, data: Optional[str], reason: str) -> None:
+        """Copy an entry to the dead-letter stream (if it still exists) and ack it"""
+        if data is not None:
+            await self.pool.execute("XADD", self.dead_letter_stream, "*",
+                                    "stream", stream, "data", data, "reason", reason)
+        await self.pool.execute("XACK", stream, self.consumer_group, entry_id)
+        self.stats["messages_dead_lettered"] += 1
+        log.warning("[RedisStreamsMessageBus] Dead-lettered %s from %s: %s", entry_id, stream, reason)
+
+    # Monitoring
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "uptime_seconds": time.time() - self.start_time if self.running else 0,
+            "redis_host": f"{self.pool.host}:{self.pool.port}",
+            "consumer_name": self.consumer_name,
+            **self.stats,
+            "buffered_commands": len(self._commands),
+            "active_subscriptions": len(self.subscriptions),
+            "registered_components": len(self.component_handlers),
+        }
+
+    def is_healthy(self) -> bool:
+        return self.running and all(not task.done() for task in self._tasks)
+
+
+def _fields(flat: Sequence[str]) -> Dict[str, str]:
+    """Turn a stream entry's [field, value, field, value, ...] into a dict"""
+    return dict(zip(flat[::2], flat[1::2]))
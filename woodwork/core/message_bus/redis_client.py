@@ -0,0 +1,188 @@
+"""
+Redis Client - Minimal asyncio RESP2 client with a connection pool
+
+Just enough Redis for RedisStreamsMessageBus, with no third-party
+dependency:
+- RedisConnection.execute() sends one command and reads its reply
+- RedisConnection.pipeline() writes a batch of commands in one go and then
+  reads the replies, so N commands cost one round trip
+- RedisConnectionPool hands out up to max_connections connections; blocking
+  reads (XREADGROUP/XREAD with BLOCK) hold their own connection so they
+  never stall writers
+"""
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Sequence
+from urllib.parse import unquote, urlparse
+
+log = logging.getLogger(__name__)
+
+
+class RedisError(Exception):
+    """Error reply from the server (e.g. "BUSYGROUP Consumer Group name already exists")"""
+
+
+def encode_command(args: Sequence[Any]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode(errors="surrogateescape")
+        else:
+            data = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one RESP2 reply; bulk strings come back as str, error replies as RedisError instances
+
+    Bulk strings that are not UTF-8 (binary codec data) decode with
+    surrogateescape, so encoding them the same way gives back the original bytes.
+    """
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by Redis")
+    prefix, rest = line[:1], line[1:-2]
+
+    if prefix == b"+":
+        return rest.decode()
+    if prefix == b"-":
+        return RedisError(rest.decode())
+    if prefix == b":":
+        return int(rest)
+    if prefix == b"$":
+        length = int(rest)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2].decode(errors="surrogateescape")
+    if prefix == b"*":
+        length = int(rest)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply from Redis: {line!r}")
+
+
+class RedisConnection:
+    """One connection; not safe for concurrent use (the pool ensures that)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int, password: Optional[str] = None, db: int = 0) -> "RedisConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+        if password:
+            await connection.execute("AUTH", password)
+        if db:
+            await connection.execute("SELECT", db)
+        return connection
+
+    async def execute(self, *args: Any) -> Any:
+        self.writer.write(encode_command(args))
+        await self.writer.drain()
+        reply = await read_reply(self.reader)
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    async def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        """Send all commands, then read all replies; errors are returned in place, not raised"""
+        self.writer.write(b"".join(encode_command(args) for args in commands))
+        await self.writer.drain()
+        return [await read_reply(self.reader) for _ in commands]
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing()
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class RedisConnectionPool:
+    """Bounded pool of RedisConnection objects for one server"""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", max_connections: int = 8):
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme}")
+
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.max_connections = max_connections
+
+        self._idle: List[RedisConnection] = []
+        self._in_use = 0
+        self._available: Optional[asyncio.Condition] = None
+
+    async def acquire(self) -> RedisConnection:
+        if self._available is None:
+            self._available = asyncio.Condition()
+        async with self._available:
+            while not self._idle and self._in_use >= self.max_connections:
+                await self._available.wait()
+            self._in_use += 1
+
+        while self._idle:
+            connection = self._idle.pop()
+            if not connection.closed:
+                return connection
+        try:
+            return await RedisConnection.open(self.host, self.port, self.password, self.db)
+        except Exception:
+            await self._release_slot()
+            raise
+
+    async def release(self, connection: RedisConnection, discard: bool = False) -> None:
+        if discard or connection.closed:
+            await connection.close()
+        else:
+            self._idle.append(connection)
+        await self._release_slot()
+
+    async def _release_slot(self) -> None:
+        async with self._available:
+            self._in_use -= 1
+            self._available.notify()
+
+    async def execute(self, *args: Any) -> Any:
+        connection = await self.acquire()
+        try:
+            reply = await connection.execute(*args)
+        except RedisError:
+            await self.release(connection)
+            raise
+        except BaseException:
+            # The connection may be mid-reply (e.g. a cancelled blocking read)
+            await self.release(connection, discard=True)
+            raise
+        await self.release(connection)
+        return reply
+
+    async def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        connection = await self.acquire()
+        try:
+            replies = await connection.pipeline(commands)
+        except BaseException:
+            await self.release(connection, discard=True)
+            raise
+        await self.release(connection)
+        return replies
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await connection.close()
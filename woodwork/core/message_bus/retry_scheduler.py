@@ -0,0 +1,87 @@
+"""
+Retry Scheduler - Heap of failed envelopes keyed by next-attempt time
+
+Each failed envelope is scheduled at now + backoff(retry_count), where the
+backoff doubles per attempt from base_delay up to max_delay and is spread
+by +/- jitter so a burst of failures does not come back as a burst of
+retries. Backoff is measured from the failed attempt, not from when the
+envelope was created.
+
+Scheduling and popping are O(log n). The retry processor asks for
+time_until_next() and sleeps exactly that long (or until an earlier retry
+is scheduled), instead of polling and scanning the whole queue. Expired
+envelopes are not searched for; the bus drops them when they come due.
+"""
+
+import heapq
+import itertools
+import random
+import time
+from typing import Callable, List, Optional, Tuple
+
+from .interface import MessageEnvelope
+
+
+class RetryScheduler:
+    """Min-heap of (due time, sequence, envelope)"""
+
+    def __init__(
+        self,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        jitter: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ):
+        if not 0.0 <= jitter < 1.0:
+            raise ValueError("Retry jitter must be in [0, 1)")
+
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._clock = clock
+        self._rng = rng
+        self._heap: List[Tuple[float, int, MessageEnvelope]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def backoff(self, retry_count: int) -> float:
+        """Delay before attempt number retry_count (1 for the first retry)"""
+        delay = min(self.base_delay * 2 ** max(retry_count - 1, 0), self.max_delay)
+        if self.jitter:
+            delay *= 1.0 + self.jitter * (2.0 * self._rng() - 1.0)
+        return delay
+
+    def schedule(self, envelope: MessageEnvelope, now: Optional[float] = None) -> bool:
+        """
+        Schedule envelope's next attempt from now.
+
+        Returns True if it is now the earliest pending retry, i.e. a sleeping
+        processor should wake up and re-plan.
+        """
+        due = (self._clock() if now is None else now) + self.backoff(envelope.retry_count)
+        heapq.heappush(self._heap, (due, next(self._sequence), envelope))
+        return self._heap[0][2] is envelope
+
+    def time_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest retry is due (<= 0 if overdue, None if empty)"""
+        if not self._heap:
+            return None
+        return self._heap[0][0] - (self._clock() if now is None else now)
+
+    def pop_due(self, now: Optional[float] = None) -> List[MessageEnvelope]:
+        """Remove and return every envelope whose attempt is due, earliest first"""
+        now = self._clock() if now is None else now
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap)[2])
+        return due
+
+    def clear(self) -> None:
+        self._heap.clear()
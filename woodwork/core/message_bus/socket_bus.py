@@ -0,0 +1,575 @@
+"""
+Socket Message Bus - Multi-process bus over Unix domain sockets
+
+Components in other local processes (so CPU-heavy work such as PDF parsing,
+local embeddings or audio VAD runs outside the main interpreter's GIL) talk
+through a small broker process:
+
+- SocketBroker listens on a Unix domain socket and routes frames by their
+  key (topic or target component) without decoding the envelope; it
+  refuses to start on a socket another broker is still listening on
+- SocketMessageBus is the MessageBusInterface for one process; the first
+  one to start spawns the broker if nothing is listening on the socket
+
+Every frame is HEADER (body length, kind, key length) + key + body. Frames
+are pipelined: senders write without waiting for a reply and only await
+the socket when its write buffer passes high_water. Bodies of at least
+shm_threshold bytes are written to a POSIX shared-memory segment and only
+its name crosses the socket; whoever consumes the segment unlinks it and
+sends RELEASE back, and the broker unlinks the segments a client had not
+released when it disconnects.
+Envelopes are encoded with the binary codec by default (see codec.py); all
+processes on one socket must use the same codec.
+
+Delivery across processes is at-most-once: messages for a component with
+no registered handler wait in the broker (bounded per component), but
+nothing is persisted and a failed remote handler is not retried.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+import subprocess
+import sys
+import time
+from collections import defaultdict, deque
+from enum import IntEnum
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from woodwork.core.bus_core import BusCore
+from woodwork.core.topic_matcher import TopicTrie
+
+from .codec import get_codec
+from .interface import MessageBusInterface, MessageEnvelope
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.path.join(".woodwork", "bus.sock")
+
+# body length, frame kind, key length
+HEADER = struct.Struct("!IBH")
+SHM_REF = struct.Struct("!I")  # payload size, followed by the segment name
+
+SHM_FLAG = 0x80
+
+
+class FrameKind(IntEnum):
+    SUBSCRIBE = 1     # key: topic pattern
+    UNSUBSCRIBE = 2   # key: topic pattern
+    REGISTER = 3      # key: component id
+    UNREGISTER = 4    # key: component id
+    PUBLISH = 5       # key: topic, body: envelope
+    SEND = 6          # key: target component, body: envelope
+    RELEASE = 7       # key: shared-memory segment the sender has consumed
+
+
+def encode_frame(kind: int, key: str, body: bytes = b"") -> bytes:
+    key_bytes = key.encode()
+    return HEADER.pack(len(body), kind, len(key_bytes)) + key_bytes + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, str, bytes]:
+    """Read one frame; raises asyncio.IncompleteReadError when the peer closes"""
+    length, kind, key_length = HEADER.unpack(await reader.readexactly(HEADER.size))
+    data = await reader.readexactly(key_length + length)
+    return kind, data[:key_length].decode(), data[key_length:]
+
+
+def _create_untracked_shm(size: int) -> SharedMemory:
+    """Create a segment this process's resource tracker will not unlink at exit
+
+    The receiving process unlinks the segment, so the creator must not track it.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(create=True, size=size, track=False)
+    shm = SharedMemory(create=True, size=size)
+    if os.name == "posix":
+        # The tracker registers POSIX segments under their "/"-prefixed name, which shm.name omits
+        resource_tracker.unregister("/" + shm.name, "shared_memory")
+    return shm
+
+
+def write_shm(body: bytes) -> bytes:
+    """Copy body into a new shared-memory segment and return the reference to send instead"""
+    shm = _create_untracked_shm(len(body))
+    try:
+        shm.buf[:len(body)] = body
+        return SHM_REF.pack(len(body)) + shm.name.encode()
+    finally:
+        shm.close()
+
+
+def shm_name(reference: bytes) -> str:
+    return reference[SHM_REF.size:].decode()
+
+
+def read_shm(reference: bytes) -> bytes:
+    """Copy a payload out of shared memory and unlink the segment"""
+    (size,) = SHM_REF.unpack_from(reference)
+    shm = SharedMemory(name=shm_name(reference))
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def unlink_shm(name: str) -> bool:
+    """Unlink a segment nobody will consume; False if it is already gone"""
+    try:
+        shm = SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    shm.unlink()
+    return True
+
+
+class _BrokerClient:
+    """One connected process, as seen by the broker"""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.active = False  # has sent a frame (i.e. is not just a liveness probe)
+        self.patterns: List[str] = []
+        self.components: List[str] = []
+        self.segments: Set[str] = set()  # shared-memory handoffs written to it and not yet released
+
+
+class SocketBroker:
+    """Routes frames between the processes connected to one Unix domain socket"""
+
+    def __init__(self, path: str = DEFAULT_SOCKET_PATH, max_queue_size: int = 10000,
+                 exit_when_idle: bool = False):
+        self.path = path
+        self.max_queue_size = max_queue_size
+        self.exit_when_idle = exit_when_idle
+
+        self.topic_index = TopicTrie()
+        self.components: Dict[str, _BrokerClient] = {}
+        self.pending: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_queue_size))
+        self.clients: List[_BrokerClient] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._idle = asyncio.Event()
+
+        self.stats = {
+            "frames_routed": 0,
+            "frames_queued": 0,
+            "frames_dropped": 0,
+            "segments_reclaimed": 0,
+        }
+
+    async def start(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path):
+            if await _is_listening(self.path):
+                # Unlinking would orphan the running broker and split its clients across two
+                raise RuntimeError(f"A message broker is already listening on {self.path}")
+            os.unlink(self.path)  # left behind by a broker that died
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        log.info("[SocketBroker] Listening on %s", self.path)
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for client in list(self.clients):
+            client.writer.close()
+            self._reclaim_segments(client)
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        for queue in self.pending.values():
+            for kind, _, body in queue:
+                if kind & SHM_FLAG:
+                    read_shm(body)  # unlink segments nobody will consume
+        self.pending.clear()
+        log.info("[SocketBroker] Stopped. Stats: %s", self.stats)
+
+    async def serve_until_idle(self) -> None:
+        await self.start()
+        try:
+            await self._idle.wait()
+        finally:
+            await self.stop()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = _BrokerClient(writer)
+        self.clients.append(client)
+        try:
+            while True:
+                kind, key, body = await read_frame(reader)
+                client.active = True
+                await self._route(client, kind, key, body)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._disconnect(client)
+            writer.close()
+
+    def _disconnect(self, client: _BrokerClient) -> None:
+        self.clients.remove(client)
+        for pattern in client.patterns:
+            self.topic_index.remove(pattern, client)
+        for component_id in client.components:
+            if self.components.get(component_id) is client:
+                del self.components[component_id]
+        self._reclaim_segments(client)
+        if self.exit_when_idle and client.active and not any(c.active for c in self.clients):
+            self._idle.set()
+
+    def _reclaim_segments(self, client: _BrokerClient) -> None:
+        """Unlink segments handed to a client that is going away before it consumed them"""
+        for name in client.segments:
+            if unlink_shm(name):
+                self.stats["segments_reclaimed"] += 1
+        client.segments.clear()
+
+    async def _route(self, client: _BrokerClient, kind: int, key: str, body: bytes) -> None:
+        base_kind = kind & ~SHM_FLAG
+
+        if base_kind == FrameKind.PUBLISH:
+            targets = list(dict.fromkeys(self.topic_index.match(key)))
+            if kind & SHM_FLAG and len(targets) != 1:
+                # A segment can be consumed once; fan-out (or nobody) gets the bytes inline
+                body = read_shm(body)
+                kind = base_kind
+            if targets:
+                frame = encode_frame(kind, key, body)
+                segment = shm_name(body) if kind & SHM_FLAG else None
+                for target in targets:
+                    await self._write(target, frame, segment)
+                self.stats["frames_routed"] += 1
+
+        elif base_kind == FrameKind.SEND:
+            target = self.components.get(key)
+            if target is not None:
+                segment = shm_name(body) if kind & SHM_FLAG else None
+                await self._write(target, encode_frame(kind, key, body), segment)
+                self.stats["frames_routed"] += 1
+            else:
+                queue = self.pending[key]
+                if len(queue) == queue.maxlen:
+                    self.stats["frames_dropped"] += 1
+                    dropped_kind, _, dropped_body = queue[0]
+                    if dropped_kind & SHM_FLAG:
+                        read_shm(dropped_body)
+                queue.append((kind, key, body))
+                self.stats["frames_queued"] += 1
+
+        elif base_kind == FrameKind.SUBSCRIBE:
+            client.patterns.append(key)
+            self.topic_index.add(key, client)
+
+        elif base_kind == FrameKind.UNSUBSCRIBE:
+            if key in client.patterns:
+                client.patterns.remove(key)
+                self.topic_index.remove(key, client)
+
+        elif base_kind == FrameKind.REGISTER:
+            client.components.append(key)
+            self.components[key] = client
+            for queued in self.pending.pop(key, ()):
+                queued_kind, _, queued_body = queued
+                segment = shm_name(queued_body) if queued_kind & SHM_FLAG else None
+                await self._write(client, encode_frame(*queued), segment)
+                self.stats["frames_routed"] += 1
+
+        elif base_kind == FrameKind.RELEASE:
+            client.segments.discard(key)
+
+        elif base_kind == FrameKind.UNREGISTER:
+            if key in client.components:
+                client.components.remove(key)
+            if self.components.get(key) is client:
+                del self.components[key]
+
+        else:
+            log.warning("[SocketBroker] Unknown frame kind %d", kind)
+
+    async def _write(self, client: _BrokerClient, frame: bytes, segment: Optional[str] = None) -> None:
+        """Write a frame to a client; segment names the shared memory the frame hands over"""
+        writer = client.writer
+        if writer.is_closing():
+            if segment is not None and unlink_shm(segment):
+                self.stats["segments_reclaimed"] += 1
+            return
+        if segment is not None:
+            client.segments.add(segment)
+        writer.write(frame)
+        if writer.transport.get_write_buffer_size() > 1 << 20:
+            await writer.drain()
+
+
+async def _is_listening(path: str) -> bool:
+    try:
+        _, writer = await asyncio.open_unix_connection(path)
+    except (ConnectionError, FileNotFoundError, OSError):
+        return False
+    writer.close()
+    return True
+
+
+def run_broker(path: str = DEFAULT_SOCKET_PATH, exit_when_idle: bool = True) -> None:
+    """Entry point for a broker process"""
+    try:
+        asyncio.run(SocketBroker(path, exit_when_idle=exit_when_idle).serve_until_idle())
+    except RuntimeError as e:
+        # Another process spawned a broker first; its clients connect to that one
+        log.info("[SocketBroker] Not starting: %s", e)
+
+
+class SocketMessageBus(MessageBusInterface):
+    """Message bus client for one process, connected to a SocketBroker"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SOCKET_PATH,
+        spawn_broker: bool = True,
+        shm_threshold: int = 64 * 1024,
+        high_water: int = 1 << 20,
+        connect_timeout: float = 5.0,
+        codec: str = "binary",
+    ):
+        self.path = path
+        self.spawn_broker = spawn_broker
+        self.shm_threshold = shm_threshold
+        self.high_water = high_water
+        self.connect_timeout = connect_timeout
+        self.codec = get_codec(codec)
+
+        self.core = BusCore()
+        self.component_handlers: Dict[str, Callable] = self.core.handlers
+        self.subscriptions: Dict[str, Tuple[str, Tuple[str, Callable]]] = {}
+        self._pattern_counts: Dict[str, int] = defaultdict(int)
+
+        self.running = False
+        self.start_time = 0.0
+        self.broker_process: Optional[subprocess.Popen] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+        self.stats = self.core.stats
+        self.stats.update({
+            "messages_sent": 0,
+            "messages_received": 0,
+            "shm_handoffs": 0,
+            "bytes_sent": 0,
+            "frames_discarded": 0,
+        })
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        if self.running:
+            return
+
+        if not await _is_listening(self.path):
+            if not self.spawn_broker:
+                raise ConnectionError(f"No message broker listening on {self.path}")
+            self._spawn_broker()
+
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+                break
+            except (ConnectionError, FileNotFoundError):
+                if time.monotonic() > deadline:
+                    raise ConnectionError(f"Could not connect to message broker on {self.path}")
+                await asyncio.sleep(0.02)
+
+        self.running = True
+        self.start_time = time.time()
+
+        # Re-announce anything registered before start()
+        for pattern in self._pattern_counts:
+            self._write_frame(FrameKind.SUBSCRIBE, pattern)
+        for component_id in self.component_handlers:
+            self._write_frame(FrameKind.REGISTER, component_id)
+
+        self._reader_task = asyncio.create_task(self._read_loop(), name="socket_bus_reader")
+        log.info("[SocketMessageBus] Connected to broker on %s", self.path)
+
+    def _spawn_broker(self) -> None:
+        log.info("[SocketMessageBus] Starting broker process on %s", self.path)
+        self.broker_process = subprocess.Popen(
+            [sys.executable, "-c",
+             "import sys; from woodwork.core.message_bus.socket_bus import run_broker; run_broker(sys.argv[1])",
+             self.path],
+            start_new_session=True,
+        )
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+
+        self.core.clear()
+        self.subscriptions.clear()
+        self._pattern_counts.clear()
+        log.info("[SocketMessageBus] Stopped. Stats: %s", self.stats)
+
+    # Framing
+
+    def _write_frame(self, kind: int, key: str, body: bytes = b"") -> None:
+        if len(body) >= self.shm_threshold:
+            body = write_shm(body)
+            kind |= SHM_FLAG
+            self.stats["shm_handoffs"] += 1
+        frame = encode_frame(kind, key, body)
+        self._writer.write(frame)
+        self.stats["bytes_sent"] += len(frame)
+
+    async def _send(self, kind: FrameKind, key: str, envelope: MessageEnvelope) -> bool:
+        if not self.running or self._writer.is_closing():
+            log.warning("[SocketMessageBus] Not connected, dropping '%s' for %s", envelope.event_type, key)
+            return False
+
+        self._write_frame(kind, key, self.codec.encode_envelope(envelope))
+        if self._writer.transport.get_write_buffer_size() > self.high_water:
+            await self._writer.drain()
+        return True
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                kind, key, body = await read_frame(self._reader)
+                self.stats["messages_received"] += 1
+                try:
+                    if kind & SHM_FLAG:
+                        segment, kind = shm_name(body), kind & ~SHM_FLAG
+                        try:
+                            body = read_shm(body)
+                        finally:
+                            self._write_frame(FrameKind.RELEASE, segment)
+                    envelope = self.codec.decode_envelope(body)
+                except Exception as e:
+                    # One bad frame (a vanished segment, a peer on another codec) must not end the connection
+                    self.stats["frames_discarded"] += 1
+                    log.error("[SocketMessageBus] Discarding unreadable frame for '%s': %s", key, e)
+                    continue
+                if kind == FrameKind.PUBLISH:
+                    await self._deliver_published(key, envelope)
+                elif kind == FrameKind.SEND:
+                    await self._deliver_to_component(key, envelope)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            if self.running:
+                log.error("[SocketMessageBus] Lost connection to broker on %s", self.path)
+                self.running = False
+
+    async def _deliver_published(self, topic: str, envelope: MessageEnvelope) -> None:
+        for _, callback in self.core.match(topic):
+            try:
+                await self.core.call(callback, envelope)
+                self.stats["messages_delivered"] += 1
+            except Exception as e:
+                self.stats["messages_failed"] += 1
+                log.error("[SocketMessageBus] Subscriber failed for '%s': %s", topic, e)
+
+    async def _deliver_to_component(self, component_id: str, envelope: MessageEnvelope) -> None:
+        handler = self.component_handlers.get(component_id)
+        if handler is None:
+            log.warning("[SocketMessageBus] No handler for %s, dropping %s", component_id, envelope.message_id)
+            self.stats["messages_failed"] += 1
+            return
+        try:
+            await self.core.call(handler, envelope)
+            self.stats["messages_delivered"] += 1
+        except Exception as e:
+            self.stats["messages_failed"] += 1
+            log.error("[SocketMessageBus] Handler failed for %s: %s", component_id, e)
+
+    # MessageBusInterface
+
+    async def publish(self, envelope: MessageEnvelope) -> bool:
+        sent = await self._send(FrameKind.PUBLISH, envelope.event_type, envelope)
+        if sent:
+            self.stats["messages_published"] += 1
+        return sent
+
+    async def send_to_component(self, envelope: MessageEnvelope) -> bool:
+        if not envelope.target_component:
+            log.error("[SocketMessageBus] Missing target_component in envelope")
+            return False
+        sent = await self._send(FrameKind.SEND, envelope.target_component, envelope)
+        if sent:
+            self.stats["messages_sent"] += 1
+        return sent
+
+    async def subscribe(self, topic: str, callback: Callable[[MessageEnvelope], None]) -> str:
+        subscription_id = self.core.next_id("sub")
+        entry = (subscription_id, callback)
+        self.subscriptions[subscription_id] = (topic, entry)
+        self.core.subscribe(topic, entry)
+
+        self._pattern_counts[topic] += 1
+        if self._pattern_counts[topic] == 1 and self.running:
+            self._write_frame(FrameKind.SUBSCRIBE, topic)
+        return subscription_id
+
+    async def unsubscribe(self, subscription_id: str) -> bool:
+        subscription = self.subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        topic, entry = subscription
+        self.core.unsubscribe(topic, entry)
+
+        self._pattern_counts[topic] -= 1
+        if self._pattern_counts[topic] == 0:
+            del self._pattern_counts[topic]
+            if self.running:
+                self._write_frame(FrameKind.UNSUBSCRIBE, topic)
+        return True
+
+    def register_component_handler(self, component_id: str, handler: Callable[[MessageEnvelope], None]) -> None:
+        self.component_handlers[component_id] = handler
+        if self.running:
+            self._write_frame(FrameKind.REGISTER, component_id)
+        log.debug("[SocketMessageBus] Registered component handler: %s", component_id)
+
+    def unregister_component_handler(self, component_id: str) -> bool:
+        handler = self.component_handlers.pop(component_id, None)
+        if handler is None:
+            return False
+        self.core.forget(handler)
+        if self.running:
+            self._write_frame(FrameKind.UNREGISTER, component_id)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "uptime_seconds": time.time() - self.start_time if self.running else 0,
+            "path": self.path,
+            **self.stats,
+            "active_subscriptions": len(self.subscriptions),
+            "registered_components": len(self.component_handlers),
+            "write_buffer_bytes": self._writer.transport.get_write_buffer_size() if self._writer else 0,
+        }
+
+    def is_healthy(self) -> bool:
+        return self.running and self._reader_task is not None and not self._reader_task.done()
@@ -0,0 +1,530 @@
+"""
+SQLite Message Bus - Durable single-host backend on a WAL database
+
+Point-to-point messages are written to a local SQLite database before
+send_to_component() returns, so AT_LEAST_ONCE delivery survives a process
+restart without an external broker:
+
+- writes are buffered and committed in groups (one transaction per batch of
+  up to batch_size rows, or every commit_interval seconds), so concurrent
+  senders share an fsync instead of paying for one each
+- pending messages are claimed per target through an index on
+  (target, status, next_attempt_at) and leased for lease_seconds; a lease
+  that runs out (e.g. the process died mid-delivery) makes the message
+  pending again
+- each target's claimed batch is delivered by its own task, in order, so a
+  slow handler only holds up messages for its own component
+- failed deliveries are rescheduled with the same jittered backoff as the
+  in-memory bus, and dead-lettered (status DEAD, last_error set) when out of
+  retries or past their TTL; rows that cannot be decoded are dead-lettered
+  at once
+
+AT_MOST_ONCE messages to a locally registered handler skip the database.
+Pub/sub hooks are delivered in-process only: hook messages are
+AT_MOST_ONCE by design and subscribers do not outlive the process.
+
+All database work runs on one dedicated thread that owns the connection.
+Envelopes are stored as JSON text by default; with codec="binary" they are
+stored as compact BLOBs. Rows are decoded by their type, so a database can
+switch codecs without migrating.
+"""
+
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from woodwork.core.bus_core import BusCore
+
+from .codec import JSONCodec, get_codec
+from .interface import MessageBusInterface, MessageDeliveryMode, MessageEnvelope
+from .retry_scheduler import RetryScheduler
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = os.path.join(".woodwork", "bus.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id TEXT NOT NULL,
+    target TEXT NOT NULL,
+    envelope BLOB NOT NULL,
+    status INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_retries INTEGER NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    lease_until REAL,
+    expires_at REAL,
+    created_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_messages_pending ON messages (target, status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS idx_messages_expiry ON messages (expires_at) WHERE expires_at IS NOT NULL;
+"""
+
+_INSERT = (
+    "INSERT INTO messages (message_id, target, envelope, max_retries, next_attempt_at, expires_at, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_ACK = "DELETE FROM messages WHERE id = ?"
+_RESCHEDULE = "UPDATE messages SET status = 0, lease_until = NULL, next_attempt_at = ?, last_error = ? WHERE id = ?"
+_DEAD_LETTER = "UPDATE messages SET status = 2, lease_until = NULL, last_error = ? WHERE id = ?"
+
+
+class MessageStatus(IntEnum):
+    """Lifecycle of a stored message"""
+    PENDING = 0
+    LEASED = 1
+    DEAD = 2
+
+
+class SQLiteMessageBus(MessageBusInterface):
+    """Durable message bus on a local SQLite WAL database"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        batch_size: int = 256,
+        commit_interval: float = 0.002,
+        lease_seconds: float = 30.0,
+        poll_interval: float = 0.5,
+        claim_size: int = 64,
+        max_retries: int = 3,
+        retry_base_delay: float = 2.0,
+        retry_max_delay: float = 60.0,
+        retry_jitter: float = 0.2,
+        synchronous: str = "NORMAL",
+        codec: str = "json",
+    ):
+        if batch_size <= 0:
+            raise ValueError("SQLite bus batch_size must be positive")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.claim_size = claim_size
+        self.max_retries = max_retries
+        self.synchronous = synchronous
+        self.codec = get_codec(codec)
+        self._backoff = RetryScheduler(retry_base_delay, retry_max_delay, retry_jitter)
+
+        self.core = BusCore()
+        self.subscriptions: Dict[str, Tuple[str, Callable]] = {}
+        self.component_handlers: Dict[str, Callable] = self.core.handlers
+
+        self.running = False
+        self.start_time = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Group commit: writes waiting for the next transaction
+        self._writes: List[Tuple[str, tuple]] = []
+        self._write_waiters: List[Optional[asyncio.Future]] = []
+        self._write_signal = asyncio.Event()
+        self._dispatch_signal = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._deliveries: Dict[str, asyncio.Task] = {}  # target -> task delivering its claimed batch
+
+        self.stats = self.core.stats
+        self.stats.update({
+            "messages_persisted": 0,
+            "messages_retried": 0,
+            "messages_dead_lettered": 0,
+            "commits": 0,
+            "rows_committed": 0,
+            "active_subscriptions": 0,
+        })
+
+    # Database thread
+
+    async def _db(self, func: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        self._conn.executescript(_SCHEMA)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _commit_batch(self, writes: List[Tuple[str, tuple]]) -> None:
+        """Apply writes in one transaction, batching consecutive runs of the same statement"""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, group in itertools.groupby(writes, key=lambda write: write[0]):
+                conn.executemany(sql, [params for _, params in group])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _claim(self, targets: List[str], now: float) -> List[Tuple[int, str, str, int]]:
+        """Lease due messages for local targets: (id, target, stored envelope, attempts)"""
+        conn = self._conn
+        claimed = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for target in targets:
+                rows = conn.execute(
+                    "SELECT id, envelope, attempts FROM messages "
+                    "WHERE target = ? AND ("
+                    "  (status = 0 AND next_attempt_at <= ?) OR (status = 1 AND lease_until < ?)"
+                    ") AND (expires_at IS NULL OR expires_at > ?) "
+                    "ORDER BY id LIMIT ?",
+                    (target, now, now, now, self.claim_size),
+                ).fetchall()
+                if not rows:
+                    continue
+                conn.executemany(
+                    "UPDATE messages SET status = 1, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                    [(now + self.lease_seconds, row[0]) for row in rows],
+                )
+                claimed.extend((row_id, target, envelope, attempts + 1) for row_id, envelope, attempts in rows)
+
+            # Expired messages are dead-lettered in bulk via the expiry index
+            conn.execute(
+                "UPDATE messages SET status = 2, lease_until = NULL, last_error = 'Message expired' "
+                "WHERE expires_at IS NOT NULL AND expires_at <= ? AND status != 2",
+                (now,),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def _next_due(self, targets: List[str]) -> Optional[float]:
+        if not targets:
+            return None
+        placeholders = ",".join("?" * len(targets))
+        row = self._conn.execute(
+            f"SELECT MIN(next_attempt_at) FROM messages WHERE status = 0 AND target IN ({placeholders})",
+            targets,
+        ).fetchone()
+        return row[0] if row else None
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        if self.running:
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="woodwork-sqlite-bus")
+        await self._db(self._open)
+        self.running = True
+        self.start_time = time.time()
+        self._writer_task = asyncio.create_task(self._writer(), name="sqlite_bus_writer")
+        self._dispatcher_task = asyncio.create_task(self._dispatcher(), name="sqlite_bus_dispatcher")
+        log.info("[SQLiteMessageBus] Started on %s", self.path)
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+
+        if self._dispatcher_task is not None:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher_task = None
+
+        # Deliveries cut short keep their lease and are redelivered after it runs out
+        deliveries = list(self._deliveries.values())
+        for task in deliveries:
+            task.cancel()
+        await asyncio.gather(*deliveries, return_exceptions=True)
+        self._deliveries.clear()
+
+        # Not cancelled: a commit still queued on the executor would be dropped along with its acks
+        if self._writer_task is not None:
+            self._write_signal.set()
+            await self._writer_task
+            self._writer_task = None
+
+        # Whatever is still buffered (e.g. acks) is committed before closing
+        await self._flush_writes()
+        await self._db(self._close)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self.core.clear()
+        self.subscriptions.clear()
+        log.info("[SQLiteMessageBus] Stopped. Stats: %s", self.stats)
+
+    # Group commit
+
+    def _queue_write(self, sql: str, params: tuple, wait: bool = True) -> Optional[asyncio.Future]:
+        """Buffer a write for the next group commit; the future resolves once it is durable"""
+        future = asyncio.get_running_loop().create_future() if wait else None
+        self._writes.append((sql, params))
+        self._write_waiters.append(future)
+        self._write_signal.set()
+        return future
+
+    async def _writer(self) -> None:
+        while self.running:
+            await self._write_signal.wait()
+            # Let concurrent senders join this batch unless it is already full
+            if self.running and len(self._writes) < self.batch_size and self.commit_interval > 0:
+                await asyncio.sleep(self.commit_interval)
+            await self._flush_writes()
+
+    async def _flush_writes(self) -> None:
+        while self._writes:
+            writes = self._writes[:self.batch_size]
+            waiters = self._write_waiters[:self.batch_size]
+            del self._writes[:self.batch_size]
+            del self._write_waiters[:self.batch_size]
+            if not self._writes:
+                self._write_signal.clear()
+
+            try:
+                await self._db(self._commit_batch, writes)
+            except Exception as e:
+                log.error("[SQLiteMessageBus] Commit of %d writes failed: %s", len(writes), e)
+                for waiter in waiters:
+                    if waiter is not None and not waiter.done():
+                        waiter.set_exception(e)
+                continue
+
+            self.stats["commits"] += 1
+            self.stats["rows_committed"] += len(writes)
+            for waiter in waiters:
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(None)
+        self._write_signal.clear()
+
+    # Point-to-point
+
+    async def send_to_component(self, envelope: MessageEnvelope) -> bool:
+        """Persist the message (durable once this returns True) for delivery to its target"""
+        if not self.running:
+            log.warning("[SQLiteMessageBus] Not running, dropping component message: %s -> %s",
+                        envelope.sender_component, envelope.target_component)
+            return False
+        if not envelope.target_component:
+            log.error("[SQLiteMessageBus] Missing target_component in envelope")
+            return False
+
+        handler = self.component_handlers.get(envelope.target_component)
+        if handler is not None and envelope.delivery_mode is MessageDeliveryMode.AT_MOST_ONCE:
+            try:
+                await self.core.call(handler, envelope)
+                self.stats["messages_delivered"] += 1
+                return True
+            except Exception as e:
+                log.error("[SQLiteMessageBus] Handler failed for %s: %s", envelope.target_component, e)
+                self.stats["messages_failed"] += 1
+                return False
+
+        now = time.time()
+        expires_at = envelope.created_at + envelope.ttl_seconds if envelope.ttl_seconds is not None else None
+        row = (envelope.message_id, envelope.target_component, self._encode(envelope),
+               envelope.max_retries, now, expires_at, envelope.created_at)
+        try:
+            await self._queue_write(_INSERT, row)
+        except Exception:
+            return False
+
+        self.stats["messages_persisted"] += 1
+        if handler is not None:
+            self._dispatch_signal.set()
+        return True
+
+    def register_component_handler(self, component_id: str, handler: Callable[[MessageEnvelope], None]) -> None:
+        """Register a handler; messages stored for it (including by earlier runs) are delivered"""
+        self.component_handlers[component_id] = handler
+        self._dispatch_signal.set()
+        log.debug("[SQLiteMessageBus] Registered component handler: %s", component_id)
+
+    def unregister_component_handler(self, component_id: str) -> bool:
+        handler = self.component_handlers.pop(component_id, None)
+        if handler is None:
+            return False
+        self.core.forget(handler)
+        return True
+
+    async def _dispatcher(self) -> None:
+        """Claim due messages for idle local handlers and deliver them, sleeping until more are due"""
+        # Loop on the running flag rather than relying on cancellation alone: on 3.11
+        # wait_for() drops a cancel that lands in the same tick as the dispatch signal.
+        while self.running:
+            try:
+                self._dispatch_signal.clear()
+                # Targets still working through a batch are claimed for again once it is done
+                targets = [target for target in self.component_handlers if target not in self._deliveries]
+                claimed = await self._db(self._claim, targets, time.time())
+
+                batches: Dict[str, List[Tuple[int, str, Any, int]]] = {}
+                for row in claimed:
+                    batches.setdefault(row[1], []).append(row)
+                for target, rows in batches.items():
+                    task = asyncio.create_task(self._deliver_batch(rows), name=f"sqlite_bus_deliver:{target}")
+                    self._deliveries[target] = task
+                    task.add_done_callback(functools.partial(self._delivery_done, target))
+
+                if claimed:
+                    continue
+
+                timeout = self.poll_interval
+                next_due = await self._db(self._next_due, targets) if targets else None
+                if next_due is not None:
+                    timeout = max(min(timeout, next_due - time.time()), 0.0)
+                try:
+                    await asyncio.wait_for(self._dispatch_signal.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("[SQLiteMessageBus] Dispatcher error: %s", e)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _deliver_batch(self, rows: List[Tuple[int, str, Any, int]]) -> None:
+        for row_id, target, stored, attempts in rows:
+            await self._deliver(row_id, target, stored, attempts)
+
+    def _delivery_done(self, target: str, task: asyncio.Task) -> None:
+        self._deliveries.pop(target, None)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("[SQLiteMessageBus] Delivery to %s failed: %s", target, task.exception())
+        self._dispatch_signal.set()
+
+    def _encode(self, envelope: MessageEnvelope) -> Any:
+        data = self.codec.encode_envelope(envelope)
+        # JSON is kept as TEXT so the database stays readable with the sqlite3 shell
+        return data.decode() if isinstance(self.codec, JSONCodec) else data
+
+    def _decode(self, stored: Any) -> MessageEnvelope:
+        if isinstance(stored, str):
+            return MessageEnvelope.from_dict(json.loads(stored))
+        return self.codec.decode_envelope(stored)
+
+    async def _deliver(self, row_id: int, target: str, stored: Any, attempts: int) -> None:
+        handler = self.component_handlers.get(target)
+        try:
+            envelope = self._decode(stored)
+        except Exception as e:
+            # Decoding will never succeed, so retrying would only block the rows behind it
+            log.error("[SQLiteMessageBus] Cannot decode message %d for %s: %s", row_id, target, e)
+            self.stats["messages_dead_lettered"] += 1
+            self._queue_write(_DEAD_LETTER, (f"Undecodable envelope: {e}", row_id), wait=False)
+            return
+        envelope.retry_count = attempts - 1
+
+        try:
+            if handler is None:
+                raise RuntimeError(f"No handler registered for {target}")
+            await self.core.call(handler, envelope)
+        except Exception as e:
+            log.error("[SQLiteMessageBus] Handler failed for %s: %s", target, e)
+            self.stats["messages_failed"] += 1
+            if attempts <= envelope.max_retries and not envelope.is_expired():
+                self.stats["messages_retried"] += 1
+                next_attempt_at = time.time() + self._backoff.backoff(attempts)
+                self._queue_write(_RESCHEDULE, (next_attempt_at, str(e), row_id), wait=False)
+            else:
+                self.stats["messages_dead_lettered"] += 1
+                self._queue_write(_DEAD_LETTER, (f"Handler exception: {e}", row_id), wait=False)
+            return
+
+        self.stats["messages_delivered"] += 1
+        # Acks ride along with the next group commit; an unacked message is redelivered after its lease
+        self._queue_write(_ACK, (row_id,), wait=False)
+
+    # Pub/sub (in-process)
+
+    async def publish(self, envelope: MessageEnvelope) -> bool:
+        if not self.running:
+            return False
+        subscribers = self.core.match(envelope.event_type)
+        failed = 0
+        for _, callback in subscribers:
+            try:
+                await self.core.call(callback, envelope)
+                self.stats["messages_delivered"] += 1
+            except Exception as e:
+                failed += 1
+                self.stats["messages_failed"] += 1
+                log.error("[SQLiteMessageBus] Subscriber failed for '%s': %s", envelope.event_type, e)
+        self.stats["messages_published"] += 1
+        return failed == 0
+
+    async def subscribe(self, topic: str, callback: Callable[[MessageEnvelope], None]) -> str:
+        subscription_id = self.core.next_id("sub")
+        entry = (subscription_id, callback)
+        self.subscriptions[subscription_id] = (topic, entry)
+        self.core.subscribe(topic, entry)
+        self.stats["active_subscriptions"] = len(self.subscriptions)
+        return subscription_id
+
+    async def unsubscribe(self, subscription_id: str) -> bool:
+        subscription = self.subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        topic, entry = subscription
+        self.core.unsubscribe(topic, entry)
+        self.stats["active_subscriptions"] = len(self.subscriptions)
+        return True
+
+    # Monitoring
+
+    def count_messages(self) -> Dict[str, int]:
+        """Count stored messages by status (opens a short-lived reader; WAL lets it run alongside writes)"""
+        counts = {status.name.lower(): 0 for status in MessageStatus}
+        if not os.path.exists(self.path):
+            return counts
+        with closing(sqlite3.connect(self.path)) as conn:
+            for status, count in conn.execute("SELECT status, COUNT(*) FROM messages GROUP BY status"):
+                counts[MessageStatus(status).name.lower()] = count
+        return counts
+
+    def get_dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        with closing(sqlite3.connect(self.path)) as conn:
+            rows = conn.execute(
+                "SELECT envelope, last_error FROM messages WHERE status = 2 ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+        return [{"envelope": self._decode_dead_letter(stored), "reason": reason} for stored, reason in rows]
+
+    def _decode_dead_letter(self, stored: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return self._decode(stored).to_dict()
+        except Exception:
+            return None  # Dead-lettered because it could not be decoded
+
+    def get_stats(self) -> Dict[str, Any]:
+        uptime = time.time() - self.start_time if self.running else 0
+        return {
+            "running": self.running,
+            "uptime_seconds": uptime,
+            "path": self.path,
+            **self.stats,
+            "avg_commit_size": self.stats["rows_committed"] / max(self.stats["commits"], 1),
+            "buffered_writes": len(self._writes),
+            "registered_components": len(self.component_handlers),
+        }
+
+    def is_healthy(self) -> bool:
+        return self.running and self._writer_task is not None and not self._writer_task.done()
@@ -0,0 +1,196 @@
+"""
+Latency Metrics - Fixed-memory histograms for event bus instrumentation
+
+Latencies are recorded into log-bucketed histograms: every power of two is
+split into SUB_BUCKETS linear sub-buckets while each histogram stays a
+fixed array of counters. A percentile is reported as the upper bound of
+its bucket, so it never understates the true value and overstates it by
+at most 1 / SUB_BUCKETS (12.5%): the first sub-bucket above a power of
+two is that wide relative to its lower bound. Recording a sample is a bisect
+over precomputed bucket bounds and an increment, cheap enough to run on
+every emit.
+
+LatencyMetrics groups histograms into families (e.g. "event", "hook",
+"route"), each keyed by a series name, and exports them as a stats dict,
+JSON, or Prometheus text exposition format.
+"""
+
+import json
+import math
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List
+
+# Histogram layout: values in milliseconds from 2^-11 ms (~0.5us) to 2^18 ms (~4.4min)
+SUB_BUCKETS = 8
+MIN_EXPONENT = -10
+MAX_EXPONENT = 18
+BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+# Upper bound of each bucket; one extra overflow bucket catches anything larger
+_UPPER_BOUNDS = [
+    math.ldexp(0.5 + (index % SUB_BUCKETS + 1) / (2 * SUB_BUCKETS), index // SUB_BUCKETS + MIN_EXPONENT)
+    for index in range(BUCKET_COUNT)
+]
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucketed latency histogram (milliseconds)"""
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (BUCKET_COUNT + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms: float, _bisect=bisect_left, _bounds=_UPPER_BOUNDS) -> None:
+        # Runs on every emit: one C-level bisect plus a few attribute updates
+        self.counts[_bisect(_bounds, value_ms)] += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples into this one"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, quantile: float) -> float:
+        """Estimate a quantile (0..1), never above the largest recorded sample"""
+        count = self.count
+        if not count:
+            return 0.0
+
+        rank = quantile * count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if bucket_count and cumulative >= rank:
+                return min(_UPPER_BOUNDS[index], self.max) if index < BUCKET_COUNT else self.max
+        return self.max
+
+    def snapshot(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, float]:
+        count = self.count
+        stats = {
+            "count": count,
+            "sum_ms": self.total,
+            "avg_ms": self.total / count if count else 0.0,
+            "max_ms": self.max,
+        }
+        for quantile in quantiles:
+            stats[f"p{quantile * 100:g}_ms"] = self.percentile(quantile)
+        return stats
+
+
+def _series_name(key: Any) -> str:
+    """Name a series key; callables are named by module and qualified name"""
+    if isinstance(key, str):
+        return key
+    module = getattr(key, "__module__", None)
+    qualname = getattr(key, "__qualname__", None) or type(key).__name__
+    return f"{module}.{qualname}" if module else qualname
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class LatencyMetrics:
+    """
+    Latency histograms grouped by family and series.
+
+    families maps each family to the Prometheus label naming its series,
+    e.g. {"event": "event_type", "route": "target"}. Series keys may be
+    strings or callables; callables are resolved to names only when a
+    snapshot is taken, so the recording path never formats strings.
+    """
+
+    def __init__(self, namespace: str, families: Dict[str, str]):
+        self.namespace = namespace
+        self._labels = dict(families)
+        self._series: Dict[str, Dict[Any, LatencyHistogram]] = {family: {} for family in families}
+
+    def series(self, family: str) -> Dict[Any, LatencyHistogram]:
+        """Get a family's live key -> histogram map, for callers that cache lookups"""
+        return self._series[family]
+
+    def histogram(self, family: str, key: Any) -> LatencyHistogram:
+        """Get or create the histogram for one series"""
+        series = self._series[family]
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = LatencyHistogram()
+        return histogram
+
+    def observe(self, family: str, key: Any, value_ms: float) -> None:
+        self.histogram(family, key).record(value_ms)
+
+    def histograms(self, family: str) -> Dict[str, LatencyHistogram]:
+        """Get a family's histograms by series name, merging keys that share a name"""
+        merged: Dict[str, LatencyHistogram] = {}
+        for key, histogram in self._series[family].items():
+            name = _series_name(key)
+            if name in merged:
+                combined = LatencyHistogram()
+                combined.merge(merged[name])
+                combined.merge(histogram)
+                merged[name] = combined
+            else:
+                merged[name] = histogram
+        return merged
+
+    def snapshot(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Dict[str, Dict[str, float]]]:
+        quantiles = tuple(quantiles)
+        return {
+            family: {name: histogram.snapshot(quantiles) for name, histogram in self.histograms(family).items()}
+            for family in self._series
+        }
+
+    def reset(self) -> None:
+        for series in self._series.values():
+            series.clear()
+
+    def to_json(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> str:
+        return json.dumps({"namespace": self.namespace, "latency": self.snapshot(quantiles)}, sort_keys=True)
+
+    def to_prometheus(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> str:
+        """Render as Prometheus summaries (in seconds) plus a max gauge per series"""
+        quantiles = tuple(quantiles)
+        lines: List[str] = []
+
+        for family, label in self._labels.items():
+            histograms = self.histograms(family)
+            if not histograms:
+                continue
+
+            metric = f"{self.namespace}_{family}_latency_seconds"
+            lines.append(f"# HELP {metric} {family} latency in seconds")
+            lines.append(f"# TYPE {metric} summary")
+            for name, histogram in sorted(histograms.items()):
+                series_label = f'{label}="{_escape_label(name)}"'
+                for quantile in quantiles:
+                    value = histogram.percentile(quantile) / 1000
+                    lines.append(f'{metric}{{{series_label},quantile="{quantile:g}"}} {value:.9g}')
+                lines.append(f"{metric}_sum{{{series_label}}} {histogram.total / 1000:.9g}")
+                lines.append(f"{metric}_count{{{series_label}}} {histogram.count}")
+
+            lines.append(f"# HELP {metric}_max maximum {family} latency in seconds")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for name, histogram in sorted(histograms.items()):
+                lines.append(f'{metric}_max{{{label}="{_escape_label(name)}"}} {histogram.max / 1000:.9g}')
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def export(self, format: str = "prometheus") -> str:
+        if format == "prometheus":
+            return self.to_prometheus()
+        if format == "json":
+            return self.to_json()
+        raise ValueError(f"Unknown metrics format '{format}', expected 'prometheus' or 'json'")
+
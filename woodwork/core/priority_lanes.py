@@ -0,0 +1,231 @@
+"""
+Priority Lanes - Weighted fair queuing for bus traffic
+
+Control traffic (errors, cancellation, stream failures, health pings) used
+to wait behind bulk traffic (stream chunks) in the same FIFO. Messages are
+now sorted into three lanes:
+
+- CONTROL: errors, cancellation, stream.failed, heartbeats and health pings
+- INTERACTIVE: everything not classified otherwise
+- BULK: stream.chunk
+
+A message's lane is its explicit priority if it has one, otherwise the
+lane of the highest-priority rule matching its topic (wildcards as in
+topic_matcher). Classification is cached per topic by the trie.
+
+LaneQueue dequeues by weighted round robin: each round a lane may yield up
+to `weight` items, higher-priority lanes first, so while every lane is
+backlogged CONTROL:INTERACTIVE:BULK get 8:4:1 of the turns by default and
+bulk traffic is delayed but never starved.
+"""
+
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from woodwork.core.topic_matcher import TopicTrie
+
+
+class MessagePriority(Enum):
+    """Delivery lane for a message, highest priority first"""
+    CONTROL = "control"
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+LANES: Tuple[MessagePriority, ...] = tuple(MessagePriority)
+
+DEFAULT_LANE_WEIGHTS: Dict[MessagePriority, int] = {
+    MessagePriority.CONTROL: 8,
+    MessagePriority.INTERACTIVE: 4,
+    MessagePriority.BULK: 1,
+}
+
+DEFAULT_LANE_RULES: Dict[str, MessagePriority] = {
+    "#.error": MessagePriority.CONTROL,
+    "#.cancel": MessagePriority.CONTROL,
+    "#.cancelled": MessagePriority.CONTROL,
+    "stream.failed": MessagePriority.CONTROL,
+    "component.heartbeat": MessagePriority.CONTROL,
+    "#.health": MessagePriority.CONTROL,
+    "#.ping": MessagePriority.CONTROL,
+    "stream.chunk": MessagePriority.BULK,
+}
+
+_RANK = {lane: rank for rank, lane in enumerate(LANES)}
+
+
+class LanePolicy:
+    """Topic -> lane classification and per-lane weights"""
+
+    def __init__(
+        self,
+        weights: Optional[Dict[Any, int]] = None,
+        rules: Optional[Dict[str, Any]] = None,
+        default: Any = MessagePriority.INTERACTIVE,
+    ):
+        self.weights = dict(DEFAULT_LANE_WEIGHTS)
+        for lane, weight in (weights or {}).items():
+            if weight <= 0:
+                raise ValueError(f"Lane weight for '{lane}' must be positive")
+            self.weights[MessagePriority(lane)] = weight
+
+        self.default = MessagePriority(default)
+        self._rules = TopicTrie()
+        for pattern, lane in (DEFAULT_LANE_RULES if rules is None else rules).items():
+            self._rules.add(pattern, MessagePriority(lane))
+
+    def classify(self, topic: str) -> MessagePriority:
+        """Lane for a topic: the highest-priority matching rule, else the default"""
+        matches = self._rules.match(topic)
+        if not matches:
+            return self.default
+        return min(matches, key=_RANK.__getitem__)
+
+    def lane_of(self, priority: Optional[Any], topic: str) -> MessagePriority:
+        """Lane for a message with an optional explicit priority"""
+        if priority is not None:
+            return MessagePriority(priority)
+        return self.classify(topic)
+
+
+class PriorityLanes:
+    """One FIFO per lane, dequeued by weighted round robin"""
+
+    def __init__(self, weights: Optional[Dict[MessagePriority, int]] = None):
+        self.weights = dict(weights or DEFAULT_LANE_WEIGHTS)
+        self._lanes: Dict[MessagePriority, deque] = {lane: deque() for lane in LANES}
+        self._credits: Dict[MessagePriority, int] = dict(self.weights)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, lane: MessagePriority, item: Any) -> None:
+        self._lanes[lane].append(item)
+        self._size += 1
+
+    def pop(self) -> Tuple[MessagePriority, Any]:
+        """Remove the next item by weighted round robin; raises IndexError when empty"""
+        if not self._size:
+            raise IndexError("pop from empty PriorityLanes")
+
+        lanes = self._lanes
+        credits = self._credits
+        for _ in range(2):
+            for lane in LANES:
+                if lanes[lane] and credits[lane] > 0:
+                    credits[lane] -= 1
+                    self._size -= 1
+                    return lane, lanes[lane].popleft()
+            # Every backlogged lane has used its turns this round
+            credits.update(self.weights)
+        raise AssertionError("unreachable: non-empty lanes with fresh credits")
+
+    def evict(self) -> Tuple[MessagePriority, Any]:
+        """Remove the oldest item of the lowest-priority non-empty lane"""
+        for lane in reversed(LANES):
+            if self._lanes[lane]:
+                self._size -= 1
+                return lane, self._lanes[lane].popleft()
+        raise IndexError("evict from empty PriorityLanes")
+
+    def depths(self) -> Dict[str, int]:
+        return {lane.value: len(items) for lane, items in self._lanes.items()}
+
+    def clear(self) -> None:
+        for items in self._lanes.values():
+            items.clear()
+        self._credits = dict(self.weights)
+        self._size = 0
+
+
+def order_by_lane(items: Iterable[Any], lane_of: Callable[[Any], MessagePriority],
+                  weights: Optional[Dict[MessagePriority, int]] = None) -> List[Any]:
+    """Reorder a batch of items the way a LaneQueue would dequeue them"""
+    lanes = PriorityLanes(weights)
+    for item in items:
+        lanes.push(lane_of(item), item)
+    return [lanes.pop()[1] for _ in range(len(lanes))]
+
+
+class LaneQueue:
+    """
+    Bounded queue that dequeues by lane instead of FIFO.
+
+    Offers the asyncio.Queue methods SubscriberMailbox uses (put/get, the
+    _nowait variants, task_done/join) on a PriorityLanes of its own rather
+    than on asyncio.Queue internals. lane_of(item) picks the lane on put;
+    maxsize bounds all lanes together. Waiters sleep on events that the
+    synchronous put_nowait/get_nowait set, so those stay usable from sync code.
+    """
+
+    def __init__(self, lane_of: Callable[[Any], MessagePriority], maxsize: int = 0,
+                 weights: Optional[Dict[MessagePriority, int]] = None):
+        self.maxsize = maxsize
+        self._lane_of = lane_of
+        self._lanes = PriorityLanes(weights)
+        self._readable = asyncio.Event()  # set while an item may be waiting
+        self._writable = asyncio.Event()  # set while there may be room
+        self._writable.set()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def qsize(self) -> int:
+        return len(self._lanes)
+
+    def empty(self) -> bool:
+        return not self._lanes
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._lanes)
+
+    def put_nowait(self, item: Any) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._lanes.push(self._lane_of(item), item)
+        self._unfinished += 1
+        self._finished.clear()
+        self._readable.set()
+
+    async def put(self, item: Any) -> None:
+        while self.full():
+            self._writable.clear()
+            await self._writable.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._lanes.pop()[1]
+        self._writable.set()
+        return item
+
+    async def get(self) -> Any:
+        while self.empty():
+            self._readable.clear()
+            await self._readable.wait()
+        return self.get_nowait()
+
+    def evict_nowait(self) -> Any:
+        """Remove the oldest lowest-priority item (for drop-oldest overflow)"""
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._lanes.evict()[1]
+        self._writable.set()
+        return item
+
+    def task_done(self) -> None:
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        await self._finished.wait()
+
+    def depths(self) -> Dict[str, int]:
+        return self._lanes.depths()
@@ -0,0 +1,158 @@
+"""
+Response Waiters - Future-based request/response correlation
+
+request() used to poll a dict of received responses every 50 ms, adding up
+to 50 ms to every round trip and waking the loop 20 times a second per
+waiter; responses that arrived after a timeout stayed in the dict forever.
+
+ResponseWaiters keeps one asyncio.Future per in-flight request_id instead.
+Whoever receives the response (the router, or the component's response
+handler) resolves the future directly, so the waiter resumes on the next
+loop iteration. Responses can also arrive before anyone waits (the
+UnifiedEventBus computes the response before returning the request_id);
+those are held briefly in a bounded early-response table. A request that
+timed out or was cancelled is remembered for a while so its late response
+is discarded instead of stored.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+class ResponseWaiters:
+    """In-flight request futures plus bounded tables of early and abandoned responses"""
+
+    def __init__(self, max_early: int = 1000, early_ttl: float = 60.0, max_abandoned: int = 1000):
+        self.max_early = max_early
+        self.early_ttl = early_ttl
+        self.max_abandoned = max_abandoned
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._early: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._abandoned: "OrderedDict[str, None]" = OrderedDict()
+
+        self.stats = {
+            "resolved": 0,
+            "early": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "late_discarded": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._pending or request_id in self._early
+
+    def resolve(self, request_id: str, response: Any) -> bool:
+        """Hand a response to its waiter; returns False if it was discarded"""
+        future = self._pending.get(request_id)
+        if future is not None:
+            if future.done():
+                return False
+            future.set_result(response)
+            self.stats["resolved"] += 1
+            return True
+
+        if request_id in self._abandoned:
+            del self._abandoned[request_id]
+            self.stats["late_discarded"] += 1
+            log.debug("[ResponseWaiters] Discarded late response for '%s'", request_id)
+            return False
+
+        # Nobody is waiting yet: keep it for a waiter that is about to arrive
+        now = time.monotonic()
+        self._early[request_id] = (now, response)
+        self._early.move_to_end(request_id)
+        self.stats["early"] += 1
+        self._prune_early(now)
+        return True
+
+    def fail(self, request_id: str, error: BaseException) -> bool:
+        """Raise error in the waiter for request_id, if one is waiting"""
+        future = self._pending.get(request_id)
+        if future is None or future.done():
+            return False
+        future.set_exception(error)
+        return True
+
+    async def wait(self, request_id: str, timeout: Optional[float]) -> Any:
+        """Wait for the response to request_id; raises TimeoutError after timeout seconds"""
+        early = self._early.pop(request_id, None)
+        if early is not None:
+            return early[1]
+
+        if request_id in self._pending:
+            raise RuntimeError(f"Already waiting for a response to '{request_id}'")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            self._abandon(request_id)
+            raise TimeoutError(f"No response to '{request_id}' after {timeout}s") from None
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            self._abandon(request_id)
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    def discard(self, request_id: str) -> None:
+        """Forget a request: cancel its waiter and drop any response held for it"""
+        self._early.pop(request_id, None)
+        future = self._pending.pop(request_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    def cancel_all(self) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        self._early.clear()
+
+    def _abandon(self, request_id: str) -> None:
+        self._abandoned[request_id] = None
+        while len(self._abandoned) > self.max_abandoned:
+            self._abandoned.popitem(last=False)
+
+    def _prune_early(self, now: float) -> None:
+        early = self._early
+        while early and (len(early) > self.max_early or now - next(iter(early.values()))[0] > self.early_ttl):
+            request_id, _ = early.popitem(last=False)
+            log.debug("[ResponseWaiters] Dropped unclaimed response for '%s'", request_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "unclaimed": len(self._early),
+        }
+
+
+def deliver_response(component: Any, request_id: str, response: Dict[str, Any]) -> bool:
+    """
+    Deliver a response to the component that made the request.
+
+    Uses the component's ResponseWaiters when it has one, and falls back to
+    storing into a plain _received_responses dict for components that still
+    poll one.
+    """
+    waiters = getattr(component, "_response_waiters", None)
+    if isinstance(waiters, ResponseWaiters):
+        return waiters.resolve(request_id, response)
+
+    received = getattr(component, "_received_responses", None)
+    if received is not None:
+        received[request_id] = response
+        return True
+    return False
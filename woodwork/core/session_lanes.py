@@ -0,0 +1,182 @@
+"""
+Session Lanes - Per-session ordered processing for the event bus
+
+Every session gets its own lane: a bounded asyncio queue drained by one
+worker task. Work submitted for a session runs strictly in submission order
+on that lane, while lanes for different sessions run concurrently, so a
+long pipe chain or slow delivery in one session does not hold up the rest.
+
+Lanes are created on first use and reaped once they have been idle (empty
+and not processing) for longer than idle_timeout. Work submitted from
+inside a lane for the same session runs inline, so nested emits (e.g.
+auto-emitted responses) cannot deadlock waiting on their own lane.
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SESSION = "default"
+
+# Session whose lane is running the current task (None outside lanes)
+_current_lane: ContextVar[Optional[str]] = ContextVar("woodwork_session_lane", default=None)
+
+
+class SessionLane:
+    """Bounded FIFO of work for one session, drained by a single worker"""
+
+    def __init__(self, session_id: str, queue_size: int):
+        self.session_id = session_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.worker: Optional[asyncio.Task] = None
+        self.busy = False
+        self.last_active = time.monotonic()
+        self.processed = 0
+        self.errors = 0
+
+    def is_idle(self, now: float, idle_timeout: float) -> bool:
+        return not self.busy and self.queue.empty() and now - self.last_active >= idle_timeout
+
+
+class SessionLanes:
+    """Per-session lanes with bounded queues and idle cleanup"""
+
+    def __init__(self, queue_size: int = 100, idle_timeout: float = 300.0):
+        if queue_size <= 0:
+            raise ValueError("Session lane queue_size must be positive")
+
+        self.queue_size = queue_size
+        self.idle_timeout = idle_timeout
+
+        self._lanes: Dict[str, SessionLane] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "lanes_created": 0,
+            "lanes_expired": 0,
+        }
+
+    @staticmethod
+    def current_session() -> Optional[str]:
+        """Get the session whose lane is running the caller, if any"""
+        return _current_lane.get()
+
+    async def run(self, session_id: Optional[str], func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run func(*args) on the session's lane and wait for its result"""
+        session_id = session_id or DEFAULT_SESSION
+        if _current_lane.get() == session_id:
+            return await func(*args)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._enqueue(session_id, func, args, future)
+        return await future
+
+    async def post(self, session_id: Optional[str], func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """Queue func(*args) on the session's lane without waiting for it to run"""
+        await self._enqueue(session_id or DEFAULT_SESSION, func, args, None)
+
+    async def _enqueue(self, session_id: str, func: Callable, args: tuple, future: Optional[asyncio.Future]) -> None:
+        lane = self._get_lane(session_id)
+        # Blocks when the lane is full: backpressure on this session only
+        await lane.queue.put((func, args, future))
+
+    def _get_lane(self, session_id: str) -> SessionLane:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Lanes belong to one event loop; start over on a new one
+            self._lanes.clear()
+            self._reaper = None
+            self._loop = loop
+
+        lane = self._lanes.get(session_id)
+        if lane is None:
+            lane = self._lanes[session_id] = SessionLane(session_id, self.queue_size)
+            lane.worker = loop.create_task(self._work(lane), name=f"woodwork-session:{session_id}")
+            self.stats["lanes_created"] += 1
+            log.debug("[SessionLanes] Created lane for session '%s'", session_id)
+
+        if self._reaper is None or self._reaper.done():
+            self._reaper = loop.create_task(self._reap_idle_lanes(), name="woodwork-session-reaper")
+
+        return lane
+
+    async def _work(self, lane: SessionLane) -> None:
+        _current_lane.set(lane.session_id)
+        while True:
+            func, args, future = await lane.queue.get()
+            lane.busy = True
+            try:
+                result = await func(*args)
+                if future is not None and not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if future is not None and not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                lane.errors += 1
+                if future is not None and not future.done():
+                    future.set_exception(e)
+                else:
+                    log.error("[SessionLanes] Work failed in session '%s': %s", lane.session_id, e)
+            finally:
+                lane.busy = False
+                lane.processed += 1
+                lane.last_active = time.monotonic()
+                lane.queue.task_done()
+
+    async def _reap_idle_lanes(self) -> None:
+        interval = max(min(self.idle_timeout / 2, 30.0), 0.01)
+        while self._lanes:
+            await asyncio.sleep(interval)
+            self.expire_idle_lanes()
+
+    def expire_idle_lanes(self) -> int:
+        """Close lanes that have been idle longer than idle_timeout"""
+        now = time.monotonic()
+        expired = [lane for lane in self._lanes.values() if lane.is_idle(now, self.idle_timeout)]
+        for lane in expired:
+            del self._lanes[lane.session_id]
+            if lane.worker is not None:
+                lane.worker.cancel()
+
+        if expired:
+            self.stats["lanes_expired"] += len(expired)
+            log.debug("[SessionLanes] Expired %d idle lanes", len(expired))
+        return len(expired)
+
+    async def drain(self) -> None:
+        """Wait until every lane has processed its queued work"""
+        for lane in list(self._lanes.values()):
+            await lane.queue.join()
+
+    async def close(self) -> None:
+        """Cancel all lane workers; queued work is discarded"""
+        tasks = [lane.worker for lane in self._lanes.values() if lane.worker is not None]
+        if self._reaper is not None:
+            tasks.append(self._reaper)
+        self._lanes.clear()
+        self._reaper = None
+
+        # Tasks from a previous event loop cannot be cancelled from this one
+        if self._loop is asyncio.get_running_loop():
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        depths = [lane.queue.qsize() for lane in self._lanes.values()]
+        return {
+            **self.stats,
+            "active_lanes": len(self._lanes),
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "queue_size": self.queue_size,
+            "idle_timeout": self.idle_timeout,
+        }
@@ -4,6 +4,12 @@ Simplified in-memory message bus for streaming implementation
 This is a basic message bus implementation that handles pub/sub messaging
 for streaming data between components. It's designed as a starting point
 before the full distributed message bus is implemented.
+
+Messages carry a priority lane (control / interactive / bulk, see
+priority_lanes.py) and an optional deadline. Messages past their deadline
+are dropped before delivery, messages queued for a component that has not
+registered yet are flushed by weighted round robin across lanes, and
+latency from send to handling is tracked per lane.
 """
 
 import asyncio
@@ -12,23 +18,31 @@ from typing import Dict, List, Callable, Any, Optional, Set
 from collections import defaultdict
 import json
 import time
-import uuid
+
+from woodwork.core.bus_core import BusCore
+from woodwork.core.metrics import LatencyMetrics
+from woodwork.core.priority_lanes import LanePolicy, MessagePriority, order_by_lane
 
 log = logging.getLogger(__name__)
 
 
 class SimpleMessageBus:
-    """Simplified in-memory message bus for streaming implementation"""
+    """Simplified in-memory message bus for streaming implementation (adapter over BusCore)"""
     
-    def __init__(self):
-        # Topic-based subscriptions
+    def __init__(self, lane_weights: Optional[Dict[str, int]] = None,
+                 lane_rules: Optional[Dict[str, str]] = None):
+        self.core = BusCore()
+        self.lanes = LanePolicy(lane_weights, lane_rules)
+
+        # Topic-based subscriptions (keys may be wildcard patterns, e.g. "stream.>")
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._topic_index = self.core.topic_index
         
         # Direct component messaging
-        self.component_handlers: Dict[str, Callable] = {}
+        self.component_handlers: Dict[str, Callable] = self.core.handlers
         
         # Message queues for components that aren't immediately available
-        self.component_queues: Dict[str, List[Any]] = defaultdict(list)
+        self.component_queues = self.core.mailboxes
         
         # Bus state
         self.running = False
@@ -37,12 +51,10 @@ class SimpleMessageBus:
         
         # Performance tracking
         self.start_time = 0
-        self.stats = {
-            "messages_published": 0,
-            "messages_delivered": 0,
-            "messages_failed": 0,
-            "active_subscriptions": 0
-        }
+        self.stats = self.core.stats
+        self.stats["active_subscriptions"] = 0
+        self.stats["messages_deadline_dropped"] = 0
+        self.latency = LatencyMetrics("woodwork_simple_bus", {"lane": "lane"})
         
     async def start(self):
         """Start the message bus"""
@@ -59,12 +71,12 @@ class SimpleMessageBus:
         
         # Clear all subscriptions and queues
         self.subscribers.clear()
-        self.component_handlers.clear()
-        self.component_queues.clear()
+        self.core.clear()
         
         log.info("Simple message bus stopped")
         
-    async def publish(self, topic: str, data: Any, sender_id: Optional[str] = None):
+    async def publish(self, topic: str, data: Any, sender_id: Optional[str] = None, *,
+                      priority: Optional[MessagePriority] = None, deadline: Optional[float] = None):
         """
         Publish message to topic
         
@@ -72,55 +84,45 @@ class SimpleMessageBus:
             topic: Topic to publish to
             data: Message data
             sender_id: ID of sending component (optional)
+            priority: Lane for the message (optional, classified from the topic)
+            deadline: Epoch seconds after which the message is dropped (optional)
         """
         if not self.running:
             log.warning("Message bus not running, dropping message")
             return
             
         self.message_count += 1
-        self.stats["messages_published"] += 1
         
         # Create message envelope
         message = {
-            "id": f"msg-{uuid.uuid4().hex[:8]}",
+            "id": self.core.next_id(),
             "topic": topic,
             "data": data,
             "sender_id": sender_id,
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "priority": self.lanes.lane_of(priority, topic).value,
+            "deadline": deadline
         }
+        if self._drop_if_late(message):
+            return
         
-        # Deliver to all subscribers
-        delivered_count = 0
-        failed_count = 0
-        
-        subscribers = self.subscribers.get(topic, [])
-        log.debug(f"Publishing to {topic}: {len(subscribers)} subscribers")
-        
-        for callback in subscribers:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(message)
-                else:
-                    callback(message)
-                delivered_count += 1
-            except Exception as e:
-                log.error(f"Error in subscriber callback for {topic}: {e}")
-                failed_count += 1
-                
-        self.stats["messages_delivered"] += delivered_count
-        self.stats["messages_failed"] += failed_count
+        # Deliver to all subscribers (counts published/delivered/failed)
+        delivered_count, failed_count = await self.core.fan_out(topic, message)
+        self._observe_lane(message)
         
-        log.debug(f"Published to {topic}: {delivered_count} delivered, {failed_count} failed")
+        log.debug("Published to %s: %d delivered, %d failed", topic, delivered_count, failed_count)
     
     def subscribe(self, topic: str, callback: Callable):
         """
         Subscribe to topic
         
         Args:
-            topic: Topic to subscribe to
+            topic: Topic or wildcard pattern to subscribe to ("*" one segment,
+                "#" zero or more segments, ">" one or more trailing segments)
             callback: Function to call when message received
         """
         self.subscribers[topic].append(callback)
+        self.core.subscribe(topic, callback)
         self.stats["active_subscriptions"] = sum(len(subs) for subs in self.subscribers.values())
         log.debug(f"Subscribed to {topic}, total subscriptions: {self.stats['active_subscriptions']}")
         
@@ -134,10 +136,12 @@ class SimpleMessageBus:
         """
         if callback in self.subscribers[topic]:
             self.subscribers[topic].remove(callback)
+            self.core.unsubscribe(topic, callback)
             self.stats["active_subscriptions"] = sum(len(subs) for subs in self.subscribers.values())
             log.debug(f"Unsubscribed from {topic}")
     
-    async def send_to_component(self, component_id: str, data: Any, sender_id: Optional[str] = None):
+    async def send_to_component(self, component_id: str, data: Any, sender_id: Optional[str] = None, *,
+                                priority: Optional[MessagePriority] = None, deadline: Optional[float] = None):
         """
         Send message directly to specific component
         
@@ -145,32 +149,37 @@ class SimpleMessageBus:
             component_id: Target component ID
             data: Message data  
             sender_id: ID of sending component (optional)
+            priority: Lane for the message (optional, classified from the event type in data)
+            deadline: Epoch seconds after which the message is dropped (optional)
         """
         if not self.running:
             return
             
+        event_type = data.get("event_type", "") if isinstance(data, dict) else ""
         message = {
-            "id": f"msg-{uuid.uuid4().hex[:8]}",
+            "id": self.core.next_id(),
             "target": component_id,
             "data": data,
             "sender_id": sender_id,
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "priority": self.lanes.lane_of(priority, event_type).value,
+            "deadline": deadline
         }
+        if self._drop_if_late(message):
+            return
         
         # Try to deliver directly if handler exists
-        if component_id in self.component_handlers:
+        handler = self.component_handlers.get(component_id)
+        if handler is not None:
             try:
-                handler = self.component_handlers[component_id]
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(message)
-                else:
-                    handler(message)
-                log.debug(f"Sent direct message to {component_id}")
+                await self.core.call(handler, message)
+                self._observe_lane(message)
+                log.debug("Sent direct message to %s", component_id)
             except Exception as e:
                 log.error(f"Error delivering message to {component_id}: {e}")
         else:
             # Queue message for when component becomes available
-            self.component_queues[component_id].append(message)
+            self.core.enqueue(component_id, message)
             log.debug(f"Queued message for {component_id}")
     
     def register_component_handler(self, component_id: str, handler: Callable):
@@ -184,11 +193,10 @@ class SimpleMessageBus:
         self.component_handlers[component_id] = handler
         
         # Deliver any queued messages
-        queued_messages = self.component_queues[component_id]
+        queued_messages = self.core.take_mailbox(component_id)
         if queued_messages:
             log.debug(f"Delivering {len(queued_messages)} queued messages to {component_id}")
             asyncio.create_task(self._deliver_queued_messages(component_id, queued_messages))
-            self.component_queues[component_id] = []
             
         log.debug(f"Registered component handler: {component_id}")
     
@@ -199,8 +207,9 @@ class SimpleMessageBus:
         Args:
             component_id: Component ID to unregister
         """
-        if component_id in self.component_handlers:
-            del self.component_handlers[component_id]
+        handler = self.component_handlers.pop(component_id, None)
+        if handler is not None:
+            self.core.forget(handler)
             log.debug(f"Unregistered component handler: {component_id}")
     
     async def _deliver_queued_messages(self, component_id: str, messages: List[Any]):
@@ -209,15 +218,30 @@ class SimpleMessageBus:
         if not handler:
             return
             
-        for message in messages:
+        for message in order_by_lane(messages, self._message_lane):
+            if self._drop_if_late(message):
+                continue
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(message)
-                else:
-                    handler(message)
+                await self.core.call(handler, message)
+                self._observe_lane(message)
             except Exception as e:
                 log.error(f"Error delivering queued message to {component_id}: {e}")
     
+    def _message_lane(self, message: Dict[str, Any]) -> MessagePriority:
+        return MessagePriority(message.get("priority") or self.lanes.default)
+
+    def _drop_if_late(self, message: Dict[str, Any]) -> bool:
+        """Drop a message whose deadline has passed, so no handler works on it"""
+        deadline = message.get("deadline")
+        if deadline is None or time.time() <= deadline:
+            return False
+        self.stats["messages_deadline_dropped"] += 1
+        log.debug("Dropped message %s: deadline passed", message["id"])
+        return True
+
+    def _observe_lane(self, message: Dict[str, Any]) -> None:
+        self.latency.observe("lane", message["priority"], (time.time() - message["timestamp"]) * 1000)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get message bus statistics"""
         uptime = time.time() - self.start_time if self.running else 0
@@ -229,7 +253,8 @@ class SimpleMessageBus:
             "messages_per_second": self.message_count / max(uptime, 1),
             "active_topics": len(self.subscribers),
             "registered_components": len(self.component_handlers),
-            "queued_messages": sum(len(queue) for queue in self.component_queues.values()),
+            "queued_messages": self.core.queued_count(),
+            "lane_latency": self.latency.snapshot()["lane"],
             **self.stats
         }
     
@@ -244,7 +269,8 @@ class SimpleMessageBus:
     def clear_topic(self, topic: str):
         """Remove all subscribers from a topic"""
         if topic in self.subscribers:
-            del self.subscribers[topic]
+            for callback in self.subscribers.pop(topic):
+                self.core.unsubscribe(topic, callback)
             self.stats["active_subscriptions"] = sum(len(subs) for subs in self.subscribers.values())
             log.debug(f"Cleared topic: {topic}")
 
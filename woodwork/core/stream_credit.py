@@ -0,0 +1,121 @@
+"""
+Stream Credit - Credit-based flow control for stream producers
+
+send_chunk() used to return False as soon as a stream's buffer or the
+manager's memory budget was full, leaving producers to drop data or spin.
+Each stream now has a StreamCredit window instead:
+
+- The producer spends one chunk and chunk_size bytes of credit per chunk
+  and suspends in wait() while either runs out
+- The consumer grants credit back as it takes chunks (receive_stream does
+  this automatically; slow sinks such as websockets can grant it themselves
+  once data has actually left the process)
+- Watermarks give hysteresis: a producer paused at the high watermark only
+  resumes once the stream has drained to the low watermark, so it is not
+  woken for every single chunk
+
+Outstanding data per stream is therefore bounded by the high watermark no
+matter how slow the consumer is, and nothing is dropped. Time spent blocked
+is counted per stream.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class StreamCredit:
+    """Chunk and byte credit window for one stream's producer"""
+
+    def __init__(
+        self,
+        high_chunks: int,
+        high_bytes: int,
+        low_chunks: Optional[int] = None,
+        low_bytes: Optional[int] = None,
+    ):
+        if low_chunks is None:
+            low_chunks = high_chunks // 2
+        if low_bytes is None:
+            low_bytes = high_bytes // 2
+        if not (0 <= low_chunks < high_chunks and 0 <= low_bytes < high_bytes):
+            raise ValueError("Stream watermarks must satisfy 0 <= low < high")
+
+        self.high_chunks = high_chunks
+        self.high_bytes = high_bytes
+        self.low_chunks = low_chunks
+        self.low_bytes = low_bytes
+
+        # Remaining credit; outstanding data is the window minus this
+        self.credit_chunks = high_chunks
+        self.credit_bytes = high_bytes
+
+        self._paused = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+        self.stats = {
+            "blocks": 0,
+            "blocked_seconds": 0.0,
+            "timeouts": 0,
+        }
+
+    def has_credit(self) -> bool:
+        return not self._paused and self.credit_chunks > 0 and self.credit_bytes > 0
+
+    async def wait(self, timeout: Optional[float]) -> bool:
+        """Suspend until credit is available; False if timeout seconds pass first"""
+        if self.has_credit():
+            return True
+
+        self._paused = True
+        self._resumed.clear()
+        self.stats["blocks"] += 1
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._resumed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            return False
+        finally:
+            self.stats["blocked_seconds"] += time.perf_counter() - started_at
+
+    def spend(self, size: int) -> None:
+        """Take credit for one chunk of size bytes"""
+        self.credit_chunks -= 1
+        self.credit_bytes -= size
+
+    def grant(self, chunks: int = 1, size: int = 0) -> None:
+        """Return credit for consumed data (capped at the window)"""
+        self.credit_chunks = min(self.high_chunks, self.credit_chunks + chunks)
+        self.credit_bytes = min(self.high_bytes, self.credit_bytes + size)
+
+        if self._paused and self.outstanding_chunks <= self.low_chunks and self.outstanding_bytes <= self.low_bytes:
+            self._resume()
+
+    def close(self) -> None:
+        """Release any waiting producer (the stream is gone)"""
+        self._resume()
+
+    def _resume(self) -> None:
+        self._paused = False
+        self._resumed.set()
+
+    @property
+    def outstanding_chunks(self) -> int:
+        return self.high_chunks - self.credit_chunks
+
+    @property
+    def outstanding_bytes(self) -> int:
+        return self.high_bytes - self.credit_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "paused": self._paused,
+            "credit_chunks": self.credit_chunks,
+            "credit_bytes": self.credit_bytes,
+            "outstanding_chunks": self.outstanding_chunks,
+            "outstanding_bytes": self.outstanding_bytes,
+        }
@@ -4,6 +4,34 @@ Stream Manager for handling streaming data between components
 This module provides the StreamManager class which coordinates streaming data
 flow between components, manages stream state, and handles reliability concerns
 like chunk ordering and missing data detection.
+
+Streams whose producer and consumer share this manager take a zero-copy fast
+path: send_chunk() puts the chunk object straight into the stream's buffer, with
+no to_dict()/from_dict(), base64 or checksum. Only streams that cross a process
+boundary (local_delivery=False, or a bus other than the in-process
+SimpleMessageBus) are serialized onto the "stream.chunk" topic, and only then
+is a checksum computed, with the stream's integrity mode (sha256 by default;
+token streams can choose "crc32", "fast" or "none").
+
+Producers are flow-controlled with per-stream credit (see StreamCredit):
+send_chunk() suspends while a stream has max_buffer_size chunks or
+max_stream_bytes bytes outstanding, or while the manager holds
+max_memory_usage bytes, and resumes once consumers drain to the low
+watermark. It only gives up, returning False, after send_timeout seconds.
+Streams that leave the process are not flow-controlled here: their chunks
+are never held by this manager, so no consumer could hand credit back.
+
+Any number of consumers can read one stream (see StreamRing): each
+receive_stream() call, or subscribe() made before production starts, gets its
+own cursor, and a chunk is reclaimed, releasing its memory and producer
+credit, once the slowest cursor has passed it. A completed stream is cleaned
+up after the last cursor finishes rather than after a fixed delay.
+
+Streams can be given a memory limit (stream_memory_limit, or memory_limit
+per stream): beyond it their oldest chunks spill to segment files under
+spill_dir (see StreamSpill) and no longer count against max_memory_usage,
+so large tool outputs are bounded by max_spill_bytes on disk instead of
+failing or holding the process's memory.
 """
 
 import asyncio
@@ -13,10 +41,14 @@ import uuid
 from typing import Dict, List, Optional, AsyncGenerator, Callable, Set, Any
 
 from woodwork.types.streaming_data import (
-    StreamChunk, StreamMetadata, StreamBuffer, StreamDataType, StreamStatus,
-    generate_stream_id, create_stream_chunk
+    StreamChunk, StreamMetadata, StreamDataType, StreamStatus,
+    IntegrityMode, generate_stream_id, create_stream_chunk
 )
 from woodwork.core.simple_message_bus import SimpleMessageBus, MessageBusAdapter
+from woodwork.core.stream_credit import StreamCredit
+from woodwork.core.stream_ring import Reclaimed, StreamCursor, StreamRing
+from woodwork.core.stream_spill import DEFAULT_STREAM_DIR
+from woodwork.core.metrics import LatencyMetrics
 
 log = logging.getLogger(__name__)
 
@@ -24,20 +56,40 @@ log = logging.getLogger(__name__)
 class StreamManager:
     """Manages streaming data between components with reliability guarantees"""
     
-    def __init__(self, message_bus: SimpleMessageBus, state_store=None):
+    def __init__(self, message_bus: SimpleMessageBus, state_store=None, local_delivery: Optional[bool] = None,
+                 integrity: str = "sha256"):
         self.message_bus = message_bus
         self.state_store = state_store  # For future persistent state
+        self.integrity = IntegrityMode(integrity)
+
+        # SimpleMessageBus never leaves this process, so its streams can skip serialization
+        if local_delivery is None:
+            local_delivery = isinstance(message_bus, SimpleMessageBus)
+        self.local_delivery = local_delivery
+        self._local_streams: Set[str] = set()
         
         # In-memory stream management
         self.active_streams: Dict[str, StreamMetadata] = {}
-        self.stream_buffers: Dict[str, StreamBuffer] = {}
-        self.stream_listeners: Dict[str, Set[asyncio.Event]] = {}
-        self.completion_events: Dict[str, asyncio.Event] = {}
+        self.stream_buffers: Dict[str, StreamRing] = {}
+        self.stream_credits: Dict[str, StreamCredit] = {}
         
         # Backpressure management
-        self.max_buffer_size = 1000  # chunks per stream
+        self.max_buffer_size = 1000  # chunks per stream (credit high watermark)
+        self.max_stream_bytes = 16 * 1024 * 1024  # bytes per stream (credit high watermark)
+        self.low_watermark = 0.5  # paused producers resume at this fraction of the high watermarks
         self.max_memory_usage = 100 * 1024 * 1024  # 100MB total
+        self.send_timeout: Optional[float] = 30.0  # seconds send_chunk waits for credit
         self.current_memory_usage = 0
+
+        # Spill to disk (off unless a memory limit is set)
+        self.stream_memory_limit: Optional[int] = None  # bytes per stream held in memory before spilling
+        self.spill_dir = DEFAULT_STREAM_DIR
+        self.spill_segment_size = 16 * 1024 * 1024
+        self.max_spill_chunks = 1_000_000  # credit high watermarks for streams that spill
+        self.max_spill_bytes = 1024 * 1024 * 1024
+
+        self._memory_available = asyncio.Event()
+        self._memory_available.set()
         
         # Cleanup and monitoring
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -50,8 +102,16 @@ class StreamManager:
             "chunks_received": 0,
             "streams_completed": 0,
             "streams_failed": 0,
-            "cleanup_runs": 0
+            "cleanup_runs": 0,
+            "chunks_local": 0,
+            "chunks_serialized": 0,
+            "producer_blocks": 0,
+            "producer_blocked_seconds": 0.0,
+            "backpressure_timeouts": 0,
+            "bytes_spilled": 0
         }
+        # Time producers spent suspended for credit, per producing component
+        self._blocked_latency = LatencyMetrics("woodwork_stream_manager", {"blocked": "component"})
         
         # Setup message bus integration
         self._setup_message_handlers()
@@ -103,7 +163,10 @@ class StreamManager:
         component_source: str, 
         component_target: str,
         data_type: StreamDataType = StreamDataType.TEXT,
-        stream_id: Optional[str] = None
+        stream_id: Optional[str] = None,
+        local: Optional[bool] = None,
+        integrity: Optional[str] = None,
+        memory_limit: Optional[int] = None
     ) -> str:
         """
         Create new stream and return stream_id
@@ -114,6 +177,12 @@ class StreamManager:
             component_target: Target component name
             data_type: Type of data being streamed
             stream_id: Optional custom stream ID
+            local: Hand chunks to in-process consumers without serializing
+                (defaults to the manager's local_delivery)
+            integrity: Checksum for serialized chunks: "none", "crc32", "fast"
+                or "sha256" (defaults to the manager's integrity)
+            memory_limit: Bytes of this stream held in memory before its
+                oldest chunks spill to disk (defaults to stream_memory_limit)
             
         Returns:
             Stream ID string
@@ -128,14 +197,31 @@ class StreamManager:
             session_id=session_id,
             component_source=component_source,
             component_target=component_target,
-            data_type=data_type
+            data_type=data_type,
+            integrity=self.integrity if integrity is None else IntegrityMode(integrity)
         )
         
         # Initialize stream management structures
         self.active_streams[stream_id] = metadata
-        self.stream_buffers[stream_id] = StreamBuffer(stream_id, self.max_buffer_size)
-        self.stream_listeners[stream_id] = set()
-        self.completion_events[stream_id] = asyncio.Event()
+        if memory_limit is None:
+            memory_limit = self.stream_memory_limit
+        self.stream_buffers[stream_id] = StreamRing(
+            stream_id, memory_limit, self.spill_dir, self.spill_segment_size
+        )
+
+        # A stream that spills may run as far ahead of its consumers as the disk budget allows
+        if memory_limit is None:
+            high_chunks, high_bytes = self.max_buffer_size, self.max_stream_bytes
+        else:
+            high_chunks, high_bytes = self.max_spill_chunks, self.max_spill_bytes
+        if self.local_delivery if local is None else local:
+            self._local_streams.add(stream_id)
+            self.stream_credits[stream_id] = StreamCredit(
+                high_chunks,
+                high_bytes,
+                int(high_chunks * self.low_watermark),
+                int(high_bytes * self.low_watermark),
+            )
         
         # Update statistics
         self.stats["streams_created"] += 1
@@ -155,7 +241,8 @@ class StreamManager:
         stream_id: str,
         data: Any,
         is_final: bool = False,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = True
     ) -> bool:
         """
         Send stream chunk to target component
@@ -165,6 +252,8 @@ class StreamManager:
             data: Chunk data to send
             is_final: Whether this is the final chunk
             metadata: Optional chunk metadata
+            wait: Suspend until the stream has credit (up to send_timeout);
+                with False, fail at once when it has none
             
         Returns:
             True if chunk was sent successfully
@@ -180,11 +269,6 @@ class StreamManager:
             log.warning(f"Stream {stream_id} is not active (status: {stream_meta.status})")
             return False
         
-        # Check backpressure
-        if not await self._check_backpressure(stream_id):
-            log.warning(f"Backpressure limit reached for stream {stream_id}")
-            return False
-        
         # Create chunk
         chunk = create_stream_chunk(
             stream_id=stream_id,
@@ -192,8 +276,23 @@ class StreamManager:
             data=data,
             data_type=stream_meta.data_type,
             is_final=is_final,
-            metadata=metadata
+            metadata=metadata,
+            integrity=stream_meta.integrity
         )
+
+        # Check backpressure, waiting for credit unless told not to (local streams only)
+        credit = self.stream_credits.get(stream_id)
+        if credit is not None and not await self._check_backpressure(stream_id):
+            if not wait or not await self._wait_for_credit(stream_id, stream_meta):
+                log.warning(f"Backpressure limit reached for stream {stream_id}")
+                return False
+            if self.active_streams.get(stream_id) is not stream_meta or stream_meta.status != StreamStatus.ACTIVE:
+                log.warning(f"Stream {stream_id} closed while waiting for credit")
+                return False
+            chunk.chunk_index = stream_meta.expected_chunks
+
+        if credit is not None:
+            credit.spend(chunk.chunk_size or 0)
         
         # Update stream metadata
         stream_meta.expected_chunks += 1
@@ -204,15 +303,18 @@ class StreamManager:
             stream_meta.status = StreamStatus.COMPLETED
             stream_meta.completed_at = time.time()
             stream_meta.total_chunks = stream_meta.expected_chunks
-            
-        # Send via message bus
-        await self.message_bus.publish("stream.chunk", {
-            "chunk": chunk.to_dict(),
-            "target_component": stream_meta.component_target
-        })
-        
-        # Update memory usage tracking
-        self.current_memory_usage += chunk.chunk_size or 0
+
+        if stream_id in self._local_streams:
+            # Consumer shares this manager: hand over the chunk object itself
+            self.stats["chunks_local"] += 1
+            await self._accept_chunk(chunk)
+        else:
+            # Send via message bus
+            self.stats["chunks_serialized"] += 1
+            await self.message_bus.publish("stream.chunk", {
+                "chunk": chunk.to_dict(),
+                "target_component": stream_meta.component_target
+            })
         
         # Update statistics
         self.stats["chunks_sent"] += 1
@@ -225,59 +327,124 @@ class StreamManager:
             
         return True
             
-    async def receive_stream(self, stream_id: str) -> AsyncGenerator[StreamChunk, None]:
+    def subscribe(
+        self,
+        stream_id: str,
+        subscriber: Optional[str] = None,
+        start: str = "head",
+        auto_credit: bool = True
+    ) -> Optional[StreamCursor]:
+        """
+        Register a consumer of a stream before it starts reading
+
+        A chunk is only reclaimed once every subscriber has read it, so
+        consumers that must see the whole stream should subscribe before the
+        producer starts and then call receive_stream() with the same name.
+
+        Args:
+            stream_id: Stream ID to subscribe to
+            subscriber: Name of the consumer (generated if omitted)
+            start: "head" to begin at the oldest chunk still held, "tail" to
+                receive only chunks sent from now on
+            auto_credit: Return producer credit as chunks are reclaimed; with
+                False, the consumer calls grant_credit() itself
+
+        Returns:
+            The subscriber's cursor, or None if the stream does not exist
+        """
+        ring = self.stream_buffers.get(stream_id)
+        if ring is None:
+            log.error(f"Stream {stream_id} not found")
+            return None
+        return ring.subscribe(subscriber, start, auto_credit)
+
+    def unsubscribe(self, stream_id: str, subscriber: str) -> None:
+        """Remove a consumer, releasing chunks only it was holding back"""
+        ring = self.stream_buffers.get(stream_id)
+        if ring is None:
+            return
+
+        self._reclaim(stream_id, ring, ring.unsubscribe(subscriber))
+        if ring.cleanup_pending and not ring.cursors:
+            self._remove_stream(stream_id)
+
+    async def receive_stream(
+        self,
+        stream_id: str,
+        auto_credit: bool = True,
+        subscriber: Optional[str] = None,
+        start: str = "head"
+    ) -> AsyncGenerator[StreamChunk, None]:
         """
         Receive stream chunks as ordered async generator
-        
+
         Args:
             stream_id: Stream ID to receive from
-            
+            auto_credit: Return credit to the producer as chunks are reclaimed;
+                with False, the consumer calls grant_credit() itself
+            subscriber: Consumer name; reuses the cursor of an earlier
+                subscribe() with this name
+            start: Where a new cursor begins, "head" or "tail" (see subscribe)
+
         Yields:
             StreamChunk objects in order
         """
-        
+
         if stream_id not in self.active_streams:
             log.error(f"Stream {stream_id} not found")
             return
-            
-        buffer = self.stream_buffers[stream_id]
-        completion_event = self.completion_events[stream_id]
-        
-        log.debug(f"Starting to receive stream {stream_id}")
-        
-        while True:
-            # Get next available chunk
-            chunk = buffer.get_next_chunk()
-            if chunk:
-                log.debug(f"Yielding chunk {chunk.chunk_index} from stream {stream_id}")
-                yield chunk
-                
-                # Update memory usage
-                self.current_memory_usage -= chunk.chunk_size or 0
-                
-                # Check if this was the final chunk
-                if chunk.is_final:
-                    log.debug(f"Stream {stream_id} completed")
-                    break
-            else:
-                # No chunk available, wait for more data or completion
-                if buffer.is_ready_for_completion():
-                    log.debug(f"Stream {stream_id} completed (no more chunks)")
-                    break
-                    
-                # Wait for new chunks or stream completion
-                try:
-                    await asyncio.wait_for(completion_event.wait(), timeout=30.0)
-                    completion_event.clear()  # Reset for next wait
-                except asyncio.TimeoutError:
-                    log.warning(f"Timeout waiting for chunks in stream {stream_id}")
-                    break
-                    
+
+        ring = self.stream_buffers[stream_id]
+        cursor = ring.cursors.get(subscriber) if subscriber is not None else None
+        if cursor is None:
+            cursor = ring.subscribe(subscriber, start, auto_credit)
+
+        log.debug(f"Starting to receive stream {stream_id} as {cursor.name}")
+
+        try:
+            while True:
+                # Get next available chunk
+                chunk = ring.read(cursor)
+                if chunk:
+                    log.debug(f"Yielding chunk {chunk.chunk_index} from stream {stream_id} to {cursor.name}")
+                    yield chunk
+
+                    # Reclaim what every subscriber has now read (memory and producer credit)
+                    self._reclaim(stream_id, ring, ring.advance(cursor))
+
+                    # Check if this was the final chunk
+                    if chunk.is_final:
+                        log.debug(f"Stream {stream_id} completed")
+                        break
+                else:
+                    # No chunk available, wait for more data or completion
+                    if ring.is_done(cursor):
+                        log.debug(f"Stream {stream_id} completed (no more chunks)")
+                        break
+
+                    # Wait for new chunks or stream completion
+                    if not await ring.wait(cursor, timeout=30.0):
+                        log.warning(f"Timeout waiting for chunks in stream {stream_id}")
+                        break
+        finally:
+            self.unsubscribe(stream_id, cursor.name)
+
         # Emit completion event
         await self.message_bus.publish("stream.received_complete", {
             "stream_id": stream_id,
-            "chunks_received": buffer.next_expected_index
+            "subscriber": cursor.name,
+            "chunks_received": cursor.position
         })
+
+    def _reclaim(self, stream_id: str, ring: StreamRing, reclaimed: Reclaimed) -> None:
+        """Release memory, and producer credit unless a subscriber grants it, for reclaimed chunks"""
+        if not reclaimed.chunks:
+            return
+
+        self._release_memory(reclaimed.resident)
+        credit = self.stream_credits.get(stream_id)
+        if credit is not None and ring.auto_credit:
+            credit.grant(reclaimed.chunks, reclaimed.size)
         
     async def _handle_chunk_message(self, message: Dict[str, Any]):
         """Handle incoming chunk from message bus"""
@@ -286,37 +453,44 @@ class StreamManager:
             chunk_data = message_data.get("chunk", {})
             
             chunk = StreamChunk.from_dict(chunk_data)
-            stream_id = chunk.stream_id
-            
-            if stream_id not in self.active_streams:
-                log.warning(f"Received chunk for unknown stream {stream_id}")
-                return
-                
-            # Add to buffer
-            buffer = self.stream_buffers[stream_id]
-            if buffer.add_chunk(chunk):
-                # Update statistics
-                self.stats["chunks_received"] += 1
-                
-                # Update stream metadata
-                stream_meta = self.active_streams[stream_id]
-                stream_meta.update_stats(chunk)
-                
-                # Notify waiting receivers
-                completion_event = self.completion_events[stream_id]
-                completion_event.set()
-                
-                log.debug(f"Buffered chunk {chunk.chunk_index} for stream {stream_id}")
-                
-                # If this was the final chunk, handle completion
-                if chunk.is_final:
-                    await self._complete_stream(stream_id)
-                    
-            else:
-                log.error(f"Failed to buffer chunk for stream {stream_id}")
+            await self._accept_chunk(chunk)
                 
         except Exception as e:
             log.error(f"Error handling chunk message: {e}")
+
+    async def _accept_chunk(self, chunk: StreamChunk):
+        """Buffer a chunk for its stream's receivers and wake them"""
+        stream_id = chunk.stream_id
+
+        if stream_id not in self.active_streams:
+            log.warning(f"Received chunk for unknown stream {stream_id}")
+            return
+
+        # Add to the stream's ring (wakes its subscribers)
+        ring = self.stream_buffers[stream_id]
+        if ring.add_chunk(chunk):
+            # Update statistics and memory usage tracking
+            self.stats["chunks_received"] += 1
+            self.current_memory_usage += chunk.chunk_size or 0
+
+            # Update stream metadata
+            stream_meta = self.active_streams[stream_id]
+            stream_meta.update_stats(chunk)
+
+            # Move what no longer fits in the stream's memory limit to disk
+            spilled = ring.spill_over()
+            if spilled:
+                self.stats["bytes_spilled"] += spilled
+                self._release_memory(spilled)
+
+            log.debug(f"Buffered chunk {chunk.chunk_index} for stream {stream_id}")
+
+            # If this was the final chunk, handle completion
+            if chunk.is_final:
+                await self._complete_stream(stream_id)
+
+        else:
+            log.error(f"Failed to buffer chunk for stream {stream_id}")
             
     async def _handle_stream_created(self, message: Dict[str, Any]):
         """Handle stream creation notification"""
@@ -364,8 +538,7 @@ class StreamManager:
         stream_meta.completed_at = time.time()
         
         # Notify completion
-        completion_event = self.completion_events[stream_id]
-        completion_event.set()
+        self.stream_buffers[stream_id].wake()
         
         # Update statistics
         self.stats["streams_completed"] += 1
@@ -382,6 +555,9 @@ class StreamManager:
             
         stream_meta = self.active_streams[stream_id]
         stream_meta.status = StreamStatus.FAILED
+
+        # Subscribers read what was sent, then stop
+        self.stream_buffers[stream_id].close()
         
         # Update statistics
         self.stats["streams_failed"] += 1
@@ -398,12 +574,18 @@ class StreamManager:
         # Schedule cleanup
         asyncio.create_task(self._cleanup_stream_delayed(stream_id, delay=5))
         
+    def grant_credit(self, stream_id: str, chunks: int = 1, size: int = 0) -> None:
+        """Return producer credit for consumed data (for receive_stream(auto_credit=False))"""
+        credit = self.stream_credits.get(stream_id)
+        if credit is not None:
+            credit.grant(chunks, size)
+
     async def _check_backpressure(self, stream_id: str) -> bool:
         """Check if backpressure limits are exceeded"""
         
-        # Check buffer size limit
-        buffer = self.stream_buffers.get(stream_id)
-        if buffer and len(buffer.chunks) >= self.max_buffer_size:
+        # Check the stream's credit (bounds its buffered chunks and bytes)
+        credit = self.stream_credits.get(stream_id)
+        if credit is not None and not credit.has_credit():
             return False
             
         # Check memory usage limit  
@@ -411,32 +593,70 @@ class StreamManager:
             return False
             
         return True
+
+    async def _wait_for_credit(self, stream_id: str, stream_meta: StreamMetadata) -> bool:
+        """Suspend the producer until the stream has credit and memory is below the limit"""
+        credit = self.stream_credits[stream_id]
+        deadline = None if self.send_timeout is None else time.monotonic() + self.send_timeout
+        started_at = time.perf_counter()
+        self.stats["producer_blocks"] += 1
+        try:
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not await credit.wait(remaining):
+                    break
+                if self.current_memory_usage < self.max_memory_usage or stream_id not in self.active_streams:
+                    return True
+
+                self._memory_available.clear()
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    await asyncio.wait_for(self._memory_available.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            self.stats["backpressure_timeouts"] += 1
+            return False
+        finally:
+            blocked = time.perf_counter() - started_at
+            self.stats["producer_blocked_seconds"] += blocked
+            self._blocked_latency.observe("blocked", stream_meta.component_source, blocked * 1000)
+
+    def _release_memory(self, size: int) -> None:
+        self.current_memory_usage -= size
+        if self.current_memory_usage < self.max_memory_usage:
+            self._memory_available.set()
         
     async def _cleanup_stream_delayed(self, stream_id: str, delay: float):
-        """Cleanup stream after delay"""
+        """Cleanup stream after delay, or once its last subscriber finishes"""
         await asyncio.sleep(delay)
+
+        ring = self.stream_buffers.get(stream_id)
+        if ring is not None and ring.cursors:
+            ring.cleanup_pending = True
+            return
         await self._cleanup_stream(stream_id)
         
     async def _cleanup_stream(self, stream_id: str):
         """Clean up stream resources"""
-        
+        self._remove_stream(stream_id)
+
+    def _remove_stream(self, stream_id: str):
         # Remove from active tracking
         if stream_id in self.active_streams:
             del self.active_streams[stream_id]
             
-        # Clean up buffer and update memory usage
-        if stream_id in self.stream_buffers:
-            buffer = self.stream_buffers[stream_id]
-            for chunk in buffer.chunks.values():
-                self.current_memory_usage -= chunk.chunk_size or 0
-            del self.stream_buffers[stream_id]
-            
-        # Clean up listeners and events
-        if stream_id in self.stream_listeners:
-            del self.stream_listeners[stream_id]
-            
-        if stream_id in self.completion_events:
-            del self.completion_events[stream_id]
+        # Drop held chunks and spill files (ending any subscriber) and update memory usage
+        ring = self.stream_buffers.pop(stream_id, None)
+        if ring is not None:
+            self._release_memory(ring.discard())
+
+        # Wake a producer still waiting for credit; it sees the stream is gone
+        credit = self.stream_credits.pop(stream_id, None)
+        if credit is not None:
+            credit.close()
+
+        self._local_streams.discard(stream_id)
             
         log.debug(f"Cleaned up stream {stream_id}")
         
@@ -458,7 +678,11 @@ class StreamManager:
                 # Cleanup stale streams
                 for stream_id in stale_streams:
                     log.warning(f"Cleaning up stale stream {stream_id}")
-                    await self._fail_stream(stream_id, "Stream timeout")
+                    if self.stream_buffers[stream_id].cleanup_pending:
+                        # Finished stream held open by subscribers that stopped reading
+                        await self._cleanup_stream(stream_id)
+                    else:
+                        await self._fail_stream(stream_id, "Stream timeout")
                     
                 if stale_streams:
                     self.stats["cleanup_runs"] += 1
@@ -474,12 +698,14 @@ class StreamManager:
             return None
             
         metadata = self.active_streams[stream_id]
-        buffer = self.stream_buffers[stream_id]
+        ring = self.stream_buffers[stream_id]
         
         return {
             "metadata": metadata.to_dict(),
-            "buffer_stats": buffer.get_stats(),
-            "listeners": len(self.stream_listeners.get(stream_id, set()))
+            "buffer_stats": ring.get_stats(),
+            "local": stream_id in self._local_streams,
+            "credit": self.stream_credits[stream_id].get_stats() if stream_id in self.stream_credits else None,
+            "listeners": len(ring.cursors)
         }
         
     def get_stats(self) -> Dict[str, Any]:
@@ -488,6 +714,7 @@ class StreamManager:
             **self.stats,
             "active_streams": len(self.active_streams),
             "memory_usage_bytes": self.current_memory_usage,
+            "blocked_ms": self._blocked_latency.snapshot()["blocked"],
             "running": self._running
         }
         
@@ -0,0 +1,257 @@
+"""
+Stream Ring - Shared chunk log with one read cursor per subscriber
+
+A StreamBuffer popped each chunk as it was read, so a stream could only have
+one consumer. The same LLM output often has to reach a websocket, a voice
+output and a logger at once, so each stream now keeps its chunks in a
+StreamRing instead:
+
+- Chunks are held once, in order, whatever the number of subscribers
+- Every subscriber reads through its own StreamCursor and never removes
+  anything; a chunk is reclaimed once the slowest cursor has passed it, so
+  memory follows the lag of the slowest reader, not the reader count
+- Subscribers joining late start at the "head" (the oldest chunk still
+  held, replaying what the others have not all consumed) or the "tail"
+  (only chunks that arrive from now on)
+- Chunks arriving ahead of a gap wait aside until the gap is filled, so
+  cursors always see the stream in chunk_index order
+
+Until the first subscriber joins nothing is reclaimed, so a consumer that
+attaches after the producer has started still sees the whole stream.
+
+A ring given a memory_limit is tiered: once the chunks it holds in memory
+exceed the limit, the oldest move to a StreamSpill on disk, and cursors
+that fall that far behind read them back from there.
+"""
+
+import asyncio
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, NamedTuple, Optional
+
+from woodwork.core.stream_spill import DEFAULT_STREAM_DIR, StreamSpill
+from woodwork.types.streaming_data import StreamChunk
+
+
+class Reclaimed(NamedTuple):
+    """Chunks every cursor has passed, released from a ring"""
+    chunks: int
+    size: int  # chunk_size total (producer credit)
+    resident: int  # of which was held in memory
+
+
+class StreamCursor:
+    """One subscriber's read position in a StreamRing"""
+
+    __slots__ = ("name", "position", "auto_credit", "_ready")
+
+    def __init__(self, name: str, position: int, auto_credit: bool = True):
+        self.name = name
+        self.position = position  # chunk_index this subscriber reads next
+        self.auto_credit = auto_credit
+        self._ready = asyncio.Event()
+
+
+class StreamRing:
+    """Ordered chunks of one stream, shared by any number of cursors"""
+
+    def __init__(
+        self,
+        stream_id: str,
+        memory_limit: Optional[int] = None,
+        spill_dir: str = DEFAULT_STREAM_DIR,
+        spill_segment_size: int = 16 * 1024 * 1024,
+    ):
+        self.stream_id = stream_id
+        self.memory_limit = memory_limit  # bytes held in memory before the oldest spill (None: never)
+        self.spill_dir = spill_dir
+        self.spill_segment_size = spill_segment_size
+        self.spill: Optional[StreamSpill] = None  # chunks base .. base + len(spill), created on first spill
+        self.chunks: Deque[StreamChunk] = deque()  # in memory, after any spilled chunks
+        self.base = 0  # chunk_index of the oldest chunk held
+        self.cursors: Dict[str, StreamCursor] = {}
+        self.is_complete = False  # final chunk is in the ring
+        self.closed = False  # no more chunks will arrive (failed or discarded)
+        self.cleanup_pending = False  # clean up once the last cursor leaves
+        self.resident_bytes = 0  # chunk_size of chunks held in memory
+        self.reclaimed_chunks = 0
+
+        # Chunks that arrived ahead of a missing index
+        self._pending: Dict[int, StreamChunk] = {}
+
+    @property
+    def spilled(self) -> int:
+        """Number of held chunks that are on disk"""
+        return len(self.spill) if self.spill is not None else 0
+
+    @property
+    def end(self) -> int:
+        """chunk_index of the next chunk to join the ring"""
+        return self.base + self.spilled + len(self.chunks)
+
+    @property
+    def auto_credit(self) -> bool:
+        """Whether reclaimed chunks return producer credit (no subscriber grants it itself)"""
+        return all(cursor.auto_credit for cursor in self.cursors.values())
+
+    # Writing
+
+    def add_chunk(self, chunk: StreamChunk) -> bool:
+        """Add chunk to the ring, returns True if it was accepted"""
+        index = chunk.chunk_index
+        if self.closed or chunk.stream_id != self.stream_id:
+            return False
+        if index < self.end or index in self._pending:
+            return False  # Duplicate
+
+        if index > self.end:
+            self._pending[index] = chunk
+            return True
+
+        self._append(chunk)
+        while self.end in self._pending:
+            self._append(self._pending.pop(self.end))
+        self.wake()
+        return True
+
+    def _append(self, chunk: StreamChunk) -> None:
+        self.chunks.append(chunk)
+        self.resident_bytes += chunk.chunk_size or 0
+        if chunk.is_final:
+            self.is_complete = True
+
+    def spill_over(self) -> int:
+        """Move the oldest in-memory chunks to disk until within memory_limit; returns bytes freed"""
+        if self.memory_limit is None or self.resident_bytes <= self.memory_limit:
+            return 0
+
+        if self.spill is None:
+            self.spill = StreamSpill(self.stream_id, self.spill_dir, self.spill_segment_size)
+        freed = 0
+        while self.chunks and self.resident_bytes > self.memory_limit:
+            chunk = self.chunks.popleft()
+            self.spill.append(chunk)
+            size = chunk.chunk_size or 0
+            self.resident_bytes -= size
+            freed += size
+        return freed
+
+    def wake(self) -> None:
+        """Wake every subscriber waiting for chunks"""
+        for cursor in self.cursors.values():
+            cursor._ready.set()
+
+    def close(self) -> None:
+        """No more chunks will arrive; subscribers finish what is held"""
+        self.closed = True
+        self.wake()
+
+    def discard(self) -> int:
+        """Drop every held chunk (deleting spill files) and detach all cursors; returns memory freed"""
+        freed = self.resident_bytes + sum(chunk.chunk_size or 0 for chunk in self._pending.values())
+        self.base = self.end
+        self.chunks.clear()
+        self._pending.clear()
+        self.resident_bytes = 0
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
+        self.close()
+        self.cursors.clear()
+        return freed
+
+    # Reading
+
+    def subscribe(self, name: Optional[str] = None, start: str = "head", auto_credit: bool = True) -> StreamCursor:
+        """Add a cursor at the oldest held chunk ("head") or at the next one to arrive ("tail")"""
+        if start == "head":
+            position = self.base
+        elif start == "tail":
+            position = self.end
+        else:
+            raise ValueError(f"Unknown stream start '{start}', expected 'head' or 'tail'")
+
+        if name is None:
+            name = f"subscriber-{uuid.uuid4().hex[:8]}"
+        if name in self.cursors:
+            raise ValueError(f"Stream {self.stream_id} already has a subscriber named '{name}'")
+
+        cursor = self.cursors[name] = StreamCursor(name, position, auto_credit)
+        return cursor
+
+    def unsubscribe(self, name: str) -> Reclaimed:
+        """Remove a cursor, releasing chunks only it was holding back"""
+        if self.cursors.pop(name, None) is None:
+            return _NOTHING
+        return self._reclaim()
+
+    def read(self, cursor: StreamCursor) -> Optional[StreamChunk]:
+        """The chunk at the cursor (read back from disk if spilled), None if it has not arrived yet"""
+        offset = cursor.position - self.base
+        if offset < 0:
+            return None
+        spilled = self.spilled
+        if offset < spilled:
+            return self.spill.read(offset)
+        offset -= spilled
+        if offset < len(self.chunks):
+            return self.chunks[offset]
+        return None
+
+    def advance(self, cursor: StreamCursor) -> Reclaimed:
+        """Move the cursor past its chunk, releasing chunks every cursor has now passed"""
+        cursor.position += 1
+        return self._reclaim()
+
+    def is_done(self, cursor: StreamCursor) -> bool:
+        """Whether the cursor has read everything this stream will ever hold"""
+        return (self.is_complete or self.closed) and cursor.position >= self.end
+
+    async def wait(self, cursor: StreamCursor, timeout: Optional[float]) -> bool:
+        """Suspend until a chunk arrives or the stream ends; False on timeout"""
+        cursor._ready.clear()
+        try:
+            await asyncio.wait_for(cursor._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _reclaim(self) -> Reclaimed:
+        if not self.cursors:
+            return _NOTHING  # Keep everything for subscribers yet to join
+
+        count = min(cursor.position for cursor in self.cursors.values()) - self.base
+        if count <= 0:
+            return _NOTHING
+
+        # Oldest chunks first: those on disk, then those in memory
+        from_disk = min(count, self.spilled)
+        size = self.spill.reclaim(from_disk) if from_disk else 0
+        resident = 0
+        for _ in range(count - from_disk):
+            resident += self.chunks.popleft().chunk_size or 0
+        self.resident_bytes -= resident
+        self.base += count
+        self.reclaimed_chunks += count
+        return Reclaimed(count, size + resident, resident)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ring statistics"""
+        end = self.end
+        return {
+            "stream_id": self.stream_id,
+            "buffered_chunks": end - self.base,
+            "buffered_bytes": self.resident_bytes,
+            "spill": self.spill.get_stats() if self.spill is not None else None,
+            "reclaimed_chunks": self.reclaimed_chunks,
+            "next_expected": end,
+            "is_complete": self.is_complete,
+            "missing_chunks": [i for i in range(end, max(self._pending, default=end)) if i not in self._pending],
+            "subscribers": {
+                name: {"position": cursor.position, "lag": end - cursor.position}
+                for name, cursor in self.cursors.items()
+            },
+        }
+
+
+_NOTHING = Reclaimed(0, 0, 0)
@@ -0,0 +1,171 @@
+"""
+Stream Spill - Memory-mapped segment files for chunks a stream cannot keep in memory
+
+Large tool outputs (file reads, PDF text, audio) used to sit in memory until
+every consumer had read them, or fail the stream at the memory limit. A
+StreamRing given a memory limit moves its oldest chunks here instead, and
+consumers read them back on demand:
+
+- Chunks are appended, encoded with the binary codec, to preallocated
+  segment files under .woodwork/streams/<stream_id>, written through mmap
+  like the event journal
+- Each record is a u32 length followed by the encoded StreamChunk; the
+  offset of every spilled chunk is kept in memory, so reads never scan
+- A segment is deleted as soon as every chunk in it has been reclaimed,
+  and the stream's directory when the stream is discarded
+
+Spilled chunks carry the stream's checksum (integrity "none" skips it), so a
+consumer can verify_checksum() what came back from disk.
+"""
+
+import logging
+import mmap
+import os
+import shutil
+import struct
+from collections import deque
+from typing import Any, Deque, Dict, NamedTuple, Optional
+
+from woodwork.core.message_bus.codec import get_codec
+from woodwork.types.streaming_data import StreamChunk
+
+log = logging.getLogger(__name__)
+
+DEFAULT_STREAM_DIR = os.path.join(".woodwork", "streams")
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".wws"
+
+_LENGTH = struct.Struct("<I")
+
+
+class _SpilledChunk(NamedTuple):
+    segment: int
+    offset: int  # of the record body
+    length: int
+    chunk_size: int
+
+
+class _Segment:
+    """One preallocated, memory-mapped segment file"""
+
+    def __init__(self, path: str, capacity: int):
+        self.path = path
+        self.file = open(path, "w+b")
+        self.file.truncate(capacity)
+        self.mmap = mmap.mmap(self.file.fileno(), capacity)
+        self.capacity = capacity
+        self.offset = 0
+        self.live = 0  # spilled chunks not yet reclaimed
+
+    def close(self) -> None:
+        self.mmap.close()
+        self.file.close()
+        os.remove(self.path)
+
+
+class StreamSpill:
+    """
+    Append-only on-disk tier for the oldest chunks of one stream.
+
+    Not thread-safe: use from the event loop thread only.
+    """
+
+    def __init__(self, stream_id: str, directory: str = DEFAULT_STREAM_DIR, segment_size: int = 16 * 1024 * 1024):
+        self.directory = os.path.join(directory, stream_id)
+        self.segment_size = segment_size
+        self.codec = get_codec("binary")
+
+        self._index: Deque[_SpilledChunk] = deque()
+        self._segments: Dict[int, _Segment] = {}
+        self._current: Optional[_Segment] = None
+        self._next_segment = 0
+        self.spilled_bytes = 0  # chunk_size of chunks still on disk
+
+        self.stats = {
+            "chunks_spilled": 0,
+            "bytes_written": 0,
+            "chunks_read": 0,
+            "segments_written": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append(self, chunk: StreamChunk) -> None:
+        """Write a chunk after those already spilled"""
+        body = self.codec.encode(chunk)
+        record_size = _LENGTH.size + len(body)
+
+        segment = self._current
+        if segment is None or segment.offset + record_size > segment.capacity:
+            segment = self._roll(record_size)
+
+        offset = segment.offset + _LENGTH.size
+        segment.mmap[offset:offset + len(body)] = body
+        _LENGTH.pack_into(segment.mmap, segment.offset, len(body))
+        segment.offset = offset + len(body)
+        segment.live += 1
+
+        chunk_size = chunk.chunk_size or 0
+        self._index.append(_SpilledChunk(self._next_segment - 1, offset, len(body), chunk_size))
+        self.spilled_bytes += chunk_size
+        self.stats["chunks_spilled"] += 1
+        self.stats["bytes_written"] += record_size
+
+    def _roll(self, min_size: int) -> _Segment:
+        previous = self._current
+        if previous is not None and previous.live == 0:
+            del self._segments[self._next_segment - 1]
+            previous.close()
+        if not self._segments:
+            os.makedirs(self.directory, exist_ok=True)
+
+        # Oversized chunks get a segment of their own
+        capacity = max(self.segment_size, min_size)
+        path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{self._next_segment:08d}{SEGMENT_SUFFIX}")
+        segment = self._segments[self._next_segment] = _Segment(path, capacity)
+        self._current = segment
+        self._next_segment += 1
+        self.stats["segments_written"] += 1
+        log.debug("[StreamSpill] Opened segment %s (%d bytes)", path, capacity)
+        return segment
+
+    def read(self, position: int) -> StreamChunk:
+        """Decode the chunk at position (0 is the oldest still spilled)"""
+        entry = self._index[position]
+        data = self._segments[entry.segment].mmap
+        self.stats["chunks_read"] += 1
+        return self.codec.decode(data[entry.offset:entry.offset + entry.length])
+
+    def reclaim(self, count: int) -> int:
+        """Forget the oldest count chunks, deleting segments left empty; returns their chunk_size total"""
+        size = 0
+        for _ in range(count):
+            entry = self._index.popleft()
+            size += entry.chunk_size
+            segment = self._segments[entry.segment]
+            segment.live -= 1
+            if segment.live == 0 and segment is not self._current:
+                del self._segments[entry.segment]
+                segment.close()
+        self.spilled_bytes -= size
+        return size
+
+    def close(self) -> None:
+        """Delete every segment and the stream's directory"""
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+        self._current = None
+        self._index.clear()
+        self.spilled_bytes = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "spilled_chunks": len(self._index),
+            "spilled_bytes": self.spilled_bytes,
+            "segments": len(self._segments),
+            "directory": self.directory,
+        }
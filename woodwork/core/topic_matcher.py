@@ -0,0 +1,179 @@
+"""
+Topic Matcher - Wildcard and hierarchical topic subscriptions
+
+Topics are dot-separated segments (e.g. "agent.thought", "stream.chunk").
+Subscription patterns may use wildcards:
+- "*" matches exactly one segment       ("agent.*" matches "agent.thought")
+- "#" matches zero or more segments     ("tool.#" matches "tool", "tool.call")
+- ">" matches one or more trailing segments, must be last ("stream.>")
+
+Patterns are compiled into a segment trie, so resolving the subscribers of a
+topic walks at most one path per wildcard instead of scanning every
+subscription. Results are cached per concrete topic and the cache is
+invalidated whenever a subscription changes.
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+log = logging.getLogger(__name__)
+
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "#"
+TAIL_WILDCARD = ">"
+
+
+def is_wildcard_pattern(pattern: str) -> bool:
+    """Check if a subscription pattern contains wildcard segments"""
+    return any(segment in (SINGLE_WILDCARD, MULTI_WILDCARD, TAIL_WILDCARD) for segment in pattern.split("."))
+
+
+class _TrieNode:
+    """Single segment in the topic trie"""
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.entries: List[Tuple[int, Any]] = []  # (registration sequence, value)
+
+
+class TopicTrie:
+    """
+    Segment trie mapping subscription patterns to values.
+
+    Values are returned in registration order, so ordering-sensitive consumers
+    (e.g. pipes) behave the same whether they subscribed by exact topic or by
+    wildcard. A value registered under several matching patterns is returned
+    once per registration.
+    """
+
+    def __init__(self, max_cache_size: int = 4096):
+        self._root = _TrieNode()
+        self._sequence = 0
+        self._size = 0
+        self._cache: Dict[str, Tuple[Any, ...]] = {}
+        self._max_cache_size = max_cache_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, value: Any) -> None:
+        """Subscribe value to a topic pattern"""
+        node = self._root
+        for segment in self._split_pattern(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+
+        node.entries.append((self._sequence, value))
+        self._sequence += 1
+        self._size += 1
+        self._cache.clear()
+
+    def remove(self, pattern: str, value: Any) -> bool:
+        """Remove one registration of value from a topic pattern"""
+        path = [self._root]
+        segments = self._split_pattern(pattern)
+        for segment in segments:
+            child = path[-1].children.get(segment)
+            if child is None:
+                return False
+            path.append(child)
+
+        entries = path[-1].entries
+        for i, (_, existing) in enumerate(entries):
+            if existing is value or existing == value:
+                del entries[i]
+                break
+        else:
+            return False
+
+        # Prune empty branches so lookups stay short
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.entries or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+
+        self._size -= 1
+        self._cache.clear()
+        return True
+
+    def remove_pattern(self, pattern: str) -> int:
+        """Remove every value subscribed to exactly this pattern"""
+        removed = 0
+        for value in self.values_for_pattern(pattern):
+            if self.remove(pattern, value):
+                removed += 1
+        return removed
+
+    def values_for_pattern(self, pattern: str) -> List[Any]:
+        """Get values registered under exactly this pattern (no wildcard expansion)"""
+        node = self._root
+        for segment in self._split_pattern(pattern):
+            node = node.children.get(segment)
+            if node is None:
+                return []
+        return [value for _, value in node.entries]
+
+    def match(self, topic: str) -> Tuple[Any, ...]:
+        """Resolve every value whose pattern matches a concrete topic"""
+        cached = self._cache.get(topic)
+        if cached is not None:
+            return cached
+
+        matches: Dict[int, Any] = {}
+        self._walk(self._root, topic.split("."), 0, matches)
+        result = tuple(matches[seq] for seq in sorted(matches))
+
+        if len(self._cache) >= self._max_cache_size:
+            self._cache.clear()
+        self._cache[topic] = result
+        return result
+
+    def clear(self) -> None:
+        """Remove all subscriptions"""
+        self._root = _TrieNode()
+        self._size = 0
+        self._cache.clear()
+
+    def _walk(self, node: _TrieNode, segments: List[str], index: int, matches: Dict[int, Any]) -> None:
+        children = node.children
+
+        # "#" can swallow any number of segments, including none
+        multi = children.get(MULTI_WILDCARD)
+        if multi is not None:
+            for next_index in range(index, len(segments) + 1):
+                self._walk(multi, segments, next_index, matches)
+
+        if index == len(segments):
+            for seq, value in node.entries:
+                matches[seq] = value
+            return
+
+        exact = children.get(segments[index])
+        if exact is not None:
+            self._walk(exact, segments, index + 1, matches)
+
+        single = children.get(SINGLE_WILDCARD)
+        if single is not None:
+            self._walk(single, segments, index + 1, matches)
+
+        tail = children.get(TAIL_WILDCARD)
+        if tail is not None:
+            for seq, value in tail.entries:
+                matches[seq] = value
+
+    @staticmethod
+    def _split_pattern(pattern: str) -> List[str]:
+        if not pattern:
+            raise ValueError("Topic pattern cannot be empty")
+
+        segments = pattern.split(".")
+        for i, segment in enumerate(segments):
+            if not segment:
+                raise ValueError(f"Empty segment in topic pattern '{pattern}'")
+            if segment == TAIL_WILDCARD and i != len(segments) - 1:
+                raise ValueError(f"'{TAIL_WILDCARD}' must be the last segment in topic pattern '{pattern}'")
+        return segments
@@ -8,13 +8,71 @@ async event system that eliminates threading issues and provides real-time deliv
 import asyncio
 import logging
 import time
-from typing import Dict, List, Any, Callable, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
 from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum
 
 from woodwork.types.events import BasePayload, PayloadRegistry
+from woodwork.core.topic_matcher import TopicTrie
+from woodwork.core.detached_hooks import DetachedHook, HookMode, HookOverflowPolicy
+from woodwork.core.metrics import LatencyMetrics
+from woodwork.core.session_lanes import SessionLanes
+from woodwork.core.journal import DEFAULT_JOURNAL_DIR, EventJournal, JournalRecordKind, read_journal
+from woodwork.core.response_waiters import deliver_response
+from woodwork.core.component_executor import ComponentExecutor, ExecutorKind
 
 log = logging.getLogger(__name__)
 
+# Sentinel for topics whose dispatch plan has not been compiled yet
+_UNCOMPILED = object()
+
+
+class RouteDeliveryMode(Enum):
+    """How an event is delivered to a component's routing targets"""
+    ORDERED = "ordered"    # one target after another, in 'to' order
+    PARALLEL = "parallel"  # all targets concurrently
+
+
+@dataclass(frozen=True)
+class DispatchPlan:
+    """
+    Immutable, precompiled dispatch plan for a single event type.
+
+    Built once at registration time so that emit() never re-inspects listeners:
+    async/sync listeners are already split and sync hooks are already routed to
+    the executor.
+    """
+    async_hooks: Tuple[Callable, ...] = ()
+    executor_hooks: Tuple[Callable, ...] = ()
+    pipes: Tuple[Tuple[Callable, bool], ...] = ()  # (pipe, is_async)
+    async_events: Tuple[Callable, ...] = ()
+    sync_events: Tuple[Callable, ...] = ()
+    detached_hooks: Tuple[DetachedHook, ...] = ()
+
+    @property
+    def hook_count(self) -> int:
+        return len(self.async_hooks) + len(self.executor_hooks)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.async_hooks or self.executor_hooks or self.pipes or self.async_events
+                    or self.sync_events or self.detached_hooks)
+
+    @classmethod
+    def compile(cls, hooks: List[Callable], pipes: List[Callable], events: List[Callable],
+                detached_hooks: Tuple[DetachedHook, ...] = ()) -> "DispatchPlan":
+        """Compile listener lists into a dispatch plan"""
+        return cls(
+            detached_hooks=tuple(detached_hooks),
+            async_hooks=tuple(h for h in hooks if asyncio.iscoroutinefunction(h)),
+            executor_hooks=tuple(h for h in hooks if not asyncio.iscoroutinefunction(h)),
+            pipes=tuple((p, asyncio.iscoroutinefunction(p)) for p in pipes),
+            async_events=tuple(e for e in events if asyncio.iscoroutinefunction(e)),
+            sync_events=tuple(e for e in events if not asyncio.iscoroutinefunction(e)),
+        )
+
 
 class UnifiedEventBus:
     """
@@ -26,20 +84,114 @@ class UnifiedEventBus:
     - MessageBus (async message passing)
 
     All operations are async and run in single event loop - no threading.
+
+    Hooks run inline by default (awaited before pipes). With hook_mode="detached"
+    (or per-hook mode="detached") each hook gets a bounded queue and a worker
+    task, so slow observers never stall emit(). Sync hooks run on a dedicated
+    thread pool of hook_executor_workers threads in both modes.
+
+    Routed events go to a component's targets one by one (route_mode="ordered")
+    or concurrently (route_mode="parallel"); components choose with the
+    'to_mode' config key. target_concurrency caps in-flight deliveries per
+    target (a component's 'max_concurrency' overrides it); waiters are served
+    FIFO, so a limit of 1 delivers to that target strictly in routing order.
+
+    Sync component input() methods (tool calls, vector and graph queries) run
+    on a shared pool of component_executor_workers threads rather than on the
+    loop; a component's 'executor' config key picks "thread", "process" or
+    "inline" instead. An "inline" component runs on the loop only while it is
+    fast: once its calls regularly take longer than slow_call_ms it moves to
+    the thread pool, and the promotion is reported under
+    get_stats()["component_promotions"]. Queue depth and wait/run latency per
+    component appear under get_stats()["component_executors"].
+
+    With session_sharding enabled, emit_from_component() runs on a per-session
+    lane: events of one session are processed in order, different sessions
+    proceed concurrently, and idle lanes are closed after session_idle_timeout.
+
+    An attached EventJournal records every emitted payload and routed delivery;
+    replay_journal() re-drives recorded emits through the bus.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        hook_mode: str = "inline",
+        hook_queue_size: int = 1000,
+        hook_overflow: str = "drop",
+        hook_timeout: Optional[float] = None,
+        hook_executor_workers: int = 4,
+        route_mode: str = "ordered",
+        target_concurrency: Optional[int] = None,
+        component_executor: str = "thread",
+        component_executor_workers: int = 8,
+        slow_call_ms: float = 5.0,
+        session_sharding: bool = False,
+        session_queue_size: int = 100,
+        session_idle_timeout: float = 300.0,
+        journal: Optional[EventJournal] = None,
+    ):
         # Component registry
         self._components: Dict[str, Any] = {}
 
         # Routing configuration (component_name -> [target_components])
         self._routing_table: Dict[str, List[str]] = {}
 
+        # Fan-out configuration: delivery mode per source, concurrency limit per target
+        self._default_route_mode = RouteDeliveryMode(route_mode)
+        self._route_modes: Dict[str, RouteDeliveryMode] = {}
+
+        # Sync component input() calls run off the loop, capped per target
+        self._component_executor = ComponentExecutor(
+            default_kind=component_executor,
+            thread_workers=component_executor_workers,
+            default_limit=target_concurrency,
+            slow_call_ms=slow_call_ms,
+        )
+        self._target_errors: Dict[str, int] = defaultdict(int)
+        self._target_last_ms: Dict[str, float] = {}
+
+        # Latency histograms per event type, hook, pipe and route target
+        self._metrics = LatencyMetrics(
+            "woodwork_event_bus",
+            {"event": "event_type", "hook": "hook", "pipe": "pipe", "route": "target"},
+        )
+        self._event_latency = self._metrics.series("event")
+        self._hook_latency = self._metrics.series("hook")
+        self._pipe_latency = self._metrics.series("pipe")
+
         # Event subscriptions
         self._hooks: Dict[str, List[Callable]] = defaultdict(list)
         self._pipes: Dict[str, List[Callable]] = defaultdict(list)
         self._events: Dict[str, List[Callable]] = defaultdict(list)
 
+        # Subscription index: patterns (exact or wildcard, e.g. "agent.*", "tool.#")
+        # mapped to ("hook" | "pipe" | "event", listener)
+        self._subscriptions = TopicTrie()
+
+        # Precompiled dispatch plans per concrete event type, compiled on first emit
+        # and invalidated on registration. None means nobody subscribes (fast path).
+        self._plans: Dict[str, Optional[DispatchPlan]] = {}
+        self._max_cached_plans = 4096
+
+        # Hook execution defaults (overridable per hook in register_hook)
+        self._hook_mode = HookMode(hook_mode)
+        self._hook_queue_size = hook_queue_size
+        self._hook_overflow = HookOverflowPolicy(hook_overflow)
+        self._hook_timeout = hook_timeout
+        self._hook_executor_workers = hook_executor_workers
+        self._hook_executor: Optional[ThreadPoolExecutor] = None
+        self._detached_hooks: List[DetachedHook] = []
+        self._closing_hooks: Set[asyncio.Task] = set()  # workers of unregistered detached hooks
+
+        # Per-session lanes (None when sharding is off)
+        self._session_lanes: Optional[SessionLanes] = None
+        if session_sharding:
+            self.enable_session_sharding(session_queue_size, session_idle_timeout)
+
+        # Optional append-only record of emits and deliveries
+        self._journal: Optional[EventJournal] = journal
+
         # Statistics
         self._stats = {
             "events_emitted": 0,
@@ -79,6 +231,8 @@ class UnifiedEventBus:
             if targets:
                 log.debug("[UnifiedEventBus] Component '%s' routes to: %s", component_name, targets)
 
+            self._configure_fan_out(component_name, component)
+
         # Infer missing routing patterns
         self._infer_routing_patterns()
 
@@ -86,6 +240,65 @@ class UnifiedEventBus:
         log.info("[UnifiedEventBus] Routing configured: %d components, %d routes",
                  len(self._components), total_routes)
 
+    def _configure_fan_out(self, component_name: str, component: Any) -> None:
+        """Apply 'to_mode', 'max_concurrency' and 'executor' from component config"""
+        config = getattr(component, 'config', None)
+        if not isinstance(config, dict):
+            return
+
+        to_mode = config.get("to_mode")
+        if to_mode is not None:
+            try:
+                self.set_route_mode(component_name, to_mode)
+            except ValueError:
+                log.warning("[UnifiedEventBus] Invalid to_mode '%s' for component '%s', expected one of %s",
+                            to_mode, component_name, [mode.value for mode in RouteDeliveryMode])
+
+        max_concurrency = config.get("max_concurrency")
+        if max_concurrency is not None:
+            try:
+                self.set_target_concurrency(component_name, int(max_concurrency))
+            except ValueError:
+                log.warning("[UnifiedEventBus] Invalid max_concurrency '%s' for component '%s'",
+                            max_concurrency, component_name)
+
+        executor = config.get("executor")
+        if executor is not None:
+            try:
+                self._component_executor.set_kind(component_name, executor, component)
+            except ValueError:
+                log.warning("[UnifiedEventBus] Invalid executor '%s' for component '%s', expected one of %s",
+                            executor, component_name, [kind.value for kind in ExecutorKind])
+
+    def set_route_mode(self, source_component: str, mode: str) -> None:
+        """Choose ordered or parallel delivery to a component's targets"""
+        self._route_modes[source_component] = RouteDeliveryMode(mode)
+        log.debug("[UnifiedEventBus] Route mode for '%s': %s", source_component, mode)
+
+    def set_target_concurrency(self, target_component: str, limit: Optional[int]) -> None:
+        """Cap concurrent deliveries to a target (None removes the cap)"""
+        self._component_executor.set_limit(target_component, limit)
+
+    def set_component_executor(self, component_name: str, executor: str) -> None:
+        """Run a component's sync input() on the 'thread' pool, a 'process' pool, or 'inline' on the loop"""
+        self._component_executor.set_kind(component_name, executor, self._components.get(component_name))
+
+    async def call_component(
+        self, component_name: str, func: Callable, *args: Any, default_executor: Optional[str] = None
+    ) -> Any:
+        """Call a component method under its concurrency cap and executor
+
+        default_executor applies when the component has no 'executor' of its
+        own; "inline" keeps a direct call on the loop until it is measured slow.
+        """
+        return await self._component_executor.call(component_name, func, *args, default_kind=default_executor)
+
+    def _record_delivery(self, target_name: str, elapsed_ms: float, failed: bool) -> None:
+        self._metrics.observe("route", target_name, elapsed_ms)
+        self._target_last_ms[target_name] = elapsed_ms
+        if failed:
+            self._target_errors[target_name] += 1
+
     def _extract_routing_targets(self, component: Any) -> List[str]:
         """Extract routing targets from component 'to' property"""
         component_name = getattr(component, 'name', 'unknown')
@@ -173,21 +386,121 @@ class UnifiedEventBus:
                 log.debug("[UnifiedEventBus] Inferred routing: %s -> %s",
                          agent_comp, self._routing_table[agent_comp])
 
-    def register_hook(self, event_type: str, hook: Callable) -> None:
-        """Register hook for event type (read-only, concurrent)"""
+    def register_hook(
+        self,
+        event_type: str,
+        hook: Callable,
+        *,
+        mode: Optional[str] = None,
+        queue_size: Optional[int] = None,
+        overflow: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Register hook for event type or wildcard pattern (read-only, concurrent).
+
+        Unset options fall back to the bus defaults. Detached hooks are queued
+        and run off the critical path; queue_size, overflow and timeout only
+        apply to them.
+        """
+        hook_mode = HookMode(mode) if mode is not None else self._hook_mode
         self._hooks[event_type].append(hook)
-        log.debug("[UnifiedEventBus] Registered hook for '%s'", event_type)
+
+        if hook_mode is HookMode.DETACHED:
+            name = f"{event_type}:{getattr(hook, '__qualname__', type(hook).__name__)}"
+            existing = {d.name for d in self._detached_hooks}
+            if name in existing:
+                name = f"{name}#{sum(1 for d in existing if d.startswith(name))}"
+
+            detached = DetachedHook(
+                hook,
+                name=name,
+                observer=lambda elapsed_ms, hook=hook: self._record_hook_latency(hook, elapsed_ms),
+                executor_provider=self._get_hook_executor,
+                queue_size=queue_size if queue_size is not None else self._hook_queue_size,
+                overflow=HookOverflowPolicy(overflow) if overflow is not None else self._hook_overflow,
+                timeout=timeout if timeout is not None else self._hook_timeout,
+            )
+            self._detached_hooks.append(detached)
+            self._subscribe(event_type, "detached", detached)
+        else:
+            self._subscribe(event_type, "hook", hook)
+
+        log.debug("[UnifiedEventBus] Registered %s hook for '%s'", hook_mode.value, event_type)
 
     def register_pipe(self, event_type: str, pipe: Callable) -> None:
-        """Register pipe for event type (transform, sequential)"""
+        """Register pipe for event type or wildcard pattern (transform, sequential)"""
         self._pipes[event_type].append(pipe)
+        self._subscribe(event_type, "pipe", pipe)
         log.debug("[UnifiedEventBus] Registered pipe for '%s'", event_type)
 
     def register_event(self, event_type: str, listener: Callable) -> None:
-        """Register event listener (fire-and-forget)"""
+        """Register event listener for event type or wildcard pattern (fire-and-forget)"""
         self._events[event_type].append(listener)
+        self._subscribe(event_type, "event", listener)
         log.debug("[UnifiedEventBus] Registered event listener for '%s'", event_type)
 
+    def unregister(self, event_type: str, listener: Callable) -> bool:
+        """Remove one registration of a hook, pipe or event listener"""
+        for kind, registry in (("hook", self._hooks), ("pipe", self._pipes), ("event", self._events)):
+            if listener not in registry.get(event_type, ()):
+                continue
+            registry[event_type].remove(listener)
+
+            if kind == "hook":
+                detached = next((d for d in self._detached_hooks
+                                 if d.hook is listener and d.name.startswith(f"{event_type}:")), None)
+                if detached is not None and self._subscriptions.remove(event_type, ("detached", detached)):
+                    self._detached_hooks.remove(detached)
+                    self._plans.clear()
+                    self._close_detached(detached)
+                    log.debug("[UnifiedEventBus] Unregistered detached hook for '%s'", event_type)
+                    return True
+
+            self._subscriptions.remove(event_type, (kind, listener))
+            self._plans.clear()
+            log.debug("[UnifiedEventBus] Unregistered %s for '%s'", kind, event_type)
+            return True
+        return False
+
+    def _close_detached(self, detached: DetachedHook) -> None:
+        """Stop an unregistered detached hook's worker; without a running loop there is none to stop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = asyncio.ensure_future(detached.close())
+        self._closing_hooks.add(task)
+        task.add_done_callback(self._closing_hooks.discard)
+
+    def _subscribe(self, pattern: str, kind: str, listener: Callable) -> None:
+        """Index a listener and invalidate compiled plans it may affect"""
+        self._subscriptions.add(pattern, (kind, listener))
+        self._plans.clear()
+
+    def _compile_plan(self, event_type: str) -> Optional[DispatchPlan]:
+        """Compile and cache the dispatch plan for a concrete event type"""
+        hooks, pipes, events, detached = [], [], [], []
+        by_kind = {"hook": hooks, "pipe": pipes, "event": events, "detached": detached}
+        for kind, listener in self._subscriptions.match(event_type):
+            by_kind[kind].append(listener)
+
+        plan = DispatchPlan.compile(hooks, pipes, events, detached)
+        if plan.is_empty:
+            plan = None
+
+        if len(self._plans) >= self._max_cached_plans:
+            self._plans.clear()
+        self._plans[event_type] = plan
+        return plan
+
+    def get_dispatch_plan(self, event_type: str) -> Optional[DispatchPlan]:
+        """Get the compiled dispatch plan for an event type (None if nobody subscribes)"""
+        plan = self._plans.get(event_type, _UNCOMPILED)
+        if plan is _UNCOMPILED:
+            plan = self._compile_plan(event_type)
+        return plan
+
     async def emit(self, event_type: str, payload: Any) -> Any:
         """
         Emit event with unified processing:
@@ -196,37 +509,152 @@ class UnifiedEventBus:
         3. Route to target components
         4. Fire event listeners
         """
-        start_time = time.time()
-
         # Create typed payload
-        if not isinstance(payload, BasePayload):
-            typed_payload = self._create_typed_payload(event_type, payload)
-        else:
+        if isinstance(payload, BasePayload):
             typed_payload = payload
+        else:
+            typed_payload = self._create_typed_payload(event_type, payload)
+
+        if self._journal is not None:
+            self._journal.record_emit(event_type, typed_payload, self._session_of(typed_payload))
+
+        plan = self._plans.get(event_type, _UNCOMPILED)
+        if plan is _UNCOMPILED:
+            plan = self._compile_plan(event_type)
 
-        log.debug("[UnifiedEventBus] Emitting '%s' with payload type: %s",
-                 event_type, type(typed_payload).__name__)
+        # Fast path: nobody subscribes to this event
+        if plan is None:
+            self._stats["events_emitted"] += 1
+            return typed_payload
+
+        start_time = time.perf_counter()
+
+        # 0. Hand off to detached hooks (only waits if a BLOCK queue is full)
+        for detached in plan.detached_hooks:
+            if not detached.offer(typed_payload):
+                await detached.put(typed_payload)
 
         # 1. Process hooks concurrently (read-only)
-        await self._process_hooks(event_type, typed_payload)
+        if plan.async_hooks or plan.executor_hooks:
+            await self._process_hooks(event_type, typed_payload, plan)
 
         # 2. Process pipes sequentially (transform)
-        transformed_payload = await self._process_pipes(event_type, typed_payload)
+        if plan.pipes:
+            transformed_payload = await self._process_pipes(event_type, typed_payload, plan)
+        else:
+            transformed_payload = typed_payload
 
         # 3. Fire event listeners (fire-and-forget)
-        self._fire_events(event_type, transformed_payload)
+        if plan.async_events or plan.sync_events:
+            self._fire_events(event_type, transformed_payload, plan)
 
         self._stats["events_emitted"] += 1
 
-        emit_time = (time.time() - start_time) * 1000
-        log.debug("[UnifiedEventBus] Event '%s' processed in %.2fms", event_type, emit_time)
+        emit_time = (time.perf_counter() - start_time) * 1000
+        (self._event_latency.get(event_type) or self._metrics.histogram("event", event_type)).record(emit_time)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[UnifiedEventBus] Event '%s' (%s) processed in %.2fms",
+                      event_type, type(typed_payload).__name__, emit_time)
 
         return transformed_payload
 
+    def emit_sync(self, event_type: str, payload: Any) -> Any:
+        """
+        Emit from synchronous code: runs sync hooks, pipes and listeners inline.
+
+        Async subscribers are skipped, and detached hooks are only fed when
+        called from a running event loop.
+        """
+        if isinstance(payload, BasePayload):
+            typed_payload = payload
+        else:
+            typed_payload = self._create_typed_payload(event_type, payload)
+
+        if self._journal is not None:
+            self._journal.record_emit(event_type, typed_payload, self._session_of(typed_payload))
+
+        plan = self.get_dispatch_plan(event_type)
+        self._stats["events_emitted"] += 1
+        if plan is None:
+            return typed_payload
+
+        if plan.detached_hooks:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                for detached in plan.detached_hooks:
+                    detached.offer(typed_payload)
+
+        for hook in plan.executor_hooks:
+            try:
+                hook(typed_payload)
+            except Exception as e:
+                log.error("[UnifiedEventBus] Hook failed for '%s': %s", event_type, e)
+        self._stats["hooks_executed"] += len(plan.executor_hooks)
+
+        current_payload = typed_payload
+        for i, (pipe, is_async) in enumerate(plan.pipes):
+            if is_async:
+                continue
+            try:
+                result = pipe(current_payload)
+                if result is not None:
+                    current_payload = result
+            except Exception as e:
+                log.error("[UnifiedEventBus] Pipe %d failed for '%s': %s", i, event_type, e)
+
+        for listener in plan.sync_events:
+            try:
+                listener(current_payload)
+            except Exception as e:
+                log.error("[UnifiedEventBus] Event listener failed for '%s': %s", event_type, e)
+
+        return current_payload
+
+    def enable_session_sharding(self, queue_size: int = 100, idle_timeout: float = 300.0) -> None:
+        """Process emit_from_component() on per-session lanes"""
+        if self._session_lanes is not None:
+            return
+        self._session_lanes = SessionLanes(queue_size=queue_size, idle_timeout=idle_timeout)
+        log.debug("[UnifiedEventBus] Session sharding enabled (queue_size=%d, idle_timeout=%.1fs)",
+                  queue_size, idle_timeout)
+
+    @staticmethod
+    def _session_of(payload: Any) -> Optional[str]:
+        if isinstance(payload, dict):
+            session_id = payload.get("session_id")
+        else:
+            session_id = getattr(payload, "session_id", None)
+        # Payload types without a session inherit the lane they are processed on
+        return session_id or SessionLanes.current_session()
+
     async def emit_from_component(self, source_component: str, event_type: str, payload: Any) -> Any:
         """
         Emit event from specific component and route to its targets
         """
+        if self._session_lanes is not None:
+            return await self._session_lanes.run(
+                self._session_of(payload), self._emit_and_route, source_component, event_type, payload
+            )
+        return await self._emit_and_route(source_component, event_type, payload)
+
+    async def post_from_component(self, source_component: str, event_type: str, payload: Any) -> None:
+        """
+        Queue an event on its session's lane without waiting for processing.
+
+        Only waits if the session's lane is full. Without session sharding
+        this is the same as emit_from_component().
+        """
+        if self._session_lanes is not None:
+            await self._session_lanes.post(
+                self._session_of(payload), self._emit_and_route, source_component, event_type, payload
+            )
+        else:
+            await self._emit_and_route(source_component, event_type, payload)
+
+    async def _emit_and_route(self, source_component: str, event_type: str, payload: Any) -> Any:
         # First emit normally (hooks, pipes, events)
         processed_payload = await self.emit(event_type, payload)
 
@@ -235,52 +663,75 @@ class UnifiedEventBus:
 
         return processed_payload
 
-    async def _process_hooks(self, event_type: str, payload: BasePayload) -> None:
+    async def _process_hooks(self, event_type: str, payload: BasePayload, plan: Optional[DispatchPlan] = None) -> None:
         """Process hooks concurrently (read-only)"""
-        hooks = self._hooks.get(event_type, [])
-
-        if not hooks:
+        if plan is None:
+            plan = self.get_dispatch_plan(event_type)
+        if plan is None or not plan.hook_count:
             return
 
-        log.debug("[UnifiedEventBus] Processing %d hooks for '%s'", len(hooks), event_type)
-
-        # Execute all hooks concurrently
-        tasks = []
-        for hook in hooks:
+        # Execute all hooks concurrently; sync hooks run in the thread pool to avoid blocking
+        hooks, awaitables = [], []
+        for hook in plan.async_hooks:
             try:
-                if asyncio.iscoroutinefunction(hook):
-                    tasks.append(hook(payload))
-                else:
-                    # Execute sync hooks in thread pool to avoid blocking
-                    tasks.append(asyncio.get_event_loop().run_in_executor(None, hook, payload))
+                awaitables.append(hook(payload))
+                hooks.append(hook)
             except Exception as e:
                 log.error("[UnifiedEventBus] Error creating hook task for '%s': %s", event_type, e)
 
-        if tasks:
-            # Wait for all hooks to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        if plan.executor_hooks:
+            loop = asyncio.get_running_loop()
+            executor = self._get_hook_executor()
+            for hook in plan.executor_hooks:
+                awaitables.append(loop.run_in_executor(executor, hook, payload))
+                hooks.append(hook)
+
+        if len(awaitables) == 1:
+            # Single hook: await and time it directly instead of wrapping it in a gather
+            start_time = time.perf_counter()
+            try:
+                await awaitables[0]
+            except Exception as e:
+                log.error("[UnifiedEventBus] Hook 0 failed for '%s': %s", event_type, e)
+            finally:
+                self._record_hook_latency(hooks[0], (time.perf_counter() - start_time) * 1000)
+        elif awaitables:
+            results = await asyncio.gather(
+                *(self._timed_hook(hook, awaitable) for hook, awaitable in zip(hooks, awaitables)),
+                return_exceptions=True
+            )
 
             # Log any hook errors
             for i, result in enumerate(results):
                 if isinstance(result, Exception):
                     log.error("[UnifiedEventBus] Hook %d failed for '%s': %s", i, event_type, result)
 
-        self._stats["hooks_executed"] += len(hooks)
+        self._stats["hooks_executed"] += plan.hook_count
 
-    async def _process_pipes(self, event_type: str, payload: BasePayload) -> BasePayload:
-        """Process pipes sequentially (transform)"""
-        pipes = self._pipes.get(event_type, [])
+    async def _timed_hook(self, hook: Callable, awaitable: Any) -> Any:
+        """Await a hook call, recording its latency under the hook's name"""
+        start_time = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record_hook_latency(hook, (time.perf_counter() - start_time) * 1000)
 
-        if not pipes:
-            return payload
+    def _record_hook_latency(self, hook: Callable, elapsed_ms: float) -> None:
+        (self._hook_latency.get(hook) or self._metrics.histogram("hook", hook)).record(elapsed_ms)
 
-        log.debug("[UnifiedEventBus] Processing %d pipes for '%s'", len(pipes), event_type)
+    async def _process_pipes(self, event_type: str, payload: BasePayload, plan: Optional[DispatchPlan] = None) -> BasePayload:
+        """Process pipes sequentially (transform)"""
+        if plan is None:
+            plan = self.get_dispatch_plan(event_type)
+        if plan is None or not plan.pipes:
+            return payload
 
         current_payload = payload
 
-        for i, pipe in enumerate(pipes):
+        for i, (pipe, is_async) in enumerate(plan.pipes):
+            start_time = time.perf_counter()
             try:
-                if asyncio.iscoroutinefunction(pipe):
+                if is_async:
                     result = await pipe(current_payload)
                 else:
                     result = pipe(current_payload)
@@ -290,26 +741,96 @@ class UnifiedEventBus:
 
             except Exception as e:
                 log.error("[UnifiedEventBus] Pipe %d failed for '%s': %s", i, event_type, e)
+            finally:
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                (self._pipe_latency.get(pipe) or self._metrics.histogram("pipe", pipe)).record(elapsed_ms)
 
         return current_payload
 
-    def _fire_events(self, event_type: str, payload: BasePayload) -> None:
-        """Fire event listeners (fire-and-forget)"""
-        listeners = self._events.get(event_type, [])
+    def attach_journal(self, journal: Optional[EventJournal]) -> None:
+        """Record emits and deliveries to a journal (None detaches it)"""
+        self._journal = journal
+        log.debug("[UnifiedEventBus] Journal %s", f"attached at {journal.directory}" if journal else "detached")
+
+    async def replay_journal(self, directory: str = DEFAULT_JOURNAL_DIR, session_id: Optional[str] = None) -> int:
+        """
+        Re-emit recorded events through hooks, pipes and listeners at full speed.
+
+        Deliveries are not re-driven: the events emitted while handling them
+        were recorded too and are replayed in order. The attached journal (if
+        any) is paused so the replay is not recorded again. Returns the number
+        of events replayed.
+        """
+        journal, self._journal = self._journal, None
+        replayed = 0
+        try:
+            for record in read_journal(directory, session_id=session_id, kinds=(JournalRecordKind.EMIT,)):
+                payload = PayloadRegistry.create_payload(record.event_type, record.payload)
+                await self.emit(record.event_type, payload)
+                replayed += 1
+        finally:
+            self._journal = journal
+
+        log.info("[UnifiedEventBus] Replayed %d events from %s", replayed, directory)
+        return replayed
+
+    def _get_hook_executor(self) -> ThreadPoolExecutor:
+        """Get the dedicated thread pool for sync hooks, creating it on first use"""
+        if self._hook_executor is None:
+            self._hook_executor = ThreadPoolExecutor(
+                max_workers=self._hook_executor_workers, thread_name_prefix="woodwork-hook"
+            )
+        return self._hook_executor
+
+    async def drain_hooks(self) -> None:
+        """Wait until every detached hook has handled its queued events"""
+        for detached in self._detached_hooks:
+            await detached.drain()
+
+    async def shutdown(self, drain: bool = True) -> None:
+        """Stop session lanes and detached hook workers, release the hook and component pools"""
+        if self._session_lanes is not None:
+            if drain:
+                await self._session_lanes.drain()
+            await self._session_lanes.close()
+
+        if drain:
+            await self.drain_hooks()
+
+        for detached in self._detached_hooks:
+            await detached.close()
+        if self._closing_hooks:
+            await asyncio.gather(*self._closing_hooks, return_exceptions=True)
+
+        if self._hook_executor is not None:
+            self._hook_executor.shutdown(wait=False)
+            self._hook_executor = None
 
-        if not listeners:
+        self._component_executor.shutdown()
+
+        if self._journal is not None:
+            self._journal.flush()
+
+        log.debug("[UnifiedEventBus] Shut down hook workers")
+
+    def _fire_events(self, event_type: str, payload: BasePayload, plan: Optional[DispatchPlan] = None) -> None:
+        """Fire event listeners (fire-and-forget)"""
+        if plan is None:
+            plan = self.get_dispatch_plan(event_type)
+        if plan is None:
             return
 
-        log.debug("[UnifiedEventBus] Firing %d event listeners for '%s'", len(listeners), event_type)
+        # Create tasks for async listeners (fire-and-forget)
+        for listener in plan.async_events:
+            try:
+                asyncio.create_task(listener(payload))
+            except Exception as e:
+                log.error("[UnifiedEventBus] Event listener failed for '%s': %s", event_type, e)
 
-        for listener in listeners:
+        # Execute sync listeners directly
+        for listener in plan.sync_events:
             try:
-                if asyncio.iscoroutinefunction(listener):
-                    # Create task for async listeners (fire-and-forget)
-                    asyncio.create_task(listener(payload))
-                else:
-                    # Execute sync listeners directly
-                    listener(payload)
+                listener(payload)
             except Exception as e:
                 log.error("[UnifiedEventBus] Event listener failed for '%s': %s", event_type, e)
 
@@ -320,8 +841,18 @@ class UnifiedEventBus:
         if not targets:
             return
 
-        log.debug("[UnifiedEventBus] Routing '%s' from '%s' to %d targets: %s",
-                 event_type, source_component, len(targets), targets)
+        mode = self._route_modes.get(source_component, self._default_route_mode)
+        log.debug("[UnifiedEventBus] Routing '%s' from '%s' to %d targets (%s): %s",
+                 event_type, source_component, len(targets), mode.value, targets)
+
+        if mode is RouteDeliveryMode.PARALLEL and len(targets) > 1:
+            # Fan out: total latency is the slowest target, not the sum
+            await asyncio.gather(*(
+                self._deliver_to_component(target_name, event_type, payload, source_component)
+                for target_name in targets
+            ))
+            self._stats["routes_processed"] += len(targets)
+            return
 
         # Route to each target component
         for target_name in targets:
@@ -342,6 +873,9 @@ class UnifiedEventBus:
             log.debug("[UnifiedEventBus] Component '%s' has no input method", target_name)
             return None
 
+        if self._journal is not None:
+            self._journal.record_delivery(source_component, target_name, event_type, payload, self._session_of(payload))
+
         try:
             log.debug("[UnifiedEventBus] Delivering '%s' to component '%s'", event_type, target_name)
 
@@ -351,11 +885,15 @@ class UnifiedEventBus:
             else:
                 input_data = payload
 
-            # Call component input method
-            if asyncio.iscoroutinefunction(target_component.input):
-                result = await target_component.input(input_data)
-            else:
-                result = target_component.input(input_data)
+            # Call component input method through the executor, which holds the target's
+            # concurrency slot and keeps sync inputs off the event loop
+            start_time = time.perf_counter()
+            failed = True
+            try:
+                result = await self._component_executor.call(target_name, target_component.input, input_data)
+                failed = False
+            finally:
+                self._record_delivery(target_name, (time.perf_counter() - start_time) * 1000, failed)
 
             log.debug("[UnifiedEventBus] Component '%s' processed input, result: %s",
                      target_name, str(result)[:100] if result else "None")
@@ -425,6 +963,8 @@ class UnifiedEventBus:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get event bus statistics"""
+        detached_stats = {detached.name: detached.get_stats() for detached in self._detached_hooks}
+        latency = self._metrics.snapshot()
         return {
             **self._stats,
             "components_count": len(self._components),
@@ -432,14 +972,41 @@ class UnifiedEventBus:
             "total_routes": sum(len(targets) for targets in self._routing_table.values()),
             "hook_subscriptions": sum(len(hooks) for hooks in self._hooks.values()),
             "pipe_subscriptions": sum(len(pipes) for pipes in self._pipes.values()),
-            "event_subscriptions": sum(len(events) for events in self._events.values())
+            "event_subscriptions": sum(len(events) for events in self._events.values()),
+            "dispatch_plans": sum(1 for plan in self._plans.values() if plan is not None),
+            "hooks_dropped": sum(stats["dropped"] for stats in detached_stats.values()),
+            "hook_timeouts": sum(stats["timeouts"] for stats in detached_stats.values()),
+            "detached_hooks": detached_stats,
+            "route_targets": {
+                target: {
+                    "deliveries": stats["count"],
+                    "errors": self._target_errors.get(target, 0),
+                    "last_ms": self._target_last_ms.get(target, 0.0),
+                    **stats
+                }
+                for target, stats in latency["route"].items()
+            },
+            "component_executors": self._component_executor.get_stats(),
+            "component_promotions": self._component_executor.get_promotions(),
+            "latency": latency,
+            "session_lanes": self._session_lanes.get_stats() if self._session_lanes is not None else None,
+            "journal": self._journal.get_stats() if self._journal is not None else None
         }
 
+    def export_metrics(self, format: str = "prometheus") -> str:
+        """Export latency histograms as Prometheus text or JSON"""
+        return self._metrics.export(format)
+
+    def reset_metrics(self) -> None:
+        """Clear latency histograms (counters in get_stats are kept)"""
+        self._metrics.reset()
+
     def get_routing_info(self, component_name: str) -> Dict[str, Any]:
         """Get routing information for a component"""
         return {
             "component_name": component_name,
             "targets": self._routing_table.get(component_name, []),
+            "route_mode": self._route_modes.get(component_name, self._default_route_mode).value,
             "is_registered": component_name in self._components,
             "target_count": len(self._routing_table.get(component_name, []))
         }
@@ -466,30 +1033,23 @@ class UnifiedEventBus:
                 # Handle different input method signatures
                 if isinstance(data, dict) and "action" in data and "inputs" in data:
                     # Tool format: input(action, inputs)
-                    action = data["action"]
-                    inputs = data["inputs"]
-                    if asyncio.iscoroutinefunction(target_component.input):
-                        result = await target_component.input(action, inputs)
-                    else:
-                        result = target_component.input(action, inputs)
+                    result = await self._component_executor.call(
+                        name, target_component.input, data["action"], data["inputs"]
+                    )
                 else:
                     # Standard format: input(data)
-                    if asyncio.iscoroutinefunction(target_component.input):
-                        result = await target_component.input(data)
-                    else:
-                        result = target_component.input(data)
-
-            # Send response back to source component
-            if source_component_name in self._components:
-                source_component = self._components[source_component_name]
-                if hasattr(source_component, '_received_responses'):
-                    source_component._received_responses[request_id] = {
-                        "result": result,
-                        "source_component": name,
-                        "received_at": time.time()
-                    }
-                    log.debug("[UnifiedEventBus] Stored response for request_id '%s' in component '%s'",
-                             request_id, source_component_name)
+                    result = await self._component_executor.call(name, target_component.input, data)
+
+            # Send response back to source component (resolves its waiting future, if any)
+            source_component = self._components.get(source_component_name)
+            if source_component is not None:
+                if deliver_response(source_component, request_id, {
+                    "result": result,
+                    "source_component": name,
+                    "received_at": time.time()
+                }):
+                    log.debug("[UnifiedEventBus] Delivered response for request_id '%s' to component '%s'",
+                              request_id, source_component_name)
 
             return True, request_id
 
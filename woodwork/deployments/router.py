@@ -23,16 +23,25 @@ class DeploymentWrapper:
                     resp = await response.text()
                     return resp[1:-1]
         else:
+            from woodwork.core.unified_event_bus import get_global_event_bus
+
+            # Sync methods stay on the loop until measured slow, then move to the bus's component pool
+            event_bus = get_global_event_bus()
+
             # Check if component has async process method (for streaming)
             if hasattr(self.component, 'process'):
-                result = self.component.process(data)
+                result = await event_bus.call_component(
+                    self.component.name, self.component.process, data, default_executor="inline"
+                )
                 # Handle both sync and async process methods
                 if hasattr(result, '__await__'):  # asyncio.iscoroutine doesn't work with some coroutines
                     return await result
                 return result
             else:
                 # Fallback to input method
-                return self.component.input(data)
+                return await event_bus.call_component(
+                    self.component.name, self.component.input, data, default_executor="inline"
+                )
 
 
 class Router:
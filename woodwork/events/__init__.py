@@ -8,7 +8,7 @@ This module provides:
 """
 
 # Core event system - keep existing API
-from .events import EventManager, get_global_event_manager, set_global_event_manager, emit, register_hook, register_pipe, create_default_emitter
+from .events import EventManager, BusEventManager, get_global_event_manager, set_global_event_manager, emit, register_hook, register_pipe, create_default_emitter
 
 # New typed payload system - now imported from types
 from woodwork.types.events import (
@@ -30,6 +30,7 @@ from woodwork.types.event_source import EventSource, track_events_from
 __all__ = [
     # Core event system
     'EventManager',
+    'BusEventManager',
     'get_global_event_manager', 
     'set_global_event_manager',
     'emit',
@@ -177,14 +177,58 @@ class EventManager:
         return current_payload
 
 
+class BusEventManager(EventManager):
+    """EventManager API over a UnifiedEventBus.
+
+    Registrations and emits go straight to the bus, so a listener registered
+    through either API lives in one place and runs once per emit. Without an
+    explicit bus the current global UnifiedEventBus is used.
+    """
+
+    def __init__(self, bus: Any = None) -> None:
+        super().__init__()
+        self._bus = bus
+
+    @property
+    def bus(self) -> Any:
+        if self._bus is not None:
+            return self._bus
+        from woodwork.core.unified_event_bus import get_global_event_bus
+        return get_global_event_bus()
+
+    def on_event(self, event: str, listener: Listener) -> None:
+        """Register a fire-and-forget event listener"""
+        self.bus.register_event(event, listener)
+
+    def on_hook(self, event: str, listener: Listener) -> None:
+        """Register a hook (read-only)"""
+        self.bus.register_hook(event, listener)
+
+    def on_pipe(self, event: str, listener: Listener) -> None:
+        """Register a pipe (transform payload)"""
+        self.bus.register_pipe(event, listener)
+
+    def off(self, event: str, listener: Listener) -> None:
+        """Remove a listener from events, hooks, or pipes"""
+        self.bus.unregister(event, listener)
+
+    async def emit(self, event: str, data: Any = None) -> Any:
+        """Emit event with typed payload"""
+        return await self.bus.emit(event, data)
+
+    def emit_sync(self, event: str, data: Any = None) -> Any:
+        """Synchronous emit with typed payload"""
+        return self.bus.emit_sync(event, data)
+
+
 # Global event manager instance
 _global_event_manager = None
 
 def get_global_event_manager() -> EventManager:
-    """Get the global event manager instance"""
+    """Get the global event manager instance (backed by the global UnifiedEventBus)"""
     global _global_event_manager
     if _global_event_manager is None:
-        _global_event_manager = EventManager()
+        _global_event_manager = BusEventManager()
     return _global_event_manager
 
 def set_global_event_manager(manager: EventManager) -> None:
@@ -499,7 +499,7 @@ def parse_config(entry: str) -> tuple[dict[Any, Any], list[Any] | Any]:
                                     line_value = line_value.strip().strip('"\'')
                                     
                                     # Map common keys for hooks and pipes
-                                    if line_key in ['event', 'script_path', 'function_name']:
+                                    if line_key in ['event', 'script_path', 'function_name', 'mode', 'timeout']:
                                         parsed_dict[line_key] = line_value
                                 else:
                                     # Handle lines without colons (might be values from multiline parsing)
@@ -20,6 +20,7 @@ from .streaming_data import (
     StreamBuffer,
     StreamDataType,
     StreamStatus,
+    IntegrityMode,
     generate_stream_id,
     create_stream_chunk
 )
@@ -37,5 +38,5 @@ __all__ = [
     "EventSource", "track_events_from",
     # Streaming data types
     "StreamChunk", "StreamMetadata", "StreamBuffer", "StreamDataType", "StreamStatus",
-    "generate_stream_id", "create_stream_chunk"
+    "IntegrityMode", "generate_stream_id", "create_stream_chunk"
 ]
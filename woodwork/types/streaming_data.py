@@ -3,9 +3,16 @@ Streaming data types for Woodwork components
 
 This module defines the core data structures for streaming data between components,
 including chunks, metadata, and stream status tracking.
+
+StreamChunk is slotted and carries no metadata dict unless given one, since
+LLM streams create one per token. Its checksum is computed only when the chunk
+is serialized, with the stream's IntegrityMode: none, crc32, a fast 64-bit
+hash (xxh3 when the optional xxhash package is installed, blake2b otherwise)
+or sha256. Checksums name their algorithm ("crc32:...", "xxh3:..."); bare hex
+is the original truncated SHA-256.
 """
 
-from typing import AsyncGenerator, Optional, Union, Any, Dict, List
+from typing import AsyncGenerator, Callable, Optional, Union, Any, Dict, List
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
@@ -14,6 +21,12 @@ import time
 import json
 import hashlib
 import base64
+import zlib
+
+try:
+    import xxhash
+except ImportError:  # optional: blake2b stands in for the fast hash
+    xxhash = None
 
 
 class StreamDataType(Enum):
@@ -33,7 +46,46 @@ class StreamStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+class IntegrityMode(Enum):
+    """Checksum computed for a stream's chunks when they are serialized"""
+    NONE = "none"
+    CRC32 = "crc32"
+    FAST = "fast"      # xxh3 (or blake2b) 64-bit hash
+    SHA256 = "sha256"
+
+
+def _crc32(data: bytes) -> str:
+    return "crc32:%08x" % zlib.crc32(data)
+
+
+def _blake2b(data: bytes) -> str:
+    return "blake2b:" + hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _xxh3(data: bytes) -> str:
+    return "xxh3:" + xxhash.xxh3_64_hexdigest(data)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]  # First 16 chars, unprefixed as before
+
+
+# Checksum functions by the prefix they write ("" for SHA-256)
+_CHECKSUMS: Dict[str, Callable[[bytes], str]] = {"crc32": _crc32, "blake2b": _blake2b, "": _sha256}
+if xxhash is not None:
+    _CHECKSUMS["xxh3"] = _xxh3
+
+# Keyed by IntegrityMode._value_: looked up per serialized chunk, and Enum hashing is slow
+_MODE_CHECKSUMS: Dict[str, Optional[Callable[[bytes], str]]] = {
+    IntegrityMode.NONE.value: None,
+    IntegrityMode.CRC32.value: _crc32,
+    IntegrityMode.FAST.value: _xxh3 if xxhash is not None else _blake2b,
+    IntegrityMode.SHA256.value: _sha256,
+}
+_DEFAULT_INTEGRITY = IntegrityMode.SHA256
+
+
+@dataclass(slots=True)
 class StreamChunk:
     """Individual chunk in a data stream with reliability metadata"""
     stream_id: str
@@ -42,41 +94,51 @@ class StreamChunk:
     data_type: StreamDataType
     is_final: bool = False
     chunk_size: Optional[int] = None
-    checksum: Optional[str] = None  # For data integrity
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    checksum: Optional[str] = None  # For data integrity, computed when serialized
+    metadata: Optional[Dict[str, Any]] = None
     timestamp: float = field(default_factory=time.time)
+    integrity: IntegrityMode = IntegrityMode.SHA256
     
     def __post_init__(self):
-        """Calculate chunk size and checksum if not provided"""
+        """Calculate chunk size if not provided"""
         if self.chunk_size is None:
             if isinstance(self.data, str):
-                self.chunk_size = len(self.data.encode('utf-8'))
+                # ASCII text (most tokens) is one byte per character; skip the encode
+                self.chunk_size = len(self.data) if self.data.isascii() else len(self.data.encode('utf-8'))
             elif isinstance(self.data, bytes):
                 self.chunk_size = len(self.data)
             elif isinstance(self.data, dict):
                 self.chunk_size = len(json.dumps(self.data).encode('utf-8'))
             else:
                 self.chunk_size = len(str(self.data).encode('utf-8'))
-        
-        if self.checksum is None:
-            self.checksum = self._calculate_checksum()
     
-    def _calculate_checksum(self) -> str:
-        """Calculate SHA-256 checksum of the data"""
+    def _data_bytes(self) -> bytes:
         if isinstance(self.data, str):
-            data_bytes = self.data.encode('utf-8')
+            return self.data.encode('utf-8')
         elif isinstance(self.data, bytes):
-            data_bytes = self.data
+            return self.data
         elif isinstance(self.data, dict):
-            data_bytes = json.dumps(self.data, sort_keys=True).encode('utf-8')
+            return json.dumps(self.data, sort_keys=True).encode('utf-8')
         else:
-            data_bytes = str(self.data).encode('utf-8')
-        
-        return hashlib.sha256(data_bytes).hexdigest()[:16]  # First 16 chars
-    
+            return str(self.data).encode('utf-8')
+
+    def _calculate_checksum(self, algorithm: Optional[str] = None) -> Optional[str]:
+        """Checksum of the data with the chunk's integrity mode (or a named algorithm)"""
+        checksum = _MODE_CHECKSUMS[self.integrity._value_] if algorithm is None else _CHECKSUMS[algorithm]
+        return None if checksum is None else checksum(self._data_bytes())
+
+    def _prepare_for_wire(self) -> None:
+        """Compute the checksum if due; called whenever the chunk is serialized"""
+        # Chunks handed over in-process never need one
+        if self.checksum is None:
+            checksum = _MODE_CHECKSUMS[self.integrity._value_]
+            if checksum is not None:
+                self.checksum = checksum(self._data_bytes())
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize for message bus transport"""
-        return {
+        self._prepare_for_wire()
+        serialized = {
             "stream_id": self.stream_id,
             "chunk_index": self.chunk_index,
             "data": self._serialize_data(),
@@ -84,9 +146,13 @@ class StreamChunk:
             "is_final": self.is_final,
             "chunk_size": self.chunk_size,
             "checksum": self.checksum,
-            "metadata": self.metadata,
+            "metadata": self.metadata or {},
             "timestamp": self.timestamp
         }
+        # Readers default to sha256, so the common case stays as it was on the wire
+        if self.integrity is not _DEFAULT_INTEGRITY:
+            serialized["integrity"] = self.integrity._value_
+        return serialized
     
     def _serialize_data(self) -> Union[str, Dict[str, Any]]:
         """Serialize data based on type for JSON transport"""
@@ -111,8 +177,9 @@ class StreamChunk:
             is_final=data.get("is_final", False),
             chunk_size=data.get("chunk_size"),
             checksum=data.get("checksum"),
-            metadata=data.get("metadata", {}),
-            timestamp=data.get("timestamp", time.time())
+            metadata=data.get("metadata") or None,
+            timestamp=data.get("timestamp", time.time()),
+            integrity=IntegrityMode(data.get("integrity", "sha256"))
         )
         chunk._deserialize_data(data["data"])
         return chunk
@@ -130,8 +197,13 @@ class StreamChunk:
             self.data = serialized_data
     
     def verify_checksum(self) -> bool:
-        """Verify data integrity using checksum"""
-        return self.checksum == self._calculate_checksum()
+        """Verify data integrity using checksum (chunks never serialized carry none)"""
+        if self.checksum is None:
+            return True
+        algorithm, _, _ = self.checksum.rpartition(":")
+        if algorithm not in _CHECKSUMS:
+            return False  # Written by an algorithm this process does not have
+        return self.checksum == self._calculate_checksum(algorithm)
 
 
 @dataclass
@@ -143,6 +215,7 @@ class StreamMetadata:
     component_target: str
     data_type: StreamDataType
     status: StreamStatus = StreamStatus.ACTIVE
+    integrity: IntegrityMode = IntegrityMode.SHA256
     created_at: float = field(default_factory=time.time)
     completed_at: Optional[float] = None
     total_chunks: Optional[int] = None
@@ -167,6 +240,7 @@ class StreamMetadata:
             "component_target": self.component_target,
             "data_type": self.data_type.value,
             "status": self.status.value,
+            "integrity": self.integrity.value,
             "created_at": self.created_at,
             "completed_at": self.completed_at,
             "total_chunks": self.total_chunks,
@@ -189,6 +263,7 @@ class StreamMetadata:
             component_target=data["component_target"],
             data_type=StreamDataType(data["data_type"]),
             status=StreamStatus(data.get("status", "active")),
+            integrity=IntegrityMode(data.get("integrity", "sha256")),
             created_at=data.get("created_at", time.time()),
             completed_at=data.get("completed_at"),
             total_chunks=data.get("total_chunks"),
@@ -301,7 +376,8 @@ def create_stream_chunk(
     data: Any,
     data_type: StreamDataType = StreamDataType.TEXT,
     is_final: bool = False,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    integrity: IntegrityMode = IntegrityMode.SHA256
 ) -> StreamChunk:
     """Convenience function to create a stream chunk"""
     return StreamChunk(
@@ -310,5 +386,6 @@ def create_stream_chunk(
         data=data,
         data_type=data_type,
         is_final=is_final,
-        metadata=metadata or {}
+        metadata=metadata or None,
+        integrity=integrity
     )
\ No newline at end of file
@@ -22,21 +22,31 @@ class Hook:
     event: str
     script_path: str
     function_name: str
+    mode: Optional[str] = None  # "inline" or "detached"; None uses the event bus default
+    timeout: Optional[float] = None  # seconds, detached hooks only
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Hook":
+        timeout = data.get("timeout")
         return cls(
             event=data["event"],
             script_path=data["script_path"], 
-            function_name=data["function_name"]
+            function_name=data["function_name"],
+            mode=data.get("mode"),
+            timeout=float(timeout) if timeout is not None else None
         )
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "event": self.event,
             "script_path": self.script_path,
             "function_name": self.function_name
         }
+        if self.mode is not None:
+            data["mode"] = self.mode
+        if self.timeout is not None:
+            data["timeout"] = self.timeout
+        return data
 
 
 @dataclass